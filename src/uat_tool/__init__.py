@@ -4,9 +4,29 @@ sobre el sistema U-space de Enaire"""
 __version__ = "1.0.0"
 __author__ = "David Vázquez Masero"
 
-from .application.app_context import ApplicationContext
-from .main import main
 from .shared.logging import get_logger, setup_logging
 
 __version__ = "1.0.0"
 __all__ = ["main", "ApplicationContext", "get_logger", "setup_logging"]
+
+
+def __getattr__(name: str):
+    # ApplicationContext importa SQLAlchemy y los modelos: se carga al pedirlo
+    # para que `python -m uat_tool` empiece a medir el arranque antes
+    if name == "ApplicationContext":
+        from .application.app_context import (  # pylint: disable=import-outside-toplevel
+            ApplicationContext,
+        )
+
+        globals()["ApplicationContext"] = ApplicationContext
+        return ApplicationContext
+    # `main` importa PySide6: se carga solo al pedirlo para que la CLI y los
+    # scripts sin pantalla no arrastren Qt
+    if name == "main":
+        from .main import main  # pylint: disable=import-outside-toplevel
+
+        # Importar el submódulo enlaza `uat_tool.main` al módulo: se sustituye
+        # por la función, como hacía el import directo
+        globals()["main"] = main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
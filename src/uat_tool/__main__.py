@@ -1,6 +1,10 @@
-"""Punto de entrada principal para ejecutar como módulo: python -m uat_tool"""
+"""Punto de entrada principal para ejecutar como módulo: python -m uat_tool
 
-from uat_tool.main import main
+Sin argumentos abre la interfaz gráfica; con un subcomando ejecuta la CLI
+(ver `uat_tool.cli`).
+"""
+
+from uat_tool.cli import main
 
 if __name__ == "__main__":
     main()
@@ -5,6 +5,7 @@ Contiene la lógica de aplicación y orquestación del sistema:
 
 - AppContext: Contenedor de dependencias y contexto global
 - UnitOfWork: Patrón unidad de trabajo para transacciones
+- ReferenceDataCache: Caché de datos de referencia (sistemas, secciones...)
 - Services: Servicios con lógica de negocio
 - DTOs: Objetos de transferencia de datos type-safe
 
@@ -15,21 +16,30 @@ Todos los componentes están exportados para importación directa:
 
 from .app_context import ApplicationContext
 from .bootstrap import bootstrap
+from .reference_cache import ReferenceDataCache
 from .services.auxiliary_service import AuxiliaryService
 
 # Services
 # DTOs
-from .services.base_service import BaseService
+from .services.base_service import BaseService, read_only
 from .services.bug_service import BugService
+from .services.coverage_service import CoverageService
+from .services.execution_service import ExecutionService
+from .services.export_service import ExportService
 from .services.requirement_service import RequirementService
 from .uow import unit_of_work
 
 __all__ = [
     "AuxiliaryService",
     "ApplicationContext",
+    "ReferenceDataCache",
     "bootstrap",
     "BugService",
     "RequirementService",
+    "ExportService",
+    "CoverageService",
+    "ExecutionService",
     "BaseService",
+    "read_only",
     "unit_of_work",
 ]
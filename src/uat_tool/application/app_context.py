@@ -1,8 +1,18 @@
+import threading
+from collections.abc import Callable
 from typing import Any
 
-from uat_tool.infrastructure import get_engine, get_session_factory, init_db
+from uat_tool.infrastructure import (
+    QueryProfiler,
+    create_read_engine,
+    get_engine,
+    get_query_profiler,
+    get_session_factory,
+    init_db,
+)
 from uat_tool.shared import get_logger
 
+from .reference_cache import ReferenceDataCache
 from .uow import UnitOfWork, unit_of_work
 
 logger = get_logger(__name__)
@@ -14,7 +24,11 @@ class ApplicationContext:
     _instance: "ApplicationContext" = None
 
     def __init__(
-        self, test_mode: bool = False, test_engine=None, load_initial_data: bool = True
+        self,
+        test_mode: bool = False,
+        test_engine=None,
+        load_initial_data: bool = True,
+        separate_read_pool: bool = False,
     ):
         self._test_mode = test_mode
         self._load_initial_data = load_initial_data
@@ -23,7 +37,27 @@ class ApplicationContext:
 
         self._session_factory = get_session_factory(self._engine, scoped=not test_mode)
 
+        # Unidades de trabajo de solo lectura: pool propio con query_only si se pide
+        self._read_engine = (
+            create_read_engine(self._engine) if separate_read_pool else self._engine
+        )
+        if self._read_engine is self._engine:
+            self._read_session_factory = self._session_factory
+        else:
+            self._read_session_factory = get_session_factory(
+                self._read_engine, scoped=not test_mode
+            )
+            profiler = get_query_profiler()
+            if profiler.enabled:
+                profiler.enable(self._read_engine)
+
+        # Caché de System, Section, Reason y Environment (carga perezosa)
+        self._reference_cache = ReferenceDataCache(self._engine)
+
+        # Los servicios se construyen en el primer get_service (arranque en frío)
         self._services: dict[str, Any] = {}
+        self._service_factories: dict[str, Callable[[ApplicationContext], Any]] = {}
+        self._services_lock = threading.Lock()
         self._is_initialized = False
 
     def initialize(self):
@@ -60,29 +94,32 @@ class ApplicationContext:
             raise
 
     def _initialize_services(self):
-        """Inicializa los servicios de la aplicación."""
+        """Registra los servicios de la aplicación (se construyen al pedirlos)."""
         from uat_tool.application.services import (  # pylint: disable=import-outside-toplevel
             AuxiliaryService,
             BugService,
+            CoverageService,
+            ExecutionService,
+            ExportService,
             RequirementService,
         )
 
         try:
-            logger.info("Inicializando servicios...")
+            logger.info("Registrando servicios...")
 
-            bug_service = BugService(self)
-            self.register_service("bug_service", bug_service)
-            requirement_service = RequirementService(self)
-            self.register_service("requirement_service", requirement_service)
-            auxiliary_service = AuxiliaryService(self)
-            self.register_service("auxiliary_service", auxiliary_service)
+            self.register_service_factory("bug_service", BugService)
+            self.register_service_factory("requirement_service", RequirementService)
+            self.register_service_factory("auxiliary_service", AuxiliaryService)
+            self.register_service_factory("export_service", ExportService)
+            self.register_service_factory("coverage_service", CoverageService)
+            self.register_service_factory("execution_service", ExecutionService)
 
-            # Inicializar otros servicios
+            # Registrar otros servicios
 
-            logger.info("Servicios inicializados correctamente")
+            logger.info("Servicios registrados correctamente")
 
         except Exception as e:
-            logger.error("Error inicializando servicios: %s", e)
+            logger.error("Error registrando servicios: %s", e)
             raise
 
     def get_uow(self) -> UnitOfWork:
@@ -90,20 +127,62 @@ class ApplicationContext:
         session = self._session_factory()
         return UnitOfWork(session)
 
-    def get_unit_of_work_context(self):
-        """Proporciona el context manager de unit of work."""
-        return unit_of_work()
+    def get_unit_of_work_context(self, read_only: bool = False, private: bool = False):
+        """Proporciona el context manager de unit of work (reentrante).
+
+        Usa la factoría de sesiones del contexto, así que respeta el engine
+        con el que se creó (p. ej. el de los tests). Con `read_only` la unidad
+        de trabajo no confirma y usa el pool de lectura si lo hay; con
+        `private` usa una sesión propia que no se comparte (generadores).
+        """
+        return unit_of_work(
+            self._session_factory,
+            read_only=read_only,
+            read_session_factory=self._read_session_factory,
+            private=private,
+        )
+
+    def get_reference_cache(self) -> ReferenceDataCache:
+        """Proporciona la caché de datos de referencia del proceso."""
+        return self._reference_cache
+
+    def get_query_profiler(self) -> QueryProfiler:
+        """Proporciona el perfilador de consultas SQL (activo con --profile-sql)."""
+        return get_query_profiler()
 
     def get_service(self, service_name: str) -> Any:
-        """Obtiene un servicio por su nombre."""
+        """Obtiene un servicio por su nombre, construyéndolo la primera vez."""
         if not self._is_initialized:
             raise RuntimeError("ApplicationContext no está inicializado")
-        return self._services.get(service_name)
+
+        service = self._services.get(service_name)
+        if service is not None or service_name not in self._service_factories:
+            return service
+
+        # Los workers de carga piden servicios desde otros hilos
+        with self._services_lock:
+            service = self._services.get(service_name)
+            if service is None:
+                try:
+                    service = self._service_factories[service_name](self)
+                except Exception as e:
+                    logger.error("Error inicializando servicio %s: %s", service_name, e)
+                    raise
+                self._services[service_name] = service
+                logger.debug("Servicio %s inicializado", service_name)
+        return service
 
     def register_service(self, service_name: str, service_instance: Any) -> None:
         """Registra un nuevo servicio en el contexto."""
         self._services[service_name] = service_instance
 
+    def register_service_factory(
+        self, service_name: str, factory: Callable[["ApplicationContext"], Any]
+    ) -> None:
+        """Registra un servicio que se construye con `factory(self)` al pedirlo."""
+        self._service_factories[service_name] = factory
+        self._services.pop(service_name, None)
+
     def is_initialized(self) -> bool:
         """Verifica si el contexto está inicializado."""
         return self._is_initialized
@@ -123,6 +202,10 @@ class ApplicationContext:
                     logger.error("Error cerrando servicio %s: %s", name, e)
 
         self._services.clear()
+        self._service_factories.clear()
+        self._reference_cache.shutdown()
+        if self._read_engine is not self._engine:
+            self._read_engine.dispose()
         self._is_initialized = False
 
         if errors:
@@ -1,28 +1,37 @@
 from uat_tool.application import ApplicationContext
-from uat_tool.infrastructure import get_engine, init_db
+from uat_tool.infrastructure import get_engine
 from uat_tool.shared import get_logger, setup_logging
 
 
 def bootstrap(
-    test_mode: bool = False, load_initial_data: bool = True
+    test_mode: bool = False,
+    load_initial_data: bool = True,
+    console_log_level: int | None = None,
+    separate_read_pool: bool = False,
 ) -> ApplicationContext:
     """Inicializa el entorno completo de la aplicación de forma determinista.
 
     Args:
         test_mode (bool, optional): Si True, elimina tablas existentes y usa un engine aislado. Default en False.
         load_initial_data (bool, optional): Si True, carga datos iniciales. Default en True.
+        console_log_level (int, optional): Nivel de log en consola (p.ej. la CLI solo muestra avisos). Default según test_mode.
+        separate_read_pool (bool, optional): Si True, las lecturas usan un pool de conexiones de solo lectura. Default en False.
     Returns:
         ApplicationContext: Contexto de aplicación completamente inicializado.
     """
-    setup_logging(verbose=test_mode)
+    setup_logging(verbose=test_mode, console_level=console_log_level)
     logger = get_logger(__name__)
     logger.info("Bootstrap de aplicación iniciado...")
 
     engine = get_engine(echo=test_mode)
-    init_db(drop_existing=test_mode, engine=engine, load_initial_data=load_initial_data)
 
+    # ApplicationContext.initialize ya ejecuta init_db: hacerlo también aquí
+    # duplicaba create_all y la carga de datos iniciales en cada arranque
     app_context = ApplicationContext(
-        test_mode=test_mode, test_engine=engine, load_initial_data=load_initial_data
+        test_mode=test_mode,
+        test_engine=engine,
+        load_initial_data=load_initial_data,
+        separate_read_pool=separate_read_pool,
     )
     app_context.initialize()
 
@@ -48,8 +48,12 @@ from .bug_dto import (
     BugServiceDTO,
     BugTableDTO,
 )
+from .execution_dto import RunProgressDTO, StepResultDTO
 from .requirement_dto import (
+    RequirementCoverageDTO,
     RequirementFormDTO,
+    RequirementImportErrorDTO,
+    RequirementImportResultDTO,
     RequirementServiceDTO,
     RequirementTableDTO,
 )
@@ -93,6 +97,11 @@ __all__ = [
     "RequirementFormDTO",
     "RequirementServiceDTO",
     "RequirementTableDTO",
+    "RequirementImportErrorDTO",
+    "RequirementImportResultDTO",
+    "RequirementCoverageDTO",
+    "RunProgressDTO",
+    "StepResultDTO",
     "EmailFormDTO",
     "EmailServiceDTO",
     "EmailTableDTO",
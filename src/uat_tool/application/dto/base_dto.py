@@ -1,6 +1,8 @@
 from dataclasses import asdict, dataclass
 from datetime import datetime
 
+from uat_tool.domain import GROUP_SEPARATOR
+
 
 @dataclass
 class BaseServiceDTO:
@@ -49,6 +51,11 @@ class BaseTableDTO:
         """Formatea fecha para UI."""
         return date.strftime("%d/%m/%Y %H:%M") if date else "N/A"
 
+    @staticmethod
+    def _split_group(value: str | None) -> list[str]:
+        """Separa una columna agregada con group_concat (None si no hay valores)."""
+        return value.split(GROUP_SEPARATOR) if value else []
+
     def _format_date_short(self, date_value: datetime | None) -> str:
         """Formatea una fecha en formato corto para la UI."""
         if not date_value:
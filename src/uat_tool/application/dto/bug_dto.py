@@ -6,6 +6,12 @@ from uat_tool.application.dto.auxiliary_dto import FileServiceDTO
 from uat_tool.application.dto.base_dto import BaseFormDTO, BaseServiceDTO, BaseTableDTO
 from uat_tool.domain import Bug, BugHistory
 
+# Urgencia e impacto numéricos -> texto para la UI
+_LEVEL_NAMES = {1: "Baja", 2: "Media", 3: "Alta"}
+
+# Nombres de archivos adjuntos que se muestran en la tabla
+_MAX_FILE_NAMES = 3
+
 
 @dataclass
 class BugHistoryServiceDTO:
@@ -165,22 +171,6 @@ class BugTableDTO(BaseTableDTO):
             BugTableDTO: TableDTO transformado.
         """
 
-        # Mapear urgencia/impacto numérico a texto
-        urgency_map = {1: "Baja", 2: "Media", 3: "Alta"}
-        impact_map = {1: "Baja", 2: "Media", 3: "Alta"}
-
-        # Formatear fechas (manejar caso de None para nuevos bugs)
-        created_at_str = (
-            service_dto.created_at.strftime("%d/%m/%Y %H:%M")
-            if service_dto.created_at
-            else "Not assigned"
-        )
-        updated_at_str = (
-            service_dto.updated_at.strftime("%d/%m/%Y %H:%M")
-            if service_dto.updated_at
-            else "Not assigned"
-        )
-
         # Formatear requisitos
         requirements_display = (
             ", ".join(requirement_codes)
@@ -189,34 +179,77 @@ class BugTableDTO(BaseTableDTO):
         )
 
         file_count = len(service_dto.files)
-        file_names = ", ".join(
-            [f.filename for f in service_dto.files[:3]]
-        )  # Primeros 3
-
-        if file_count > 3:
-            file_names += f" ... (+{file_count - 3} más)"
 
         return cls(
             id=service_dto.id,
             status=service_dto.status.title(),
             system=system_name or "Unknown",
             system_version=service_dto.system_version,
-            created_at=created_at_str,
-            updated_at=updated_at_str,
+            created_at=cls._format_timestamp(service_dto.created_at),
+            updated_at=cls._format_timestamp(service_dto.updated_at),
             modified_by=service_dto.modified_by,
             service_now_id=service_dto.service_now_id or "N/A",
             campaign_run=service_dto.campaign_run_id or "N/A",
             requirements=requirements_display,
             short_description=service_dto.short_description,
             definition=service_dto.definition,
-            urgency=urgency_map.get(service_dto.urgency, "Unknown"),
-            impact=impact_map.get(service_dto.impact, "Unknown"),
+            urgency=_LEVEL_NAMES.get(service_dto.urgency, "Unknown"),
+            impact=_LEVEL_NAMES.get(service_dto.impact, "Unknown"),
             comments=service_dto.comments or "",
             file_count=file_count,
-            file_names=file_names if file_count > 0 else "No files attached",
+            file_names=cls._format_file_names(
+                [f.filename for f in service_dto.files[:_MAX_FILE_NAMES]], file_count
+            ),
             history_count=len(service_dto.history),
         )
 
+    @classmethod
+    def from_row(cls, row) -> "BugTableDTO":
+        """Crea el DTO desde una fila de `BugRepository.get_all_table_rows`.
+
+        La fila ya trae el nombre del sistema, los códigos de requisitos, los
+        nombres de archivos y los contadores, así que no se construye ni el
+        modelo ni el BugServiceDTO.
+        """
+        requirement_codes = cls._split_group(row.requirement_codes)
+        file_names = cls._split_group(row.file_names)[:_MAX_FILE_NAMES]
+
+        return cls(
+            id=row.id,
+            status=row.status.title(),
+            system=row.system_name or "Unknown",
+            system_version=row.system_version,
+            created_at=cls._format_timestamp(row.created_at),
+            updated_at=cls._format_timestamp(row.updated_at),
+            modified_by=row.modified_by,
+            service_now_id=row.service_now_id or "N/A",
+            campaign_run=row.campaign_run_id or "N/A",
+            requirements=", ".join(requirement_codes) if requirement_codes else "N/A",
+            short_description=row.short_description,
+            definition=row.definition,
+            urgency=_LEVEL_NAMES.get(row.urgency, "Unknown"),
+            impact=_LEVEL_NAMES.get(row.impact, "Unknown"),
+            comments=row.comments or "",
+            file_count=row.file_count,
+            file_names=cls._format_file_names(file_names, row.file_count),
+            history_count=row.history_count,
+        )
+
+    @staticmethod
+    def _format_timestamp(value: datetime | None) -> str:
+        """Fecha y hora para la tabla (los bugs nuevos aún no tienen fechas)."""
+        return value.strftime("%d/%m/%Y %H:%M") if value else "Not assigned"
+
+    @staticmethod
+    def _format_file_names(file_names: list[str], file_count: int) -> str:
+        """Primeros nombres de archivo y cuántos más hay."""
+        if not file_count:
+            return "No files attached"
+        display = ", ".join(file_names)
+        if file_count > _MAX_FILE_NAMES:
+            display += f" ... (+{file_count - _MAX_FILE_NAMES} más)"
+        return display
+
 
 @dataclass
 class BugFormDTO(BaseFormDTO):
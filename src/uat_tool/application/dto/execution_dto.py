@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class RunProgressDTO:
+    """Progreso de una ejecución (de campaña o de caso) según sus step runs.
+
+    Propósito: dashboards y listados de ejecuciones. Se construye desde los
+    contadores materializados, sin cargar los step runs.
+    """
+
+    run_id: int
+    total: int = 0
+    passed: int = 0
+    failed: int = 0
+
+    @classmethod
+    def from_row(cls, row) -> "RunProgressDTO":
+        """Crea el DTO desde una fila (id, steps_total, steps_passed, steps_failed)."""
+        run_id, total, passed, failed = row
+        return cls(run_id=run_id, total=total, passed=passed, failed=failed)
+
+    @property
+    def executed(self) -> int:
+        return self.passed + self.failed
+
+    @property
+    def not_run(self) -> int:
+        return self.total - self.executed
+
+    @property
+    def percent_done(self) -> float:
+        """Porcentaje de pasos con resultado (100 si no hay pasos)."""
+        return 100.0 * self.executed / self.total if self.total else 100.0
+
+
+@dataclass
+class StepResultDTO:
+    """Resultado de un paso ejecutado para registrarlo en bloque.
+
+    Propósito: entrada de `ExecutionService.record_step_results`.
+    """
+
+    step_run_id: int
+    passed: bool
+    notes: str | None = None
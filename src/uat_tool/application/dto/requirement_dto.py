@@ -106,6 +106,23 @@ class RequirementTableDTO(BaseTableDTO):
             modified_by=service_dto.modified_by,
         )
 
+    @classmethod
+    def from_row(cls, row) -> "RequirementTableDTO":
+        """Crea el DTO desde una fila de `RequirementRepository.get_all_table_rows`."""
+        system_names = cls._split_group(row.system_names)
+        section_names = cls._split_group(row.section_names)
+
+        return cls(
+            id=row.id,
+            code=row.code,
+            definition=row.definition,
+            systems=", ".join(system_names) if system_names else "N/A",
+            sections=", ".join(section_names) if section_names else "N/A",
+            created_at=cls._format_date(row.created_at),
+            updated_at=cls._format_date(row.updated_at),
+            modified_by=row.modified_by,
+        )
+
 
 @dataclass
 class RequirementFormDTO(BaseFormDTO):
@@ -153,3 +170,74 @@ class RequirementFormDTO(BaseFormDTO):
             lw_systems=service_dto.systems,
             lw_sections=service_dto.sections,
         )
+
+
+@dataclass
+class RequirementImportErrorDTO:
+    """Fila rechazada en una importación masiva de requisitos."""
+
+    row: int  # Número de registro en el archivo (1 = primer registro de datos)
+    code: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"Fila {self.row} ({self.code or 'sin código'}): {self.message}"
+
+
+@dataclass
+class RequirementImportResultDTO:
+    """Resultado de una importación masiva de requisitos.
+
+    Las filas con errores se descartan sin abortar el resto del lote.
+    """
+
+    total: int
+    created_ids: list[int] = field(default_factory=list)
+    errors: list[RequirementImportErrorDTO] = field(default_factory=list)
+
+    @property
+    def created(self) -> int:
+        return len(self.created_ids)
+
+
+@dataclass
+class RequirementCoverageDTO:
+    """Cobertura de un requisito: pasos que lo prueban, ejecuciones y bugs abiertos.
+
+    Propósito: informes de trazabilidad. Se construye directamente desde las
+    filas agregadas de `RequirementRepository.get_coverage`.
+    """
+
+    requirement_id: int
+    code: str
+    steps: int = 0  # Pasos vinculados al requisito
+    step_runs: int = 0  # Ejecuciones de esos pasos (con o sin resultado)
+    executed: int = 0  # Ejecuciones con resultado
+    passed: int = 0
+    open_bugs: int = 0
+
+    @classmethod
+    def from_row(cls, row) -> "RequirementCoverageDTO":
+        """Crea el DTO desde una fila de `RequirementRepository.get_coverage`."""
+        return cls(**row._mapping)
+
+    @property
+    def failed(self) -> int:
+        return self.executed - self.passed
+
+    @property
+    def not_run(self) -> int:
+        return self.step_runs - self.executed
+
+    @property
+    def status(self) -> str:
+        """NOT COVERED, NOT RUN, FAILED, PASSED o IN PROGRESS."""
+        if not self.steps:
+            return "NOT COVERED"
+        if not self.executed:
+            return "NOT RUN"
+        if self.failed:
+            return "FAILED"
+        if self.passed == self.step_runs:
+            return "PASSED"
+        return "IN PROGRESS"
@@ -0,0 +1,142 @@
+"""
+Caché de datos de referencia a nivel de proceso.
+
+Systems, Sections, Reasons y Environments se cargan una vez por
+`initial_data.load_initial_data` y casi nunca cambian, por lo que se mantienen
+en memoria para resolver id -> nombre y nombre -> id en O(1). La caché se
+invalida sola mediante eventos de SQLAlchemy cuando alguna sesión confirma
+escrituras sobre esas tablas.
+"""
+
+import threading
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
+
+from uat_tool.domain import Environment, Reason, Section, System
+from uat_tool.shared import get_logger
+
+logger = get_logger(__name__)
+
+# Clave en Session.info donde se acumulan los tipos modificados hasta el commit
+_PENDING_KEY = "reference_cache_pending"
+
+
+class ReferenceDataCache:
+    """Caché en memoria de las tablas de referencia con invalidación automática."""
+
+    ENTITY_MODELS = {
+        "system": System,
+        "section": Section,
+        "reason": Reason,
+        "environment": Environment,
+    }
+
+    def __init__(self, engine):
+        self._session_factory = sessionmaker(bind=engine, future=True)
+        self._lock = threading.RLock()
+        self._id_to_name: dict[str, dict[int, str]] = {}
+        self._name_to_id: dict[str, dict[str, int]] = {}
+        self._listening = False
+
+    # --- CONSULTAS ---
+
+    def get_names(self, entity_type: str) -> dict[int, str]:
+        """Devuelve el diccionario {id: nombre} de un tipo de entidad."""
+        return self._ensure_loaded(entity_type)[0]
+
+    def get_name(
+        self, entity_type: str, entity_id: int, default: str | None = None
+    ) -> str | None:
+        """Obtiene el nombre de una entidad de referencia por su ID."""
+        return self.get_names(entity_type).get(entity_id, default)
+
+    def get_id(self, entity_type: str, name: str) -> int | None:
+        """Obtiene el ID de una entidad de referencia por su nombre."""
+        return self._ensure_loaded(entity_type)[1].get(name)
+
+    def get_items(self, entity_type: str) -> list[tuple[int, str]]:
+        """Devuelve las parejas (id, nombre) ordenadas por ID."""
+        return sorted(self.get_names(entity_type).items())
+
+    def is_cached(self, entity_type: str) -> bool:
+        """Indica si el tipo de entidad está cargado en memoria."""
+        return entity_type in self._id_to_name
+
+    # --- CARGA E INVALIDACIÓN ---
+
+    def invalidate(self, entity_type: str | None = None) -> None:
+        """Descarta un tipo de entidad (o todos) para recargarlo en el próximo acceso."""
+        with self._lock:
+            if entity_type is None:
+                self._id_to_name.clear()
+                self._name_to_id.clear()
+            else:
+                self._id_to_name.pop(entity_type, None)
+                self._name_to_id.pop(entity_type, None)
+        logger.debug("Caché de referencia invalidada: %s", entity_type or "todas")
+
+    def _ensure_loaded(
+        self, entity_type: str
+    ) -> tuple[dict[int, str], dict[str, int]]:
+        """Carga un tipo de entidad desde BD si no está en memoria."""
+        if entity_type not in self.ENTITY_MODELS:
+            raise ValueError(f"Tipo de entidad de referencia no soportado: {entity_type}")
+
+        with self._lock:
+            if entity_type not in self._id_to_name:
+                # Los listeners se registran al cargar por primera vez: mientras
+                # la caché esté vacía no hay nada que invalidar.
+                self._register_listeners()
+                model = self.ENTITY_MODELS[entity_type]
+                with self._session_factory() as session:
+                    rows = session.query(model.id, model.name).all()
+                self._id_to_name[entity_type] = {row_id: name for row_id, name in rows}
+                self._name_to_id[entity_type] = {name: row_id for row_id, name in rows}
+                logger.debug(
+                    "Caché de referencia cargada: %s (%i registros)",
+                    entity_type,
+                    len(rows),
+                )
+            return self._id_to_name[entity_type], self._name_to_id[entity_type]
+
+    # --- EVENTOS DE SQLALCHEMY ---
+
+    def _register_listeners(self) -> None:
+        """Escucha los flush/commit de todas las sesiones para invalidar la caché."""
+        if self._listening:
+            return
+        event.listen(Session, "after_flush", self._on_after_flush)
+        event.listen(Session, "after_commit", self._on_after_commit)
+        event.listen(Session, "after_soft_rollback", self._on_after_soft_rollback)
+        self._listening = True
+
+    def _on_after_flush(self, session: Session, _flush_context) -> None:
+        """Anota qué tablas de referencia se han escrito en la transacción."""
+        touched = {
+            entity_type
+            for instance in (*session.new, *session.dirty, *session.deleted)
+            for entity_type, model in self.ENTITY_MODELS.items()
+            if isinstance(instance, model)
+        }
+        if touched:
+            session.info.setdefault(_PENDING_KEY, set()).update(touched)
+
+    def _on_after_commit(self, session: Session) -> None:
+        """Invalida los tipos escritos una vez confirmada la transacción."""
+        for entity_type in session.info.pop(_PENDING_KEY, set()):
+            self.invalidate(entity_type)
+
+    def _on_after_soft_rollback(self, session: Session, previous_transaction) -> None:
+        """Descarta las escrituras anotadas si la transacción principal se revierte."""
+        if previous_transaction.parent is None:
+            session.info.pop(_PENDING_KEY, None)
+
+    def shutdown(self) -> None:
+        """Elimina los listeners y vacía la caché."""
+        if self._listening:
+            event.remove(Session, "after_flush", self._on_after_flush)
+            event.remove(Session, "after_commit", self._on_after_commit)
+            event.remove(Session, "after_soft_rollback", self._on_after_soft_rollback)
+            self._listening = False
+        self.invalidate()
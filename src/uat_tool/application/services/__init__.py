@@ -4,6 +4,9 @@ Paquete `application.services`
 Contiene los servicios de aplicación con lógica de negocio:
 
 - BugService: Gestión completa del ciclo de vida de bugs
+- ExportService: Exportación de tablas a CSV/XLSX en streaming
+- CoverageService: Cobertura de requisitos (pasos, ejecuciones y bugs) en SQL
+- ExecutionService: Progreso de ejecuciones desde contadores materializados
 - [Futuros]: CampaignService, RequirementService, etc.
 
 Cada servicio encapsula la lógica de negocio para una entidad específica
@@ -15,8 +18,20 @@ Ejemplo:
 """
 
 from .auxiliary_service import AuxiliaryService
-from .base_service import BaseService
+from .base_service import BaseService, read_only
 from .bug_service import BugService
+from .coverage_service import CoverageService
+from .execution_service import ExecutionService
+from .export_service import ExportService
 from .requirement_service import RequirementService
 
-__all__ = ["BugService", "BaseService", "RequirementService", "AuxiliaryService"]
+__all__ = [
+    "BugService",
+    "BaseService",
+    "RequirementService",
+    "AuxiliaryService",
+    "ExportService",
+    "CoverageService",
+    "ExecutionService",
+    "read_only",
+]
@@ -1,4 +1,5 @@
 import sys
+from collections.abc import Iterable
 from pathlib import Path
 
 from uat_tool.application.dto import FileServiceDTO, SectionServiceDTO, SystemServiceDTO
@@ -17,27 +18,28 @@ class AuxiliaryService(BaseService):
     def get_all_systems(self) -> list[System]:
         """Obtiene todos los sistemas como objetos SQLAlchemy (para lógica de negocio)."""
         self._log_operation("get_all", "System")
-        with self.app_context.get_unit_of_work_context() as uow:
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
             return uow.sys_repo.get_all()
 
     def get_all_systems_service_dto(self) -> list[SystemServiceDTO]:
-        """Obtiene todos los sistemas como DTOs."""
+        """Obtiene todos los sistemas como DTOs (desde la caché de referencia)."""
         self._log_operation("get_all", "System")
-        with self.app_context.get_unit_of_work_context() as uow:
-            systems_model = uow.sys_repo.get_all()
-            # Convertir a DTOs DENTRO del contexto de sesión
-            return [SystemServiceDTO.from_model(sys) for sys in systems_model]
+        cache = self.app_context.get_reference_cache()
+        return [
+            SystemServiceDTO(id=sys_id, name=name)
+            for sys_id, name in cache.get_items("system")
+        ]
 
     def get_system_by_id(self, system_id: int) -> System | None:
         """Obtiene un sistema como objeto SQLAlchemy (para edición)."""
         self._log_operation("get_by_id", "System", system_id)
-        with self.app_context.get_unit_of_work_context() as uow:
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
             return uow.sys_repo.get_by_id(system_id)
 
     def get_system_dto_by_id(self, system_id: int) -> SystemServiceDTO | None:
         """Obtiene un sistema como ServiceDTO."""
         self._log_operation("get_by_id", "System", system_id)
-        with self.app_context.get_unit_of_work_context() as uow:
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
             system = uow.sys_repo.get_by_id(system_id)
             return SystemServiceDTO.from_model(system) if system else None
 
@@ -46,27 +48,28 @@ class AuxiliaryService(BaseService):
     def get_all_sections(self) -> list[Section]:
         """Obtiene todos los sistemas como objetos SQLAlchemy (para lógica de negocio)."""
         self._log_operation("get_all", "Section")
-        with self.app_context.get_unit_of_work_context() as uow:
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
             return uow.section_repo.get_all()
 
     def get_all_sections_service_dto(self) -> list[SectionServiceDTO]:
-        """Obtiene todos los sistemas como DTOs."""
+        """Obtiene todas las secciones como DTOs (desde la caché de referencia)."""
         self._log_operation("get_all", "Section")
-        with self.app_context.get_unit_of_work_context() as uow:
-            sections_model = uow.section_repo.get_all()
-            # Convertir a DTOs DENTRO del contexto de sesión
-            return [SectionServiceDTO.from_model(sec) for sec in sections_model]
+        cache = self.app_context.get_reference_cache()
+        return [
+            SectionServiceDTO(id=sec_id, name=name)
+            for sec_id, name in cache.get_items("section")
+        ]
 
     def get_section_by_id(self, section_id: int) -> Section | None:
         """Obtiene una sección como objeto SQLAlchemy (para edición)."""
         self._log_operation("get_by_id", "Section", section_id)
-        with self.app_context.get_unit_of_work_context() as uow:
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
             return uow.section_repo.get_by_id(section_id)
 
     def get_section_dto_by_id(self, section_id: int) -> SectionServiceDTO | None:
         """Obtiene una sección como ServiceDTO."""
         self._log_operation("get_by_id", "Section", section_id)
-        with self.app_context.get_unit_of_work_context() as uow:
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
             section = uow.section_repo.get_by_id(section_id)
             return SectionServiceDTO.from_model(section) if section else None
 
@@ -125,7 +128,7 @@ class AuxiliaryService(BaseService):
     def get_files_by_bug_id(self, bug_id: int) -> list[FileServiceDTO]:
         """Obtiene todos los archivos asociados a un bug."""
         try:
-            with self.app_context.get_unit_of_work_context() as uow:
+            with self.app_context.get_unit_of_work_context(read_only=True) as uow:
                 files = uow.file_repo.get_by_owner("bug", bug_id)
                 return [FileServiceDTO.from_model(file) for file in files]
 
@@ -133,6 +136,40 @@ class AuxiliaryService(BaseService):
             logger.error("Error obteniendo archivos para bug %i: %s", bug_id, e)
             return []
 
+    def get_files_by_owners(
+        self, owner_type: str, owner_ids: Iterable[int]
+    ) -> dict[int, list[FileServiceDTO]]:
+        """Obtiene los archivos de muchos propietarios en una sola unidad de trabajo.
+
+        Args:
+            owner_type (str): tipo de propietario ("bug", "case", "campaign_run"...)
+            owner_ids (Iterable[int]): IDs de los propietarios
+
+        Returns:
+            dict[int, list[FileServiceDTO]]: archivos agrupados por ID de
+            propietario. Todos los IDs pedidos aparecen, con lista vacía si no
+            tienen archivos.
+        """
+        files_by_owner = {owner_id: [] for owner_id in owner_ids}
+        if not files_by_owner:
+            return files_by_owner
+
+        try:
+            with self.app_context.get_unit_of_work_context(read_only=True) as uow:
+                files = uow.file_repo.get_by_owners(owner_type, files_by_owner.keys())
+                for file in files:
+                    files_by_owner[file.owner_id].append(
+                        FileServiceDTO.from_model(file)
+                    )
+        except Exception as e:
+            logger.error(
+                "Error obteniendo archivos para %i propietarios %s: %s",
+                len(files_by_owner),
+                owner_type,
+                e,
+            )
+        return files_by_owner
+
     # Métodos de archivos
     def get_app_root(self) -> Path:
         """Obtiene la ruta raíz de la aplicación."""
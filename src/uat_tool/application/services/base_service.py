@@ -3,159 +3,157 @@ Servicio base con funcionalidad común para todos los servicios.
 Proporiona métodos de enriquecimiento, formato y helpers reutilizables.
 """
 
-from uat_tool.application import ApplicationContext
+import functools
+import inspect
+from collections.abc import Callable, Iterable
+
+from uat_tool.application import ApplicationContext, ReferenceDataCache
+from uat_tool.infrastructure import track_queries
 from uat_tool.shared import get_logger
 
 logger = get_logger(__name__)
 
 
+def read_only(method: Callable) -> Callable:
+    """Ejecuta un método de servicio en una unidad de trabajo de solo lectura.
+
+    Las unidades de trabajo que abra el método (también las de otros
+    servicios o de `_resolve_ids`) se anidan en ella, así que todas sus
+    consultas comparten una sesión y una transacción de lectura, sin commit.
+    No sirve para generadores: la unidad se cerraría antes de recorrerlos;
+    estos abren su propia unidad con `private=True`.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.app_context.get_unit_of_work_context(read_only=True):
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class BaseService:
     """Servicio base con métodos comunes para todas las entidades."""
 
     def __init__(self, app_context: ApplicationContext):
         self.app_context = app_context
 
-    # --- MÉTODOS DE ENRIQUECIMIENTO (obtener parámetros concretos por IDs) ---
+    def __init_subclass__(cls, **kwargs):
+        """Registra las sentencias SQL de cada método público del servicio.
 
-    def _get_system_name(self, system_id: int) -> str:
-        """Obtiene el nombre del sistema por su ID."""
+        Con el perfilador de consultas desactivado (lo normal) el coste es
+        una comprobación por llamada; ver `infrastructure.track_queries`.
+        """
+        super().__init_subclass__(**kwargs)
+        for name, value in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.isfunction(value):
+                setattr(cls, name, track_queries()(value))
 
+    # --- MÉTODOS DE ENRIQUECIMIENTO (obtener parámetros concretos por IDs) ---
+
+    # Tipo de entidad -> (repositorio de la UnitOfWork, campo a mostrar)
+    _LOOKUP_FIELDS: dict[str, tuple[str, str]] = {
+        "system": ("sys_repo", "name"),
+        "section": ("section_repo", "name"),
+        "reason": ("reason_repo", "name"),
+        "environment": ("env_repo", "name"),
+        "requirement": ("req_repo", "code"),
+        "file_name": ("file_repo", "filename"),
+        "file_path": ("file_repo", "filepath"),
+        "operator": ("ope_repo", "name"),
+        "organization": ("org_repo", "name"),
+        "email": ("email_repo", "email"),
+        "drone": ("drone_repo", "serial_number"),
+        "uas_zone": ("zone_repo", "name"),
+        "uhub_user": ("user_repo", "username"),
+    }
+
+    def _resolve_ids(self, entity_type: str, ids: Iterable[int]) -> dict[int, str]:
+        """Resuelve varios IDs de un mismo tipo de entidad en una sola consulta IN.
+
+        Los datos de referencia (sistemas, secciones, razones y entornos) se
+        resuelven desde la caché del ApplicationContext sin tocar la BD.
+
+        Args:
+            entity_type (str): clave de `_LOOKUP_FIELDS` (p.ej. "system").
+            ids (Iterable[int]): IDs a resolver; se ignoran duplicados y None.
+
+        Returns:
+            dict[int, str]: {id: valor a mostrar} con los IDs encontrados. Los IDs
+            inexistentes no aparecen en el diccionario.
+        """
+        unique_ids = {id for id in ids if id is not None}
+        if not unique_ids:
+            return {}
+
+        if entity_type in ReferenceDataCache.ENTITY_MODELS:
+            names = self.app_context.get_reference_cache().get_names(entity_type)
+            return {id: names[id] for id in unique_ids if id in names}
+
+        repo_name, field = self._LOOKUP_FIELDS[entity_type]
         try:
-            with self.app_context.get_unit_of_work_context() as uow:
-                system = uow.sys_repo.get_by_id(system_id)
-                return system.name if system else "Unknown"
+            with self.app_context.get_unit_of_work_context(read_only=True) as uow:
+                repo = getattr(uow, repo_name)
+                return repo.get_field_by_ids(unique_ids, field)
         except Exception as e:
-            logger.error("Error obteniendo nombre del sistema %i: %s", system_id, e)
-            return "Error"
+            logger.error("Error resolviendo IDs de %s: %s", entity_type, e)
+            return {}
+
+    def _resolve_id(
+        self, entity_type: str, entity_id: int, not_found: str = "Unknown"
+    ) -> str:
+        """Resuelve un único ID reutilizando el resolvedor por lotes."""
+        if entity_id is None:
+            return not_found
+        return self._resolve_ids(entity_type, [entity_id]).get(entity_id, not_found)
+
+    def _get_system_name(self, system_id: int) -> str:
+        """Obtiene el nombre del sistema por su ID."""
+        return self._resolve_id("system", system_id)
 
     def _get_section_name(self, section_id: int) -> str:
         """Obtiene el nombre de la sección por su ID."""
-
-        try:
-            with self.app_context.get_unit_of_work_context() as uow:
-                section = uow.section_repo.get_by_id(section_id)
-                return section.name if section else "Unknown"
-        except Exception as e:
-            logger.error("Error obteniendo nombre de la sección %i: %s", section_id, e)
-            return "Error"
+        return self._resolve_id("section", section_id)
 
     def _get_reason_name(self, reason_id: int) -> str:
         """Obtiene el nombre de la razón de una zona UAS por su ID."""
-
-        try:
-            with self.app_context.get_unit_of_work_context() as uow:
-                reason = uow.reason_repo.get_by_id(reason_id)
-                return reason.name if reason else "Unknown"
-        except Exception as e:
-            logger.error("Error obteniendo nombre de la razón %i: %s", reason_id, e)
-            return "Error"
+        return self._resolve_id("reason", reason_id)
 
     def _get_requirement_code(self, requirement_id: int) -> str:
         """Obtiene el código de un requisito por su ID."""
-
-        try:
-            with self.app_context.get_unit_of_work_context() as uow:
-                requirement = uow.req_repo.get_by_id(requirement_id)
-                return requirement.code if requirement else "Unknown"
-        except Exception as e:
-            logger.error(
-                "Error obteniendo código de requisito %i: %s", requirement_id, e
-            )
-            return ["Error"]
+        return self._resolve_id("requirement", requirement_id)
 
     def _get_file_name(self, file_id: int) -> str:
         """Obtiene el nombre del archivo por su ID."""
-
-        try:
-            with self.app_context.get_unit_of_work_context() as uow:
-                file_record = uow.file_repo.get_by_id(file_id)
-                return file_record.filename if file_record else "File not found"
-        except Exception as e:
-            logger.error("Error obteniendo nombre de archivo %i: %s", file_id, e)
-            return "Error"
+        return self._resolve_id("file_name", file_id, not_found="File not found")
 
     def _get_file_path(self, file_id: int) -> str:
         """Obtiene la ruta del archivo por su ID."""
-
-        try:
-            with self.app_context.get_unit_of_work_context() as uow:
-                file_record = uow.file_repo.get_by_id(file_id)
-                return file_record.filepath if file_record else "File not found"
-        except Exception as e:
-            logger.error("Error obteniendo ruta de archivo %i: %s", file_id, e)
-            return "Error"
+        return self._resolve_id("file_path", file_id, not_found="File not found")
 
     def _get_operator_name(self, operator_id: int) -> str:
         """Obtiene el nombre del operador por su ID."""
-
-        try:
-            with self.app_context.get_unit_of_work_context() as uow:
-                operator = uow.ope_repo.get_by_id(operator_id)
-                return operator.name if operator else "Unknown"
-        except Exception as e:
-            logger.error("Error obteniendo nombre del operador %i: %s", operator_id, e)
-            return "Error"
+        return self._resolve_id("operator", operator_id)
 
     def _get_organization_name(self, organization_id: int) -> str:
         """Obtiene el nombre de la organización por su ID."""
-
-        try:
-            with self.app_context.get_unit_of_work_context() as uow:
-                organization = uow.org_repo.get_by_id(organization_id)
-                return organization.name if organization else "Unknown"
-        except Exception as e:
-            logger.error(
-                "Error obteniendo nombre de la organización %i: %s", organization_id, e
-            )
-            return "Error"
+        return self._resolve_id("organization", organization_id)
 
     def _get_email_email(self, email_id: int) -> str:
         """Obtiene el campo email de un email por su ID."""
-
-        try:
-            with self.app_context.get_unit_of_work_context() as uow:
-                email = uow.email_repo.get_by_id(email_id)
-                return email.email if email else "Unknown"
-        except Exception as e:
-            logger.error("Error obteniendo email de %i: %s", email_id, e)
-            return "Error"
+        return self._resolve_id("email", email_id)
 
     def _get_drone_serial_number(self, drone_id: int) -> str:
         """Obtiene el número de serie de un dron por su ID."""
-
-        try:
-            with self.app_context.get_unit_of_work_context() as uow:
-                drone = uow.drone_repo.get_by_id(drone_id)
-                return drone.serial_number if drone else "Unknown"
-        except Exception as e:
-            logger.error("Error obteniendo número de serie de %i: %s", drone_id, e)
-            return "Error"
+        return self._resolve_id("drone", drone_id)
 
     def _get_uas_zone_name(self, uas_zone_id: int) -> str:
         """Obtiene el nombre de una zona UAS por su ID."""
-
-        try:
-            with self.app_context.get_unit_of_work_context() as uow:
-                uas_zone = uow.zone_repo.get_by_id(uas_zone_id)
-                return uas_zone.name if uas_zone else "Unknown"
-        except Exception as e:
-            logger.error(
-                "Error obteniendo nombre de zona UAS de %i: %s", uas_zone_id, e
-            )
-            return "Error"
+        return self._resolve_id("uas_zone", uas_zone_id)
 
     def _get_uhub_user_username(self, uhub_user_id: int) -> str:
         """Obtiene el nombre de usuario de un usuario de uHub por su ID."""
-
-        try:
-            with self.app_context.get_unit_of_work_context() as uow:
-                user = uow.user_repo.get_by_id(uhub_user_id)
-                return user.username if user else "Unknown"
-        except Exception as e:
-            logger.error(
-                "Error obteniendo nombre de usuario de %i: %s", uhub_user_id, e
-            )
-            return "Error"
+        return self._resolve_id("uhub_user", uhub_user_id)
 
     # --- MÉTODOS DE LOGGING Y ERRORES ---
 
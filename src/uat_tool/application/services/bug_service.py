@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 from uat_tool.application.dto import (
     BugFormDTO,
     BugHistoryServiceDTO,
@@ -6,12 +8,16 @@ from uat_tool.application.dto import (
     BugTableDTO,
     FileServiceDTO,
 )
-from uat_tool.application.services.base_service import BaseService
+from uat_tool.application.services.base_service import BaseService, read_only
 from uat_tool.domain import Bug
+from uat_tool.infrastructure import DEFAULT_SEARCH_LIMIT, SearchHit
 from uat_tool.shared import get_logger
 
 logger = get_logger(__name__)
 
+# Bugs por página en la tabla de la UI
+BUG_PAGE_SIZE = 200
+
 
 class BugService(BaseService):
     """Servicio para manejar la lógica de negocio de Bugs."""
@@ -21,13 +27,13 @@ class BugService(BaseService):
     def get_all_bugs(self) -> list[Bug]:
         """Obtiene todos los bugs como objetos SQLAlchemy (para lógica de negocio)."""
         self._log_operation("get_all", "Bug")
-        with self.app_context.get_unit_of_work_context() as uow:
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
             return uow.bug_repo.get_all()
 
     def get_all_bugs_service_dto(self) -> list[BugServiceDTO]:
         """Obtiene todos los bugs como DTOs."""
         self._log_operation("get_all", "Bug")
-        with self.app_context.get_unit_of_work_context() as uow:
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
             bugs_model = uow.bug_repo.get_all()
             # Convertir a DTOs DENTRO del contexto de sesión
             return [BugServiceDTO.from_model(bug) for bug in bugs_model]
@@ -35,13 +41,13 @@ class BugService(BaseService):
     def get_bug_by_id(self, bug_id: int) -> Bug | None:
         """Obtiene un bug como objeto SQLAlchemy (para edición)."""
         self._log_operation("get_by_id", "Bug", bug_id)
-        with self.app_context.get_unit_of_work_context() as uow:
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
             return uow.bug_repo.get_by_id(bug_id)
 
     def get_bug_dto_by_id(self, bug_id: int) -> BugServiceDTO | None:
         """Obtiene un bug como ServiceDTO."""
         self._log_operation("get_by_id", "Bug", bug_id)
-        with self.app_context.get_unit_of_work_context() as uow:
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
             bug = uow.bug_repo.get_by_id(bug_id)
             files = uow.file_repo.get_by_owner("bug", bug_id)
             if files:
@@ -57,33 +63,168 @@ class BugService(BaseService):
     # --- MÉTODOS ENRIQUECIDOS (específicos para UI) ---
 
     def get_all_bugs_for_table(self) -> list[BugTableDTO]:
-        """Obtiene todos los bugs enriquecidos para mostrar en la tabla UI."""
-        self._log_operation("get_all_for_table", "Bug")
+        """Obtiene todos los bugs enriquecidos para mostrar en la tabla UI.
 
-        # Obtener bugs básicos
-        with self.app_context.get_unit_of_work_context() as uow:
-            bugs = uow.bug_repo.get_all_with_relations()
-            bugs_dto = [BugServiceDTO.from_model(bug) for bug in bugs]
-
-        # Enriquecer con archivos
-        auxiliary_service = self.app_context.get_service("auxiliary_service")
-        for bug_dto in bugs_dto:
-            bug_dto.files = auxiliary_service.get_files_by_bug_id(bug_dto.id)
-
-        return [self._enrich_bug_for_table(bug) for bug in bugs_dto]
-
-    def _enrich_bug_for_table(self, bug_dto: BugServiceDTO) -> BugTableDTO:
-        """Enriquece un BugServiceDTO con datos para la tabla UI."""
+        Se leen solo las columnas de la tabla (ver `BugRepository._table_query`)
+        y cada fila se convierte directamente en BugTableDTO, sin cargar
+        modelos, relaciones ni historial.
+        """
+        self._log_operation("get_all_for_table", "Bug")
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
+            rows = uow.bug_repo.get_all_table_rows()
+        return [BugTableDTO.from_row(row) for row in rows]
+
+    def get_bug_for_table(self, bug_id: int) -> BugTableDTO | None:
+        """Obtiene un bug enriquecido (con sus adjuntos) para una fila de la tabla UI."""
+        bugs = self.get_bugs_for_table_by_ids([bug_id])
+        return bugs[0] if bugs else None
+
+    def get_bugs_page_for_table(
+        self, limit: int = BUG_PAGE_SIZE, after: tuple | None = None
+    ) -> tuple[list[BugTableDTO], tuple | None]:
+        """Obtiene una página de bugs enriquecidos para la tabla UI.
+
+        Solo se cargan y enriquecen los bugs de la página, así que el coste no
+        crece con el total de bugs de la base de datos.
+
+        Args:
+            limit: tamaño de la página
+            after: cursor devuelto por la página anterior; None para la primera
+
+        Returns:
+            tuple: (bugs de la página, cursor de la siguiente o None si no hay más)
+        """
+        self._log_operation("get_page_for_table", "Bug")
+
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
+            rows, next_cursor = uow.bug_repo.get_table_page(limit, after)
+        return [BugTableDTO.from_row(row) for row in rows], next_cursor
+
+    def get_bugs_for_table_by_ids(self, bug_ids: list[int]) -> list[BugTableDTO]:
+        """Obtiene varios bugs enriquecidos para la tabla UI (sin orden garantizado)."""
+        if not bug_ids:
+            return []
+        self._log_operation("get_by_ids_for_table", "Bug")
+
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
+            rows = uow.bug_repo.get_table_rows_by_ids(bug_ids)
+        return [BugTableDTO.from_row(row) for row in rows]
+
+    def iter_bugs_for_table(
+        self, batch_size: int, include_history: bool = True
+    ) -> Iterator[list[BugTableDTO]]:
+        """Recorre todos los bugs enriquecidos para la tabla, por lotes.
+
+        Las filas de la tabla se leen con `yield_per` y cada una ya trae
+        adjuntos, sistema y requisitos, así que la memoria no depende del
+        total de bugs. La sesión de lectura queda abierta hasta agotar o
+        cerrar el generador.
+
+        Args:
+            batch_size: bugs por lote
+            include_history: si es False no se lee el historial (más rápido;
+                `history_count` queda a 0)
+
+        Yields:
+            list[BugTableDTO]: bugs del lote, ordenados por ID
+        """
+        self._log_operation("iter_for_table", "Bug")
+        # Sesión privada: queda abierta mientras el generador está suspendido
+        with self.app_context.get_unit_of_work_context(
+            read_only=True, private=True
+        ) as uow:
+            for rows in uow.bug_repo.iter_table_rows(batch_size, include_history):
+                yield [BugTableDTO.from_row(row) for row in rows]
+
+    def count_bugs(self) -> int:
+        """Número total de bugs."""
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
+            return uow.bug_repo.count()
+
+    @read_only
+    def count_bugs_by_status_and_system(self) -> list[tuple[str, str, int]]:
+        """Resumen de bugs por estado y sistema.
+
+        Returns:
+            list[tuple[str, str, int]]: (estado, nombre del sistema, número de bugs)
+        """
+        self._log_operation("count_by_status_and_system", "Bug")
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
+            counts = uow.bug_repo.count_by_status_and_system()
+        system_names = self._resolve_ids("system", [row[1] for row in counts])
+        return [
+            (status, system_names.get(system_id, ""), count)
+            for status, system_id, count in counts
+        ]
+
+    def search_bugs(
+        self, search_text: str, limit: int = DEFAULT_SEARCH_LIMIT
+    ) -> list[SearchHit]:
+        """Busca bugs por descripción, definición y comentarios (FTS5).
+
+        Args:
+            search_text: texto introducido por el usuario
+            limit: número máximo de resultados
+
+        Returns:
+            list[SearchHit]: IDs ordenados por relevancia con un fragmento del texto
+        """
+        self._log_operation("search", "Bug")
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
+            return uow.bug_repo.search(search_text, limit)
+
+    def _build_bug_lookups(self, bugs_dto: list[BugServiceDTO]) -> dict:
+        """Resuelve por lotes los nombres que falten en una lista de bugs.
+
+        Solo se consultan los IDs cuyos nombres no vengan ya cargados en el DTO,
+        con una consulta IN por tipo de entidad independientemente del número
+        de bugs.
+        """
+        missing_system_ids = {
+            bug.system_id for bug in bugs_dto if not bug.system_name and bug.system_id
+        }
+        missing_requirement_ids = {
+            req_id
+            for bug in bugs_dto
+            if not bug.requirement_codes
+            for req_id in bug.requirements
+        }
+        return {
+            "system": self._resolve_ids("system", missing_system_ids),
+            "requirement": self._resolve_ids("requirement", missing_requirement_ids),
+        }
+
+    def _enrich_bugs_for_table(
+        self, bugs_dto: list[BugServiceDTO]
+    ) -> list[BugTableDTO]:
+        """Enriquece una lista de bugs con un número constante de consultas."""
+        lookups = self._build_bug_lookups(bugs_dto)
+        return [self._enrich_bug_for_table(bug, lookups) for bug in bugs_dto]
+
+    def _enrich_bug_for_table(
+        self, bug_dto: BugServiceDTO, lookups: dict | None = None
+    ) -> BugTableDTO:
+        """Enriquece un BugServiceDTO con datos para la tabla UI.
+
+        Args:
+            bug_dto (BugServiceDTO): bug a enriquecer.
+            lookups (dict | None): diccionarios {id: nombre} por tipo de entidad
+                generados con `_build_bug_lookups`. Si es None se resuelven solo
+                los datos de este bug.
+        """
         try:
+            if lookups is None:
+                lookups = self._build_bug_lookups([bug_dto])
+
             system_name = bug_dto.system_name
             requirement_codes = bug_dto.requirement_codes
 
             if not system_name and bug_dto.system_id:
-                system_name = self._get_system_name(bug_dto.system_id)
+                system_name = lookups["system"].get(bug_dto.system_id, "Unknown")
 
             if not requirement_codes and bug_dto.requirements:
                 requirement_codes = [
-                    self._get_requirement_code(req_id)
+                    lookups["requirement"].get(req_id, "Unknown")
                     for req_id in bug_dto.requirements
                 ]
 
@@ -154,20 +295,21 @@ class BugService(BaseService):
     def get_bugs_by_status(self, status: str) -> list[Bug]:
         """Obtiene bugs por estado."""
         self._log_operation("get_by_status", "Bug")
-        with self.app_context.get_unit_of_work_context() as uow:
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
             return uow.bug_repo.get_bugs_by_status(status)
 
+    @read_only
     def get_bugs_by_status_for_table(self, status: str) -> list[BugTableDTO]:
         """Obtiene bugs por estado enriquecidos para tabla UI."""
         bugs = self.get_bugs_by_status(status)
         bugs_service_dto = [BugServiceDTO.from_model(bug) for bug in bugs]
-        return [self._enrich_bug_for_table(bug_dto) for bug_dto in bugs_service_dto]
+        return self._enrich_bugs_for_table(bugs_service_dto)
 
     def get_bug_history_dto(self, bug_id) -> list[BugHistoryTableDTO]:
         """Obtiene el historial de un bug listo para mostrar en formulario."""
         self._log_operation("get_bug_history_dto", "Bug")
         # Obtener el historial de un bug segun su id
-        with self.app_context.get_unit_of_work_context() as uow:
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
             history = uow.bug_repo.get_with_history(bug_id).history
 
             return [
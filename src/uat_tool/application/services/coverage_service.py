@@ -0,0 +1,49 @@
+"""
+Cobertura y trazabilidad de requisitos.
+
+Para cada requisito de un entorno: pasos que lo prueban, ejecuciones de esos
+pasos (con resultado, superadas, fallidas) y bugs abiertos vinculados. Todo
+se agrega en la BD (`RequirementRepository.get_coverage`) sin recorrer las
+relaciones del ORM, así que el coste es una consulta independientemente del
+número de requisitos y ejecuciones.
+"""
+
+from collections import Counter
+
+from uat_tool.application.dto import RequirementCoverageDTO
+from uat_tool.application.services.base_service import BaseService
+from uat_tool.shared import get_logger
+
+logger = get_logger(__name__)
+
+
+class CoverageService(BaseService):
+    """Servicio de cobertura de requisitos (matriz de trazabilidad)."""
+
+    def get_requirement_coverage(
+        self, environment_id: int, campaign_run_id: int | None = None
+    ) -> list[RequirementCoverageDTO]:
+        """Cobertura de todos los requisitos de un entorno, ordenada por código.
+
+        Args:
+            environment_id: entorno de los requisitos
+            campaign_run_id: limita ejecuciones y bugs a esa ejecución de campaña
+
+        Returns:
+            list[RequirementCoverageDTO]: una fila por requisito
+        """
+        self._log_operation("coverage", "Requirement")
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
+            rows = uow.req_repo.get_coverage(environment_id, campaign_run_id)
+        coverage = [RequirementCoverageDTO.from_row(row) for row in rows]
+        logger.info(
+            "Cobertura calculada para %i requisitos del entorno %i",
+            len(coverage),
+            environment_id,
+        )
+        return coverage
+
+    @staticmethod
+    def count_by_status(coverage: list[RequirementCoverageDTO]) -> dict[str, int]:
+        """Número de requisitos por estado de cobertura."""
+        return dict(Counter(item.status for item in coverage))
@@ -0,0 +1,91 @@
+"""
+Progreso de las ejecuciones de campaña y de caso.
+
+El progreso (pasos totales, superados y fallidos) se lee de contadores
+materializados en `campaign_runs` y `case_runs` que mantienen triggers sobre
+`step_runs` (ver `infrastructure.database.counters`), así que consultar el
+progreso de una ejecución es una lectura de una fila, sin cargar ni contar
+sus pasos, y registrar un resultado actualiza los contadores en la misma
+transacción.
+"""
+
+from dataclasses import asdict
+
+from uat_tool.application.dto import RunProgressDTO, StepResultDTO
+from uat_tool.application.services.base_service import BaseService
+from uat_tool.shared import get_logger
+
+logger = get_logger(__name__)
+
+
+class ExecutionService(BaseService):
+    """Servicio de progreso y resultados de ejecuciones."""
+
+    def get_campaign_run_progress(self, campaign_run_id: int) -> RunProgressDTO:
+        """Progreso de una ejecución de campaña.
+
+        Raises:
+            ValueError: si la ejecución de campaña no existe
+        """
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
+            row = uow.campaign_run_repo.get_progress(campaign_run_id)
+        if row is None:
+            raise ValueError(f"Ejecución de campaña no encontrada: {campaign_run_id}")
+        return RunProgressDTO.from_row(row)
+
+    def get_campaign_runs_progress(self, campaign_id: int) -> list[RunProgressDTO]:
+        """Progreso de todas las ejecuciones de una campaña, la más reciente primero."""
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
+            rows = uow.campaign_run_repo.get_progress_by_campaign(campaign_id)
+        return [RunProgressDTO.from_row(row) for row in rows]
+
+    def get_case_runs_progress(self, campaign_run_id: int) -> list[RunProgressDTO]:
+        """Progreso de cada case run de una ejecución de campaña."""
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
+            rows = uow.case_run_repo.get_progress_by_campaign_run(campaign_run_id)
+        return [RunProgressDTO.from_row(row) for row in rows]
+
+    def record_step_result(
+        self, step_run_id: int, passed: bool, notes: str | None = None
+    ) -> RunProgressDTO:
+        """Registra el resultado de un paso ejecutado.
+
+        Returns:
+            RunProgressDTO: progreso de su ejecución de campaña tras el cambio
+        """
+        self._log_operation("update", "StepRun", step_run_id)
+        with self.app_context.get_unit_of_work_context() as uow:
+            step_run = uow.step_run_repo.update_step_result(step_run_id, passed, notes)
+            # El trigger ya ha actualizado los contadores en esta transacción
+            row = uow.campaign_run_repo.get_progress(step_run.campaign_run_id)
+        logger.info(
+            "Resultado del step run %i registrado (%s)",
+            step_run_id,
+            "passed" if passed else "failed",
+        )
+        return RunProgressDTO.from_row(row)
+
+    def record_step_results(
+        self, results: list[StepResultDTO], campaign_run_id: int | None = None
+    ) -> RunProgressDTO:
+        """Registra los resultados de varios pasos en una sola transacción.
+
+        Todos los pasos deben pertenecer a la misma ejecución de campaña (la
+        indicada, si se pasa `campaign_run_id`); si no, no se registra ninguno.
+
+        Returns:
+            RunProgressDTO: progreso de la ejecución de campaña tras el cambio
+
+        Raises:
+            ValueError: si algún paso no existe o no pertenece a la ejecución
+        """
+        self._log_operation("update", "StepRun")
+        with self.app_context.get_unit_of_work_context() as uow:
+            run_id = uow.step_run_repo.update_step_results(
+                [asdict(result) for result in results], campaign_run_id
+            )
+            row = uow.campaign_run_repo.get_progress(run_id)
+        logger.info(
+            "Registrados %i resultados en la ejecución de campaña %i", len(results), run_id
+        )
+        return RunProgressDTO.from_row(row)
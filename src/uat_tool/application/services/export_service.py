@@ -0,0 +1,217 @@
+"""
+Exportación de las tablas de bugs y requisitos a CSV o XLSX.
+
+Las filas se leen de la BD por lotes (`yield_per`), se enriquecen por lote y
+se escriben en el archivo en cuanto llegan, así que exportar 500.000 bugs
+usa la misma memoria que exportar 1.000. El archivo se escribe primero con
+extensión `.part` y solo se renombra al terminar, de modo que un error a
+mitad no deja un archivo incompleto con el nombre final.
+
+Uso sin interfaz gráfica:
+    python -m uat_tool export bugs bugs.xlsx
+"""
+
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from uat_tool.application.services.base_service import BaseService
+from uat_tool.infrastructure import open_table_writer
+from uat_tool.shared import get_logger
+
+logger = get_logger(__name__)
+
+# Filas leídas, enriquecidas y escritas por lote
+EXPORT_BATCH_SIZE = 1000
+
+# Recibe (filas exportadas, total de filas)
+ProgressCallback = Callable[[int, int], None]
+
+# Columnas de cada tabla: (cabecera, atributo del TableDTO)
+BUG_EXPORT_COLUMNS: list[tuple[str, str]] = [
+    ("Id", "id"),
+    ("Status", "status"),
+    ("System", "system"),
+    ("Version", "system_version"),
+    ("Creation Time", "created_at"),
+    ("Last Update", "updated_at"),
+    ("Modified By", "modified_by"),
+    ("ServiceNow ID", "service_now_id"),
+    ("Campaign", "campaign_run"),
+    ("Requirements", "requirements"),
+    ("Short Description", "short_description"),
+    ("Definition", "definition"),
+    ("Urgency", "urgency"),
+    ("Impact", "impact"),
+    ("Comments", "comments"),
+    ("Associated files", "file_names"),
+]
+
+REQUIREMENT_EXPORT_COLUMNS: list[tuple[str, str]] = [
+    ("Id", "id"),
+    ("Code", "code"),
+    ("Definition", "definition"),
+    ("Systems", "systems"),
+    ("Sections", "sections"),
+    ("Creation Time", "created_at"),
+    ("Last Update", "updated_at"),
+    ("Last Modified By", "modified_by"),
+]
+
+# Columnas de la matriz de cobertura: (cabecera, atributo del RequirementCoverageDTO)
+COVERAGE_EXPORT_COLUMNS: list[tuple[str, str]] = [
+    ("Code", "code"),
+    ("Status", "status"),
+    ("Steps", "steps"),
+    ("Step Runs", "step_runs"),
+    ("Executed", "executed"),
+    ("Passed", "passed"),
+    ("Failed", "failed"),
+    ("Not Run", "not_run"),
+    ("Open Bugs", "open_bugs"),
+]
+
+# Tablas exportables (método `export_<tabla>` de ExportService)
+EXPORT_TABLES = ("bugs", "requirements")
+
+
+class ExportService(BaseService):
+    """Servicio de exportación de tablas a archivo."""
+
+    def export_bugs(
+        self,
+        path: str | Path,
+        progress: ProgressCallback | None = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> int:
+        """Exporta todos los bugs con las columnas de la tabla de la UI.
+
+        Args:
+            path: archivo de destino (.csv o .xlsx)
+            progress: callback opcional llamado tras cada lote
+            batch_size: bugs por lote
+
+        Returns:
+            int: número de bugs exportados
+        """
+        self._log_operation("export", "Bug")
+        bug_service = self.app_context.get_service("bug_service")
+        return self._export(
+            path,
+            BUG_EXPORT_COLUMNS,
+            total=bug_service.count_bugs(),
+            # La tabla exportada no incluye el historial
+            batches=bug_service.iter_bugs_for_table(batch_size, include_history=False),
+            progress=progress,
+        )
+
+    def export_requirements(
+        self,
+        path: str | Path,
+        progress: ProgressCallback | None = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> int:
+        """Exporta todos los requisitos con las columnas de la tabla de la UI.
+
+        Args:
+            path: archivo de destino (.csv o .xlsx)
+            progress: callback opcional llamado tras cada lote
+            batch_size: requisitos por lote
+
+        Returns:
+            int: número de requisitos exportados
+        """
+        self._log_operation("export", "Requirement")
+        requirement_service = self.app_context.get_service("requirement_service")
+        return self._export(
+            path,
+            REQUIREMENT_EXPORT_COLUMNS,
+            total=requirement_service.count_requirements(),
+            batches=requirement_service.iter_requirements_for_table(batch_size),
+            progress=progress,
+        )
+
+    def export_coverage(
+        self,
+        path: str | Path,
+        environment_id: int,
+        campaign_run_id: int | None = None,
+        progress: ProgressCallback | None = None,
+    ) -> int:
+        """Exporta la matriz de cobertura de requisitos de un entorno.
+
+        La cobertura se calcula de una vez en SQL (ver CoverageService), así
+        que se escribe en un único lote.
+
+        Returns:
+            int: número de requisitos exportados
+        """
+        self._log_operation("export", "Coverage")
+        coverage_service = self.app_context.get_service("coverage_service")
+        coverage = coverage_service.get_requirement_coverage(
+            environment_id, campaign_run_id
+        )
+        return self._export(
+            path,
+            COVERAGE_EXPORT_COLUMNS,
+            total=len(coverage),
+            batches=(batch for batch in [coverage]),
+            progress=progress,
+        )
+
+    def export_table(
+        self,
+        table: str,
+        path: str | Path,
+        progress: ProgressCallback | None = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> int:
+        """Exporta una tabla por nombre ("bugs" o "requirements").
+
+        Raises:
+            ValueError: si la tabla no es exportable
+        """
+        if table not in EXPORT_TABLES:
+            raise ValueError(f"Tabla no exportable: {table}")
+        return getattr(self, f"export_{table}")(path, progress, batch_size)
+
+    def _export(
+        self,
+        path: str | Path,
+        columns: list[tuple[str, str]],
+        total: int,
+        batches: Iterator[list],
+        progress: ProgressCallback | None,
+    ) -> int:
+        """Escribe los lotes de TableDTOs en `path` a través de un `.part`."""
+        path = Path(path)
+        part_path = path.with_name(path.name + ".part")
+        headers = [header for header, _ in columns]
+        attributes = [attribute for _, attribute in columns]
+
+        try:
+            # Valida la extensión antes de empezar a leer la BD
+            writer = open_table_writer(part_path, headers, file_format=path.suffix)
+        except ValueError:
+            batches.close()
+            raise
+
+        try:
+            with writer:
+                if progress:
+                    progress(0, total)
+                for batch in batches:
+                    writer.write_rows(
+                        [getattr(item, attr) for attr in attributes] for item in batch
+                    )
+                    if progress:
+                        progress(writer.rows_written, max(total, writer.rows_written))
+            part_path.replace(path)
+        except Exception as e:
+            batches.close()
+            part_path.unlink(missing_ok=True)
+            logger.error("Error exportando a %s: %s", path, e)
+            raise
+
+        logger.info("Exportadas %i filas a %s", writer.rows_written, path)
+        return writer.rows_written
+
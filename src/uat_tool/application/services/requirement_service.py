@@ -1,14 +1,28 @@
+import re
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
 from uat_tool.application.dto import (
+    RequirementImportErrorDTO,
+    RequirementImportResultDTO,
     RequirementServiceDTO,
     RequirementTableDTO,
 )
 from uat_tool.application.dto.requirement_dto import RequirementFormDTO
-from uat_tool.application.services.base_service import BaseService
+from uat_tool.application.services.base_service import BaseService, read_only
 from uat_tool.domain import Requirement
+from uat_tool.infrastructure import SearchHit, read_table_records
 from uat_tool.shared import get_logger
 
 logger = get_logger(__name__)
 
+# Separadores de los nombres de sistemas y secciones en una celda de CSV
+_NAME_SEPARATORS = re.compile(r"[,;|]")
+
+# Valor de una celda vacía en las exportaciones (ver RequirementTableDTO)
+_EMPTY_CELL = "N/A"
+
 
 class RequirementService(BaseService):
     """Servicio para manejar la lógica de negocio de Requisitos."""
@@ -16,15 +30,15 @@ class RequirementService(BaseService):
     # --- MÉTODOS BÁSICOS (para la lógica de negocio y otros servicios) ---
 
     def get_all_requirements(self) -> list[Requirement]:
-        """Obtiene todos los requisitos como objetos SQLAlchemy (para lógica de negocio)."""
+        """Obtiene todos los requisitos como modelos SQLAlchemy (lógica de negocio)."""
         self._log_operation("get_all", "Requirement")
-        with self.app_context.get_unit_of_work_context() as uow:
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
             return uow.req_repo.get_all_with_relations()
 
     def get_all_requirements_service_dto(self) -> list[RequirementServiceDTO]:
         """Obtiene todos los requisitos como DTOs."""
         self._log_operation("get_all", "Requirement")
-        with self.app_context.get_unit_of_work_context() as uow:
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
             requirements_model = uow.req_repo.get_all_with_relations()
             # Convertir a DTOs DENTRO del contexto de sesión
             return [RequirementServiceDTO.from_model(req) for req in requirements_model]
@@ -32,7 +46,7 @@ class RequirementService(BaseService):
     def get_requirement_by_id(self, requirement_id: int) -> Requirement | None:
         """Obtiene un requisito como objeto SQLAlchemy (para edición)."""
         self._log_operation("get_by_id", "Requirement", requirement_id)
-        with self.app_context.get_unit_of_work_context() as uow:
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
             return uow.req_repo.get_with_relations(requirement_id)
 
     def get_requirement_dto_by_id(
@@ -40,7 +54,7 @@ class RequirementService(BaseService):
     ) -> RequirementServiceDTO | None:
         """Obtiene un requisito como ServiceDTO."""
         self._log_operation("get_by_id", "Requirement", requirement_id)
-        with self.app_context.get_unit_of_work_context() as uow:
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
             requirement = uow.req_repo.get_with_relations(requirement_id)
             return (
                 RequirementServiceDTO.from_model(requirement) if requirement else None
@@ -49,30 +63,114 @@ class RequirementService(BaseService):
     # --- MÉTODOS ENRIQUECIDOS (específicos para UI) ---
 
     def get_all_requirements_for_table(self) -> list[RequirementTableDTO]:
-        """Obtiene todos los requisitos enriquecidos para mostrar en la tabla UI."""
+        """Obtiene todos los requisitos enriquecidos para mostrar en la tabla UI.
+
+        Igual que `BugService.get_all_bugs_for_table`: proyección SQL con los
+        nombres de sistemas y secciones ya agregados, sin cargar modelos.
+        """
         self._log_operation("get_all_for_table", "Requirement")
-        with self.app_context.get_unit_of_work_context() as uow:
-            requirements = uow.req_repo.get_all_with_relations()
-            requirements_dto = [
-                RequirementServiceDTO.from_model(req) for req in requirements
-            ]
-        return [self._enrich_requirement_for_table(req) for req in requirements_dto]
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
+            rows = uow.req_repo.get_all_table_rows()
+        return [RequirementTableDTO.from_row(row) for row in rows]
+
+    def iter_requirements_for_table(
+        self, batch_size: int
+    ) -> Iterator[list[RequirementTableDTO]]:
+        """Recorre todos los requisitos enriquecidos para la tabla, por lotes.
+
+        Igual que `BugService.iter_bugs_for_table`: filas de la tabla leídas
+        con `yield_per` y con los nombres de sistemas y secciones agregados.
+
+        Args:
+            batch_size: requisitos por lote
+
+        Yields:
+            list[RequirementTableDTO]: requisitos del lote, ordenados por ID
+        """
+        self._log_operation("iter_for_table", "Requirement")
+        # Sesión privada: queda abierta mientras el generador está suspendido
+        with self.app_context.get_unit_of_work_context(
+            read_only=True, private=True
+        ) as uow:
+            for rows in uow.req_repo.iter_table_rows(batch_size):
+                yield [RequirementTableDTO.from_row(row) for row in rows]
+
+    def count_requirements(self) -> int:
+        """Número total de requisitos."""
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
+            return uow.req_repo.count()
+
+    def search_requirements(self, search_text: str) -> list[SearchHit]:
+        """Busca requisitos por código y definición (FTS5).
+
+        Returns:
+            list[SearchHit]: IDs ordenados por relevancia con un fragmento del texto
+        """
+        self._log_operation("search", "Requirement")
+        with self.app_context.get_unit_of_work_context(read_only=True) as uow:
+            return uow.req_repo.search(search_text)
+
+    def _build_requirement_lookups(
+        self, requirements_dto: list[RequirementServiceDTO]
+    ) -> dict:
+        """Resuelve por lotes los nombres de sistemas y secciones que falten.
+
+        Solo se consultan los IDs cuyos nombres no vengan ya cargados en el DTO,
+        con una consulta IN por tipo de entidad independientemente del número
+        de requisitos.
+        """
+        missing_system_ids = {
+            sys_id
+            for req in requirements_dto
+            if not req.system_names
+            for sys_id in req.systems
+        }
+        missing_section_ids = {
+            section_id
+            for req in requirements_dto
+            if not req.section_names
+            for section_id in req.sections
+        }
+        return {
+            "system": self._resolve_ids("system", missing_system_ids),
+            "section": self._resolve_ids("section", missing_section_ids),
+        }
+
+    def _enrich_requirements_for_table(
+        self, requirements_dto: list[RequirementServiceDTO]
+    ) -> list[RequirementTableDTO]:
+        """Enriquece una lista de requisitos con un número constante de consultas."""
+        lookups = self._build_requirement_lookups(requirements_dto)
+        return [
+            self._enrich_requirement_for_table(req, lookups) for req in requirements_dto
+        ]
 
     def _enrich_requirement_for_table(
-        self, requirement_dto: RequirementServiceDTO
+        self, requirement_dto: RequirementServiceDTO, lookups: dict | None = None
     ) -> RequirementTableDTO:
-        """Enriquece un Requirement directamente con sus relaciones cargadas."""
+        """Enriquece un Requirement directamente con sus relaciones cargadas.
+
+        Args:
+            requirement_dto (RequirementServiceDTO): requisito a enriquecer.
+            lookups (dict | None): diccionarios {id: nombre} por tipo de entidad
+                generados con `_build_requirement_lookups`. Si es None se
+                resuelven solo los datos de este requisito.
+        """
         try:
+            if lookups is None:
+                lookups = self._build_requirement_lookups([requirement_dto])
+
             system_names = requirement_dto.system_names
             section_names = requirement_dto.section_names
 
             if not system_names and requirement_dto.systems:
                 system_names = [
-                    self._get_system_name(sys_id) for sys_id in requirement_dto.systems
+                    lookups["system"].get(sys_id, "Unknown")
+                    for sys_id in requirement_dto.systems
                 ]
             if not section_names and requirement_dto.sections:
                 section_names = [
-                    self._get_section_name(section_id)
+                    lookups["section"].get(section_id, "Unknown")
                     for section_id in requirement_dto.sections
                 ]
 
@@ -137,6 +235,135 @@ class RequirementService(BaseService):
             )
             return RequirementServiceDTO.from_model(requirement_with_relations)
 
+    # --- IMPORTACIÓN MASIVA ---
+
+    def import_requirements_file(
+        self, path: str | Path, context: dict
+    ) -> RequirementImportResultDTO:
+        """Importa los requisitos de un CSV o JSON (ver `import_requirements`).
+
+        Raises:
+            ValueError: si el formato del archivo no está soportado
+        """
+        return self.import_requirements(read_table_records(path), context)
+
+    def import_requirements(
+        self, records: list[dict[str, Any]], context: dict
+    ) -> RequirementImportResultDTO:
+        """Crea muchos requisitos de una vez con validación por conjuntos.
+
+        Cada registro tiene `code`, `definition`, `systems` y `sections`; los
+        sistemas y secciones se dan por nombre (lista o texto separado por
+        comas) y se resuelven con la caché de referencia sin tocar la BD. Los
+        códigos repetidos se detectan en el propio archivo y contra el entorno
+        con una consulta IN, y los válidos se insertan en bloque con
+        `RequirementRepository.bulk_create`.
+
+        Las filas inválidas se devuelven como errores sin abortar el resto.
+
+        Args:
+            records: registros leídos del archivo (claves en minúsculas)
+            context: `modified_by` y `environment_id`, como en los formularios
+
+        Returns:
+            RequirementImportResultDTO: IDs creados y errores por fila
+        """
+        self._log_operation("import", "Requirement")
+        result = RequirementImportResultDTO(total=len(records))
+        system_ids = self._ids_by_name("system")
+        section_ids = self._ids_by_name("section")
+
+        candidates: list[tuple[int, RequirementServiceDTO]] = []
+        seen_codes: set[str] = set()
+        for row, record in enumerate(records, start=1):
+            code = str(record.get("code") or "").strip()
+            try:
+                form_dto = RequirementFormDTO(
+                    id=None,
+                    le_code=code,
+                    le_definition=str(record.get("definition") or "").strip(),
+                    lw_systems=self._names_to_ids(
+                        record.get("systems"), system_ids, "Sistemas no encontrados"
+                    ),
+                    lw_sections=self._names_to_ids(
+                        record.get("sections"), section_ids, "Secciones no encontradas"
+                    ),
+                )
+                if not form_dto.lw_systems:
+                    raise ValueError(
+                        "Un requisito debe estar asociado a al menos un sistema."
+                    )
+                if not form_dto.lw_sections:
+                    raise ValueError(
+                        "Un requisito debe estar asociado a al menos una sección."
+                    )
+                if code in seen_codes:
+                    raise ValueError("Código repetido en el archivo")
+            except ValueError as e:
+                result.errors.append(RequirementImportErrorDTO(row, code, str(e)))
+                continue
+
+            seen_codes.add(code)
+            candidates.append((row, form_dto.to_service_dto(context)))
+
+        with self.app_context.get_unit_of_work_context() as uow:
+            existing = uow.req_repo.get_existing_codes(
+                seen_codes, context["environment_id"]
+            )
+            valid = []
+            for row, service_dto in candidates:
+                if service_dto.code in existing:
+                    result.errors.append(
+                        RequirementImportErrorDTO(
+                            row, service_dto.code, "El código ya existe en el entorno"
+                        )
+                    )
+                else:
+                    valid.append(service_dto.to_dict())
+
+            ids_by_code = uow.req_repo.bulk_create(
+                valid, context["environment_id"], context["modified_by"]
+            )
+
+        result.created_ids = [ids_by_code[row["code"]] for row in valid]
+        result.errors.sort(key=lambda error: error.row)
+        logger.info(
+            "Importados %i de %i requisitos (%i errores)",
+            result.created,
+            result.total,
+            len(result.errors),
+        )
+        return result
+
+    def _ids_by_name(self, entity_type: str) -> dict[str, int]:
+        """{nombre en minúsculas: ID} de un tipo de datos de referencia."""
+        names = self.app_context.get_reference_cache().get_names(entity_type)
+        return {name.casefold(): entity_id for entity_id, name in names.items()}
+
+    @staticmethod
+    def _names_to_ids(
+        value, ids_by_name: dict[str, int], error_message: str
+    ) -> list[int]:
+        """Convierte una lista (o texto separado por comas) de nombres en IDs.
+
+        Raises:
+            ValueError: si algún nombre no existe
+        """
+        if isinstance(value, str):
+            value = _NAME_SEPARATORS.split(value)
+        names = [
+            str(name).strip()
+            for name in value or []
+            if str(name).strip() != _EMPTY_CELL
+        ]
+        names = [name for name in names if name]
+
+        missing = [name for name in names if name.casefold() not in ids_by_name]
+        if missing:
+            raise ValueError(f"{error_message}: {', '.join(missing)}")
+        return list(dict.fromkeys(ids_by_name[name.casefold()] for name in names))
+
+    @read_only
     def get_requirement_for_edit(
         self, requirement_id: int
     ) -> RequirementFormDTO | None:
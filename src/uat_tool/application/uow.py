@@ -1,6 +1,37 @@
-from collections.abc import Generator
-from contextlib import contextmanager
+"""
+Unidad de trabajo: una sesión y los repositorios que la comparten.
 
+`unit_of_work` abre una sesión con la factoría indicada (la del
+ApplicationContext en los servicios), confirma al salir sin errores y
+revierte si hay una excepción. Es reentrante: dentro de una unidad de trabajo
+abierta (en el mismo hilo y con la misma factoría), las llamadas anidadas
+reutilizan la misma sesión y transacción, de modo que un servicio que llama a
+otro servicio confirma todo junto al salir de la unidad de trabajo externa.
+Si una unidad anidada falla, la transacción entera se revierte aunque el
+llamador capture la excepción.
+
+Los repositorios se crean al acceder a ellos por primera vez: abrir una
+unidad de trabajo solo construye la sesión.
+
+Las unidades de solo lectura (`read_only=True`) nunca confirman: sin
+autoflush ni expire_on_commit, al salir se cierra la sesión, que libera la
+transacción de lectura sin coste de commit ni bloqueo de escritura. Cualquier
+flush dentro de ellas falla, también el de una unidad anidada que intente
+escribir; abrir una unidad de escritura dentro de una de solo lectura falla
+al entrar. Se pueden dirigir a otra factoría (p. ej. un pool de conexiones de
+solo lectura) con `read_session_factory`.
+
+Las unidades privadas (`private=True`) usan una sesión propia que no se
+publica como unidad activa: son las de los generadores, que quedan abiertas
+mientras el generador está suspendido y no deben capturar las unidades de
+trabajo que el llamador abra entre lote y lote.
+"""
+
+from collections.abc import Callable, Generator
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+from sqlalchemy import event
 from sqlalchemy.orm import Session as SQLAlchemySession
 from sqlalchemy.orm import scoped_session
 
@@ -27,52 +58,79 @@ from uat_tool.domain import (
     UhubUserRepository,
     UspaceRepository,
 )
-from uat_tool.infrastructure import get_session_factory
+from uat_tool.infrastructure import get_engine, get_query_profiler, get_session_factory
 
 
 class UnitOfWork:
     """Unidad de trabajo que agrupa todos los repositorios para transacciones
     atómicas.
-    """
 
-    def __init__(self, session: SQLAlchemySession | scoped_session):
-        self.session = session
+    Los repositorios (`bug_repo`, `req_repo`...) se construyen al primer
+    acceso y quedan guardados en la instancia.
+    """
 
+    _REPOSITORIES = {
         # Repositorios de ejecución
-        self.campaign_run_repo = CampaignRunRepository(session)
-        self.case_run_repo = CaseRunRepository(session)
-        self.step_run_repo = StepRunRepository(session)
-
+        "campaign_run_repo": CampaignRunRepository,
+        "case_run_repo": CaseRunRepository,
+        "step_run_repo": StepRunRepository,
         # Repositorios de gestión de tests
-        self.campaign_repo = CampaignRepository(session)
-        self.block_repo = BlockRepository(session)
-        self.case_repo = CaseRepository(session)
-        self.step_repo = StepRepository(session)
-
+        "campaign_repo": CampaignRepository,
+        "block_repo": BlockRepository,
+        "case_repo": CaseRepository,
+        "step_repo": StepRepository,
         # Repositorio de bugs
-        self.bug_repo = BugRepository(session)
-
+        "bug_repo": BugRepository,
         # Repositorio de requisitos
-        self.req_repo = RequirementRepository(session)
-
+        "req_repo": RequirementRepository,
         # Repositorios auxiliares
-        self.env_repo = EnvironmentRepository(session)
-        self.sys_repo = SystemRepository(session)
-        self.section_repo = SectionRepository(session)
-        self.reason_repo = ReasonRepository(session)
-        self.file_repo = FileRepository(session)
-
+        "env_repo": EnvironmentRepository,
+        "sys_repo": SystemRepository,
+        "section_repo": SectionRepository,
+        "reason_repo": ReasonRepository,
+        "file_repo": FileRepository,
         # Repositorio de assets
-        self.email_repo = EmailRepository(session)
-        self.ope_repo = OperatorRepository(session)
-        self.zone_repo = UasZoneRepository(session)
-        self.org_repo = UhubOrgRepository(session)
-        self.user_repo = UhubUserRepository(session)
-        self.uspace_repo = UspaceRepository(session)
-        self.drone_repo = DroneRepository(session)
+        "email_repo": EmailRepository,
+        "ope_repo": OperatorRepository,
+        "zone_repo": UasZoneRepository,
+        "org_repo": UhubOrgRepository,
+        "user_repo": UhubUserRepository,
+        "uspace_repo": UspaceRepository,
+        "drone_repo": DroneRepository,
+    }
+
+    def __init__(
+        self, session: SQLAlchemySession | scoped_session, read_only: bool = False
+    ):
+        self.session = session
+        self.read_only = read_only
+        # Una unidad anidada falló: la externa revierte en lugar de confirmar
+        self.rollback_only = False
+
+        if read_only:
+            # La sesión scoped del hilo se reutiliza: close() restaura su configuración
+            self._session_settings = (session.autoflush, session.expire_on_commit)
+            session.autoflush = False
+            session.expire_on_commit = False
+            event.listen(session, "before_flush", _reject_flush)
+
+    def __getattr__(self, name: str):
+        # Solo se llama si el atributo no existe: el primer acceso a un repositorio
+        repository_class = self._REPOSITORIES.get(name)
+        if repository_class is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        repository = repository_class(self.session)
+        setattr(self, name, repository)
+        return repository
 
     def commit(self):
         """Confirma todas las operaciones pendientes."""
+        if self.read_only:
+            raise RuntimeError(
+                "No se puede confirmar una unidad de trabajo de solo lectura"
+            )
         self.session.commit()
 
     def rollback(self):
@@ -81,6 +139,13 @@ class UnitOfWork:
 
     def close(self):
         """Cierra la sesión de forma segura para ambos tipos (scoped o no)."""
+        if self.read_only and event.contains(
+            self.session, "before_flush", _reject_flush
+        ):
+            event.remove(self.session, "before_flush", _reject_flush)
+            self.session.autoflush, self.session.expire_on_commit = (
+                self._session_settings
+            )
         try:
             # Priorizar remove para scoped sessions
             if hasattr(self.session, "remove"):
@@ -92,24 +157,104 @@ class UnitOfWork:
             print(f"Error cerrando sesión: {e}")
 
 
+def _reject_flush(_session, _flush_context, _instances):
+    raise RuntimeError("Escritura en una unidad de trabajo de solo lectura")
+
+
+# Unidad de trabajo abierta en el contexto actual (hilo) y su factoría
+_active_uow: ContextVar[tuple[Callable, UnitOfWork] | None] = ContextVar(
+    "active_unit_of_work", default=None
+)
+
+# Factoría por defecto de `unit_of_work()` y engine al que está ligada
+_default_factory: tuple[object, Callable] | None = None
+
+
+def _private_session(factory: Callable) -> SQLAlchemySession:
+    """Sesión nueva que no comparte la sesión scoped del hilo."""
+    if isinstance(factory, scoped_session):
+        return factory.session_factory()
+    return factory()
+
+
+def _get_default_session_factory() -> Callable:
+    """Factoría de sesiones del engine global, creada una vez por engine."""
+    global _default_factory  # pylint: disable=global-statement
+    engine = get_engine()
+    if _default_factory is None or _default_factory[0] is not engine:
+        _default_factory = (engine, get_session_factory(engine))
+    return _default_factory[1]
+
+
 @contextmanager
-def unit_of_work() -> Generator[UnitOfWork, None, None]:
+def unit_of_work(
+    session_factory: Callable | None = None,
+    read_only: bool = False,
+    read_session_factory: Callable | None = None,
+    private: bool = False,
+) -> Generator[UnitOfWork, None, None]:
     """Context manager para manejar la unidad de trabajo.
 
+    Args:
+        session_factory: factoría de sesiones; por defecto la del engine global
+        read_only: si True, la unidad de trabajo no escribe ni confirma
+        read_session_factory: factoría para las unidades de solo lectura;
+            por defecto `session_factory`
+        private: si True, usa una sesión propia que ni se anida en la unidad
+            activa ni la sustituye (para mantenerla abierta en un generador)
+
+    Raises:
+        RuntimeError: si se abre una unidad de escritura dentro de una de
+            solo lectura
+
     Usage:
     with unit_of_work() as uow:
         uow.bug_repo.create(...)
         # Commit automático al salir si no hay erorres
     """
-    session_factory = get_session_factory()
-    session = session_factory()
-    uow = UnitOfWork(session)
+    factory = session_factory or _get_default_session_factory()
+
+    active = None if private else _active_uow.get()
+    if active is not None and active[0] is factory:
+        # Anidada (de lectura o escritura): comparte sesión y transacción, así
+        # que las lecturas ven lo pendiente; la unidad externa confirma
+        uow = active[1]
+        if uow.read_only and not read_only:
+            raise RuntimeError(
+                "No se puede abrir una unidad de trabajo de escritura dentro "
+                "de una de solo lectura"
+            )
+        try:
+            yield uow
+        except Exception:
+            uow.rollback_only = True
+            raise
+        return
+
+    new_factory = (read_session_factory or factory) if read_only else factory
+    session = _private_session(new_factory) if private else new_factory()
+    uow = UnitOfWork(session, read_only=read_only)
+    token = None if private else _active_uow.set((factory, uow))
     try:
-        yield uow
-        uow.commit()
+        # Sentencias por unidad de trabajo (solo con el perfilador activo). Las
+        # privadas siguen abiertas entre lotes: el ámbito no puede abarcarlas
+        scope = nullcontext() if private else get_query_profiler().scope("unit_of_work")
+        with scope:
+            yield uow
+            # Las de solo lectura no confirman: close() termina la transacción
+            if not uow.read_only:
+                if uow.rollback_only:
+                    raise RuntimeError(
+                        "Una unidad de trabajo anidada falló: se revierte la transacción"
+                    )
+                # Sin ninguna consulta no hay transacción que confirmar
+                if uow.session.in_transaction():
+                    uow.commit()
 
     except Exception:
         uow.rollback()
         raise
     finally:
+        if token is not None:
+            _active_uow.reset(token)
         uow.close()
@@ -0,0 +1,16 @@
+"""
+Paquete `benchmarks`
+
+Mediciones de rendimiento reproducibles fuera de la GUI:
+
+- sqlite_profiles: Latencia de commit y lectura concurrente por perfil de PRAGMAs
+- datasets: Generador de datos sintéticos deterministas (escalas 1k/10k/100k)
+- services: Tiempos y sentencias SQL de los servicios principales, comparables
+  entre commits
+- startup: Tiempo de import de la GUI desglosado por paquete y módulo
+- uow: Coste fijo de abrir y cerrar una unidad de trabajo
+
+Cada benchmark expone una función `run_*` que devuelve un diccionario
+serializable a JSON y se ejecuta como módulo (`python -m uat_tool.benchmarks.X`).
+Los submódulos no se importan aquí para no cargarlos dos veces con `-m`.
+"""
@@ -0,0 +1,729 @@
+"""
+Generador de datos sintéticos deterministas para benchmarks.
+
+Llena una BD vacía (con el esquema y los datos iniciales de `init_db`) con un
+entorno completo a la escala indicada: requisitos, casos con pasos, bloques,
+campañas con ejecuciones y resultados, bugs con historial, requisitos y
+adjuntos, y activos (emails, operadores, drones, organizaciones, usuarios,
+zonas UAS y U-spaces). Con la misma escala y semilla se generan exactamente
+los mismos datos, así que los resultados son comparables entre commits.
+
+Las filas se insertan con Core en bloques (executemany), sin pasar por el
+ORM; los triggers de búsqueda y de contadores se ejecutan igual que en uso
+real.
+
+Uso:
+    python -m uat_tool.benchmarks.datasets --scale 10k --output bench_10k.db
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import islice
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, insert, select
+
+from uat_tool.domain import (
+    Block,
+    Bug,
+    BugHistory,
+    Campaign,
+    CampaignRun,
+    Case,
+    CaseRun,
+    Drone,
+    Email,
+    Environment,
+    File,
+    Operator,
+    Reason,
+    Requirement,
+    Section,
+    Step,
+    StepRun,
+    System,
+    UasZone,
+    UhubOrg,
+    UhubUser,
+    Uspace,
+    block_cases,
+    bug_requirements,
+    campaign_blocks,
+    case_sections,
+    case_systems,
+    requirement_sections,
+    requirement_systems,
+    step_requirements,
+    zone_organization,
+    zone_reasons,
+)
+from uat_tool.infrastructure import apply_sqlite_profile, chunked, init_db
+
+# Filas por sentencia INSERT (executemany)
+INSERT_BATCH_SIZE = 10_000
+
+DEFAULT_SEED = 0
+
+ENVIRONMENT_NAME = "BENCH"
+
+# Fecha de las filas generadas (fija para que los datos sean deterministas)
+BASE_TIME = datetime(2024, 1, 1)
+
+_WORDS = (
+    "validación zona vuelo dron operador autorización trayectoria conflicto "
+    "alerta registro mapa usuario organización geocerca altitud sensor "
+    "telemetría tracking emergencia meteorología servicio interfaz mensaje "
+    "error conexión tiempo espera respuesta solicitud plan aprobado rechazado"
+).split()
+
+_BUG_STATUSES = (
+    "OPEN",
+    "OPEN",
+    "PENDING",
+    "ON HOLD",
+    "CLOSED SOLVED",
+    "CLOSED UNSOLVED",
+)
+
+
+@dataclass(frozen=True)
+class DatasetScale:
+    """Volumen de cada entidad del dataset sintético."""
+
+    requirements: int
+    cases: int
+    steps_per_case: int
+    cases_per_block: int
+    campaigns: int
+    runs_per_campaign: int
+    bugs: int
+    history_per_bug: int
+    attachment_every: int  # Un bug de cada N tiene adjunto
+    assets: int  # Emails, operadores, usuarios y zonas UAS
+
+
+SCALES: dict[str, DatasetScale] = {
+    "1k": DatasetScale(
+        requirements=1_000,
+        cases=200,
+        steps_per_case=5,
+        cases_per_block=10,
+        campaigns=4,
+        runs_per_campaign=1,
+        bugs=1_000,
+        history_per_bug=2,
+        attachment_every=5,
+        assets=50,
+    ),
+    "10k": DatasetScale(
+        requirements=10_000,
+        cases=2_000,
+        steps_per_case=5,
+        cases_per_block=20,
+        campaigns=4,
+        runs_per_campaign=2,
+        bugs=10_000,
+        history_per_bug=2,
+        attachment_every=5,
+        assets=200,
+    ),
+    "100k": DatasetScale(
+        requirements=100_000,
+        cases=20_000,
+        steps_per_case=5,
+        cases_per_block=50,
+        campaigns=4,
+        runs_per_campaign=3,
+        bugs=100_000,
+        history_per_bug=2,
+        attachment_every=5,
+        assets=1_000,
+    ),
+}
+
+
+def get_scale(scale: str | DatasetScale) -> DatasetScale:
+    """Devuelve la escala por nombre (o la propia escala si ya lo es).
+
+    Raises:
+        ValueError: si el nombre no está en `SCALES`
+    """
+    if isinstance(scale, DatasetScale):
+        return scale
+    if scale not in SCALES:
+        raise ValueError(
+            f"Escala desconocida: {scale} (disponibles: {', '.join(SCALES)})"
+        )
+    return SCALES[scale]
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize()
+
+
+def _insert(connection, table, rows: Iterable[dict]) -> int:
+    """Inserta las filas por bloques y devuelve el ID de la primera fila.
+
+    La BD es nueva y SQLite asigna los IDs consecutivos a partir del máximo,
+    así que los IDs de las filas insertadas son `first_id + i`.
+    """
+    first_id = None
+    if "id" in table.c:
+        first_id = (connection.execute(select(func.max(table.c.id))).scalar() or 0) + 1
+    # Por bloques sin materializar todas las filas (millones en la escala 100k)
+    rows = iter(rows)
+    while batch := list(islice(rows, INSERT_BATCH_SIZE)):
+        connection.execute(insert(table), batch)
+    return first_id
+
+
+def _all_ids(connection, model) -> list[int]:
+    return list(connection.execute(select(model.id).order_by(model.id)).scalars())
+
+
+def _links(rng, left_ids: Iterable[int], right_ids: list[int], low: int, high: int):
+    """Pares (izquierda, derecha) con entre `low` y `high` enlaces distintos por fila."""
+    for left_id in left_ids:
+        for right_id in set(rng.sample(right_ids, rng.randint(low, high))):
+            yield left_id, right_id
+
+
+def _timestamps(i: int) -> dict:
+    created_at = BASE_TIME + timedelta(minutes=i)
+    return {"created_at": created_at, "updated_at": created_at + timedelta(days=1)}
+
+
+def generate_dataset(
+    engine, scale: str | DatasetScale = "1k", seed: int = DEFAULT_SEED
+) -> dict[str, int]:
+    """Genera el dataset en `engine` (el esquema se crea si no existe).
+
+    Args:
+        engine: engine de una BD vacía
+        scale: nombre de `SCALES` o una DatasetScale a medida
+        seed: semilla del generador aleatorio
+
+    Returns:
+        dict[str, int]: número de filas de cada tabla tras la generación
+
+    Raises:
+        ValueError: si la BD ya tiene el entorno de benchmark
+    """
+    scale = get_scale(scale)
+    rng = random.Random(seed)
+    init_db(engine=engine, load_initial_data=True)
+
+    with engine.begin() as connection:
+        if connection.execute(
+            select(Environment.id).where(Environment.name == ENVIRONMENT_NAME)
+        ).first():
+            raise ValueError(f"La BD ya contiene el entorno {ENVIRONMENT_NAME}")
+
+        environment_id = _insert(
+            connection,
+            Environment.__table__,
+            [
+                {
+                    "name": ENVIRONMENT_NAME,
+                    "description": "Datos sintéticos de benchmark",
+                }
+            ],
+        )
+        audit = {"environment_id": environment_id, "modified_by": "benchmark"}
+        system_ids = _all_ids(connection, System)
+        section_ids = _all_ids(connection, Section)
+        reason_ids = _all_ids(connection, Reason)
+
+        requirement_ids = _generate_requirements(
+            connection, rng, scale, audit, system_ids, section_ids
+        )
+        step_ids_by_case, block_ids = _generate_test_management(
+            connection, rng, scale, audit, system_ids, section_ids, requirement_ids
+        )
+        campaign_run_ids = _generate_campaigns(
+            connection, rng, scale, audit, system_ids, block_ids, step_ids_by_case
+        )
+        _generate_bugs(
+            connection, rng, scale, audit, system_ids, requirement_ids, campaign_run_ids
+        )
+        _generate_assets(connection, rng, scale, audit, reason_ids)
+        connection.exec_driver_sql("ANALYZE")
+
+    return count_rows(engine)
+
+
+def _generate_requirements(connection, rng, scale, audit, system_ids, section_ids):
+    first_id = _insert(
+        connection,
+        Requirement.__table__,
+        (
+            {
+                "code": f"REQ-{i:06d}",
+                "definition": _text(rng, 12),
+                **_timestamps(i),
+                **audit,
+            }
+            for i in range(scale.requirements)
+        ),
+    )
+    requirement_ids = list(range(first_id, first_id + scale.requirements))
+    _insert(
+        connection,
+        requirement_systems,
+        (
+            {"requirement_id": left, "system_id": right}
+            for left, right in _links(rng, requirement_ids, system_ids, 1, 2)
+        ),
+    )
+    _insert(
+        connection,
+        requirement_sections,
+        (
+            {"requirement_id": left, "section_id": right}
+            for left, right in _links(rng, requirement_ids, section_ids, 1, 1)
+        ),
+    )
+    return requirement_ids
+
+
+def _generate_test_management(
+    connection, rng, scale, audit, system_ids, section_ids, requirement_ids
+):
+    first_case_id = _insert(
+        connection,
+        Case.__table__,
+        (
+            {
+                "code": f"CASE-{i:06d}",
+                "name": _text(rng, 4),
+                "comments": _text(rng, 6),
+                **_timestamps(i),
+                **audit,
+            }
+            for i in range(scale.cases)
+        ),
+    )
+    case_ids = list(range(first_case_id, first_case_id + scale.cases))
+    _insert(
+        connection,
+        case_systems,
+        (
+            {"case_id": left, "system_id": right}
+            for left, right in _links(rng, case_ids, system_ids, 1, 1)
+        ),
+    )
+    _insert(
+        connection,
+        case_sections,
+        (
+            {"case_id": left, "section_id": right}
+            for left, right in _links(rng, case_ids, section_ids, 1, 2)
+        ),
+    )
+
+    first_step_id = _insert(
+        connection,
+        Step.__table__,
+        (
+            {
+                "action": _text(rng, 6),
+                "expected_result": _text(rng, 6),
+                "comments": "",
+                "case_id": case_id,
+            }
+            for case_id in case_ids
+            for _ in range(scale.steps_per_case)
+        ),
+    )
+    step_ids_by_case = {
+        case_id: list(
+            range(
+                first_step_id + i * scale.steps_per_case,
+                first_step_id + (i + 1) * scale.steps_per_case,
+            )
+        )
+        for i, case_id in enumerate(case_ids)
+    }
+    step_ids = [step_id for ids in step_ids_by_case.values() for step_id in ids]
+    _insert(
+        connection,
+        step_requirements,
+        (
+            {"step_id": left, "requirement_id": right}
+            for left, right in _links(rng, step_ids, requirement_ids, 1, 2)
+        ),
+    )
+
+    case_chunks = list(chunked(case_ids, scale.cases_per_block))
+    first_block_id = _insert(
+        connection,
+        Block.__table__,
+        (
+            {
+                "code": f"BLOCK-{i:05d}",
+                "name": _text(rng, 3),
+                "system_id": rng.choice(system_ids),
+                **_timestamps(i),
+                **audit,
+            }
+            for i in range(len(case_chunks))
+        ),
+    )
+    block_ids = list(range(first_block_id, first_block_id + len(case_chunks)))
+    _insert(
+        connection,
+        block_cases,
+        (
+            {"block_id": block_id, "case_id": case_id}
+            for block_id, cases in zip(block_ids, case_chunks, strict=True)
+            for case_id in cases
+        ),
+    )
+    return step_ids_by_case, block_ids
+
+
+def _generate_campaigns(
+    connection, rng, scale, audit, system_ids, block_ids, step_ids_by_case
+):
+    blocks_per_campaign = max(1, len(block_ids) // scale.campaigns)
+    campaign_blocks_ids = list(chunked(block_ids, blocks_per_campaign))[
+        : scale.campaigns
+    ]
+    first_campaign_id = _insert(
+        connection,
+        Campaign.__table__,
+        (
+            {
+                "code": f"CAMPAIGN-{i:03d}",
+                "description": _text(rng, 8),
+                "system_id": rng.choice(system_ids),
+                "system_version": f"1.{i}.0",
+                "status": "RUNNING",
+                **_timestamps(i),
+                **audit,
+            }
+            for i in range(len(campaign_blocks_ids))
+        ),
+    )
+    campaign_ids = range(
+        first_campaign_id, first_campaign_id + len(campaign_blocks_ids)
+    )
+    _insert(
+        connection,
+        campaign_blocks,
+        (
+            {"campaign_id": campaign_id, "block_id": block_id}
+            for campaign_id, blocks in zip(
+                campaign_ids, campaign_blocks_ids, strict=True
+            )
+            for block_id in blocks
+        ),
+    )
+
+    cases_by_block = {}
+    for block_id, case_id in connection.execute(
+        select(block_cases.c.block_id, block_cases.c.case_id).order_by(
+            block_cases.c.block_id, block_cases.c.case_id
+        )
+    ):
+        cases_by_block.setdefault(block_id, []).append(case_id)
+
+    campaign_run_ids = []
+    for campaign_id, blocks in zip(campaign_ids, campaign_blocks_ids, strict=True):
+        case_ids = [
+            case_id for block_id in blocks for case_id in cases_by_block[block_id]
+        ]
+        for run in range(scale.runs_per_campaign):
+            campaign_run_id = _insert(
+                connection,
+                CampaignRun.__table__,
+                [
+                    {
+                        "campaign_id": campaign_id,
+                        "started_at": BASE_TIME + timedelta(days=run),
+                        **audit,
+                    }
+                ],
+            )
+            campaign_run_ids.append(campaign_run_id)
+            first_case_run_id = _insert(
+                connection,
+                CaseRun.__table__,
+                (
+                    {"campaign_run_id": campaign_run_id, "case_id": case_id}
+                    for case_id in case_ids
+                ),
+            )
+            _insert(
+                connection,
+                StepRun.__table__,
+                (
+                    {
+                        "campaign_run_id": campaign_run_id,
+                        "case_run_id": first_case_run_id + i,
+                        "step_id": step_id,
+                        "passed": rng.choice((None, True, True, True, False)),
+                    }
+                    for i, case_id in enumerate(case_ids)
+                    for step_id in step_ids_by_case[case_id]
+                ),
+            )
+    return campaign_run_ids
+
+
+def _generate_bugs(
+    connection, rng, scale, audit, system_ids, requirement_ids, campaign_run_ids
+):
+    first_bug_id = _insert(
+        connection,
+        Bug.__table__,
+        (
+            {
+                "status": rng.choice(_BUG_STATUSES),
+                "system_id": rng.choice(system_ids),
+                "campaign_run_id": rng.choice([None, *campaign_run_ids]),
+                "system_version": f"1.{rng.randint(0, 9)}.{rng.randint(0, 20)}",
+                "service_now_id": f"INC{i:07d}" if i % 3 == 0 else None,
+                "short_description": _text(rng, 5),
+                "definition": _text(rng, 20),
+                "urgency": rng.randint(1, 4),
+                "impact": rng.randint(1, 4),
+                "comments": _text(rng, 8) if i % 2 == 0 else None,
+                **_timestamps(i),
+                **audit,
+            }
+            for i in range(scale.bugs)
+        ),
+    )
+    bug_ids = range(first_bug_id, first_bug_id + scale.bugs)
+    _insert(
+        connection,
+        BugHistory.__table__,
+        (
+            {
+                "bug_id": bug_id,
+                "changed_by": "benchmark",
+                "change_timestamp": BASE_TIME + timedelta(minutes=bug_id, hours=h),
+                "change_summary": _text(rng, 6),
+            }
+            for bug_id in bug_ids
+            for h in range(scale.history_per_bug)
+        ),
+    )
+    _insert(
+        connection,
+        bug_requirements,
+        (
+            {"bug_id": left, "requirement_id": right}
+            for left, right in _links(rng, bug_ids, requirement_ids, 0, 3)
+        ),
+    )
+    _insert(
+        connection,
+        File.__table__,
+        (
+            {
+                "owner_type": "bug",
+                "owner_id": bug_id,
+                "filename": f"evidencia_{bug_id}.png",
+                "filepath": f"bugs/{bug_id}/evidencia_{bug_id}.png",
+                "mime_type": "image/png",
+                "size": str(rng.randint(10_000, 2_000_000)),
+                "uploaded_by": "benchmark",
+                "uploaded_at": BASE_TIME + timedelta(minutes=bug_id),
+            }
+            for bug_id in bug_ids
+            if bug_id % scale.attachment_every == 0
+        ),
+    )
+
+
+def _generate_assets(connection, rng, scale, audit, reason_ids):
+    n = scale.assets
+    first_email_id = _insert(
+        connection,
+        Email.__table__,
+        (
+            {
+                "name": f"Email {i}",
+                "email": f"operador{i}@example.com",
+                "password": f"email-pass-{i}",
+                **audit,
+                **_timestamps(i),
+            }
+            for i in range(n)
+        ),
+    )
+    first_operator_id = _insert(
+        connection,
+        Operator.__table__,
+        (
+            {
+                "name": f"Operador {i}",
+                "easa_id": f"ESP{i:08d}",
+                "verification_code": f"V{i:05d}",
+                "password": f"op-pass-{i}",
+                "phone": f"+34600{i:06d}",
+                "email_id": first_email_id + i,
+                **audit,
+                **_timestamps(i),
+            }
+            for i in range(n)
+        ),
+    )
+    _insert(
+        connection,
+        Drone.__table__,
+        (
+            {
+                "name": f"Dron {i}",
+                "serial_number": f"SN{i:08d}",
+                "manufacturer": rng.choice(("DJI", "Parrot", "Autel")),
+                "model": f"M{rng.randint(1, 9)}",
+                "tracker_type": rng.choice(("GCS-API", "SIMULATOR", "TRACKER")),
+                "transponder_id": f"T{i:06d}",
+                "operator_id": first_operator_id + i // 2,
+                **audit,
+                **_timestamps(i),
+            }
+            for i in range(2 * n)
+        ),
+    )
+
+    organizations = max(1, n // 5)
+    first_org_id = _insert(
+        connection,
+        UhubOrg.__table__,
+        (
+            {
+                "name": f"Organización {i}",
+                "email": f"org{i}@example.com",
+                "phone": f"+34910{i:06d}",
+                "jurisdiction": "Spain",
+                "aoi": rng.choice(("Madrid", "Barcelona", "Sevilla")),
+                "role": "Administrator",
+                "type": rng.choice(("INFORMATIVE", "OPERATIVE")),
+                **audit,
+                **_timestamps(i),
+            }
+            for i in range(organizations)
+        ),
+    )
+    _insert(
+        connection,
+        UhubUser.__table__,
+        (
+            {
+                "email": f"usuario{i}@example.com",
+                "dni": f"{i:08d}X",
+                "username": f"usuario{i}",
+                "password": f"user-pass-{i}",
+                "type": rng.choice(("ADMIN", "USER")),
+                "role": "Tester",
+                "jurisdiction": "Spain",
+                "aoi": "Madrid",
+                "organization_id": first_org_id + i % organizations,
+                **audit,
+                **_timestamps(i),
+            }
+            for i in range(n)
+        ),
+    )
+    first_zone_id = _insert(
+        connection,
+        UasZone.__table__,
+        (
+            {
+                "name": f"Zona {i}",
+                "area_type": "CIRCLE",
+                "circle_radius": rng.randint(100, 5000),
+                "lower_limit": 0,
+                "upper_limit": 120,
+                "reference_lower": "AGL",
+                "reference_upper": "AGL",
+                "application": rng.choice(("TEMPORAL", "PERMANENT")),
+                "restriction_type": rng.choice(("INFORMATIVE", "PROHIBITED")),
+                "message": _text(rng, 6),
+                "clearance_required": rng.random() < 0.3,
+                **audit,
+                **_timestamps(i),
+            }
+            for i in range(n)
+        ),
+    )
+    zone_ids = range(first_zone_id, first_zone_id + n)
+    _insert(
+        connection,
+        zone_reasons,
+        (
+            {"zone_id": left, "reason_id": right}
+            for left, right in _links(rng, zone_ids, reason_ids, 1, 2)
+        ),
+    )
+    _insert(
+        connection,
+        zone_organization,
+        (
+            {"zone_id": zone_id, "uhub_org_id": first_org_id + zone_id % organizations}
+            for zone_id in zone_ids
+        ),
+    )
+    _insert(
+        connection,
+        Uspace.__table__,
+        (
+            {
+                "code": f"USPACE-{i:04d}",
+                "name": f"U-space {i}",
+                "sectors_count": rng.randint(1, 20),
+                **audit,
+                **_timestamps(i),
+            }
+            for i in range(max(1, n // 10))
+        ),
+    )
+
+
+def count_rows(engine) -> dict[str, int]:
+    """Número de filas de cada tabla del esquema (sin las tablas FTS)."""
+    from uat_tool.infrastructure import Base  # pylint: disable=import-outside-toplevel
+
+    with engine.connect() as connection:
+        return {
+            name: connection.execute(select(func.count()).select_from(table)).scalar()
+            for name, table in sorted(Base.metadata.tables.items())
+        }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", choices=list(SCALES), default="1k")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument(
+        "--output", type=Path, required=True, help="Fichero SQLite nuevo"
+    )
+    args = parser.parse_args(argv)
+
+    if args.output.exists():
+        parser.error(f"{args.output} ya existe")
+
+    engine = create_engine(f"sqlite:///{args.output}", future=True)
+    apply_sqlite_profile(engine)
+    start = time.perf_counter()
+    try:
+        counts = generate_dataset(engine, args.scale, args.seed)
+    finally:
+        engine.dispose()
+
+    print(f"Dataset {args.scale} generado en {time.perf_counter() - start:.1f} s")
+    for table, rows in counts.items():
+        if rows:
+            print(f"{table:>22}: {rows}")
+
+
+if __name__ == "__main__":
+    main()
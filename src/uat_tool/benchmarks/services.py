@@ -0,0 +1,392 @@
+"""
+Benchmark de los servicios principales sobre un dataset sintético.
+
+Genera (o reutiliza) una BD con `datasets.generate_dataset` y mide, con el
+ApplicationContext real, las operaciones que más pesan en el uso diario:
+cargas de tablas, búsquedas, cobertura, progreso, creación de ejecuciones,
+registro de resultados y exportaciones. De cada operación se guarda el tiempo
+(mínimo, mediana y máximo de varias repeticiones tras una de calentamiento)
+y el número de sentencias SQL, en un JSON que se puede comparar con el de
+otro commit (`compare_reports`).
+
+Las operaciones que escriben (crear una ejecución, registrar resultados) se
+hacen en una transacción que se revierte, para que todas las repeticiones y
+todos los commits midan sobre los mismos datos.
+
+Uso:
+    python -m uat_tool.benchmarks.services --scale 10k --db bench_10k.db --output base.json
+    python -m uat_tool.benchmarks.services --scale 10k --db bench_10k.db --baseline base.json
+"""
+
+import argparse
+import json
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+
+import sqlalchemy
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from uat_tool.benchmarks.datasets import (
+    DEFAULT_SEED,
+    ENVIRONMENT_NAME,
+    DatasetScale,
+    count_rows,
+    generate_dataset,
+    get_scale,
+)
+from uat_tool.domain import (
+    Bug,
+    Campaign,
+    CampaignRun,
+    CampaignRunRepository,
+    Environment,
+    StepRun,
+    StepRunRepository,
+)
+from uat_tool.infrastructure import count_queries, get_engine
+
+DEFAULT_REPEAT = 3
+
+# Resultados registrados en bloque por `executions.record_results`
+RECORDED_RESULTS = 200
+
+# Una operación es regresión si su mediana crece más de esta fracción...
+DEFAULT_TOLERANCE = 0.25
+# ...y al menos estos milisegundos (evita falsos positivos en operaciones rápidas)
+MIN_REGRESSION_MS = 5.0
+
+Operation = Callable[[], object]
+
+
+def _git_commit() -> str | None:
+    """Commit actual del repositorio, si se ejecuta desde un checkout de git."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _rolled_back(engine, write: Callable[[Session], object]) -> Operation:
+    """Operación que escribe en una sesión propia y revierte la transacción."""
+
+    def operation():
+        with Session(engine) as session:
+            try:
+                return write(session)
+            finally:
+                session.rollback()
+
+    return operation
+
+
+def _operations(app_context, engine, tmp_dir: Path) -> dict[str, Operation]:
+    """Operaciones a medir: {nombre: función sin argumentos}."""
+    with Session(engine) as session:
+        environment_id = session.scalar(
+            select(Environment.id).where(Environment.name == ENVIRONMENT_NAME)
+        )
+        campaign_id = session.scalar(
+            select(Campaign.id)
+            .where(Campaign.environment_id == environment_id)
+            .limit(1)
+        )
+        campaign_run_id = session.scalar(
+            select(CampaignRun.id)
+            .where(CampaignRun.campaign_id == campaign_id)
+            .limit(1)
+        )
+        bug_id = session.scalar(select(Bug.id).order_by(Bug.id.desc()).limit(1))
+        step_run_ids = session.scalars(
+            select(StepRun.id)
+            .where(StepRun.campaign_run_id == campaign_run_id)
+            .order_by(StepRun.id)
+            .limit(RECORDED_RESULTS)
+        ).all()
+
+    def record_results(session):
+        results = [{"step_run_id": id_, "passed": True} for id_ in step_run_ids]
+        StepRunRepository(session).update_step_results(results)
+        return len(results)
+
+    bug_service = app_context.get_service("bug_service")
+    requirement_service = app_context.get_service("requirement_service")
+    coverage_service = app_context.get_service("coverage_service")
+    execution_service = app_context.get_service("execution_service")
+    export_service = app_context.get_service("export_service")
+
+    return {
+        "bugs.table_load": bug_service.get_all_bugs_for_table,
+        "bugs.first_page": bug_service.get_bugs_page_for_table,
+        "bugs.search": lambda: bug_service.search_bugs("zona vuelo"),
+        "bugs.count_by_status": bug_service.count_bugs_by_status_and_system,
+        "bugs.history": lambda: bug_service.get_bug_history_dto(bug_id),
+        "requirements.table_load": requirement_service.get_all_requirements_for_table,
+        "requirements.search": lambda: requirement_service.search_requirements(
+            "registro dron"
+        ),
+        "coverage.environment": lambda: coverage_service.get_requirement_coverage(
+            environment_id
+        ),
+        "coverage.campaign_run": lambda: coverage_service.get_requirement_coverage(
+            environment_id, campaign_run_id
+        ),
+        "executions.case_runs_progress": lambda: (
+            execution_service.get_case_runs_progress(campaign_run_id)
+        ),
+        "executions.create_run": _rolled_back(
+            engine,
+            lambda session: CampaignRunRepository(session).create(
+                {"campaign_id": campaign_id, "modified_by": "benchmark"}, environment_id
+            ),
+        ),
+        "executions.record_results": _rolled_back(engine, record_results),
+        "export.bugs": lambda: export_service.export_bugs(tmp_dir / "bugs.csv"),
+        "export.requirements": lambda: export_service.export_requirements(
+            tmp_dir / "requirements.csv"
+        ),
+    }
+
+
+def _row_count(result) -> int | None:
+    """Filas devueltas por una operación (listas, páginas o número de filas)."""
+    if isinstance(result, tuple):  # Página: (filas, cursor)
+        result = result[0]
+    if isinstance(result, list):
+        return len(result)
+    if isinstance(result, int):
+        return result
+    return None
+
+
+def _measure(engine, operation: Operation, repeat: int) -> dict:
+    """Calentamiento (contando sentencias) y `repeat` ejecuciones cronometradas."""
+    with count_queries(engine) as captured:
+        result = operation()
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "max_ms": round(max(timings), 3),
+        "queries": captured.count,
+        "rows": _row_count(result),
+    }
+
+
+def run_services_benchmark(
+    scale: str | DatasetScale = "1k",
+    repeat: int = DEFAULT_REPEAT,
+    db_path: Path | None = None,
+    only: list[str] | None = None,
+    seed: int = DEFAULT_SEED,
+) -> dict:
+    """Ejecuta el benchmark de servicios y devuelve los resultados.
+
+    Args:
+        scale: escala del dataset (nombre de `SCALES` o DatasetScale)
+        repeat: ejecuciones cronometradas de cada operación
+        db_path: BD del dataset; si no existe se genera ahí (y se reutiliza en
+            siguientes ejecuciones). Por defecto, una BD temporal
+        only: prefijos de las operaciones a medir (p.ej. ["bugs.", "export."])
+        seed: semilla del dataset
+
+    Returns:
+        dict: {"benchmark": ..., "commit": ..., "dataset": ..., "results": {operación: {...}}}
+
+    Raises:
+        RuntimeError: si el engine global ya apunta a otra base de datos
+    """
+    from uat_tool.application import (  # pylint: disable=import-outside-toplevel
+        ApplicationContext,
+    )
+
+    scale = get_scale(scale)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        db_path = Path(db_path or tmp_dir / "bench.db").resolve()
+        generated = not db_path.exists()
+
+        # Los servicios usan el engine global (unit_of_work), que debe ser el del dataset
+        engine = get_engine(f"sqlite:///{db_path}")
+        if Path(engine.url.database).resolve() != db_path:
+            raise RuntimeError(f"El engine global ya apunta a {engine.url.database}")
+
+        start = time.perf_counter()
+        rows = (
+            generate_dataset(engine, scale, seed) if generated else count_rows(engine)
+        )
+        generation_s = time.perf_counter() - start
+
+        app_context = ApplicationContext(test_engine=engine, load_initial_data=False)
+        app_context.initialize()
+        try:
+            operations = _operations(app_context, engine, tmp_dir)
+            results = {
+                name: _measure(engine, operation, repeat)
+                for name, operation in operations.items()
+                if not only or name.startswith(tuple(only))
+            }
+        finally:
+            app_context.shutdown()
+            engine.dispose()
+
+    return {
+        "benchmark": "services",
+        "commit": _git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "platform": {
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "sqlite": sqlite3.sqlite_version,
+        },
+        "dataset": {
+            "scale": asdict(scale),
+            "seed": seed,
+            "generated": generated,
+            "generation_s": round(generation_s, 2),
+            "rows": rows,
+        },
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare_reports(
+    baseline: dict,
+    current: dict,
+    tolerance: float = DEFAULT_TOLERANCE,
+    min_delta_ms: float = MIN_REGRESSION_MS,
+) -> list[dict]:
+    """Compara dos informes de `run_services_benchmark` operación a operación.
+
+    Una operación es regresión si ejecuta más sentencias SQL que antes o si
+    su mediana crece más de `tolerance` (fracción) y de `min_delta_ms`.
+
+    Returns:
+        list[dict]: {"operation", "baseline_ms", "current_ms", "ratio",
+        "baseline_queries", "current_queries", "status"} por operación, con
+        status "regression", "improvement", "ok", "new" o "removed"
+    """
+    base_results = baseline["results"]
+    current_results = current["results"]
+    comparison = []
+    for name in sorted(base_results.keys() | current_results.keys()):
+        base = base_results.get(name)
+        now = current_results.get(name)
+        row = {
+            "operation": name,
+            "baseline_ms": base and base["median_ms"],
+            "current_ms": now and now["median_ms"],
+            "ratio": None,
+            "baseline_queries": base and base["queries"],
+            "current_queries": now and now["queries"],
+        }
+        if base is None:
+            row["status"] = "new"
+        elif now is None:
+            row["status"] = "removed"
+        else:
+            delta = now["median_ms"] - base["median_ms"]
+            if base["median_ms"]:
+                row["ratio"] = round(now["median_ms"] / base["median_ms"], 3)
+            slower = delta > min_delta_ms and delta > tolerance * base["median_ms"]
+            faster = -delta > min_delta_ms and -delta > tolerance * base["median_ms"]
+            if slower or now["queries"] > base["queries"]:
+                row["status"] = "regression"
+            elif faster or now["queries"] < base["queries"]:
+                row["status"] = "improvement"
+            else:
+                row["status"] = "ok"
+        comparison.append(row)
+    return comparison
+
+
+def format_comparison(comparison: list[dict]) -> str:
+    """Tabla de texto de `compare_reports`."""
+    width = max([len("Operation"), *(len(row["operation"]) for row in comparison)])
+    lines = [
+        f"{'Operation':<{width}}  {'Base ms':>9}  {'Now ms':>9}  Queries    Status"
+    ]
+    for row in comparison:
+        base_ms = "-" if row["baseline_ms"] is None else f"{row['baseline_ms']:.1f}"
+        now_ms = "-" if row["current_ms"] is None else f"{row['current_ms']:.1f}"
+        queries = f"{row['baseline_queries'] or '-'}->{row['current_queries'] or '-'}"
+        lines.append(
+            f"{row['operation']:<{width}}  {base_ms:>9}  {now_ms:>9}  {queries:<9}  "
+            f"{row['status']}"
+        )
+    return "\n".join(lines)
+
+
+def format_report(report: dict) -> str:
+    """Tabla de texto con los resultados de `run_services_benchmark`."""
+    results = report["results"]
+    width = max([len("Operation"), *(len(name) for name in results)])
+    lines = [f"{'Operation':<{width}}  {'Median ms':>9}  {'Min ms':>9}  Queries  Rows"]
+    for name, result in results.items():
+        lines.append(
+            f"{name:<{width}}  {result['median_ms']:>9.1f}  {result['min_ms']:>9.1f}  "
+            f"{result['queries']:>7}  {result['rows']}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", default="1k", help="1k, 10k o 100k")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument(
+        "--db", type=Path, help="BD del dataset (se genera si no existe)"
+    )
+    parser.add_argument("--only", action="append", help="Prefijo de operación a medir")
+    parser.add_argument("--output", type=Path, help="Fichero JSON de resultados")
+    parser.add_argument("--baseline", type=Path, help="JSON de otro commit a comparar")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    try:
+        report = run_services_benchmark(
+            args.scale, args.repeat, args.db, args.only, args.seed
+        )
+    except (ValueError, RuntimeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(format_report(report))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        comparison = compare_reports(baseline, report, args.tolerance)
+        print()
+        print(format_comparison(comparison))
+        if any(row["status"] == "regression" for row in comparison):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
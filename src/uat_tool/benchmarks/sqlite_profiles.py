@@ -0,0 +1,165 @@
+"""
+Benchmark de perfiles de PRAGMAs de SQLite.
+
+Compara, sobre un fichero temporal, el engine sin PRAGMAs ("none") con cada
+perfil de `SQLITE_PROFILES`:
+
+- Latencia de commit: N transacciones de una sola fila, como hace cada
+  unit_of_work al guardar desde un diálogo.
+- Lectura concurrente: consultas por segundo de varios hilos lectores mientras
+  un hilo escritor confirma transacciones.
+
+Uso:
+    python -m uat_tool.benchmarks.sqlite_profiles --commits 200 --output res.json
+"""
+
+import argparse
+import json
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+
+from uat_tool.infrastructure import SQLITE_PROFILES, apply_sqlite_profile
+
+_BASELINE = "none"
+
+
+def _create_engine(db_path: Path, profile: str):
+    """Crea un engine sobre `db_path` con el perfil indicado (o sin PRAGMAs)."""
+    engine = create_engine(f"sqlite:///{db_path}", future=True)
+    if profile != _BASELINE:
+        apply_sqlite_profile(engine, profile)
+    return engine
+
+
+def _measure_commits(engine, commits: int) -> dict:
+    """Mide la latencia de `commits` transacciones de una fila."""
+    latencies = []
+    for i in range(commits):
+        start = time.perf_counter()
+        with engine.begin() as conn:
+            conn.execute(
+                text("INSERT INTO bench (payload) VALUES (:payload)"),
+                {"payload": f"row {i}"},
+            )
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    latencies.sort()
+    return {
+        "commits": commits,
+        "mean_ms": round(statistics.mean(latencies), 3),
+        "p50_ms": round(latencies[len(latencies) // 2], 3),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 3),
+    }
+
+
+def _measure_concurrent_reads(engine, readers: int, duration: float) -> dict:
+    """Cuenta lecturas por segundo con un escritor activo en paralelo."""
+    stop = threading.Event()
+    reads = [0] * readers
+    errors = []
+
+    def reader(index: int):
+        with engine.connect() as conn:
+            while not stop.is_set():
+                try:
+                    conn.execute(text("SELECT count(*) FROM bench")).scalar()
+                    reads[index] += 1
+                except Exception as e:  # p.ej. "database is locked"
+                    errors.append(str(e))
+
+    def writer():
+        while not stop.is_set():
+            try:
+                with engine.begin() as conn:
+                    conn.execute(
+                        text("INSERT INTO bench (payload) VALUES ('concurrent')")
+                    )
+            except Exception as e:
+                errors.append(str(e))
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return {
+        "readers": readers,
+        "reads_per_second": round(sum(reads) / duration, 1),
+        "errors": len(errors),
+    }
+
+
+def run_sqlite_profiles_benchmark(
+    commits: int = 200,
+    readers: int = 4,
+    duration: float = 2.0,
+    profiles: list[str] | None = None,
+) -> dict:
+    """Ejecuta el benchmark para cada perfil y devuelve los resultados.
+
+    Args:
+        commits: número de transacciones para medir la latencia de commit
+        readers: hilos lectores en la prueba de lectura concurrente
+        duration: segundos que dura la prueba de lectura concurrente
+        profiles: perfiles a medir; por defecto "none" y todos los definidos
+
+    Returns:
+        dict: {"benchmark": ..., "results": {perfil: {"commit": ..., "read": ...}}}
+    """
+    profiles = profiles or [_BASELINE, *SQLITE_PROFILES]
+    results = {}
+
+    for profile in profiles:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            engine = _create_engine(Path(tmp_dir) / "bench.db", profile)
+            try:
+                with engine.begin() as conn:
+                    conn.execute(
+                        text(
+                            "CREATE TABLE bench "
+                            "(id INTEGER PRIMARY KEY, payload TEXT NOT NULL)"
+                        )
+                    )
+                results[profile] = {
+                    "commit": _measure_commits(engine, commits),
+                    "read": _measure_concurrent_reads(engine, readers, duration),
+                }
+            finally:
+                engine.dispose()
+
+    return {"benchmark": "sqlite_profiles", "results": results}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--commits", type=int, default=200)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=2.0)
+    parser.add_argument("--output", type=Path, help="Fichero JSON de resultados")
+    args = parser.parse_args(argv)
+
+    report = run_sqlite_profiles_benchmark(args.commits, args.readers, args.duration)
+
+    for profile, result in report["results"].items():
+        print(
+            f"{profile:>8}: commit p50 {result['commit']['p50_ms']:.2f} ms, "
+            f"p95 {result['commit']['p95_ms']:.2f} ms | "
+            f"{result['read']['reads_per_second']:.0f} lecturas/s "
+            f"({result['read']['errors']} errores)"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Benchmark de imports del arranque (`python -X importtime`).
+
+Importa el módulo de arranque de la GUI (`uat_tool.main`) en un intérprete
+nuevo con `-X importtime`, parsea la salida y agrupa el tiempo propio de cada
+módulo por paquete de primer nivel, para ver qué cuesta más antes de que
+aparezca la ventana. Las fases posteriores (Qt, bootstrap, ventana) se
+registran en el log en cada arranque (ver `uat_tool.shared.startup`).
+
+Uso:
+    python -m uat_tool.benchmarks.startup --repeat 5 --output imports.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+DEFAULT_MODULE = "uat_tool.main"
+
+# Módulos y paquetes más lentos que se muestran
+DEFAULT_TOP = 15
+
+
+@dataclass
+class ImportTime:
+    """Una línea de `-X importtime` (tiempos en microsegundos)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int  # Nivel de anidamiento: 0 para los imports de primer nivel
+
+
+def parse_importtime(output: str) -> list[ImportTime]:
+    """Parsea la salida de `-X importtime` (se ignoran otras líneas)."""
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+            imports.append(
+                ImportTime(
+                    module=name.strip(),
+                    self_us=int(self_us),
+                    cumulative_us=int(cumulative_us),
+                    depth=(len(name) - len(name.lstrip()) - 1) // 2,
+                )
+            )
+        except ValueError:
+            continue  # Cabecera: "self [us] | cumulative | imported package"
+    return imports
+
+
+def measure_imports(module: str = DEFAULT_MODULE) -> list[ImportTime]:
+    """Importa `module` en un intérprete nuevo y devuelve sus tiempos de import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    return parse_importtime(result.stderr)
+
+
+def _by_package(imports: list[ImportTime]) -> dict[str, int]:
+    """Tiempo propio (us) por paquete de primer nivel, de mayor a menor."""
+    totals: dict[str, int] = {}
+    for item in imports:
+        package = item.module.split(".", 1)[0]
+        totals[package] = totals.get(package, 0) + item.self_us
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def run_startup_benchmark(
+    module: str = DEFAULT_MODULE, repeat: int = 3, top: int = DEFAULT_TOP
+) -> dict:
+    """Mide `repeat` veces el import de `module` y desglosa la más rápida."""
+    runs = [measure_imports(module) for _ in range(repeat)]
+    totals = [
+        sum(item.cumulative_us for item in run if item.depth == 0) for run in runs
+    ]
+    fastest = runs[totals.index(min(totals))]
+
+    return {
+        "benchmark": "startup",
+        "module": module,
+        "repeat": repeat,
+        "import_ms": {
+            "min": min(totals) / 1000,
+            "median": statistics.median(totals) / 1000,
+            "max": max(totals) / 1000,
+        },
+        "packages_ms": {
+            package: self_us / 1000
+            for package, self_us in list(_by_package(fastest).items())[:top]
+        },
+        "slowest_modules": [
+            asdict(item)
+            for item in sorted(fastest, key=lambda item: item.self_us, reverse=True)[
+                :top
+            ]
+        ],
+    }
+
+
+def format_report(report: dict) -> str:
+    """Informe de texto del benchmark."""
+    import_ms = report["import_ms"]
+    lines = [
+        f"import {report['module']}: {import_ms['median']:.0f} ms "
+        f"(min {import_ms['min']:.0f}, max {import_ms['max']:.0f}, "
+        f"{report['repeat']} ejecuciones)",
+        "",
+        "Tiempo propio por paquete:",
+    ]
+    lines += [
+        f"{ms:>9.1f} ms  {package}" for package, ms in report["packages_ms"].items()
+    ]
+    lines += ["", "Módulos más lentos (tiempo propio):"]
+    lines += [
+        f"{item['self_us'] / 1000:>9.1f} ms  {item['module']}"
+        for item in report["slowest_modules"]
+    ]
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP)
+    parser.add_argument("--output", type=Path, help="Fichero JSON de resultados")
+    args = parser.parse_args(argv)
+
+    report = run_startup_benchmark(args.module, args.repeat, args.top)
+    print(format_report(report))
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
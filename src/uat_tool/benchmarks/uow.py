@@ -0,0 +1,119 @@
+"""
+Benchmark del coste fijo de abrir y cerrar una unidad de trabajo.
+
+Mide, sin consultas, cuánto cuesta cada `with ...get_unit_of_work_context()`
+de un ApplicationContext (factoría de sesiones del contexto y repositorios
+perezosos), con y sin acceso a un repositorio y anidada dentro de otra, frente
+al patrón anterior: una factoría `scoped_session` nueva por unidad de trabajo
+y los 21 repositorios construidos en cada una.
+
+Uso:
+    python -m uat_tool.benchmarks.uow --iterations 20000 --output uow.json
+"""
+
+import argparse
+import json
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from sqlalchemy import create_engine
+
+from uat_tool.application import ApplicationContext
+from uat_tool.application.uow import UnitOfWork
+from uat_tool.infrastructure import get_session_factory
+
+DEFAULT_ITERATIONS = 10_000
+DEFAULT_REPEAT = 3
+
+
+def _legacy_uow(engine) -> None:
+    """Patrón anterior: factoría nueva y todos los repositorios por unidad de trabajo."""
+    session = get_session_factory(engine)()
+    uow = UnitOfWork(session)
+    for name in UnitOfWork._REPOSITORIES:
+        getattr(uow, name)
+    uow.commit()
+    uow.close()
+
+
+def _scenarios(
+    app_context: ApplicationContext, engine
+) -> dict[str, Callable[[], None]]:
+    def empty():
+        with app_context.get_unit_of_work_context():
+            pass
+
+    def one_repository():
+        with app_context.get_unit_of_work_context() as uow:
+            _ = uow.bug_repo
+
+    def nested():
+        with app_context.get_unit_of_work_context():
+            with app_context.get_unit_of_work_context() as uow:
+                _ = uow.bug_repo
+
+    return {
+        "legacy": lambda: _legacy_uow(engine),
+        "context": empty,
+        "context_one_repo": one_repository,
+        "context_nested": nested,
+    }
+
+
+def _time_per_call_us(func: Callable[[], None], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def run_uow_benchmark(
+    iterations: int = DEFAULT_ITERATIONS, repeat: int = DEFAULT_REPEAT
+) -> dict:
+    """Microsegundos por unidad de trabajo (mediana de `repeat` tandas)."""
+    engine = create_engine("sqlite://")
+    # Igual que en la aplicación: factoría scoped del contexto
+    app_context = ApplicationContext(test_engine=engine)
+
+    results = {}
+    for name, scenario in _scenarios(app_context, engine).items():
+        scenario()  # Calentamiento
+        times = [_time_per_call_us(scenario, iterations) for _ in range(repeat)]
+        results[name] = {"us_per_uow": statistics.median(times), "min_us": min(times)}
+
+    legacy = results["legacy"]["us_per_uow"]
+    for result in results.values():
+        result["speedup"] = legacy / result["us_per_uow"]
+
+    engine.dispose()
+    return {
+        "benchmark": "uow",
+        "iterations": iterations,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--output", type=Path, help="Fichero JSON de resultados")
+    args = parser.parse_args(argv)
+
+    report = run_uow_benchmark(args.iterations, args.repeat)
+
+    for name, result in report["results"].items():
+        print(
+            f"{name:>16}: {result['us_per_uow']:8.1f} us/uow "
+            f"(min {result['min_us']:.1f}, x{result['speedup']:.1f})"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,493 @@
+"""
+Interfaz de línea de comandos de UAT Tool.
+
+Expone los servicios de la aplicación para operaciones por lotes sin interfaz
+gráfica (exportaciones, informes, mantenimiento de la BD y benchmarks). Sin
+subcomando arranca la interfaz gráfica, como hasta ahora.
+
+PySide6 solo se importa al lanzar la interfaz gráfica: los subcomandos se
+pueden ejecutar en servidores sin Qt instalado.
+
+Uso:
+    python -m uat_tool                              # interfaz gráfica
+    python -m uat_tool export bugs bugs.xlsx
+    python -m uat_tool import requirements requisitos.csv --environment PRE
+    python -m uat_tool report bugs
+    python -m uat_tool report coverage --environment PRE --output cobertura.xlsx
+    python -m uat_tool report progress 42
+    python -m uat_tool db audit --min-rows 1000
+    python -m uat_tool --db sqlite:///otra.db db rebuild-search
+    python -m uat_tool benchmark sqlite-profiles --output perfiles.json
+    python -m uat_tool benchmark services --scale 10k --dataset bench.db --output base.json
+    python -m uat_tool benchmark startup
+    python -m uat_tool --profile-sql report coverage --environment PRE
+"""
+
+import getpass
+import logging
+from pathlib import Path
+
+import click
+
+
+def _bootstrap(ctx: click.Context, load_initial_data: bool = True):
+    """Inicializa el ApplicationContext y lo cierra al terminar el comando."""
+    from uat_tool.application import (  # pylint: disable=import-outside-toplevel
+        bootstrap,
+    )
+
+    # En consola solo avisos y errores salvo con --verbose, para no mezclar
+    # los logs con la salida del comando
+    app_context = bootstrap(
+        load_initial_data=load_initial_data,
+        console_log_level=logging.DEBUG if ctx.obj["verbose"] else logging.WARNING,
+    )
+    ctx.call_on_close(app_context.shutdown)
+    return app_context
+
+
+def _environment_id(app_context, name: str) -> int:
+    """ID del entorno con ese nombre (error de uso si no existe)."""
+    environment_id = app_context.get_reference_cache().get_id("environment", name)
+    if environment_id is None:
+        raise click.ClickException(f"Entorno no encontrado: {name}")
+    return environment_id
+
+
+def _engine(ctx: click.Context):
+    from uat_tool.infrastructure import (  # pylint: disable=import-outside-toplevel
+        get_engine,
+    )
+
+    return get_engine(ctx.obj["db"])
+
+
+def _print_progress(done: int, total: int):
+    click.echo(f"\r{done}/{total} filas", nl=False, err=True)
+
+
+@click.group(invoke_without_command=True)
+@click.option(
+    "--db", "db_url", help="URL de la base de datos (por defecto la de la app)"
+)
+@click.option("-v", "--verbose", is_flag=True, help="Muestra los logs en consola")
+@click.option(
+    "--profile-sql",
+    is_flag=True,
+    help="Cuenta y cronometra las sentencias SQL y muestra el informe al terminar",
+)
+@click.pass_context
+def cli(ctx: click.Context, db_url: str | None, verbose: bool, profile_sql: bool):
+    """UAT Tool: sin subcomando abre la interfaz gráfica."""
+    ctx.ensure_object(dict)
+    ctx.obj.update(db=db_url, verbose=verbose)
+
+    if db_url:
+        # El engine es global: crearlo aquí hace que bootstrap use esta URL
+        _engine(ctx)
+
+    if profile_sql:
+        from uat_tool.infrastructure import (  # pylint: disable=import-outside-toplevel
+            get_query_profiler,
+        )
+
+        profiler = get_query_profiler()
+        profiler.enable(_engine(ctx))
+
+        def _print_query_report():
+            profiler.disable()
+            click.echo(profiler.format_report(), err=True)
+
+        ctx.call_on_close(_print_query_report)
+
+    if ctx.invoked_subcommand is None:
+        from uat_tool.main import main  # pylint: disable=import-outside-toplevel
+
+        main()
+
+
+# --- EXPORTACIÓN ---
+
+
+@cli.command("export")
+@click.argument("table", type=click.Choice(["bugs", "requirements"]))
+@click.argument("path", type=click.Path(dir_okay=False, writable=True))
+@click.option(
+    "--batch-size", type=click.IntRange(min=1), default=1000, show_default=True
+)
+@click.pass_context
+def export_command(ctx: click.Context, table: str, path: str, batch_size: int):
+    """Exporta una tabla a CSV o XLSX (según la extensión de PATH)."""
+    app_context = _bootstrap(ctx)
+    try:
+        rows = app_context.get_service("export_service").export_table(
+            table, path, progress=_print_progress, batch_size=batch_size
+        )
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+    click.echo(err=True)
+    click.echo(f"{rows} filas exportadas a {path}")
+
+
+# --- IMPORTACIÓN ---
+
+
+@cli.group("import")
+def import_group():
+    """Importación masiva desde CSV o JSON."""
+
+
+@import_group.command("requirements")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--environment", required=True, help="Nombre del entorno de destino")
+@click.option("--user", default=getpass.getuser, show_default="usuario del sistema")
+@click.pass_context
+def import_requirements(ctx: click.Context, path: str, environment: str, user: str):
+    """Importa requisitos (columnas code, definition, systems y sections).
+
+    Las filas con errores se listan y se omiten; el resto se importa. El
+    código de salida es 1 si alguna fila tiene errores.
+    """
+    app_context = _bootstrap(ctx)
+    environment_id = _environment_id(app_context, environment)
+
+    try:
+        result = app_context.get_service(
+            "requirement_service"
+        ).import_requirements_file(
+            path, {"modified_by": user, "environment_id": environment_id}
+        )
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+
+    for error in result.errors:
+        click.echo(str(error), err=True)
+    click.echo(
+        f"{result.created} de {result.total} requisitos importados "
+        f"({len(result.errors)} errores)"
+    )
+    if result.errors:
+        ctx.exit(1)
+
+
+# --- INFORMES ---
+
+
+@cli.group()
+def report():
+    """Informes de resumen."""
+
+
+@report.command("bugs")
+@click.pass_context
+def report_bugs(ctx: click.Context):
+    """Número de bugs por estado y sistema."""
+    app_context = _bootstrap(ctx)
+    rows = app_context.get_service("bug_service").count_bugs_by_status_and_system()
+
+    status_width = max([len("Status"), *(len(row[0]) for row in rows)])
+    system_width = max([len("System"), *(len(row[1]) for row in rows)])
+    click.echo(f"{'Status':<{status_width}}  {'System':<{system_width}}  Bugs")
+    for status, system, count in rows:
+        click.echo(f"{status:<{status_width}}  {system:<{system_width}}  {count}")
+    click.echo(f"Total: {sum(row[2] for row in rows)}")
+
+
+@report.command("coverage")
+@click.option("--environment", required=True, help="Nombre del entorno")
+@click.option(
+    "--campaign-run", type=int, help="Solo ejecuciones y bugs de esta ejecución"
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Exporta la matriz completa a CSV o XLSX",
+)
+@click.pass_context
+def report_coverage(
+    ctx: click.Context, environment: str, campaign_run: int | None, output: str | None
+):
+    """Cobertura de requisitos: pasos, ejecuciones y bugs abiertos."""
+    app_context = _bootstrap(ctx)
+    environment_id = _environment_id(app_context, environment)
+
+    if output:
+        try:
+            rows = app_context.get_service("export_service").export_coverage(
+                output, environment_id, campaign_run
+            )
+        except ValueError as e:
+            raise click.ClickException(str(e)) from e
+        click.echo(f"{rows} requisitos exportados a {output}")
+        return
+
+    coverage_service = app_context.get_service("coverage_service")
+    coverage = coverage_service.get_requirement_coverage(environment_id, campaign_run)
+    code_width = max([len("Code"), *(len(item.code) for item in coverage)])
+    click.echo(
+        f"{'Code':<{code_width}}  {'Status':<11}  Steps  Runs  Passed  Failed  Bugs"
+    )
+    for item in coverage:
+        click.echo(
+            f"{item.code:<{code_width}}  {item.status:<11}  {item.steps:>5}  "
+            f"{item.step_runs:>4}  {item.passed:>6}  {item.failed:>6}  {item.open_bugs:>4}"
+        )
+    summary = coverage_service.count_by_status(coverage)
+    click.echo(
+        f"Total: {len(coverage)} ("
+        + ", ".join(f"{status}: {count}" for status, count in sorted(summary.items()))
+        + ")"
+    )
+
+
+@report.command("progress")
+@click.argument("campaign_run_id", type=int)
+@click.pass_context
+def report_progress(ctx: click.Context, campaign_run_id: int):
+    """Progreso de una ejecución de campaña y de cada uno de sus casos."""
+    app_context = _bootstrap(ctx)
+    execution_service = app_context.get_service("execution_service")
+    try:
+        progress = execution_service.get_campaign_run_progress(campaign_run_id)
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+
+    click.echo(f"{'Case Run':>8}  Steps  Passed  Failed  Not Run  Done")
+    for item in execution_service.get_case_runs_progress(campaign_run_id):
+        click.echo(
+            f"{item.run_id:>8}  {item.total:>5}  {item.passed:>6}  {item.failed:>6}  "
+            f"{item.not_run:>7}  {item.percent_done:>3.0f}%"
+        )
+    click.echo(
+        f"Total: {progress.total} pasos, {progress.passed} superados, "
+        f"{progress.failed} fallidos, {progress.not_run} sin ejecutar "
+        f"({progress.percent_done:.0f}%)"
+    )
+
+
+# --- MANTENIMIENTO DE LA BD ---
+
+
+@cli.group()
+def db():
+    """Mantenimiento de la base de datos."""
+
+
+@db.command("init")
+@click.option("--no-seed", is_flag=True, help="No carga los datos iniciales")
+@click.pass_context
+def db_init(ctx: click.Context, no_seed: bool):
+    """Crea el esquema o aplica las migraciones pendientes (y los datos iniciales)."""
+    from uat_tool.infrastructure import (  # pylint: disable=import-outside-toplevel
+        get_schema_version,
+        init_db,
+    )
+
+    engine = _engine(ctx)
+    init_db(engine=engine, load_initial_data=not no_seed)
+    click.echo(f"Base de datos inicializada (esquema v{get_schema_version(engine)})")
+
+
+@db.command("version")
+@click.pass_context
+def db_version(ctx: click.Context):
+    """Muestra la versión del esquema de la BD y la de la aplicación."""
+    from uat_tool.infrastructure import (  # pylint: disable=import-outside-toplevel
+        SCHEMA_VERSION,
+        get_schema_version,
+    )
+
+    click.echo(f"Esquema de la BD: v{get_schema_version(_engine(ctx))}")
+    click.echo(f"Esquema de la aplicación: v{SCHEMA_VERSION}")
+
+
+@db.command("audit")
+@click.option("--min-rows", type=int, default=1000, show_default=True)
+@click.pass_context
+def db_audit(ctx: click.Context, min_rows: int):
+    """Audita los índices del esquema (código de salida 1 si hay problemas)."""
+    from uat_tool.infrastructure import (  # pylint: disable=import-outside-toplevel
+        audit_schema,
+    )
+
+    issues = audit_schema(_engine(ctx), min_rows)
+    for issue in issues:
+        click.echo(str(issue))
+    click.echo(f"{len(issues)} problemas encontrados")
+    if issues:
+        ctx.exit(1)
+
+
+@db.command("rebuild-search")
+@click.pass_context
+def db_rebuild_search(ctx: click.Context):
+    """Reconstruye y compacta los índices de búsqueda de texto completo."""
+    from uat_tool.infrastructure import (  # pylint: disable=import-outside-toplevel
+        rebuild_search_indexes,
+    )
+
+    rebuilt = rebuild_search_indexes(_engine(ctx))
+    click.echo(f"Índices reconstruidos: {', '.join(rebuilt) or 'ninguno'}")
+
+
+@db.command("rebuild-counters")
+@click.pass_context
+def db_rebuild_counters(ctx: click.Context):
+    """Recalcula los contadores de progreso de las ejecuciones."""
+    from uat_tool.infrastructure import (  # pylint: disable=import-outside-toplevel
+        rebuild_result_counters,
+    )
+
+    rebuilt = rebuild_result_counters(_engine(ctx))
+    click.echo(f"Contadores recalculados: {', '.join(rebuilt) or 'ninguno'}")
+
+
+@db.command("vacuum")
+@click.pass_context
+def db_vacuum(ctx: click.Context):
+    """Actualiza las estadísticas del planificador y compacta el archivo."""
+    engine = _engine(ctx)
+    if engine.dialect.name != "sqlite":
+        raise click.ClickException("vacuum solo está disponible para SQLite")
+
+    # VACUUM no puede ejecutarse dentro de una transacción
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.exec_driver_sql("PRAGMA optimize")
+        connection.exec_driver_sql("VACUUM")
+    click.echo("Base de datos compactada")
+
+
+# --- BENCHMARKS ---
+
+
+@cli.group()
+def benchmark():
+    """Benchmarks de rendimiento."""
+
+
+@benchmark.command("sqlite-profiles")
+@click.option("--commits", type=int, default=200, show_default=True)
+@click.option("--readers", type=int, default=4, show_default=True)
+@click.option("--duration", type=float, default=2.0, show_default=True)
+@click.option(
+    "--output", type=click.Path(dir_okay=False), help="Guarda el informe en JSON"
+)
+def benchmark_sqlite_profiles(
+    commits: int, readers: int, duration: float, output: str | None
+):
+    """Compara los perfiles de PRAGMAs de SQLite (escrituras y lecturas)."""
+    from uat_tool.benchmarks import sqlite_profiles  # pylint: disable=import-outside-toplevel
+
+    argv = [
+        "--commits",
+        str(commits),
+        "--readers",
+        str(readers),
+        "--duration",
+        str(duration),
+    ]
+    if output:
+        argv += ["--output", output]
+    sqlite_profiles.main(argv)
+
+
+@benchmark.command("startup")
+@click.option("--repeat", type=click.IntRange(min=1), default=3, show_default=True)
+@click.option("--top", type=click.IntRange(min=1), default=15, show_default=True)
+@click.option(
+    "--output", type=click.Path(dir_okay=False), help="Guarda el informe en JSON"
+)
+def benchmark_startup(repeat: int, top: int, output: str | None):
+    """Desglosa el tiempo de import de la GUI (-X importtime)."""
+    from uat_tool.benchmarks import startup  # pylint: disable=import-outside-toplevel
+
+    argv = ["--repeat", str(repeat), "--top", str(top)]
+    if output:
+        argv += ["--output", output]
+    startup.main(argv)
+
+
+@benchmark.command("uow")
+@click.option(
+    "--iterations", type=click.IntRange(min=1), default=10_000, show_default=True
+)
+@click.option(
+    "--output", type=click.Path(dir_okay=False), help="Guarda el informe en JSON"
+)
+def benchmark_uow(iterations: int, output: str | None):
+    """Mide el coste fijo de abrir una unidad de trabajo."""
+    from uat_tool.benchmarks import uow  # pylint: disable=import-outside-toplevel
+
+    argv = ["--iterations", str(iterations)]
+    if output:
+        argv += ["--output", output]
+    uow.main(argv)
+
+
+@benchmark.command("dataset")
+@click.argument("path", type=click.Path(dir_okay=False, path_type=Path))
+@click.option(
+    "--scale", type=click.Choice(["1k", "10k", "100k"]), default="1k", show_default=True
+)
+@click.option("--seed", type=int, default=0, show_default=True)
+def benchmark_dataset(path: Path, scale: str, seed: int):
+    """Genera un dataset sintético determinista en una BD SQLite nueva."""
+    from uat_tool.benchmarks import datasets  # pylint: disable=import-outside-toplevel
+
+    if path.exists():
+        raise click.ClickException(f"{path} ya existe")
+    datasets.main(["--scale", scale, "--seed", str(seed), "--output", str(path)])
+
+
+@benchmark.command("services")
+@click.option(
+    "--scale", type=click.Choice(["1k", "10k", "100k"]), default="1k", show_default=True
+)
+@click.option("--repeat", type=click.IntRange(min=1), default=3, show_default=True)
+@click.option(
+    "--dataset",
+    type=click.Path(dir_okay=False),
+    help="BD del dataset (se genera si no existe y se reutiliza después)",
+)
+@click.option(
+    "--only", multiple=True, help="Prefijo de las operaciones a medir (repetible)"
+)
+@click.option(
+    "--output", type=click.Path(dir_okay=False), help="Guarda el informe en JSON"
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Informe JSON de otro commit; código de salida 1 si hay regresiones",
+)
+@click.pass_context
+def benchmark_services(
+    ctx: click.Context,
+    scale: str,
+    repeat: int,
+    dataset: str | None,
+    only: tuple[str, ...],
+    output: str | None,
+    baseline: str | None,
+):
+    """Mide los servicios principales sobre un dataset sintético."""
+    from uat_tool.benchmarks import services  # pylint: disable=import-outside-toplevel
+
+    if ctx.obj["db"]:
+        raise click.ClickException("benchmark services usa su propia BD: use --dataset")
+
+    argv = ["--scale", scale, "--repeat", str(repeat)]
+    if dataset:
+        argv += ["--db", dataset]
+    for prefix in only:
+        argv += ["--only", prefix]
+    if output:
+        argv += ["--output", output]
+    if baseline:
+        argv += ["--baseline", baseline]
+    ctx.exit(services.main(argv))
+
+
+def main():
+    """Punto de entrada de `python -m uat_tool`."""
+    cli(obj={})  # pylint: disable=no-value-for-parameter
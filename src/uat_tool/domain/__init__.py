@@ -54,6 +54,7 @@ from .models import (
     zone_reasons,
 )
 from .repositories import (
+    GROUP_SEPARATOR,
     BaseRepository,
     BlockRepository,
     BugRepository,
@@ -118,6 +119,7 @@ __all__ = [
     "bug_requirements",
     # Repositories
     "BaseRepository",
+    "GROUP_SEPARATOR",
     "DroneRepository",
     "EmailRepository",
     "OperatorRepository",
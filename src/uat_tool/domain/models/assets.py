@@ -13,6 +13,7 @@ from sqlalchemy import (
     Column,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -63,6 +64,7 @@ class Operator(AuditMixin, EnvironmentMixin, Base):
         Integer,
         ForeignKey("emails.id", ondelete="RESTRICT"),
         nullable=False,
+        index=True,
     )
 
     __table_args__ = (
@@ -96,12 +98,19 @@ class Drone(AuditMixin, EnvironmentMixin, Base):
     transponder_id = Column(String, nullable=False)
 
     operator_id = Column(
-        Integer, ForeignKey("operators.id", ondelete="RESTRICT"), nullable=False
+        Integer,
+        ForeignKey("operators.id", ondelete="RESTRICT"),
+        nullable=False,
+        index=True,
     )
     operator = relationship("Operator", back_populates="drones")
     cases = relationship("Case", secondary="case_drones", back_populates="drones")
     environment = relationship("Environment", back_populates="drones")
 
+    __table_args__ = (
+        Index("ix_drones_environment_serial", "environment_id", "serial_number"),
+    )
+
 
 # ---- U-HUB ORGANIZATIONS ---- #
 
@@ -153,6 +162,7 @@ class UhubUser(AuditMixin, EnvironmentMixin, Base):
         Integer,
         ForeignKey("uhub_orgs.id", ondelete="RESTRICT"),
         nullable=False,
+        index=True,
     )
     organization = relationship("UhubOrg", back_populates="users")
     cases = relationship(
@@ -24,6 +24,7 @@ zone_organization = Table(
         Integer,
         ForeignKey("uhub_orgs.id", ondelete="RESTRICT"),
         primary_key=True,
+        index=True,
     ),
 )
 
@@ -42,6 +43,7 @@ zone_reasons = Table(
         Integer,
         ForeignKey("reasons.id", ondelete="RESTRICT"),
         primary_key=True,
+        index=True,
     ),
 )
 
@@ -60,6 +62,7 @@ requirement_systems = Table(
         Integer,
         ForeignKey("systems.id", ondelete="RESTRICT"),
         primary_key=True,
+        index=True,
     ),
 )
 
@@ -77,6 +80,7 @@ requirement_sections = Table(
         Integer,
         ForeignKey("sections.id", ondelete="RESTRICT"),
         primary_key=True,
+        index=True,
     ),
 )
 
@@ -92,6 +96,7 @@ step_requirements = Table(
         Integer,
         ForeignKey("requirements.id", ondelete="RESTRICT"),
         primary_key=True,
+        index=True,
     ),
 )
 
@@ -107,6 +112,7 @@ case_systems = Table(
         Integer,
         ForeignKey("systems.id", ondelete="RESTRICT"),
         primary_key=True,
+        index=True,
     ),
 )
 
@@ -121,6 +127,7 @@ case_sections = Table(
         Integer,
         ForeignKey("sections.id", ondelete="RESTRICT"),
         primary_key=True,
+        index=True,
     ),
 )
 
@@ -135,6 +142,7 @@ case_operators = Table(
         Integer,
         ForeignKey("operators.id", ondelete="RESTRICT"),
         primary_key=True,
+        index=True,
     ),
 )
 
@@ -149,6 +157,7 @@ case_drones = Table(
         Integer,
         ForeignKey("drones.id", ondelete="RESTRICT"),
         primary_key=True,
+        index=True,
     ),
 )
 
@@ -163,6 +172,7 @@ case_uhub_users = Table(
         Integer,
         ForeignKey("uhub_users.id", ondelete="RESTRICT"),
         primary_key=True,
+        index=True,
     ),
 )
 
@@ -177,6 +187,7 @@ case_uas_zones = Table(
         Integer,
         ForeignKey("uas_zones.id", ondelete="RESTRICT"),
         primary_key=True,
+        index=True,
     ),
 )
 
@@ -195,6 +206,7 @@ block_cases = Table(
         Integer,
         ForeignKey("cases.id", ondelete="RESTRICT"),
         primary_key=True,
+        index=True,
     ),
 )
 
@@ -213,6 +225,7 @@ campaign_blocks = Table(
         Integer,
         ForeignKey("blocks.id", ondelete="RESTRICT"),
         primary_key=True,
+        index=True,
     ),
 )
 
@@ -222,5 +235,11 @@ bug_requirements = Table(
     "bug_requirements",
     Base.metadata,
     Column("bug_id", Integer, ForeignKey("bugs.id"), primary_key=True),
-    Column("requirement_id", Integer, ForeignKey("requirements.id"), primary_key=True),
+    Column(
+        "requirement_id",
+        Integer,
+        ForeignKey("requirements.id"),
+        primary_key=True,
+        index=True,
+    ),
 )
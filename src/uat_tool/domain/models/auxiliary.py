@@ -7,7 +7,7 @@ Environments, Systems, Sections, Reasons y Files.
 Todos los modelos heredan EnvironmentMixin (excepto Environment) y Base para coherencia con el ORM.
 """
 
-from sqlalchemy import Column, DateTime, Integer, String, Text, func
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, func
 from sqlalchemy.orm import relationship
 
 from uat_tool.infrastructure import Base
@@ -95,9 +95,11 @@ class File(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     owner_type = Column(String, nullable=False)
     owner_id = Column(Integer, nullable=False)
-    filename = Column(String, nullable=False)
+    filename = Column(String, nullable=False, index=True)
     filepath = Column(String, nullable=False)
     mime_type = Column(String, nullable=False)
     size = Column(String, nullable=False)
     uploaded_by = Column(String, nullable=False)
     uploaded_at = Column(DateTime, server_default=func.now(), nullable=False)  # pylint: disable=not-callable
+
+    __table_args__ = (Index("ix_files_owner", "owner_type", "owner_id"),)
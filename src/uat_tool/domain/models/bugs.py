@@ -10,6 +10,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -19,7 +20,12 @@ from sqlalchemy.orm import (
     relationship,
 )
 
-from uat_tool.infrastructure import AuditMixin, Base, EnvironmentMixin
+from uat_tool.infrastructure import (
+    AuditMixin,
+    Base,
+    EnvironmentMixin,
+    register_search_index,
+)
 
 
 # ---- BUGS ---- #
@@ -43,10 +49,10 @@ class Bug(AuditMixin, EnvironmentMixin, Base):
         Integer, ForeignKey("systems.id", ondelete="RESTRICT"), nullable=False
     )
     campaign_run_id = Column(
-        Integer, ForeignKey("campaign_runs.id", ondelete="RESTRICT")
+        Integer, ForeignKey("campaign_runs.id", ondelete="RESTRICT"), index=True
     )
     system_version = Column(String, nullable=False)
-    service_now_id = Column(String)
+    service_now_id = Column(String, index=True)
     short_description = Column(String, nullable=False)
     definition = Column(Text, nullable=False)
     urgency = Column(Integer, nullable=False)
@@ -61,6 +67,12 @@ class Bug(AuditMixin, EnvironmentMixin, Base):
     system = relationship("System", back_populates="bugs")
     history = relationship("BugHistory", back_populates="bug")
 
+    __table_args__ = (
+        Index("ix_bugs_environment_status", "environment_id", "status"),
+        Index("ix_bugs_system_environment", "system_id", "environment_id"),
+        Index("ix_bugs_updated_at_id", "updated_at", "id"),  # Paginación keyset
+    )
+
 
 # ---- HISTORIAL DE BUGS ---- #
 class BugHistory(Base):
@@ -70,9 +82,15 @@ class BugHistory(Base):
 
     __tablename__ = "bug_history"
     id = Column(Integer, primary_key=True, autoincrement=True)
-    bug_id = Column(Integer, ForeignKey("bugs.id", ondelete="CASCADE"), nullable=False)
+    bug_id = Column(
+        Integer, ForeignKey("bugs.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     changed_by = Column(String, nullable=False)
     change_timestamp = Column(DateTime, server_default=func.now(), nullable=False)  # pylint: disable=not-callable
     change_summary = Column(Text, nullable=False)
 
     bug = relationship("Bug", back_populates="history")
+
+
+# ---- BÚSQUEDA DE TEXTO COMPLETO ---- #
+register_search_index(Bug.__table__, "short_description", "definition", "comments")
@@ -12,6 +12,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -21,7 +22,7 @@ from sqlalchemy.orm import (
     relationship,
 )
 
-from uat_tool.infrastructure import Base, EnvironmentMixin
+from uat_tool.infrastructure import Base, EnvironmentMixin, register_result_counters
 
 
 # ---- EJECUCIÓN DE CAMPAÑAS ---- #
@@ -31,7 +32,10 @@ class CampaignRun(EnvironmentMixin, Base):
     __tablename__ = "campaign_runs"
     id = Column(Integer, primary_key=True, autoincrement=True)
     campaign_id = Column(
-        Integer, ForeignKey("campaigns.id", ondelete="RESTRICT"), nullable=False
+        Integer,
+        ForeignKey("campaigns.id", ondelete="RESTRICT"),
+        nullable=False,
+        index=True,
     )
     started_at = Column(DateTime, server_default=func.now(), nullable=False)  # pylint: disable=not-callable
     updated_at = Column(
@@ -42,6 +46,11 @@ class CampaignRun(EnvironmentMixin, Base):
     modified_by = Column(String, nullable=False)
     notes = Column(Text)
 
+    # Progreso de los step runs, mantenido por triggers (ver registro al final)
+    steps_total = Column(Integer, nullable=False, server_default="0", default=0)
+    steps_passed = Column(Integer, nullable=False, server_default="0", default=0)
+    steps_failed = Column(Integer, nullable=False, server_default="0", default=0)
+
     case_runs = relationship("CaseRun", back_populates="campaign_run")
     step_runs = relationship("StepRun", back_populates="campaign_run")
     bugs = relationship("Bug", back_populates="campaign_run")
@@ -50,6 +59,8 @@ class CampaignRun(EnvironmentMixin, Base):
     )
     campaign = relationship("Campaign", back_populates="campaign_runs")
 
+    __table_args__ = (Index("ix_campaign_runs_environment_id", "environment_id"),)
+
 
 class CaseRun(Base):
     """Modelo que representa el estado de ejecución de un caso de prueba dentro de una campaña."""
@@ -57,13 +68,21 @@ class CaseRun(Base):
     __tablename__ = "case_runs"
     id = Column(Integer, primary_key=True, autoincrement=True)
     campaign_run_id = Column(
-        Integer, ForeignKey("campaign_runs.id", ondelete="RESTRICT"), nullable=False
+        Integer,
+        ForeignKey("campaign_runs.id", ondelete="RESTRICT"),
+        nullable=False,
+        index=True,
     )
     case_id = Column(
-        Integer, ForeignKey("cases.id", ondelete="RESTRICT"), nullable=False
+        Integer, ForeignKey("cases.id", ondelete="RESTRICT"), nullable=False, index=True
     )
     notes = Column(Text)
 
+    # Progreso de los step runs, mantenido por triggers (ver registro al final)
+    steps_total = Column(Integer, nullable=False, server_default="0", default=0)
+    steps_passed = Column(Integer, nullable=False, server_default="0", default=0)
+    steps_failed = Column(Integer, nullable=False, server_default="0", default=0)
+
     step_runs = relationship("StepRun", back_populates="case_run")
     campaign_run = relationship("CampaignRun", back_populates="case_runs")
     case = relationship("Case", back_populates="case_runs")
@@ -75,13 +94,19 @@ class StepRun(Base):
     __tablename__ = "step_runs"
     id = Column(Integer, primary_key=True, autoincrement=True)
     campaign_run_id = Column(
-        Integer, ForeignKey("campaign_runs.id", ondelete="RESTRICT"), nullable=False
+        Integer,
+        ForeignKey("campaign_runs.id", ondelete="RESTRICT"),
+        nullable=False,
+        index=True,
     )
     case_run_id = Column(
-        Integer, ForeignKey("case_runs.id", ondelete="RESTRICT"), nullable=False
+        Integer,
+        ForeignKey("case_runs.id", ondelete="RESTRICT"),
+        nullable=False,
+        index=True,
     )
     step_id = Column(
-        Integer, ForeignKey("steps.id", ondelete="RESTRICT"), nullable=False
+        Integer, ForeignKey("steps.id", ondelete="RESTRICT"), nullable=False, index=True
     )
     passed = Column(Boolean)
     notes = Column(Text)
@@ -89,3 +114,17 @@ class StepRun(Base):
     step = relationship("Step", back_populates="step_runs")
     campaign_run = relationship("CampaignRun", back_populates="step_runs")
     case_run = relationship("CaseRun", back_populates="step_runs")
+
+    __table_args__ = (
+        # Cubre la cobertura de requisitos por ejecución sin leer la tabla
+        Index("ix_step_runs_step_campaign_run", "step_id", "campaign_run_id", "passed"),
+    )
+
+
+# ---- CONTADORES DE PROGRESO ---- #
+register_result_counters(
+    CampaignRun.__table__, StepRun.__table__, "campaign_run_id", "passed", "steps"
+)
+register_result_counters(
+    CaseRun.__table__, StepRun.__table__, "case_run_id", "passed", "steps"
+)
@@ -11,7 +11,12 @@ from sqlalchemy.orm import (
     relationship,
 )
 
-from uat_tool.infrastructure import AuditMixin, Base, EnvironmentMixin
+from uat_tool.infrastructure import (
+    AuditMixin,
+    Base,
+    EnvironmentMixin,
+    register_search_index,
+)
 
 
 # ---- REQUIREMENTS ---- #
@@ -43,3 +48,7 @@ class Requirement(AuditMixin, EnvironmentMixin, Base):
     bugs = relationship(
         "Bug", secondary="bug_requirements", back_populates="requirements"
     )
+
+
+# ---- BÚSQUEDA DE TEXTO COMPLETO ---- #
+register_search_index(Requirement.__table__, "code", "definition")
@@ -11,7 +11,12 @@ from sqlalchemy.orm import (
     relationship,
 )
 
-from uat_tool.infrastructure import AuditMixin, Base, EnvironmentMixin
+from uat_tool.infrastructure import (
+    AuditMixin,
+    Base,
+    EnvironmentMixin,
+    register_search_index,
+)
 
 
 # ---- TEST MANAGEMENT ---- #
@@ -23,7 +28,7 @@ class Step(Base):
     comments = Column(Text, nullable=False)
 
     case_id = Column(
-        Integer, ForeignKey("cases.id", ondelete="CASCADE"), nullable=False
+        Integer, ForeignKey("cases.id", ondelete="CASCADE"), nullable=False, index=True
     )
     step_runs = relationship("StepRun", back_populates="step")
     requirements = relationship(
@@ -67,7 +72,10 @@ class Block(AuditMixin, EnvironmentMixin, Base):
     code = Column(String, nullable=False)
     name = Column(String)
     system_id = Column(
-        Integer, ForeignKey("systems.id", ondelete="RESTRICT"), nullable=False
+        Integer,
+        ForeignKey("systems.id", ondelete="RESTRICT"),
+        nullable=False,
+        index=True,
     )
     comments = Column(Text)
 
@@ -85,7 +93,10 @@ class Campaign(AuditMixin, EnvironmentMixin, Base):
     code = Column(String, nullable=False)
     description = Column(Text, nullable=False)
     system_id = Column(
-        Integer, ForeignKey("systems.id", ondelete="RESTRICT"), nullable=False
+        Integer,
+        ForeignKey("systems.id", ondelete="RESTRICT"),
+        nullable=False,
+        index=True,
     )
     system_version = Column(String, nullable=False)
     comments = Column(Text)
@@ -106,3 +117,8 @@ class Campaign(AuditMixin, EnvironmentMixin, Base):
     environment = relationship(
         "Environment", back_populates="campaigns"
     )
+
+
+# ---- BÚSQUEDA DE TEXTO COMPLETO ---- #
+register_search_index(Case.__table__, "name", "comments")
+register_search_index(Step.__table__, "action", "expected_result")
@@ -39,7 +39,7 @@ from .auxiliary_repository import (
     SectionRepository,
     SystemRepository,
 )
-from .base import BaseRepository
+from .base import GROUP_SEPARATOR, BaseRepository
 
 # ---- Bug Repositories ----
 from .bug_repository import BugRepository
@@ -64,6 +64,7 @@ from .test_management_repository import (
 
 __all__ = [
     "BaseRepository",
+    "GROUP_SEPARATOR",
     # Asset Repositories
     "DroneRepository",
     "EmailRepository",
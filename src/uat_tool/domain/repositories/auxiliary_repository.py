@@ -1,6 +1,9 @@
+from collections.abc import Iterable
+
 from sqlalchemy.orm import Session, joinedload
 
 from uat_tool.domain import Environment, File, Reason, Section, System
+from uat_tool.infrastructure import chunked
 
 from .base import BaseRepository
 
@@ -96,12 +99,29 @@ class FileRepository(BaseRepository[File]):
             .all()
         )
 
-    def get_by_owners(self, owner_type: str, owner_ids: list[int]) -> list[File]:
-        return (
-            self.query()
-            .filter(File.owner_type == owner_type, File.owner_id.in_(owner_ids))
-            .all()
-        )
+    def get_by_owners(self, owner_type: str, owner_ids: Iterable[int]) -> list[File]:
+        """Obtiene los archivos de varios propietarios del mismo tipo.
+
+        Los IDs se consultan en bloques para no superar el límite de parámetros
+        de SQLite en la cláusula IN.
+
+        Args:
+            owner_type (str): tipo de propietario ("bug", "case", ...)
+            owner_ids (Iterable[int]): IDs de los propietarios
+
+        Returns:
+            list[File]: archivos encontrados, ordenados por propietario e ID.
+        """
+        unique_ids = sorted({id for id in owner_ids if id is not None})
+        files = []
+        for chunk in chunked(unique_ids):
+            files.extend(
+                self.query()
+                .filter(File.owner_type == owner_type, File.owner_id.in_(chunk))
+                .order_by(File.owner_id, File.id)
+                .all()
+            )
+        return files
 
 
 class ReasonRepository(BaseRepository[Reason]):
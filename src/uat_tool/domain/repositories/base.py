@@ -1,14 +1,46 @@
 import logging
+from collections.abc import Iterable, Iterator
 from typing import Any, Generic, TypeVar
 
+from sqlalchemy import Row, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import (
+    InstrumentedAttribute,
+    Query,
+    Session,
+    joinedload,
+    lazyload,
+    noload,
+    selectinload,
+)
+
+from uat_tool.infrastructure import (
+    DEFAULT_SEARCH_LIMIT,
+    SearchHit,
+    chunked,
+    search_index,
+)
 
 # Configurar logging
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Registros por lote al recorrer una tabla completa con `iter_batches`
+STREAM_BATCH_SIZE = 1000
+
+# Separador de los valores agregados con group_concat en las proyecciones
+# para tablas (no aparece en nombres ni códigos)
+GROUP_SEPARATOR = "\x1f"
+
+# Estrategias de carga de relaciones que se pueden elegir por llamada
+LOADER_STRATEGIES = {
+    "selectin": selectinload,
+    "joined": joinedload,
+    "lazy": lazyload,
+    "noload": noload,  # La relación queda vacía: para lecturas que no la usan
+}
+
 
 class BaseRepository(Generic[T]):
     """Repositorio base genérico para operaciones CRUD con manejo de errores
@@ -65,6 +97,159 @@ class BaseRepository(Generic[T]):
         """
         return self.session.query(self.model_class).filter_by(**kwargs).all()
 
+    def get_by_ids(self, ids: Iterable[int]) -> list[T]:
+        """Obtiene varios registros por sus IDs con consultas IN por bloques.
+
+        Args:
+            ids: IDs de los registros a buscar (se ignoran duplicados y None)
+
+        Returns:
+            Lista de instancias encontradas (sin orden garantizado)
+        """
+        unique_ids = {id for id in ids if id is not None}
+        instances = []
+        for chunk in chunked(unique_ids):
+            instances.extend(
+                self.session.query(self.model_class)
+                .filter(self.model_class.id.in_(chunk))
+                .all()
+            )
+        return instances
+
+    def get_field_by_ids(self, ids: Iterable[int], field: str) -> dict[int, Any]:
+        """Obtiene un único campo de varios registros sin hidratar entidades.
+
+        Args:
+            ids: IDs de los registros a buscar (se ignoran duplicados y None)
+            field: nombre de la columna a devolver (p.ej. "name" o "code")
+
+        Returns:
+            Diccionario {id: valor} con los registros encontrados
+        """
+        column = getattr(self.model_class, field)
+        unique_ids = {id for id in ids if id is not None}
+        values = {}
+        for chunk in chunked(unique_ids):
+            rows = (
+                self.session.query(self.model_class.id, column)
+                .filter(self.model_class.id.in_(chunk))
+                .all()
+            )
+            values.update({row_id: value for row_id, value in rows})
+        return values
+
+    def iter_batches(
+        self, batch_size: int = STREAM_BATCH_SIZE, options: list | None = None
+    ) -> Iterator[list[T]]:
+        """Recorre todos los registros por lotes, ordenados por ID.
+
+        La consulta se ejecuta con `yield_per`, así que el cursor entrega
+        `batch_size` filas cada vez y las relaciones con selectinload se cargan
+        con una consulta IN por lote. Cada lote se libera al pedir el siguiente
+        (el identity map de la sesión solo guarda referencias débiles), de modo
+        que la memoria no crece con el tamaño de la tabla.
+
+        Args:
+            batch_size: registros por lote
+            options: opciones de carga (p.ej. de `eager_options`); las
+                colecciones no pueden usar joinedload con yield_per
+
+        Yields:
+            Listas de como máximo `batch_size` instancias
+        """
+        statement = (
+            select(self.model_class)
+            .options(*(options or []))
+            .order_by(self.model_class.id)
+            .execution_options(yield_per=batch_size)
+        )
+        for partition in self.session.execute(statement).scalars().partitions():
+            yield list(partition)
+
+    def iter_rows(
+        self, query: Query, batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[list[Row]]:
+        """Recorre por lotes las filas de una consulta de columnas (proyección).
+
+        Igual que `iter_batches` pero para consultas que no cargan entidades:
+        el cursor entrega `batch_size` filas cada vez.
+
+        Args:
+            query: consulta ya ordenada
+            batch_size: filas por lote
+
+        Yields:
+            Listas de como máximo `batch_size` filas
+        """
+        statement = query.statement.execution_options(yield_per=batch_size)
+        for partition in self.session.execute(statement).partitions():
+            yield list(partition)
+
+    def eager_options(
+        self,
+        *paths: InstrumentedAttribute | tuple[InstrumentedAttribute, ...],
+        strategies: dict[str, str] | None = None,
+    ) -> list:
+        """Construye las opciones de carga para las relaciones indicadas.
+
+        Por defecto las colecciones se cargan con selectinload (una consulta IN
+        adicional por relación, sin multiplicar filas) y las relaciones
+        many-to-one con joinedload (un LEFT JOIN que no duplica filas).
+
+        Args:
+            *paths: relaciones a cargar; una tupla indica una ruta anidada
+                (p.ej. `(CampaignRun.case_runs, CaseRun.step_runs)`)
+            strategies: estrategia por ruta para sobrescribir la de defecto,
+                con claves como "history" o "case_runs.step_runs" y valores de
+                `LOADER_STRATEGIES` ("selectin", "joined", "lazy" o "noload")
+
+        Returns:
+            Lista de opciones para pasar a `Query.options`
+
+        Raises:
+            ValueError: Si se indica una estrategia desconocida
+        """
+        strategies = strategies or {}
+        options = []
+        for path in paths:
+            attributes = path if isinstance(path, tuple) else (path,)
+            option = None
+            keys = []
+            for attribute in attributes:
+                keys.append(attribute.key)
+                default = "selectin" if attribute.property.uselist else "joined"
+                strategy = strategies.get(".".join(keys), default)
+                if strategy not in LOADER_STRATEGIES:
+                    raise ValueError(f"Estrategia de carga desconocida: {strategy}")
+                if option is None:
+                    option = LOADER_STRATEGIES[strategy](attribute)
+                else:
+                    option = getattr(option, f"{strategy}load")(attribute)
+            options.append(option)
+        return options
+
+    def search(
+        self, search_text: str, limit: int = DEFAULT_SEARCH_LIMIT
+    ) -> list[SearchHit]:
+        """Búsqueda de texto completo en el índice FTS5 del modelo.
+
+        Cada palabra se busca como prefijo, sin distinguir mayúsculas ni
+        tildes, y deben aparecer todas.
+
+        Args:
+            search_text: texto introducido por el usuario
+            limit: número máximo de resultados
+
+        Returns:
+            Resultados (id, relevancia, fragmento) del más al menos relevante
+
+        Raises:
+            ValueError: si el modelo no tiene índice de búsqueda registrado
+        """
+        return search_index(
+            self.session, self.model_class.__tablename__, search_text, limit
+        )
+
     def query(self) -> Query:
         """Devuelve una query base para construir consultas personalizadas.
 
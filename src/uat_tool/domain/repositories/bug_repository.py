@@ -1,19 +1,39 @@
+from collections.abc import Iterable, Iterator
+
+from sqlalchemy import Row, String, func, literal, select, tuple_, type_coerce
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Query, Session
 
 from uat_tool.domain import (
     Bug,
     BugHistory,
     CampaignRun,
+    File,
     Requirement,
     System,
+    bug_requirements,
+)
+from uat_tool.infrastructure import chunked
+from uat_tool.shared import (
+    BUG_STATUS_ON_HOLD,
+    BUG_STATUS_OPEN,
+    BUG_STATUS_PENDING,
+    get_logger,
 )
-from uat_tool.shared import get_logger
 
-from .base import AuditEnvironmentMixinRepository
+from .base import GROUP_SEPARATOR, STREAM_BATCH_SIZE, AuditEnvironmentMixinRepository
 
 logger = get_logger(__name__)
 
+# updated_at tal y como está guardado en SQLite. El cursor de paginación se
+# compara contra el texto almacenado para no depender de cómo se formatee el
+# datetime al volver a enviarlo como parámetro (CURRENT_TIMESTAMP no guarda
+# microsegundos y SQLAlchemy sí los añade).
+_UPDATED_AT_RAW = type_coerce(Bug.updated_at, String)
+
+# Estados de un bug que todavía no está cerrado
+OPEN_BUG_STATUSES = (BUG_STATUS_OPEN, BUG_STATUS_PENDING, BUG_STATUS_ON_HOLD)
+
 
 class BugRepository(AuditEnvironmentMixinRepository[Bug]):
     """Repositorio específico para la entidad Bug."""
@@ -231,7 +251,7 @@ class BugRepository(AuditEnvironmentMixinRepository[Bug]):
         """Devuelve un bug junto con su historial cargado."""
         return (
             self.session.query(Bug)
-            .options(joinedload(Bug.history))
+            .options(*self.eager_options(Bug.history))
             .filter(Bug.id == bug_id)
             .one_or_none()
         )
@@ -284,29 +304,230 @@ class BugRepository(AuditEnvironmentMixinRepository[Bug]):
             .first()
         )
 
-    def get_with_relations(self, bug_id: int) -> Bug | None:
-        """Obtiene un bug con sus relaciones cargadas."""
+    def count_by_status_and_system(self) -> list[tuple[str, int | None, int]]:
+        """Cuenta los bugs agrupados por estado y sistema con un solo GROUP BY.
+
+        Returns:
+            list[tuple[str, int | None, int]]: (estado, system_id, número de bugs)
+        """
+        return [
+            tuple(row)
+            for row in self.session.query(Bug.status, Bug.system_id, func.count(Bug.id))
+            .group_by(Bug.status, Bug.system_id)
+            .order_by(Bug.status, Bug.system_id)
+            .all()
+        ]
+
+    def _relations_options(self, strategies: dict[str, str] | None) -> list:
+        """Opciones de carga de system, campaign_run, requirements e history."""
+        return self.eager_options(
+            Bug.system,
+            Bug.campaign_run,
+            Bug.requirements,
+            Bug.history,
+            strategies=strategies,
+        )
+
+    def get_with_relations(
+        self, bug_id: int, strategies: dict[str, str] | None = None
+    ) -> Bug | None:
+        """Obtiene un bug con sus relaciones cargadas.
+
+        Args:
+            bug_id: ID del bug
+            strategies: estrategias de carga por relación (ver `eager_options`)
+        """
         return (
             self.query()
-            .options(
-                joinedload(Bug.system),
-                joinedload(Bug.campaign_run),
-                joinedload(Bug.requirements),
-                joinedload(Bug.history),
-            )
+            .options(*self._relations_options(strategies))
             .filter(Bug.id == bug_id)
             .first()
         )
 
-    def get_all_with_relations(self) -> list[Bug]:
-        """Obtiene todos los bugs con sus relaciones cargadas."""
-        return (
-            self.query()
-            .options(
-                joinedload(Bug.system),
-                joinedload(Bug.campaign_run),
-                joinedload(Bug.requirements),
-                joinedload(Bug.history),
+    def get_all_with_relations(
+        self, strategies: dict[str, str] | None = None
+    ) -> list[Bug]:
+        """Obtiene todos los bugs con sus relaciones cargadas.
+
+        Args:
+            strategies: estrategias de carga por relación (ver `eager_options`)
+        """
+        return self.query().options(*self._relations_options(strategies)).all()
+
+    def iter_with_relations(
+        self,
+        batch_size: int = STREAM_BATCH_SIZE,
+        strategies: dict[str, str] | None = None,
+    ) -> Iterator[list[Bug]]:
+        """Recorre todos los bugs por lotes con sus relaciones cargadas.
+
+        Args:
+            batch_size: bugs por lote (ver `iter_batches`)
+            strategies: estrategias de carga por relación (ver `eager_options`)
+        """
+        return self.iter_batches(batch_size, self._relations_options(strategies))
+
+    def get_with_relations_by_ids(
+        self, bug_ids, strategies: dict[str, str] | None = None
+    ) -> list[Bug]:
+        """Obtiene varios bugs con sus relaciones cargadas (sin orden garantizado).
+
+        Args:
+            bug_ids: IDs de los bugs (p.ej. resultados de `search`)
+            strategies: estrategias de carga por relación (ver `eager_options`)
+        """
+        bugs = []
+        for chunk in chunked(set(bug_ids)):
+            bugs.extend(
+                self.query()
+                .options(*self._relations_options(strategies))
+                .filter(Bug.id.in_(chunk))
+                .all()
             )
-            .all()
+        return bugs
+
+    def get_page(
+        self,
+        limit: int,
+        after: tuple[str | None, int] | None = None,
+        strategies: dict[str, str] | None = None,
+    ) -> tuple[list[Bug], tuple[str | None, int] | None]:
+        """Obtiene una página de bugs con paginación keyset sobre (updated_at, id).
+
+        Los bugs se ordenan del último modificado al más antiguo; los que nunca
+        se han editado (updated_at NULL) van al final ordenados por id. Cada
+        página es una búsqueda en el índice `ix_bugs_updated_at_id`, así que su
+        coste no depende de cuántas páginas se hayan leído antes.
+
+        Args:
+            limit: número máximo de bugs de la página
+            after: cursor devuelto por la llamada anterior; None para la primera
+            strategies: estrategias de carga por relación (ver `eager_options`)
+
+        Returns:
+            tuple: (bugs, cursor de la página siguiente o None si no hay más)
+        """
+        query = self.session.query(Bug).options(*self._relations_options(strategies))
+        rows, next_cursor = self._keyset_page(query, limit, after)
+        return [row[0] for row in rows], next_cursor
+
+    def _keyset_page(
+        self, query: Query, limit: int, after: tuple[str | None, int] | None
+    ) -> tuple[list[Row], tuple[str | None, int] | None]:
+        """Aplica la paginación keyset de `get_page` a una consulta de bugs.
+
+        Sirve tanto para consultas de entidades como para proyecciones: se
+        añaden las columnas del cursor y se devuelven las filas completas.
+        """
+        query = query.add_columns(
+            _UPDATED_AT_RAW.label("cursor_updated_at"), Bug.id.label("cursor_id")
+        )
+        rows = []
+
+        # Tramo 1: bugs con updated_at, del más reciente al más antiguo
+        if after is None or after[0] is not None:
+            updated = query.filter(Bug.updated_at.is_not(None))
+            if after is not None:
+                updated = updated.filter(tuple_(_UPDATED_AT_RAW, Bug.id) < after)
+            rows = (
+                updated.order_by(Bug.updated_at.desc(), Bug.id.desc())
+                .limit(limit)
+                .all()
+            )
+
+        # Tramo 2: bugs nunca editados, completando la página si hace falta
+        if len(rows) < limit:
+            never_updated = query.filter(Bug.updated_at.is_(None))
+            if after is not None and after[0] is None:
+                never_updated = never_updated.filter(Bug.id < after[1])
+            rows += (
+                never_updated.order_by(Bug.id.desc()).limit(limit - len(rows)).all()
+            )
+
+        next_cursor = (
+            (rows[-1].cursor_updated_at, rows[-1].cursor_id)
+            if len(rows) == limit
+            else None
+        )
+        return rows, next_cursor
+
+    # --- PROYECCIONES PARA LA TABLA (sin cargar entidades) ---
+
+    def _table_query(self, include_history: bool = True) -> Query:
+        """Consulta con exactamente las columnas de la tabla de bugs.
+
+        Los códigos de requisitos y los nombres de archivos se agregan con
+        group_concat (separados por `GROUP_SEPARATOR`) y los contadores con
+        subconsultas correlacionadas sobre índices, así que cada bug es una
+        sola fila sin multiplicar por sus colecciones.
+
+        Args:
+            include_history: si es False no se cuenta el historial
+                (`history_count` = 0)
+        """
+        requirement_codes = (
+            select(func.group_concat(Requirement.code, GROUP_SEPARATOR))
+            .join(bug_requirements, bug_requirements.c.requirement_id == Requirement.id)
+            .where(bug_requirements.c.bug_id == Bug.id)
+            .scalar_subquery()
+        )
+        bug_files = (File.owner_type == "bug", File.owner_id == Bug.id)
+        file_names = (
+            select(func.group_concat(File.filename, GROUP_SEPARATOR))
+            .where(*bug_files)
+            .scalar_subquery()
+        )
+        file_count = select(func.count(File.id)).where(*bug_files).scalar_subquery()
+        history_count = (
+            select(func.count(BugHistory.id))
+            .where(BugHistory.bug_id == Bug.id)
+            .scalar_subquery()
+            if include_history
+            else literal(0)
+        )
+
+        return self.session.query(
+            Bug.id,
+            Bug.status,
+            System.name.label("system_name"),
+            Bug.system_version,
+            Bug.created_at,
+            Bug.updated_at,
+            Bug.modified_by,
+            Bug.service_now_id,
+            Bug.campaign_run_id,
+            Bug.short_description,
+            Bug.definition,
+            Bug.urgency,
+            Bug.impact,
+            Bug.comments,
+            requirement_codes.label("requirement_codes"),
+            file_names.label("file_names"),
+            file_count.label("file_count"),
+            history_count.label("history_count"),
+        ).outerjoin(System, System.id == Bug.system_id)
+
+    def get_all_table_rows(self) -> list[Row]:
+        """Filas de la tabla de bugs (ver `_table_query`) ordenadas por ID."""
+        return self._table_query().order_by(Bug.id).all()
+
+    def get_table_rows_by_ids(self, bug_ids: Iterable[int]) -> list[Row]:
+        """Filas de la tabla de varios bugs (sin orden garantizado)."""
+        rows = []
+        for chunk in chunked(set(bug_ids)):
+            rows.extend(self._table_query().filter(Bug.id.in_(chunk)).all())
+        return rows
+
+    def get_table_page(
+        self, limit: int, after: tuple[str | None, int] | None = None
+    ) -> tuple[list[Row], tuple[str | None, int] | None]:
+        """Página de filas de la tabla con la misma paginación que `get_page`."""
+        return self._keyset_page(self._table_query(), limit, after)
+
+    def iter_table_rows(
+        self, batch_size: int = STREAM_BATCH_SIZE, include_history: bool = True
+    ) -> Iterator[list[Row]]:
+        """Recorre las filas de la tabla por lotes, ordenadas por ID."""
+        return self.iter_rows(
+            self._table_query(include_history).order_by(Bug.id), batch_size
         )
@@ -1,7 +1,10 @@
+import logging
+from collections import defaultdict
 from datetime import datetime
 
+from sqlalchemy import Row, bindparam, func, insert, select, update
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 
 from uat_tool.domain import (
     Campaign,
@@ -10,11 +13,16 @@ from uat_tool.domain import (
     CaseRun,
     Step,
     StepRun,
+    block_cases,
+    campaign_blocks,
 )
+from uat_tool.infrastructure import chunked
 
 from .base import BaseRepository, EnvironmentMixinRepository
 from .test_management_repository import CampaignRepository
 
+logger = logging.getLogger(__name__)
+
 
 class CampaignRunRepository(EnvironmentMixinRepository[CampaignRun]):
     """Repositorio para la entidad CampaignRun."""
@@ -61,33 +69,25 @@ class CampaignRunRepository(EnvironmentMixinRepository[CampaignRun]):
             raise
 
     def _initialize_case_runs(self, campaign_run_id: int, campaign_id: int):
-        """Inicializa los case runs para todos los casos de la campaña."""
-        # Obtener todos los casos de la campaña a través de bloques
-        from uat_tool.domain import Block
-
-        campaign = (
-            self.session.query(Campaign)
-            .options(joinedload(Campaign.blocks).joinedload(Block.cases))
-            .filter(Campaign.id == campaign_id)
-            .first()
+        """Inicializa los case runs para todos los casos de la campaña.
+
+        Los IDs de los casos se leen directamente de las tablas intermedias
+        (campaign_blocks -> block_cases) sin hidratar bloques ni casos, y los
+        case runs y step runs se insertan en bloque.
+        """
+        case_ids = list(
+            self.session.execute(
+                select(block_cases.c.case_id)
+                .join(
+                    campaign_blocks,
+                    campaign_blocks.c.block_id == block_cases.c.block_id,
+                )
+                .where(campaign_blocks.c.campaign_id == campaign_id)
+                .order_by(block_cases.c.block_id, block_cases.c.case_id)
+            ).scalars()
         )
 
-        if not campaign:
-            return
-
-        # Recoger todos los casos únicos de todos los bloques
-        all_cases = []
-        for block in campaign.blocks:
-            all_cases.extend(block.cases)
-
-        # Crear case runs para cada caso
-        case_run_repo = CaseRunRepository(self.session)
-        for case in all_cases:
-            case_run_data = {
-                "campaign_run_id": campaign_run_id,
-                "case_id": case.id,
-            }
-            case_run_repo.create(case_run_data)
+        CaseRunRepository(self.session).bulk_create_for_cases(campaign_run_id, case_ids)
 
     def finalize(
         self, campaign_run_id: int, modified_by: str, notes: str = None
@@ -127,19 +127,65 @@ class CampaignRunRepository(EnvironmentMixinRepository[CampaignRun]):
         self.session.flush()
         return campaign_run
 
-    def get_with_details(self, campaign_run_id: int) -> CampaignRun | None:
-        """Obtiene una ejecución de campaña con todos sus detalles."""
+    def get_with_details(
+        self, campaign_run_id: int, strategies: dict[str, str] | None = None
+    ) -> CampaignRun | None:
+        """Obtiene una ejecución de campaña con todos sus detalles.
+
+        Args:
+            campaign_run_id: ID de la ejecución de campaña
+            strategies: estrategias de carga por relación (ver `eager_options`)
+        """
         return (
             self.query()
             .options(
-                joinedload(CampaignRun.case_runs).joinedload(CaseRun.step_runs),
-                joinedload(CampaignRun.campaign),
-                joinedload(CampaignRun.bugs),
+                *self.eager_options(
+                    (CampaignRun.case_runs, CaseRun.step_runs),
+                    CampaignRun.campaign,
+                    CampaignRun.bugs,
+                    strategies=strategies,
+                )
             )
             .filter(CampaignRun.id == campaign_run_id)
             .one_or_none()
         )
 
+    def get_progress(self, campaign_run_id: int) -> Row | None:
+        """Lee los contadores de progreso de una ejecución de campaña.
+
+        Los contadores los mantienen triggers sobre `step_runs` (ver
+        `register_result_counters`), así que no se cargan ni cuentan pasos.
+
+        Returns:
+            Row | None: (id, steps_total, steps_passed, steps_failed)
+        """
+        return self.session.execute(
+            select(
+                CampaignRun.id,
+                CampaignRun.steps_total,
+                CampaignRun.steps_passed,
+                CampaignRun.steps_failed,
+            ).where(CampaignRun.id == campaign_run_id)
+        ).one_or_none()
+
+    def get_progress_by_campaign(self, campaign_id: int) -> list[Row]:
+        """Contadores de progreso de todas las ejecuciones de una campaña.
+
+        Returns:
+            list[Row]: (id, steps_total, steps_passed, steps_failed), de la
+            ejecución más reciente a la más antigua
+        """
+        return self.session.execute(
+            select(
+                CampaignRun.id,
+                CampaignRun.steps_total,
+                CampaignRun.steps_passed,
+                CampaignRun.steps_failed,
+            )
+            .where(CampaignRun.campaign_id == campaign_id)
+            .order_by(CampaignRun.started_at.desc(), CampaignRun.id.desc())
+        ).all()
+
     def get_by_campaign(self, campaign_id: int) -> list[CampaignRun]:
         """Obtiene todas las ejecuciones de una campaña."""
         return (
@@ -192,6 +238,73 @@ class CaseRunRepository(BaseRepository[CaseRun]):
             self.session.rollback()
             raise
 
+    def bulk_create_for_cases(
+        self, campaign_run_id: int, case_ids: list[int]
+    ) -> list[int]:
+        """Crea un case run por caso, y sus step runs, con inserciones en bloque.
+
+        A diferencia de `create`, no valida cada caso por separado: los IDs
+        deben venir de la propia campaña, y la ejecución de campaña no debe
+        tener case runs previos. Se emiten una inserción (executemany) de case
+        runs, una consulta de pasos por bloque de IDs y una inserción de step
+        runs, independientemente del número de casos.
+
+        Args:
+            campaign_run_id (int): ejecución de campaña a la que pertenecen
+            case_ids (list[int]): casos a materializar, en orden
+
+        Returns:
+            list[int]: IDs de los case runs creados, en el mismo orden que case_ids
+        """
+        if not case_ids:
+            return []
+
+        try:
+            self.session.execute(
+                insert(CaseRun),
+                [
+                    {"campaign_run_id": campaign_run_id, "case_id": case_id}
+                    for case_id in case_ids
+                ],
+            )
+            case_runs = self.session.execute(
+                select(CaseRun.id, CaseRun.case_id)
+                .where(CaseRun.campaign_run_id == campaign_run_id)
+                .order_by(CaseRun.id)
+            ).all()
+
+            steps_by_case = defaultdict(list)
+            for chunk in chunked(set(case_ids)):
+                rows = self.session.execute(
+                    select(Step.id, Step.case_id)
+                    .where(Step.case_id.in_(chunk))
+                    .order_by(Step.case_id, Step.id)
+                )
+                for step_id, case_id in rows:
+                    steps_by_case[case_id].append(step_id)
+
+            step_runs = [
+                {
+                    "campaign_run_id": campaign_run_id,
+                    "case_run_id": case_run_id,
+                    "step_id": step_id,
+                }
+                for case_run_id, case_id in case_runs
+                for step_id in steps_by_case[case_id]
+            ]
+            if step_runs:
+                self.session.execute(insert(StepRun), step_runs)
+
+            logger.info(
+                f"Materializados {len(case_runs)} case runs y {len(step_runs)} "
+                f"step runs para CampaignRun {campaign_run_id}"
+            )
+            return [case_run_id for case_run_id, _ in case_runs]
+
+        except SQLAlchemyError:
+            self.session.rollback()
+            raise
+
     def _initialize_step_runs(
         self, campaign_run_id: int, case_run_id: int, case_id: int
     ):
@@ -212,16 +325,33 @@ class CaseRunRepository(BaseRepository[CaseRun]):
         """Obtiene una ejecución de caso con sus step runs."""
         return (
             self.query()
-            .options(joinedload(CaseRun.step_runs))
+            .options(*self.eager_options(CaseRun.step_runs))
             .filter(CaseRun.id == case_run_id)
             .one_or_none()
         )
 
+    def get_progress_by_campaign_run(self, campaign_run_id: int) -> list[Row]:
+        """Contadores de progreso de los case runs de una ejecución de campaña.
+
+        Returns:
+            list[Row]: (id, steps_total, steps_passed, steps_failed) por case run
+        """
+        return self.session.execute(
+            select(
+                CaseRun.id,
+                CaseRun.steps_total,
+                CaseRun.steps_passed,
+                CaseRun.steps_failed,
+            )
+            .where(CaseRun.campaign_run_id == campaign_run_id)
+            .order_by(CaseRun.id)
+        ).all()
+
     def get_by_campaign_run(self, campaign_run_id: int) -> list[CaseRun]:
         """Obtiene todas las ejecuciones de caso de una campaña."""
         return (
             self.query()
-            .options(joinedload(CaseRun.case))
+            .options(*self.eager_options(CaseRun.case))
             .filter(CaseRun.campaign_run_id == campaign_run_id)
             .all()
         )
@@ -274,14 +404,101 @@ class StepRunRepository(BaseRepository[StepRun]):
         self.session.flush()
         return step_run
 
+    def update_step_results(
+        self, results: list[dict], campaign_run_id: int | None = None
+    ) -> int:
+        """Actualiza el resultado de varios pasos ejecutados en bloque.
+
+        Primero valida en una consulta (por bloque de IDs) que todos los step
+        runs existen y pertenecen a la misma ejecución de campaña, y después
+        los actualiza con un único UPDATE (executemany). Las notas vacías no
+        sobrescriben las existentes, igual que en `update_step_result`. Los
+        contadores de progreso se actualizan por trigger.
+
+        Args:
+            results (list[dict]): {"step_run_id", "passed", "notes" (opcional)}
+            campaign_run_id (int | None): si se indica, la ejecución a la que
+                deben pertenecer los pasos
+
+        Returns:
+            int: ID de la ejecución de campaña de los pasos
+
+        Raises:
+            ValueError: si la lista está vacía, repite pasos, alguno no existe
+                o pertenecen a otra ejecución (o a varias)
+        """
+        step_run_ids = [result["step_run_id"] for result in results]
+        if not step_run_ids:
+            raise ValueError("No hay resultados que registrar")
+        if len(set(step_run_ids)) != len(step_run_ids):
+            raise ValueError("Hay pasos repetidos en los resultados")
+
+        found = 0
+        campaign_run_ids = set()
+        for chunk in chunked(step_run_ids):
+            rows = self.session.execute(
+                select(StepRun.campaign_run_id, func.count(StepRun.id))
+                .where(StepRun.id.in_(chunk))
+                .group_by(StepRun.campaign_run_id)
+            )
+            for run_id, count in rows:
+                campaign_run_ids.add(run_id)
+                found += count
+
+        if found != len(step_run_ids):
+            raise ValueError(
+                f"{len(step_run_ids) - found} step runs no encontrados en los resultados"
+            )
+        if len(campaign_run_ids) > 1:
+            raise ValueError(
+                "Los resultados pertenecen a varias ejecuciones de campaña: "
+                f"{sorted(campaign_run_ids)}"
+            )
+        (actual_campaign_run_id,) = campaign_run_ids
+        if campaign_run_id is not None and actual_campaign_run_id != campaign_run_id:
+            raise ValueError(
+                f"Los resultados pertenecen a la ejecución de campaña "
+                f"{actual_campaign_run_id}, no a {campaign_run_id}"
+            )
+
+        step_runs = StepRun.__table__
+        self.session.execute(
+            update(step_runs)
+            .where(step_runs.c.id == bindparam("b_id"))
+            .values(
+                passed=bindparam("b_passed"),
+                notes=func.coalesce(bindparam("b_notes"), step_runs.c.notes),
+            ),
+            [
+                {
+                    "b_id": result["step_run_id"],
+                    "b_passed": result["passed"],
+                    "b_notes": result.get("notes") or None,
+                }
+                for result in results
+            ],
+        )
+
+        # El UPDATE de Core no pasa por el ORM: las instancias ya cargadas
+        # de esos pasos se recargarán en el siguiente acceso
+        updated = set(step_run_ids)
+        for instance in list(self.session.identity_map.values()):
+            if isinstance(instance, StepRun) and instance.id in updated:
+                self.session.expire(instance)
+
+        logger.info(
+            f"Registrados {len(results)} resultados en CampaignRun {actual_campaign_run_id}"
+        )
+        return actual_campaign_run_id
+
     def get_with_details(self, step_run_id: int) -> StepRun | None:
         """Obtiene una ejecución de paso con todos sus detalles."""
         return (
             self.query()
             .options(
-                joinedload(StepRun.step),
-                joinedload(StepRun.case_run),
-                joinedload(StepRun.campaign_run),
+                *self.eager_options(
+                    StepRun.step, StepRun.case_run, StepRun.campaign_run
+                )
             )
             .filter(StepRun.id == step_run_id)
             .one_or_none()
@@ -291,7 +508,7 @@ class StepRunRepository(BaseRepository[StepRun]):
         """Obtiene todas las ejecuciones de paso de un caso."""
         return (
             self.query()
-            .options(joinedload(StepRun.step))
+            .options(*self.eager_options(StepRun.step))
             .filter(StepRun.case_run_id == case_run_id)
             .order_by(StepRun.step_id)
             .all()
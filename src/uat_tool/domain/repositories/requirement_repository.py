@@ -1,9 +1,24 @@
+from collections.abc import Iterable, Iterator
+
+from sqlalchemy import Integer, Row, cast, func, insert, select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Query, Session
 
-from uat_tool.domain import Requirement, Section, System
+from uat_tool.domain import (
+    Bug,
+    Requirement,
+    Section,
+    StepRun,
+    System,
+    bug_requirements,
+    requirement_sections,
+    requirement_systems,
+    step_requirements,
+)
+from uat_tool.infrastructure import chunked
 
-from .base import AuditEnvironmentMixinRepository
+from .base import GROUP_SEPARATOR, STREAM_BATCH_SIZE, AuditEnvironmentMixinRepository
+from .bug_repository import OPEN_BUG_STATUSES
 
 
 class RequirementRepository(AuditEnvironmentMixinRepository[Requirement]):
@@ -75,31 +90,231 @@ class RequirementRepository(AuditEnvironmentMixinRepository[Requirement]):
             .one_or_none()
         )
 
-    def get_with_relations(self, requirement_id: int) -> Requirement | None:
-        """Obtiene un requisito con sus relaciones cargadas."""
+    def get_existing_codes(self, codes: Iterable[str], environment_id: int) -> set[str]:
+        """Devuelve cuáles de los códigos ya existen en el entorno.
+
+        Una consulta IN por bloque de `IN_CLAUSE_CHUNK_SIZE` códigos, que usa
+        el índice de `uq_requirement_code_env`.
+        """
+        existing = set()
+        for chunk in chunked(set(codes)):
+            existing.update(
+                self.session.scalars(
+                    select(Requirement.code).where(
+                        Requirement.environment_id == environment_id,
+                        Requirement.code.in_(chunk),
+                    )
+                )
+            )
+        return existing
+
+    def bulk_create(
+        self, rows: list[dict], environment_id: int, modified_by: str
+    ) -> dict[str, int]:
+        """Inserta muchos requisitos con sus sistemas y secciones en bloque.
+
+        A diferencia de `create`, no valida nada ni carga objetos: los
+        requisitos y las filas de `requirement_systems` y
+        `requirement_sections` se insertan con executemany (tres sentencias
+        en total). Quien llama debe haber validado los códigos y los IDs.
+
+        Args:
+            rows: dicts con `code`, `definition`, `systems` y `sections` (IDs)
+            environment_id: entorno de todos los requisitos
+            modified_by: usuario que importa
+
+        Returns:
+            dict[str, int]: {código: ID del requisito creado}
+        """
+        if not rows:
+            return {}
+
+        try:
+            created = self.session.execute(
+                insert(Requirement).returning(Requirement.code, Requirement.id),
+                [
+                    {
+                        "code": row["code"],
+                        "definition": row["definition"],
+                        "environment_id": environment_id,
+                        "modified_by": modified_by,
+                    }
+                    for row in rows
+                ],
+            )
+            ids_by_code = dict(created.all())
+
+            system_links = [
+                {"requirement_id": ids_by_code[row["code"]], "system_id": system_id}
+                for row in rows
+                for system_id in row["systems"]
+            ]
+            section_links = [
+                {"requirement_id": ids_by_code[row["code"]], "section_id": section_id}
+                for row in rows
+                for section_id in row["sections"]
+            ]
+            if system_links:
+                self.session.execute(insert(requirement_systems), system_links)
+            if section_links:
+                self.session.execute(insert(requirement_sections), section_links)
+            return ids_by_code
+
+        except SQLAlchemyError:
+            self.session.rollback()
+            raise
+
+    def get_coverage(
+        self, environment_id: int, campaign_run_id: int | None = None
+    ) -> list[Row]:
+        """Calcula la cobertura de todos los requisitos de un entorno en SQL.
+
+        Pasos, ejecuciones y bugs se agregan por separado con GROUP BY sobre
+        las tablas intermedias (`step_requirements` y `bug_requirements`) y
+        se unen a los requisitos con LEFT JOIN, así que no se carga ningún
+        objeto ni se recorren relaciones: una sola consulta para todo el
+        entorno.
+
+        Args:
+            environment_id: entorno de los requisitos
+            campaign_run_id: si se indica, solo cuentan los step runs y los
+                bugs de esa ejecución de campaña
+
+        Returns:
+            list[Row]: filas (requirement_id, code, steps, step_runs, executed,
+            passed, open_bugs) ordenadas por código
+        """
+        links = step_requirements.c
+        steps = (
+            select(links.requirement_id, func.count().label("steps"))
+            .group_by(links.requirement_id)
+            .subquery()
+        )
+
+        runs = select(
+            links.requirement_id,
+            func.count(StepRun.id).label("step_runs"),
+            func.count(StepRun.passed).label("executed"),
+            func.sum(cast(StepRun.passed, Integer)).label("passed"),
+        ).join(StepRun, StepRun.step_id == links.step_id)
+        bugs = (
+            select(bug_requirements.c.requirement_id, func.count().label("open_bugs"))
+            .join(Bug, Bug.id == bug_requirements.c.bug_id)
+            .where(Bug.status.in_(OPEN_BUG_STATUSES))
+        )
+        if campaign_run_id is not None:
+            runs = runs.where(StepRun.campaign_run_id == campaign_run_id)
+            bugs = bugs.where(Bug.campaign_run_id == campaign_run_id)
+        runs = runs.group_by(links.requirement_id).subquery()
+        bugs = bugs.group_by(bug_requirements.c.requirement_id).subquery()
+
+        return self.session.execute(
+            select(
+                Requirement.id.label("requirement_id"),
+                Requirement.code,
+                func.coalesce(steps.c.steps, 0).label("steps"),
+                func.coalesce(runs.c.step_runs, 0).label("step_runs"),
+                func.coalesce(runs.c.executed, 0).label("executed"),
+                func.coalesce(runs.c.passed, 0).label("passed"),
+                func.coalesce(bugs.c.open_bugs, 0).label("open_bugs"),
+            )
+            .outerjoin(steps, steps.c.requirement_id == Requirement.id)
+            .outerjoin(runs, runs.c.requirement_id == Requirement.id)
+            .outerjoin(bugs, bugs.c.requirement_id == Requirement.id)
+            .where(Requirement.environment_id == environment_id)
+            .order_by(Requirement.code)
+        ).all()
+
+    def _relations_options(self, strategies: dict[str, str] | None) -> list:
+        """Opciones de carga de systems, sections y bugs."""
+        return self.eager_options(
+            Requirement.systems,
+            Requirement.sections,
+            Requirement.bugs,
+            strategies=strategies,
+        )
+
+    def get_with_relations(
+        self, requirement_id: int, strategies: dict[str, str] | None = None
+    ) -> Requirement | None:
+        """Obtiene un requisito con sus relaciones cargadas.
+
+        Args:
+            requirement_id: ID del requisito
+            strategies: estrategias de carga por relación (ver `eager_options`)
+        """
         return (
             self.query()
-            .options(
-                joinedload(Requirement.bugs),
-                joinedload(Requirement.systems),
-                joinedload(Requirement.sections),
-            )
+            .options(*self._relations_options(strategies))
             .filter(Requirement.id == requirement_id)
             .first()
         )
 
-    def get_all_with_relations(self) -> list[Requirement]:
-        """Obtiene todos los requisitos con sistemas y secciones cargadas."""
-        return (
-            self.query()
-            .options(
-                joinedload(Requirement.systems),
-                joinedload(Requirement.sections),
-                joinedload(Requirement.bugs),
-            )
-            .all()
+    def get_all_with_relations(
+        self, strategies: dict[str, str] | None = None
+    ) -> list[Requirement]:
+        """Obtiene todos los requisitos con sistemas, secciones y bugs cargados.
+
+        Args:
+            strategies: estrategias de carga por relación (ver `eager_options`)
+        """
+        return self.query().options(*self._relations_options(strategies)).all()
+
+    def iter_with_relations(
+        self,
+        batch_size: int = STREAM_BATCH_SIZE,
+        strategies: dict[str, str] | None = None,
+    ) -> Iterator[list[Requirement]]:
+        """Recorre todos los requisitos por lotes con sus relaciones cargadas.
+
+        Args:
+            batch_size: requisitos por lote (ver `iter_batches`)
+            strategies: estrategias de carga por relación (ver `eager_options`)
+        """
+        return self.iter_batches(batch_size, self._relations_options(strategies))
+
+    # --- PROYECCIONES PARA LA TABLA (sin cargar entidades) ---
+
+    def _table_query(self) -> Query:
+        """Consulta con exactamente las columnas de la tabla de requisitos.
+
+        Los nombres de sistemas y secciones se agregan con group_concat
+        (separados por `GROUP_SEPARATOR`) en subconsultas correlacionadas,
+        así que cada requisito es una sola fila.
+        """
+        system_names = (
+            select(func.group_concat(System.name, GROUP_SEPARATOR))
+            .join(requirement_systems, requirement_systems.c.system_id == System.id)
+            .where(requirement_systems.c.requirement_id == Requirement.id)
+            .scalar_subquery()
+        )
+        section_names = (
+            select(func.group_concat(Section.name, GROUP_SEPARATOR))
+            .join(requirement_sections, requirement_sections.c.section_id == Section.id)
+            .where(requirement_sections.c.requirement_id == Requirement.id)
+            .scalar_subquery()
+        )
+        return self.session.query(
+            Requirement.id,
+            Requirement.code,
+            Requirement.definition,
+            Requirement.created_at,
+            Requirement.updated_at,
+            Requirement.modified_by,
+            system_names.label("system_names"),
+            section_names.label("section_names"),
         )
 
+    def get_all_table_rows(self) -> list[Row]:
+        """Filas de la tabla de requisitos (ver `_table_query`) ordenadas por ID."""
+        return self._table_query().order_by(Requirement.id).all()
+
+    def iter_table_rows(
+        self, batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[list[Row]]:
+        """Recorre las filas de la tabla por lotes, ordenadas por ID."""
+        return self.iter_rows(self._table_query().order_by(Requirement.id), batch_size)
+
     def update(
         self, requirement_id: int, data: dict, environment_id: int, modified_by: str
     ) -> Requirement:
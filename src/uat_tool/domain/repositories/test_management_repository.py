@@ -1,5 +1,5 @@
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 
 from uat_tool.domain import (
     Block,
@@ -75,7 +75,7 @@ class CampaignRepository(AuditEnvironmentMixinRepository[Campaign]):
         """Obtiene una campaña con sus bloques cargados."""
         return (
             self.query()
-            .options(joinedload(Campaign.blocks))
+            .options(*self.eager_options(Campaign.blocks))
             .filter(Campaign.id == campaign_id)
             .one_or_none()
         )
@@ -172,7 +172,7 @@ class BlockRepository(AuditEnvironmentMixinRepository[Block]):
         """Obtiene un bloque con sus casos cargados."""
         return (
             self.query()
-            .options(joinedload(Block.cases))
+            .options(*self.eager_options(Block.cases))
             .filter(Block.id == block_id)
             .one_or_none()
         )
@@ -275,19 +275,29 @@ class CaseRepository(AuditEnvironmentMixinRepository[Case]):
             self.session.rollback()
             raise
 
-    def get_with_full_relations(self, case_id: int) -> Case | None:
-        """Obtiene un caso con todas sus relaciones cargadas."""
+    def get_with_full_relations(
+        self, case_id: int, strategies: dict[str, str] | None = None
+    ) -> Case | None:
+        """Obtiene un caso con todas sus relaciones cargadas.
+
+        Args:
+            case_id: ID del caso
+            strategies: estrategias de carga por relación (ver `eager_options`)
+        """
         return (
             self.query()
             .options(
-                joinedload(Case.operators),
-                joinedload(Case.drones),
-                joinedload(Case.uhub_users),
-                joinedload(Case.uas_zones),
-                joinedload(Case.systems),
-                joinedload(Case.sections),
-                joinedload(Case.steps),
-                joinedload(Case.blocks),
+                *self.eager_options(
+                    Case.operators,
+                    Case.drones,
+                    Case.uhub_users,
+                    Case.uas_zones,
+                    Case.systems,
+                    Case.sections,
+                    Case.steps,
+                    Case.blocks,
+                    strategies=strategies,
+                )
             )
             .filter(Case.id == case_id)
             .one_or_none()
@@ -412,7 +422,7 @@ class StepRepository(BaseRepository[Step]):
         """Obtiene un paso con sus requisitos cargados."""
         return (
             self.query()
-            .options(joinedload(Step.requirements))
+            .options(*self.eager_options(Step.requirements))
             .filter(Step.id == step_id)
             .one_or_none()
         )
@@ -5,23 +5,75 @@ Proporciona acceso a la capa de infraestructura:
 - Configuración de base de datos
 - Sesiones y motor SQLAlchemy
 - Utilidades de persistencia
+- Instrumentación de consultas SQL (número de sentencias y tiempos)
+- Auditoría de índices del esquema
+- Exportación de tablas a CSV/XLSX en streaming
+- Lectura de tablas CSV/JSON para importaciones masivas
 - [Futuros]: APIs externas, sistemas de archivos, etc.
 """
 
 from .database import (
+    DEFAULT_SEARCH_LIMIT,
+    DEFAULT_SQLITE_PROFILE,
+    IN_CLAUSE_CHUNK_SIZE,
+    MIGRATIONS,
+    RESULT_COUNTERS,
+    SCHEMA_VERSION,
+    SEARCH_INDEXES,
+    SQLITE_PROFILES,
     AuditMixin,
     Base,
     EnvironmentMixin,
+    Migration,
+    QueryCapture,
+    QueryProfiler,
+    QueryStats,
+    ResultCounters,
+    SchemaIssue,
+    SearchHit,
+    apply_sqlite_profile,
+    audit_schema,
+    build_match_query,
+    chunked,
+    count_queries,
+    create_missing_result_counters,
+    create_missing_search_indexes,
+    create_read_engine,
+    find_full_scans,
+    find_unindexed_foreign_keys,
     get_engine,
     get_or_create,
+    get_query_profiler,
+    get_schema_version,
     get_session_factory,
     init_db,
+    migrate,
+    rebuild_result_counters,
+    rebuild_search_indexes,
+    register_result_counters,
+    register_search_index,
+    repository_queries,
+    search_index,
+    track_queries,
 )
+from .export import (
+    TABLE_WRITERS,
+    XLSX_MAX_ROWS,
+    CsvTableWriter,
+    TableWriter,
+    XlsxTableWriter,
+    open_table_writer,
+)
+from .imports import TABLE_READERS, read_table_records
 
 __all__ = [
     # Configuración BD
     "get_engine",
     "get_session_factory",
+    "create_read_engine",
+    "apply_sqlite_profile",
+    "SQLITE_PROFILES",
+    "DEFAULT_SQLITE_PROFILE",
     "Session",
     # Base y Mixins para modelos
     "Base",
@@ -30,4 +82,50 @@ __all__ = [
     # Funciones públicas
     "init_db",
     "get_or_create",
+    "chunked",
+    "IN_CLAUSE_CHUNK_SIZE",
+    # Versión del esquema
+    "Migration",
+    "MIGRATIONS",
+    "SCHEMA_VERSION",
+    "get_schema_version",
+    "migrate",
+    # Búsqueda de texto completo
+    "SearchHit",
+    "SEARCH_INDEXES",
+    "DEFAULT_SEARCH_LIMIT",
+    "register_search_index",
+    "create_missing_search_indexes",
+    "rebuild_search_indexes",
+    "build_match_query",
+    "search_index",
+    # Contadores materializados
+    "ResultCounters",
+    "RESULT_COUNTERS",
+    "register_result_counters",
+    "create_missing_result_counters",
+    "rebuild_result_counters",
+    # Instrumentación de consultas
+    "QueryProfiler",
+    "QueryStats",
+    "QueryCapture",
+    "get_query_profiler",
+    "track_queries",
+    "count_queries",
+    # Auditoría del esquema
+    "SchemaIssue",
+    "audit_schema",
+    "find_full_scans",
+    "find_unindexed_foreign_keys",
+    "repository_queries",
+    # Exportación
+    "TableWriter",
+    "CsvTableWriter",
+    "XlsxTableWriter",
+    "TABLE_WRITERS",
+    "XLSX_MAX_ROWS",
+    "open_table_writer",
+    # Importación
+    "TABLE_READERS",
+    "read_table_records",
 ]
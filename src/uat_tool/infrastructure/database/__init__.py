@@ -6,16 +6,67 @@ Contiene la configuración y acceso a base de datos:
 - Engine: Configuración del motor de base de datos
 - Base: Clase base para todos los modelos SQLAlchemy
 - InitDB: Utilidades para inicialización de base de datos
+- Migrations: Versión del esquema y migraciones pendientes
 - Session: Gestión de sesiones de base de datos
+- FTS: Índices de búsqueda de texto completo (SQLite FTS5)
+- Counters: Contadores de resultados materializados con triggers
+- Instrumentation: Número de sentencias SQL y tiempos por ámbito
+- SchemaAudit: Claves foráneas sin índice y consultas que recorren tablas enteras
 
 Configuración centralizada para PostgreSQL + SQLAlchemy.
 """
 
 from .base import AuditMixin, Base, EnvironmentMixin
-from .engine import get_engine, get_session_factory
+from .counters import (
+    RESULT_COUNTERS,
+    ResultCounters,
+    create_missing_result_counters,
+    rebuild_result_counters,
+    register_result_counters,
+)
+from .engine import (
+    DEFAULT_SQLITE_PROFILE,
+    SQLITE_PROFILES,
+    apply_sqlite_profile,
+    create_read_engine,
+    get_engine,
+    get_session_factory,
+)
+from .fts import (
+    DEFAULT_SEARCH_LIMIT,
+    SEARCH_INDEXES,
+    SearchHit,
+    build_match_query,
+    create_missing_search_indexes,
+    rebuild_search_indexes,
+    register_search_index,
+    search_index,
+)
 from .init_db import init_db
+from .instrumentation import (
+    QueryCapture,
+    QueryProfiler,
+    QueryStats,
+    count_queries,
+    get_query_profiler,
+    track_queries,
+)
+from .migrations import (
+    MIGRATIONS,
+    SCHEMA_VERSION,
+    Migration,
+    get_schema_version,
+    migrate,
+)
 from .models_init import init_models
-from .utils import get_or_create
+from .schema_audit import (
+    SchemaIssue,
+    audit_schema,
+    find_full_scans,
+    find_unindexed_foreign_keys,
+    repository_queries,
+)
+from .utils import IN_CLAUSE_CHUNK_SIZE, chunked, get_or_create
 
 __all__ = [
     "AuditMixin",
@@ -23,7 +74,42 @@ __all__ = [
     "Base",
     "init_db",
     "init_models",
+    "Migration",
+    "MIGRATIONS",
+    "SCHEMA_VERSION",
+    "get_schema_version",
+    "migrate",
     "get_or_create",
+    "chunked",
+    "IN_CLAUSE_CHUNK_SIZE",
     "get_engine",
     "get_session_factory",
+    "create_read_engine",
+    "apply_sqlite_profile",
+    "SQLITE_PROFILES",
+    "DEFAULT_SQLITE_PROFILE",
+    "SearchHit",
+    "SEARCH_INDEXES",
+    "DEFAULT_SEARCH_LIMIT",
+    "register_search_index",
+    "create_missing_search_indexes",
+    "rebuild_search_indexes",
+    "build_match_query",
+    "search_index",
+    "ResultCounters",
+    "RESULT_COUNTERS",
+    "register_result_counters",
+    "create_missing_result_counters",
+    "rebuild_result_counters",
+    "QueryProfiler",
+    "QueryStats",
+    "QueryCapture",
+    "get_query_profiler",
+    "track_queries",
+    "count_queries",
+    "SchemaIssue",
+    "audit_schema",
+    "find_full_scans",
+    "find_unindexed_foreign_keys",
+    "repository_queries",
 ]
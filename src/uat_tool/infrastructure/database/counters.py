@@ -0,0 +1,173 @@
+"""
+Contadores de resultados materializados con triggers de SQLite.
+
+Un contador de resultados guarda en una tabla padre cuántas filas hijas tiene
+y cuántas tienen un resultado verdadero o falso (el resto están sin
+resultado). Por ejemplo, cada CaseRun guarda `steps_total`, `steps_passed` y
+`steps_failed` de sus StepRuns, de modo que el progreso de una ejecución se
+lee en O(1) sin cargar ni contar sus pasos.
+
+Tres triggers sobre la tabla hija (INSERT, UPDATE del resultado o del padre y
+DELETE) mantienen los contadores en la misma transacción que el cambio,
+también con inserciones y actualizaciones masivas de Core que no pasan por el
+ORM, igual que los índices de `fts`.
+
+Los modelos declaran las columnas y registran el contador con
+`register_result_counters`; los triggers se crean junto con la tabla hija en
+`create_all` y, para bases de datos ya existentes, con
+`create_missing_result_counters` (llamado desde `init_db`), que además añade
+y recalcula las columnas que falten. `rebuild_result_counters` los recalcula
+todos desde cero.
+"""
+
+from dataclasses import dataclass
+
+from sqlalchemy import Table, event
+from sqlalchemy.engine import Connection
+
+
+@dataclass(frozen=True)
+class ResultCounters:
+    """Contadores de filas de `child` por fila de `parent`."""
+
+    parent: str
+    child: str
+    foreign_key: str  # Columna de `child` que apunta a `parent.id`
+    result: str  # Columna booleana (o NULL) del resultado en `child`
+    prefix: str  # Prefijo de las columnas de `parent`: <prefix>_total, ...
+
+    @property
+    def name(self) -> str:
+        return f"{self.child}_{self.parent}_counters"
+
+    @property
+    def columns(self) -> tuple[str, str, str]:
+        """Columnas de `parent`: total, con resultado verdadero y con falso."""
+        return (
+            f"{self.prefix}_total",
+            f"{self.prefix}_passed",
+            f"{self.prefix}_failed",
+        )
+
+    def _apply(self, row: str, sign: str) -> str:
+        """UPDATE que suma (`+`) o resta (`-`) la fila `new`/`old` a su padre."""
+        total, passed, failed = self.columns
+        return (
+            f"UPDATE {self.parent} SET "
+            f"{total} = {total} {sign} 1, "
+            f"{passed} = {passed} {sign} ({row}.{self.result} IS 1), "
+            f"{failed} = {failed} {sign} ({row}.{self.result} IS 0) "
+            f"WHERE id = {row}.{self.foreign_key};"
+        )
+
+    def ddl(self) -> list[str]:
+        """Sentencias idempotentes que crean los triggers."""
+        return [
+            f"CREATE TRIGGER IF NOT EXISTS {self.name}_ai AFTER INSERT ON {self.child} "
+            f"BEGIN {self._apply('new', '+')} END",
+            f"CREATE TRIGGER IF NOT EXISTS {self.name}_ad AFTER DELETE ON {self.child} "
+            f"BEGIN {self._apply('old', '-')} END",
+            f"CREATE TRIGGER IF NOT EXISTS {self.name}_au "
+            f"AFTER UPDATE OF {self.result}, {self.foreign_key} ON {self.child} "
+            f"BEGIN {self._apply('old', '-')} {self._apply('new', '+')} END",
+        ]
+
+    def rebuild_sql(self) -> str:
+        """UPDATE que recalcula los contadores de todos los padres."""
+        total, passed, failed = self.columns
+        where = f"{self.child}.{self.foreign_key} = {self.parent}.id"
+        return (
+            f"UPDATE {self.parent} SET "
+            f"{total} = (SELECT COUNT(*) FROM {self.child} WHERE {where}), "
+            f"{passed} = (SELECT COUNT(*) FROM {self.child} "
+            f"WHERE {where} AND {self.result} IS 1), "
+            f"{failed} = (SELECT COUNT(*) FROM {self.child} "
+            f"WHERE {where} AND {self.result} IS 0)"
+        )
+
+
+# Contadores registrados por los modelos
+RESULT_COUNTERS: list[ResultCounters] = []
+
+
+def register_result_counters(
+    parent: Table, child: Table, foreign_key: str, result: str, prefix: str
+) -> ResultCounters:
+    """Declara contadores de `child` en `parent` mantenidos por triggers.
+
+    Las columnas `<prefix>_total`, `<prefix>_passed` y `<prefix>_failed` deben
+    estar declaradas en el modelo de `parent` (enteras, por defecto 0).
+    """
+    counters = ResultCounters(parent.name, child.name, foreign_key, result, prefix)
+    missing = [column for column in counters.columns if column not in parent.c]
+    if missing:
+        raise ValueError(f"Faltan columnas de contadores en {parent.name}: {missing}")
+    RESULT_COUNTERS.append(counters)
+
+    @event.listens_for(child, "after_create")
+    def _create_counter_triggers(_target, connection, **_kw):
+        _create_counters_ddl(connection, counters)
+
+    return counters
+
+
+def _create_counters_ddl(connection: Connection, counters: ResultCounters) -> None:
+    if connection.dialect.name != "sqlite":
+        return
+    for statement in counters.ddl():
+        connection.exec_driver_sql(statement)
+
+
+def create_missing_result_counters(engine) -> list[str]:
+    """Añade las columnas y triggers de contadores que falten y los recalcula.
+
+    Solo se recalculan los contadores a los que les faltaba alguna columna o
+    trigger; el resto ya estaban al día.
+
+    Returns:
+        list[str]: nombres de los contadores creados o completados
+    """
+    if engine.dialect.name != "sqlite":
+        return []
+
+    created = []
+    with engine.begin() as connection:
+        for counters in RESULT_COUNTERS:
+            existing_columns = {
+                row[1]
+                for row in connection.exec_driver_sql(
+                    f"PRAGMA table_info({counters.parent})"
+                )
+            }
+            missing_columns = [c for c in counters.columns if c not in existing_columns]
+            for column in missing_columns:
+                connection.exec_driver_sql(
+                    f"ALTER TABLE {counters.parent} "
+                    f"ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0"
+                )
+            triggers = connection.exec_driver_sql(
+                "SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' "
+                f"AND name LIKE '{counters.name}_%'"
+            ).scalar()
+
+            _create_counters_ddl(connection, counters)
+            if missing_columns or triggers < len(counters.ddl()):
+                connection.exec_driver_sql(counters.rebuild_sql())
+                created.append(counters.name)
+    return created
+
+
+def rebuild_result_counters(engine) -> list[str]:
+    """Recalcula todos los contadores desde las tablas hijas.
+
+    Returns:
+        list[str]: nombres de los contadores recalculados
+    """
+    if engine.dialect.name != "sqlite":
+        return []
+
+    create_missing_result_counters(engine)
+    with engine.begin() as connection:
+        for counters in RESULT_COUNTERS:
+            connection.exec_driver_sql(counters.rebuild_sql())
+    return [counters.name for counters in RESULT_COUNTERS]
@@ -1,22 +1,116 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import scoped_session, sessionmaker
 
 DB_NAME = "uat_tool.db"
 _DEFAULT_DATABASE_URL = f"sqlite:///{DB_NAME}"
 
+# Perfiles de PRAGMAs de SQLite que se aplican a cada conexión nueva.
+#
+# - "desktop" (por defecto): WAL para que las lecturas no bloqueen a las
+#   escrituras y synchronous=NORMAL, que solo hace fsync en los checkpoints.
+#   Ante un corte de luz se pueden perder las últimas transacciones, pero la
+#   base de datos nunca queda corrupta.
+# - "durable": journal clásico (DELETE) con synchronous=FULL. Cada commit
+#   llega a disco antes de volver; usar si la BD vive en una unidad de red,
+#   donde WAL no está soportado.
+SQLITE_PROFILES: dict[str, dict[str, str | int]] = {
+    "desktop": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "foreign_keys": "ON",
+        "busy_timeout": 5000,  # ms
+        "temp_store": "MEMORY",
+        "cache_size": -64000,  # negativo = KiB (64 MB)
+        "mmap_size": 268435456,  # 256 MB
+    },
+    "durable": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "foreign_keys": "ON",
+        "busy_timeout": 5000,
+        "temp_store": "MEMORY",
+        "cache_size": -16000,
+        "mmap_size": 0,
+    },
+}
+DEFAULT_SQLITE_PROFILE = "desktop"
+
 _engine = None
 
 
-def get_engine(database_url: str = None, echo: bool = False):
-    """Devuelve el engine global (o crea uno nuevo si no existe)."""
+def get_engine(
+    database_url: str = None, echo: bool = False, profile: str | None = None
+):
+    """Devuelve el engine global (o crea uno nuevo si no existe).
+
+    Args:
+        database_url: URL de la BD; por defecto `sqlite:///uat_tool.db`
+        echo: si True, SQLAlchemy registra todas las sentencias
+        profile: perfil de `SQLITE_PROFILES`; por defecto "desktop"
+    """
     global _engine
     if _engine is None:
         _engine = create_engine(
             database_url or _DEFAULT_DATABASE_URL, echo=echo, future=True
         )
+        apply_sqlite_profile(_engine, profile or DEFAULT_SQLITE_PROFILE)
     return _engine
 
 
+def apply_sqlite_profile(engine, profile: str = DEFAULT_SQLITE_PROFILE) -> None:
+    """Registra un listener que aplica los PRAGMAs del perfil en cada conexión.
+
+    No hace nada si el engine no es de SQLite.
+
+    Raises:
+        ValueError: si el perfil no existe en `SQLITE_PROFILES`
+    """
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"Perfil de SQLite desconocido: {profile}")
+    if engine.dialect.name != "sqlite":
+        return
+
+    pragmas = SQLITE_PROFILES[profile]
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def create_read_engine(engine, profile: str | None = None):
+    """Crea un engine de solo lectura sobre la misma BD, con su propio pool.
+
+    Las conexiones llevan `PRAGMA query_only`, así que cualquier escritura
+    falla. Las lecturas de la interfaz no esperan por conexiones ocupadas por
+    escrituras y, con WAL, no bloquean los commits.
+
+    En SQLite en memoria cada conexión es una BD distinta, y para otros
+    dialectos no hay réplica configurada: en ambos casos se devuelve el
+    propio `engine`.
+    """
+    url = engine.url
+    if engine.dialect.name != "sqlite" or url.database in (None, "", ":memory:"):
+        return engine
+
+    read_engine = create_engine(url, future=True)
+    apply_sqlite_profile(read_engine, profile or DEFAULT_SQLITE_PROFILE)
+
+    @event.listens_for(read_engine, "connect")
+    def _set_query_only(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("PRAGMA query_only=ON")
+        finally:
+            cursor.close()
+
+    return read_engine
+
+
 def get_session_factory(engine=None, scoped: bool = True):
     """Devuelve la sesión scoped o normal ligada a un engine."""
     engine = engine or get_engine()
@@ -0,0 +1,211 @@
+"""
+Índices de búsqueda de texto completo con SQLite FTS5.
+
+Cada índice es una tabla virtual FTS5 de contenido externo (`content=<tabla>`)
+que guarda solo el índice invertido; el texto se sigue leyendo de la tabla
+original. Tres triggers (INSERT, UPDATE de las columnas indexadas y DELETE)
+lo mantienen sincronizado, también con inserciones masivas de Core que no
+pasan por el ORM.
+
+Los modelos registran sus columnas con `register_search_index`; las tablas
+FTS se crean junto con la tabla original en `create_all` y, para bases de
+datos ya existentes, con `create_missing_search_indexes` (llamado desde
+`init_db`), que además indexa las filas que ya hubiera.
+"""
+
+import re
+from dataclasses import dataclass
+
+from sqlalchemy import Table, event, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+# Tokenizador sin distinción de mayúsculas ni tildes ("validación" ~ "VALIDACION")
+FTS_TOKENIZER = "unicode61 remove_diacritics 2"
+
+# Resultados por defecto de una búsqueda
+DEFAULT_SEARCH_LIMIT = 500
+
+# Palabras más cortas se buscan completas: un prefijo de una letra coincide con
+# casi todo el índice y ordenar esos resultados por relevancia es lo más caro
+MIN_PREFIX_LENGTH = 2
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass(frozen=True)
+class SearchIndex:
+    """Definición de un índice FTS5 sobre columnas de texto de una tabla."""
+
+    table: str
+    columns: tuple[str, ...]
+
+    @property
+    def name(self) -> str:
+        return f"{self.table}_fts"
+
+    def ddl(self) -> list[str]:
+        """Sentencias idempotentes que crean la tabla FTS y sus triggers."""
+        cols = ", ".join(self.columns)
+        new_values = ", ".join(f"new.{col}" for col in self.columns)
+        old_values = ", ".join(f"old.{col}" for col in self.columns)
+        insert_new = (
+            f"INSERT INTO {self.name}(rowid, {cols}) VALUES (new.id, {new_values});"
+        )
+        delete_old = (
+            f"INSERT INTO {self.name}({self.name}, rowid, {cols}) "
+            f"VALUES ('delete', old.id, {old_values});"
+        )
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.name} USING fts5("
+            f"{cols}, content='{self.table}', content_rowid='id', "
+            f"tokenize='{FTS_TOKENIZER}')",
+            f"CREATE TRIGGER IF NOT EXISTS {self.name}_ai AFTER INSERT ON {self.table} "
+            f"BEGIN {insert_new} END",
+            f"CREATE TRIGGER IF NOT EXISTS {self.name}_ad AFTER DELETE ON {self.table} "
+            f"BEGIN {delete_old} END",
+            f"CREATE TRIGGER IF NOT EXISTS {self.name}_au "
+            f"AFTER UPDATE OF {cols} ON {self.table} "
+            f"BEGIN {delete_old} {insert_new} END",
+        ]
+
+
+@dataclass
+class SearchHit:
+    """Resultado de una búsqueda: ID de la entidad, relevancia y fragmento."""
+
+    id: int
+    rank: float  # bm25: cuanto más negativo, más relevante
+    snippet: str
+
+
+# Índices registrados por los modelos: {nombre de tabla: SearchIndex}
+SEARCH_INDEXES: dict[str, SearchIndex] = {}
+
+
+def register_search_index(table: Table, *columns: str) -> SearchIndex:
+    """Declara un índice FTS5 sobre `columns` de `table`.
+
+    La tabla FTS se crea tras `CREATE TABLE` y se elimina antes de
+    `DROP TABLE` (los triggers desaparecen con la tabla original).
+    """
+    index = SearchIndex(table.name, tuple(columns))
+    SEARCH_INDEXES[table.name] = index
+
+    @event.listens_for(table, "after_create")
+    def _create_search_index(_target, connection, **_kw):
+        _create_search_index_ddl(connection, index)
+
+    @event.listens_for(table, "before_drop")
+    def _drop_search_index(_target, connection, **_kw):
+        if connection.dialect.name == "sqlite":
+            connection.exec_driver_sql(f"DROP TABLE IF EXISTS {index.name}")
+
+    return index
+
+
+def _create_search_index_ddl(connection: Connection, index: SearchIndex) -> None:
+    if connection.dialect.name != "sqlite":
+        return
+    for statement in index.ddl():
+        connection.exec_driver_sql(statement)
+
+
+def create_missing_search_indexes(engine) -> list[str]:
+    """Crea los índices FTS que falten y los llena con las filas existentes.
+
+    Returns:
+        list[str]: nombres de los índices creados
+    """
+    if engine.dialect.name != "sqlite":
+        return []
+
+    created = []
+    with engine.begin() as connection:
+        for index in SEARCH_INDEXES.values():
+            exists = connection.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": index.name},
+            ).first()
+            _create_search_index_ddl(connection, index)
+            if not exists:
+                connection.exec_driver_sql(
+                    f"INSERT INTO {index.name}({index.name}) VALUES ('rebuild')"
+                )
+                created.append(index.name)
+    return created
+
+
+def rebuild_search_indexes(engine) -> list[str]:
+    """Reconstruye y compacta todos los índices FTS desde sus tablas.
+
+    Útil si el índice se ha desincronizado (p.ej. tras editar la BD con
+    triggers desactivados) o para reducir su tamaño tras muchos borrados.
+
+    Returns:
+        list[str]: nombres de los índices reconstruidos
+    """
+    if engine.dialect.name != "sqlite":
+        return []
+
+    create_missing_search_indexes(engine)
+    with engine.begin() as connection:
+        for index in SEARCH_INDEXES.values():
+            connection.exec_driver_sql(
+                f"INSERT INTO {index.name}({index.name}) VALUES ('rebuild')"
+            )
+            connection.exec_driver_sql(
+                f"INSERT INTO {index.name}({index.name}) VALUES ('optimize')"
+            )
+    return [index.name for index in SEARCH_INDEXES.values()]
+
+
+def build_match_query(search_text: str) -> str | None:
+    """Convierte el texto del usuario en una consulta MATCH de FTS5.
+
+    Cada palabra se busca como prefijo (salvo las de menos de
+    `MIN_PREFIX_LENGTH` caracteres) y todas deben aparecer (AND), de modo que
+    "valid usp" encuentra "Validación del USSP". Los operadores de FTS5 que
+    escriba el usuario se tratan como texto.
+
+    Returns:
+        str | None: consulta MATCH, o None si el texto no tiene palabras
+    """
+    tokens = _TOKEN.findall(search_text or "")
+    if not tokens:
+        return None
+    return " ".join(
+        f'"{token}"*' if len(token) >= MIN_PREFIX_LENGTH else f'"{token}"'
+        for token in tokens
+    )
+
+
+def search_index(
+    session: Session,
+    table: str,
+    search_text: str,
+    limit: int = DEFAULT_SEARCH_LIMIT,
+) -> list[SearchHit]:
+    """Busca en el índice FTS de `table` y devuelve los IDs ordenados por relevancia.
+
+    Raises:
+        ValueError: si la tabla no tiene índice de búsqueda registrado
+    """
+    index = SEARCH_INDEXES.get(table)
+    if index is None:
+        raise ValueError(f"La tabla {table} no tiene índice de búsqueda")
+
+    match = build_match_query(search_text)
+    if match is None:
+        return []
+
+    rows = session.execute(
+        text(
+            f"SELECT rowid, bm25({index.name}) AS rank, "
+            f"snippet({index.name}, -1, '[', ']', '…', 12) "
+            f"FROM {index.name} WHERE {index.name} MATCH :match "
+            f"ORDER BY rank LIMIT :limit"
+        ),
+        {"match": match, "limit": limit},
+    ).all()
+    return [SearchHit(row_id, rank, snippet) for row_id, rank, snippet in rows]
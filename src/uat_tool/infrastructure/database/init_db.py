@@ -2,13 +2,20 @@ from sqlalchemy.orm import sessionmaker
 
 from .base import Base
 from .engine import get_engine
+from .migrations import migrate
 
 
 def init_db(drop_existing: bool = False, engine=None, load_initial_data: bool = True):
     """Inicializa la base de datos.
 
     Esta función crea la base de datos y todas las tablas definidas en los modelos y
-    la pobla con los datos iniciales.
+    la pobla con los datos iniciales. Si el esquema ya está en la versión actual
+    solo se ejecuta la consulta de la versión (ver `migrations`) en lugar de
+    crear el esquema.
+
+    Los datos iniciales se cargan en cada llamada, no solo al migrar: la versión
+    del esquema no registra si se cargaron (`--no-seed` o una carga fallida), y
+    la carga es idempotente (un INSERT ... ON CONFLICT DO NOTHING por tabla).
 
     Args:
         drop_existing (bool): Si True, elimina las tablas existentes primero
@@ -21,7 +28,9 @@ def init_db(drop_existing: bool = False, engine=None, load_initial_data: bool =
     if drop_existing:
         Base.metadata.drop_all(actual_engine)
 
-    Base.metadata.create_all(actual_engine)
+    migrate(actual_engine)
+    if not load_initial_data:
+        return actual_engine
 
     SessionLocal = sessionmaker(
         bind=actual_engine, autoflush=False, autocommit=False, future=True
@@ -29,10 +38,9 @@ def init_db(drop_existing: bool = False, engine=None, load_initial_data: bool =
     session = SessionLocal()
 
     try:
-        if load_initial_data:
-            from .initial_data import load_initial_data as load_data
+        from .initial_data import load_initial_data as load_data
 
-            load_data(session)
+        load_data(session)
 
         session.commit()
     except Exception as e:
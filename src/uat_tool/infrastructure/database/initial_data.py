@@ -1,7 +1,6 @@
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
-from .utils import get_or_create
-
 # ---- Datos iniciales ----
 SYSTEMS = ["USSP", "CISP", "AUDI", "EXCHANGE", "NA"]
 SECTIONS = [
@@ -38,7 +37,11 @@ REASONS = [
 
 
 def load_initial_data(session: Session) -> None:
-    """Puebla las tablas con datos predefinidos cuando el programa se lanza."""
+    """Puebla las tablas con datos predefinidos al crear o migrar la base de datos.
+
+    Un INSERT ... ON CONFLICT DO NOTHING por tabla: los nombres que ya
+    existen (columna UNIQUE) se ignoran.
+    """
     from uat_tool.domain import Reason, Section, System
     mapping = {
         System: SYSTEMS,
@@ -46,6 +49,10 @@ def load_initial_data(session: Session) -> None:
         Reason: REASONS,
     }
 
+    dialect = postgresql if session.get_bind().dialect.name == "postgresql" else sqlite
     for model, values in mapping.items():
-        for value in values:
-            get_or_create(session, model, name=value)
+        session.execute(
+            dialect.insert(model.__table__)
+            .values([{"name": value} for value in values])
+            .on_conflict_do_nothing()
+        )
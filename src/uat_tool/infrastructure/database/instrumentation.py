@@ -0,0 +1,262 @@
+"""
+Instrumentación de consultas SQL: número de sentencias y tiempos.
+
+`QueryProfiler` se engancha a `before_cursor_execute`/`after_cursor_execute`
+de un engine y acumula, para cada sentencia (normalizada) y para cada ámbito
+activo, el número de ejecuciones y su tiempo. Los ámbitos se abren con
+`QueryProfiler.scope` (o el decorador `track_queries`): los servicios
+registran así cada método público y `unit_of_work` cada unidad de trabajo.
+Los ámbitos se anidan y una sentencia cuenta en todos los ámbitos abiertos.
+
+Hay un perfilador global (`get_query_profiler`) desactivado por defecto: sin
+engine enganchado, `track_queries` solo añade una comprobación por llamada.
+Se activa con `python -m uat_tool --profile-sql ...`, que además vuelca el
+informe al terminar y, en la interfaz gráfica, habilita el panel de consultas
+del menú de estadísticas.
+
+Para tests y auditorías sin el perfilador global, `count_queries` captura las
+sentencias que se ejecutan en un engine dentro de un bloque `with`.
+"""
+
+import functools
+import inspect
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+
+# Sentencias más lentas que se muestran en el informe
+REPORT_LIMIT = 10
+
+# Listas de parámetros de IN de longitud variable: "(?, ?, ?)" -> "(?, ...)"
+_PARAMETER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """Agrupa las variantes de una sentencia que solo difieren en los IN."""
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    return _PARAMETER_LIST.sub("(?, ...)", statement)
+
+
+@dataclass
+class QueryStats:
+    """Sentencias ejecutadas y tiempo total (en segundos) de un ámbito o sentencia."""
+
+    calls: int = 0  # Entradas al ámbito (0 para sentencias)
+    statements: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    def add(self, duration: float) -> None:
+        self.statements += 1
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+
+    @property
+    def statements_per_call(self) -> float:
+        return self.statements / self.calls if self.calls else float(self.statements)
+
+
+@dataclass
+class QueryCapture:
+    """Sentencias capturadas por `count_queries`, en orden de ejecución."""
+
+    statements: list[str] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+class QueryProfiler:
+    """Acumula número de sentencias y tiempos por sentencia y por ámbito.
+
+    Seguro entre hilos: los ámbitos abiertos son propios de cada hilo (o
+    contexto) y los acumulados se protegen con un lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._engines = []
+        self._scopes: ContextVar[tuple[str, ...]] = ContextVar(
+            f"query_scopes_{id(self)}", default=()
+        )
+        self.total = QueryStats()
+        self.by_scope: dict[str, QueryStats] = {}
+        self.by_statement: dict[str, QueryStats] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._engines)
+
+    def enable(self, engine) -> None:
+        """Empieza a registrar las sentencias de `engine`."""
+        if engine in self._engines:
+            return
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engines.append(engine)
+
+    def disable(self) -> None:
+        """Deja de registrar sentencias (los acumulados se conservan)."""
+        for engine in self._engines:
+            event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+            event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engines = []
+
+    def reset(self) -> None:
+        """Borra los acumulados."""
+        with self._lock:
+            self.total = QueryStats()
+            self.by_scope = {}
+            self.by_statement = {}
+
+    @contextmanager
+    def scope(self, name: str) -> Iterator[None]:
+        """Atribuye a `name` las sentencias ejecutadas dentro del bloque."""
+        if not self.enabled:
+            yield
+            return
+
+        with self._lock:
+            self.by_scope.setdefault(name, QueryStats()).calls += 1
+        token = self._scopes.set((*self._scopes.get(), name))
+        try:
+            yield
+        finally:
+            self._scopes.reset(token)
+
+    @contextmanager
+    def _resume_scope(self, name: str) -> Iterator[None]:
+        """Como `scope`, sin contar una nueva llamada (reanudar un generador)."""
+        token = self._scopes.set((*self._scopes.get(), name))
+        try:
+            yield
+        finally:
+            self._scopes.reset(token)
+
+    def _before_cursor_execute(self, conn, _cursor, _statement, _params, _ctx, _many):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, _cursor, statement, _params, _ctx, _many):
+        duration = time.perf_counter() - conn.info["query_start_time"].pop()
+        key = normalize_statement(statement)
+        # Un mismo nombre anidado (recursión) cuenta una sola vez
+        scopes = set(self._scopes.get())
+        with self._lock:
+            self.total.add(duration)
+            self.by_statement.setdefault(key, QueryStats()).add(duration)
+            for name in scopes:
+                self.by_scope.setdefault(name, QueryStats()).add(duration)
+
+    def format_report(self, limit: int = REPORT_LIMIT) -> str:
+        """Informe de texto: ámbitos por número de sentencias y sentencias más lentas."""
+        with self._lock:
+            total = self.total
+            scopes = sorted(
+                self.by_scope.items(), key=lambda item: item[1].statements, reverse=True
+            )
+            statements = sorted(
+                self.by_statement.items(),
+                key=lambda item: item[1].total_time,
+                reverse=True,
+            )[:limit]
+
+        name_width = max([len("Scope"), *(len(name) for name, _ in scopes)])
+        lines = [
+            f"{total.statements} sentencias SQL en {total.total_time * 1000:.1f} ms",
+            "",
+            f"{'Scope':<{name_width}}  Calls  Queries  Q/call  Time (ms)",
+        ]
+        for name, stats in scopes:
+            lines.append(
+                f"{name:<{name_width}}  {stats.calls:>5}  {stats.statements:>7}  "
+                f"{stats.statements_per_call:>6.1f}  {stats.total_time * 1000:>9.1f}"
+            )
+        lines += ["", "Sentencias más lentas (tiempo total):"]
+        for statement, stats in statements:
+            lines.append(
+                f"{stats.total_time * 1000:>9.1f} ms  {stats.statements:>6}x  "
+                f"{statement[:120]}"
+            )
+        return "\n".join(lines)
+
+
+_profiler = QueryProfiler()
+
+
+def get_query_profiler() -> QueryProfiler:
+    """Devuelve el perfilador global (desactivado hasta llamar a `enable`)."""
+    return _profiler
+
+
+def track_queries(name: str | None = None) -> Callable:
+    """Decorador que atribuye a un ámbito las sentencias de la función.
+
+    El ámbito por defecto es `<Clase>.<método>` (`__qualname__`). En las
+    funciones generadoras el ámbito se reabre en cada iteración, de modo que
+    solo cuenta lo que ejecuta el propio generador.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        scope_name = name or func.__qualname__
+
+        if inspect.isgeneratorfunction(func):
+
+            @functools.wraps(func)
+            def generator_wrapper(*args, **kwargs):
+                if not _profiler.enabled:
+                    return (yield from func(*args, **kwargs))
+
+                with _profiler.scope(scope_name):
+                    generator = func(*args, **kwargs)
+                try:
+                    while True:
+                        with _profiler._resume_scope(scope_name):
+                            try:
+                                item = next(generator)
+                            except StopIteration as stop:
+                                return stop.value
+                        yield item
+                finally:
+                    generator.close()
+
+            return generator_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _profiler.enabled:
+                return func(*args, **kwargs)
+            with _profiler.scope(scope_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def count_queries(engine) -> Iterator[QueryCapture]:
+    """Captura las sentencias que se ejecutan en `engine` dentro del bloque.
+
+    Uso:
+        with count_queries(engine) as captured:
+            service.get_all_bugs_dto()
+        assert captured.count <= 3
+    """
+    capture = QueryCapture()
+
+    def _after_cursor_execute(_conn, _cursor, statement, _params, _ctx, _many):
+        capture.statements.append(statement)
+
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    try:
+        yield capture
+    finally:
+        event.remove(engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,122 @@
+"""
+Versión del esquema y migraciones.
+
+La tabla `schema_version` guarda una fila por migración aplicada. `init_db`
+lee la versión con una sola consulta y, si ya es `SCHEMA_VERSION`, no crea
+nada: ni `create_all` (que inspecciona cada tabla) ni índices. Si es menor,
+`migrate` aplica en orden las migraciones pendientes y registra cada una al
+terminar. La versión solo cubre el esquema: los datos iniciales los carga
+`init_db` aparte.
+
+La migración 1 crea el esquema actual completo con `create_all` y completa
+lo que falte (índices, FTS y contadores) en las BD anteriores al versionado.
+Por eso las migraciones deben ser idempotentes: las posteriores también se
+ejecutan sobre BD recién creadas que ya tienen el cambio.
+
+Para cambiar el esquema: modificar el modelo y añadir a `MIGRATIONS` una
+`Migration` con la versión siguiente (p. ej. un ADD COLUMN si la columna no
+existe). Las migraciones publicadas no se editan ni se reordenan.
+"""
+
+import importlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String, Table, func, insert, select
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+from .base import Base
+from .counters import create_missing_result_counters
+from .fts import create_missing_search_indexes
+
+schema_version = Table(
+    "schema_version",
+    Base.metadata,
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """Cambio de esquema que lleva la BD a `version`."""
+
+    version: int
+    description: str
+    upgrade: Callable  # upgrade(engine); debe ser idempotente
+
+
+def _create_missing_indexes(engine) -> None:
+    """Crea los índices declarados en los modelos que aún no existan.
+
+    `create_all` solo crea índices junto con su tabla, así que las bases de
+    datos creadas con versiones anteriores no los recibirían.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+
+def _create_schema(engine) -> None:
+    # Registra los modelos en Base.metadata aunque el llamador no los haya importado
+    importlib.import_module("uat_tool.domain")
+
+    Base.metadata.create_all(engine)
+    _create_missing_indexes(engine)
+    create_missing_search_indexes(engine)
+    create_missing_result_counters(engine)
+
+
+MIGRATIONS: list[Migration] = [
+    Migration(1, "Esquema inicial: tablas, índices, FTS y contadores", _create_schema),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def get_schema_version(engine) -> int:
+    """Versión del esquema de la BD (0 si aún no está versionada)."""
+    try:
+        with engine.connect() as connection:
+            return (
+                connection.execute(select(func.max(schema_version.c.version))).scalar()
+                or 0
+            )
+    except (OperationalError, ProgrammingError):
+        # No existe la tabla: BD vacía o anterior al versionado
+        return 0
+
+
+def migrate(engine) -> list[Migration]:
+    """Aplica las migraciones pendientes en orden.
+
+    Returns:
+        list[Migration]: migraciones aplicadas (vacía si la BD ya estaba al día)
+
+    Raises:
+        RuntimeError: si la BD tiene una versión posterior a la de la aplicación
+    """
+    current = get_schema_version(engine)
+    if current > SCHEMA_VERSION:
+        raise RuntimeError(
+            f"La base de datos tiene la versión de esquema {current}, posterior "
+            f"a la de esta versión de la aplicación ({SCHEMA_VERSION})"
+        )
+
+    applied = []
+    for migration in MIGRATIONS:
+        if migration.version <= current:
+            continue
+        migration.upgrade(engine)
+        with engine.begin() as connection:
+            connection.execute(
+                insert(schema_version).values(
+                    version=migration.version,
+                    description=migration.description,
+                    applied_at=datetime.now(),
+                )
+            )
+        applied.append(migration)
+    return applied
@@ -0,0 +1,316 @@
+"""
+Auditoría de índices del esquema.
+
+Comprueba dos cosas sobre una base de datos SQLite:
+
+1. Que toda clave foránea sea la primera columna de algún índice (PK, UNIQUE o
+   Index), para que los lazy loads y los JOIN no recorran la tabla entera.
+2. Que ninguna consulta de los repositorios haga un `SCAN` completo de una
+   tabla con más de `min_rows` filas, según `EXPLAIN QUERY PLAN`.
+
+Los listados completos (`get_all`, `get_all_with_relations`) no se auditan
+porque leen la tabla entera por diseño.
+
+Uso:
+    python -m uat_tool db audit [--min-rows 1000]
+
+Las consultas auditadas llaman a los repositorios del dominio, que se importan
+al construir la lista (`repository_queries`) porque el dominio depende de esta
+capa.
+"""
+
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from sqlalchemy import UniqueConstraint, event, func, select
+from sqlalchemy.orm import Session
+
+from .base import Base
+
+RepositoryQuery = tuple[str, Callable[[Session], object]]
+
+
+def repository_queries() -> list[RepositoryQuery]:
+    """Consultas filtradas de los repositorios: (descripción, llamada con sesión)."""
+    # pylint: disable=import-outside-toplevel
+    from uat_tool.domain.repositories import (
+        BlockRepository,
+        BugRepository,
+        CampaignRepository,
+        CampaignRunRepository,
+        CaseRepository,
+        CaseRunRepository,
+        DroneRepository,
+        EmailRepository,
+        EnvironmentRepository,
+        FileRepository,
+        OperatorRepository,
+        ReasonRepository,
+        RequirementRepository,
+        SectionRepository,
+        StepRepository,
+        StepRunRepository,
+        SystemRepository,
+        UasZoneRepository,
+        UhubOrgRepository,
+        UhubUserRepository,
+        UspaceRepository,
+    )
+
+    return [
+        (
+            "BugRepository.get_bugs_by_system",
+            lambda s: BugRepository(s).get_bugs_by_system(1, 1),
+        ),
+        (
+            "BugRepository.get_bugs_by_status",
+            lambda s: BugRepository(s).get_bugs_by_status("OPEN", 1),
+        ),
+        (
+            "BugRepository.get_by_service_now_id",
+            lambda s: BugRepository(s).get_by_service_now_id("INC0", 1),
+        ),
+        (
+            "BugRepository.get_with_history",
+            lambda s: BugRepository(s).get_with_history(1),
+        ),
+        (
+            "BugRepository.get_with_relations",
+            lambda s: BugRepository(s).get_with_relations(1),
+        ),
+        ("BugRepository.search", lambda s: BugRepository(s).search("zona")),
+        (
+            "BugRepository.get_page",
+            lambda s: BugRepository(s).get_page(50, ("2025-01-01 00:00:00", 1)),
+        ),
+        (
+            "FileRepository.get_by_filename",
+            lambda s: FileRepository(s).get_by_filename("a.txt"),
+        ),
+        (
+            "FileRepository.get_by_owner",
+            lambda s: FileRepository(s).get_by_owner("bug", 1),
+        ),
+        (
+            "FileRepository.get_by_owners",
+            lambda s: FileRepository(s).get_by_owners("bug", [1, 2]),
+        ),
+        (
+            "EnvironmentRepository.get_by_name",
+            lambda s: EnvironmentRepository(s).get_by_name("x"),
+        ),
+        (
+            "SystemRepository.get_by_name",
+            lambda s: SystemRepository(s).get_by_name("x"),
+        ),
+        (
+            "SectionRepository.get_by_name",
+            lambda s: SectionRepository(s).get_by_name("x"),
+        ),
+        (
+            "ReasonRepository.get_by_name",
+            lambda s: ReasonRepository(s).get_by_name("x"),
+        ),
+        (
+            "RequirementRepository.get_by_code",
+            lambda s: RequirementRepository(s).get_by_code("x", 1),
+        ),
+        (
+            "RequirementRepository.get_with_relations",
+            lambda s: RequirementRepository(s).get_with_relations(1),
+        ),
+        (
+            "CampaignRepository.get_by_code",
+            lambda s: CampaignRepository(s).get_by_code("x", 1),
+        ),
+        (
+            "CampaignRepository.get_with_blocks",
+            lambda s: CampaignRepository(s).get_with_blocks(1),
+        ),
+        (
+            "BlockRepository.get_by_code",
+            lambda s: BlockRepository(s).get_by_code("x", 1),
+        ),
+        (
+            "BlockRepository.get_with_cases",
+            lambda s: BlockRepository(s).get_with_cases(1),
+        ),
+        (
+            "CaseRepository.get_by_code",
+            lambda s: CaseRepository(s).get_by_code("x", 1),
+        ),
+        (
+            "CaseRepository.get_with_full_relations",
+            lambda s: CaseRepository(s).get_with_full_relations(1),
+        ),
+        ("StepRepository.get_by_case", lambda s: StepRepository(s).get_by_case(1)),
+        (
+            "StepRepository.get_with_requirements",
+            lambda s: StepRepository(s).get_with_requirements(1),
+        ),
+        (
+            "CampaignRunRepository.get_by_campaign",
+            lambda s: CampaignRunRepository(s).get_by_campaign(1),
+        ),
+        (
+            "CampaignRunRepository.get_with_details",
+            lambda s: CampaignRunRepository(s).get_with_details(1),
+        ),
+        (
+            "CaseRunRepository.get_by_campaign_run",
+            lambda s: CaseRunRepository(s).get_by_campaign_run(1),
+        ),
+        (
+            "CaseRunRepository.get_with_steps",
+            lambda s: CaseRunRepository(s).get_with_steps(1),
+        ),
+        (
+            "StepRunRepository.get_by_case_run",
+            lambda s: StepRunRepository(s).get_by_case_run(1),
+        ),
+        (
+            "StepRunRepository.get_with_details",
+            lambda s: StepRunRepository(s).get_with_details(1),
+        ),
+        (
+            "EmailRepository.get_by_email",
+            lambda s: EmailRepository(s).get_by_email("x", 1),
+        ),
+        (
+            "OperatorRepository.get_by_easa_id",
+            lambda s: OperatorRepository(s).get_by_easa_id("x", 1),
+        ),
+        (
+            "DroneRepository.get_by_serial_number",
+            lambda s: DroneRepository(s).get_by_serial_number("x", 1),
+        ),
+        (
+            "UhubOrgRepository.get_by_org_email",
+            lambda s: UhubOrgRepository(s).get_by_org_email("x", 1),
+        ),
+        (
+            "UhubUserRepository.get_by_username",
+            lambda s: UhubUserRepository(s).get_by_username("x", 1),
+        ),
+        (
+            "UasZoneRepository.get_by_zone_name",
+            lambda s: UasZoneRepository(s).get_by_zone_name("x", 1),
+        ),
+        (
+            "UspaceRepository.get_by_code",
+            lambda s: UspaceRepository(s).get_by_code("x", 1),
+        ),
+    ]
+
+
+# "SCAN bugs" o "SCAN bug_history_1" (sin "USING INDEX"), según la versión de SQLite
+_FULL_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$")
+
+
+@dataclass
+class SchemaIssue:
+    """Problema detectado por la auditoría."""
+
+    kind: str  # "unindexed_fk" o "full_scan"
+    table: str
+    detail: str
+
+    def __str__(self) -> str:
+        return f"[{self.kind}] {self.table}: {self.detail}"
+
+
+def find_unindexed_foreign_keys(metadata=Base.metadata) -> list[SchemaIssue]:
+    """Devuelve las claves foráneas que no encabezan ningún índice."""
+    issues = []
+    for table in metadata.sorted_tables:
+        leading_columns = {
+            cols[0].name
+            for cols in (
+                list(table.primary_key.columns),
+                *(list(index.columns) for index in table.indexes),
+                *(
+                    list(constraint.columns)
+                    for constraint in table.constraints
+                    if isinstance(constraint, UniqueConstraint)
+                ),
+            )
+            if cols
+        }
+        for fk in table.foreign_keys:
+            if fk.parent.name not in leading_columns:
+                issues.append(
+                    SchemaIssue(
+                        "unindexed_fk",
+                        table.name,
+                        f"{fk.parent.name} -> {fk.target_fullname}",
+                    )
+                )
+    return issues
+
+
+def capture_statements(engine, session: Session, queries: list[RepositoryQuery]):
+    """Ejecuta las consultas y devuelve (descripción, sentencia, parámetros)."""
+    captured = []
+    current = {"name": None}
+
+    def _before_cursor_execute(_conn, _cursor, statement, parameters, _ctx, _many):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((current["name"], statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        for name, call in queries:
+            current["name"] = name
+            call(session)
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+    return captured
+
+
+def find_full_scans(
+    engine, min_rows: int = 1000, queries: list[RepositoryQuery] | None = None
+) -> list[SchemaIssue]:
+    """Lanza EXPLAIN QUERY PLAN sobre las consultas de los repositorios.
+
+    Args:
+        engine: engine SQLite con el esquema creado
+        min_rows: solo se reportan SCAN sobre tablas con al menos estas filas
+        queries: consultas a auditar; por defecto `repository_queries()`
+
+    Returns:
+        list[SchemaIssue]: un problema por consulta y tabla recorrida
+    """
+    if queries is None:
+        queries = repository_queries()
+    tables = Base.metadata.tables
+    issues = []
+
+    with Session(engine) as session:
+        statements = capture_statements(engine, session, queries)
+        row_counts = {
+            name: session.execute(select(func.count()).select_from(table)).scalar()
+            for name, table in tables.items()
+        }
+
+        connection = session.connection()
+        for name, statement, parameters in statements:
+            plan = connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            ).all()
+            for row in plan:
+                match = _FULL_SCAN.match(row[-1])
+                if not match:
+                    continue
+                table = match.group(1)
+                if table not in tables:
+                    # Alias de joinedload (p.ej. "bug_history_1")
+                    table = re.sub(r"_\d+$", "", table)
+                if table in tables and row_counts[table] >= min_rows:
+                    issues.append(SchemaIssue("full_scan", table, f"{name}: {row[-1]}"))
+    return issues
+
+
+def audit_schema(engine, min_rows: int = 1000) -> list[SchemaIssue]:
+    """Ejecuta ambas comprobaciones y devuelve todos los problemas."""
+    return find_unindexed_foreign_keys() + find_full_scans(engine, min_rows)
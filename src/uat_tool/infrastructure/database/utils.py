@@ -31,3 +31,23 @@ def get_or_create(session: Session, model, **kwargs):
         if not instance:
             raise
         return instance, False
+
+
+# SQLite limita el número de parámetros por sentencia (999 en versiones antiguas),
+# por lo que las cláusulas IN con muchos IDs se dividen en bloques.
+IN_CLAUSE_CHUNK_SIZE = 500
+
+
+def chunked(values, size: int = IN_CLAUSE_CHUNK_SIZE):
+    """Divide una colección en listas de como máximo `size` elementos.
+
+    Args:
+        values: colección iterable de valores (p.ej. IDs)
+        size: tamaño máximo de cada bloque
+
+    Yields:
+        list: bloques consecutivos de la colección
+    """
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
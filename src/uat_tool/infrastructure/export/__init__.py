@@ -0,0 +1,27 @@
+"""
+Paquete `infrastructure.export`
+
+Escritura de tablas en archivos fila a fila, con memoria constante:
+
+- CsvTableWriter: CSV (UTF-8 con BOM)
+- XlsxTableWriter: XLSX de una hoja generado en streaming
+- open_table_writer: Elige el escritor por la extensión del archivo
+"""
+
+from .writers import (
+    TABLE_WRITERS,
+    XLSX_MAX_ROWS,
+    CsvTableWriter,
+    TableWriter,
+    XlsxTableWriter,
+    open_table_writer,
+)
+
+__all__ = [
+    "TableWriter",
+    "CsvTableWriter",
+    "XlsxTableWriter",
+    "TABLE_WRITERS",
+    "XLSX_MAX_ROWS",
+    "open_table_writer",
+]
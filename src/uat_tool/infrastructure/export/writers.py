@@ -0,0 +1,234 @@
+"""
+Escritores de tablas en CSV y XLSX fila a fila.
+
+Ninguno guarda las filas en memoria: el CSV se escribe directamente y el XLSX
+se genera como un ZIP cuya hoja (`sheet1.xml`) se comprime mientras se
+escribe, con las celdas de texto en línea (`inlineStr`) para no tener que
+construir la tabla de cadenas compartidas. Así se pueden exportar cientos de
+miles de filas con memoria constante y sin dependencias externas.
+
+Uso:
+    with open_table_writer("bugs.xlsx", ["ID", "Estado"]) as writer:
+        writer.write_rows([(1, "Open"), (2, "Closed")])
+"""
+
+import csv
+import re
+import zipfile
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+# Límite de filas de una hoja de Excel (incluida la cabecera)
+XLSX_MAX_ROWS = 1_048_576
+
+# Caracteres de control no permitidos en XML 1.0
+_XML_ILLEGAL = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" '
+    'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    "</Types>"
+)
+
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/'
+    'officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{sheet_name}" sheetId="1" r:id="rId1"/></sheets>'
+    "</workbook>"
+)
+
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/'
+    'officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    "</Relationships>"
+)
+
+# Cabecera fija en la primera fila al desplazarse
+_SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<sheetViews><sheetView workbookViewId="0">'
+    '<pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>'
+    "</sheetView></sheetViews><sheetData>"
+)
+_SHEET_END = "</sheetData></worksheet>"
+
+
+def _xml_text(value) -> str:
+    """Texto de una celda escapado para XML (sin quitar caracteres de control)."""
+    text = value if isinstance(value, str) else str(value)
+    if "&" in text or "<" in text or ">" in text:
+        text = escape(text)
+    return text
+
+
+def _column_letter(index: int) -> str:
+    """Letra de columna de Excel para un índice 0-based (0 -> A, 26 -> AA)."""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+class TableWriter:
+    """Escritor de una tabla con cabecera. Se usa como context manager."""
+
+    def __init__(self, path: str | Path, headers: list[str]):
+        self.path = Path(path)
+        self.headers = list(headers)
+        self.rows_written = 0
+
+    def write_rows(self, rows):
+        """Escribe un lote de filas (secuencias con un valor por columna)."""
+        raise NotImplementedError
+
+    def close(self):
+        raise NotImplementedError
+
+    def __enter__(self) -> "TableWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class CsvTableWriter(TableWriter):
+    """CSV en UTF-8 con BOM para que Excel reconozca las tildes."""
+
+    def __init__(self, path: str | Path, headers: list[str]):
+        super().__init__(path, headers)
+        self._file = self.path.open("w", encoding="utf-8-sig", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.headers)
+
+    def write_rows(self, rows):
+        for row in rows:
+            self._writer.writerow(row)
+            self.rows_written += 1
+
+    def close(self):
+        self._file.close()
+
+
+class XlsxTableWriter(TableWriter):
+    """Libro XLSX de una sola hoja escrito en streaming."""
+
+    def __init__(self, path: str | Path, headers: list[str], sheet_name: str = "Datos"):
+        super().__init__(path, headers)
+        self._columns = [_column_letter(i) for i in range(len(self.headers))]
+        # Compresión rápida: el XML de la hoja es muy repetitivo y comprime bien
+        self._zip = zipfile.ZipFile(
+            self.path, "w", zipfile.ZIP_DEFLATED, compresslevel=1
+        )
+        try:
+            # Las partes fijas van antes: el ZIP no admite otra entrada
+            # mientras la hoja está abierta
+            self._zip.writestr("[Content_Types].xml", _CONTENT_TYPES)
+            self._zip.writestr("_rels/.rels", _ROOT_RELS)
+            self._zip.writestr(
+                "xl/workbook.xml",
+                _WORKBOOK.format(sheet_name=escape(sheet_name, {'"': "&quot;"})),
+            )
+            self._zip.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+            self._sheet = self._zip.open(
+                "xl/worksheets/sheet1.xml", "w", force_zip64=True
+            )
+            self._sheet.write(_SHEET_START.encode())
+            self._write_row(1, self.headers)
+        except Exception:
+            self._zip.close()
+            raise
+
+    def write_rows(self, rows):
+        # Un solo write por lote: el coste está en formatear, no en comprimir
+        chunk = []
+        for row in rows:
+            # +1 por la cabecera, +1 porque las filas de Excel empiezan en 1
+            row_number = self.rows_written + 2
+            if row_number > XLSX_MAX_ROWS:
+                raise ValueError(
+                    f"Una hoja XLSX admite como máximo {XLSX_MAX_ROWS - 1} filas"
+                )
+            chunk.append(self._format_row(row_number, row))
+            self.rows_written += 1
+        self._write_xml("".join(chunk))
+
+    def _write_row(self, row_number: int, values):
+        self._write_xml(self._format_row(row_number, values))
+
+    def _write_xml(self, xml: str):
+        # Los caracteres de control no pueden aparecer en el marcado, así que
+        # se quitan de todo el bloque de una vez en lugar de celda a celda
+        if _XML_ILLEGAL.search(xml):
+            xml = _XML_ILLEGAL.sub("", xml)
+        self._sheet.write(xml.encode())
+
+    def _format_row(self, row_number: int, values) -> str:
+        cells = []
+        for column, value in zip(self._columns, values, strict=True):
+            if value is None:
+                continue
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                cells.append(f'<c r="{column}{row_number}"><v>{value}</v></c>')
+            else:
+                cells.append(
+                    f'<c r="{column}{row_number}" t="inlineStr"><is>'
+                    f'<t xml:space="preserve">{_xml_text(value)}</t></is></c>'
+                )
+        return f'<row r="{row_number}">{"".join(cells)}</row>'
+
+    def close(self):
+        try:
+            self._sheet.write(_SHEET_END.encode())
+            self._sheet.close()
+        finally:
+            self._zip.close()
+
+
+# Extensión de archivo -> escritor
+TABLE_WRITERS: dict[str, type[TableWriter]] = {
+    ".csv": CsvTableWriter,
+    ".xlsx": XlsxTableWriter,
+}
+
+
+def open_table_writer(
+    path: str | Path, headers: list[str], file_format: str | None = None
+) -> TableWriter:
+    """Abre el escritor que corresponde a la extensión de `path`.
+
+    Args:
+        path: archivo de destino
+        headers: cabeceras de las columnas
+        file_format: extensión a usar en lugar de la de `path` (p.ej. ".xlsx"
+            al escribir en un archivo temporal)
+
+    Raises:
+        ValueError: si la extensión no es .csv ni .xlsx
+    """
+    suffix = (file_format or Path(path).suffix).lower()
+    writer_class = TABLE_WRITERS.get(suffix)
+    if writer_class is None:
+        formats = ", ".join(TABLE_WRITERS)
+        raise ValueError(f"Formato de exportación no soportado: {suffix} ({formats})")
+    return writer_class(path, headers)
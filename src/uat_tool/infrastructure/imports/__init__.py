@@ -0,0 +1,14 @@
+"""
+Paquete `infrastructure.imports`
+
+Lectura de tablas desde archivos para las importaciones masivas:
+
+- read_table_records: Lee un CSV o JSON como lista de registros (dict)
+"""
+
+from .readers import TABLE_READERS, read_table_records
+
+__all__ = [
+    "TABLE_READERS",
+    "read_table_records",
+]
@@ -0,0 +1,74 @@
+"""
+Lectores de tablas en CSV y JSON.
+
+Ambos devuelven una lista de registros `{columna: valor}` con los nombres de
+columna normalizados (sin espacios en los extremos y en minúsculas), de modo
+que "Code", " code" y "CODE" son la misma columna. La validación de los
+valores es cosa de quien importa.
+
+- CSV: con cabecera, UTF-8 (con o sin BOM) y separador `,`, `;` o tabulador,
+  que se detecta con la primera línea (Excel usa `;` con configuración
+  regional española). Se leen sin problema los CSV de `infrastructure.export`.
+- JSON: una lista de objetos.
+"""
+
+import csv
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Separadores de CSV que se detectan automáticamente
+CSV_DELIMITERS = ",;\t"
+
+
+def _normalize_keys(record: dict) -> dict[str, Any]:
+    return {
+        str(key).strip().lower(): value
+        for key, value in record.items()
+        if key is not None
+    }
+
+
+def _read_csv(path: Path) -> list[dict[str, Any]]:
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        header = f.readline()
+        try:
+            dialect = csv.Sniffer().sniff(header, delimiters=CSV_DELIMITERS)
+        except csv.Error:
+            dialect = csv.excel
+        f.seek(0)
+        # El BOM ya lo ha consumido utf-8-sig al abrir; seek(0) lo vuelve a saltar
+        return [_normalize_keys(row) for row in csv.DictReader(f, dialect=dialect)]
+
+
+def _read_json(path: Path) -> list[dict[str, Any]]:
+    with path.open(encoding="utf-8-sig") as f:
+        data = json.load(f)
+    if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+        raise ValueError(f"{path.name}: el JSON debe ser una lista de objetos")
+    return [_normalize_keys(item) for item in data]
+
+
+# Lectores por extensión de archivo
+TABLE_READERS: dict[str, Callable[[Path], list[dict[str, Any]]]] = {
+    ".csv": _read_csv,
+    ".json": _read_json,
+}
+
+
+def read_table_records(path: str | Path) -> list[dict[str, Any]]:
+    """Lee todos los registros de un archivo CSV o JSON.
+
+    Raises:
+        ValueError: si la extensión no está soportada o el contenido no es una
+            tabla
+    """
+    path = Path(path)
+    reader = TABLE_READERS.get(path.suffix.lower())
+    if reader is None:
+        supported = ", ".join(TABLE_READERS)
+        raise ValueError(
+            f"Formato de importación no soportado: {path.suffix} ({supported})"
+        )
+    return reader(path)
@@ -6,12 +6,21 @@ crea la ventana principal y lanza el bucle de eventos de la interfaz gráfica.
 
 import sys
 
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication
 
 from uat_tool.application import bootstrap
 from uat_tool.presentation import MainWindow
 from uat_tool.presentation.controllers import MainController
-from uat_tool.shared import get_logger, setup_logging
+from uat_tool.shared import (
+    STARTUP_BUDGET_S,
+    get_logger,
+    get_startup_profiler,
+    setup_logging,
+)
+
+startup = get_startup_profiler()
+startup.mark("imports")
 
 setup_logging(verbose=False)
 logger = get_logger(__name__)
@@ -40,22 +49,27 @@ class ApplicationOrchestrator:
             logger.info("Inicializando UAT Tool...")
 
             # Crear aplicación Qt
-            self.app = QApplication(sys.argv)
-            self.app.setApplicationName("ENAIRE U-space UAT Tool")
-            self.app.setApplicationVersion("1.0.0")
-            self.app.setOrganizationName("ENAIRE")
+            with startup.phase("qt"):
+                self.app = QApplication(sys.argv)
+                self.app.setApplicationName("ENAIRE U-space UAT Tool")
+                self.app.setApplicationVersion("1.0.0")
+                self.app.setOrganizationName("ENAIRE")
 
             # Inicializar contexto de la aplicación
             logger.info("Configurando capa de aplicación...")
-            self.app_context = bootstrap()
+            with startup.phase("bootstrap"):
+                # Las lecturas de la UI van por un pool propio de solo lectura
+                self.app_context = bootstrap(separate_read_pool=True)
 
             # Configurar controlador principal
             logger.info("Configurando interfaz...")
-            self.main_controller = MainController(self.app_context)
-            self.main_controller.initialize()
+            with startup.phase("controller"):
+                self.main_controller = MainController(self.app_context)
+                self.main_controller.initialize()
 
             # Crear ventana principal
-            self.main_window = MainWindow(self.main_controller)
+            with startup.phase("window"):
+                self.main_window = MainWindow(self.main_controller)
 
             # Configurar manejo de excepciones global
             self._setup_global_exception_handling()
@@ -67,6 +81,18 @@ class ApplicationOrchestrator:
             self._safe_shutdown()
             raise
 
+    def _log_startup_time(self):
+        """Registra el tiempo hasta la ventana visible y el desglose por fases."""
+        startup.mark("show")
+        total = startup.elapsed()
+        logger.info("Ventana principal visible en %s", startup.format_report(total))
+        if total > STARTUP_BUDGET_S:
+            logger.warning(
+                "Arranque por encima del objetivo de %.1f s; detalle de imports con "
+                "'python -m uat_tool benchmark startup'",
+                STARTUP_BUDGET_S,
+            )
+
     def _setup_global_exception_handling(self):
         """Configura el manejo global de excepciones."""
 
@@ -123,6 +149,8 @@ class ApplicationOrchestrator:
         try:
             logger.info("Mostrando ventana principal...")
             self.main_window.show()
+            # Primera vuelta del bucle de eventos: la ventana ya está pintada
+            QTimer.singleShot(0, self._log_startup_time)
             return_code = self.app.exec()
             logger.info("Aplicación finalizada")
             return return_code
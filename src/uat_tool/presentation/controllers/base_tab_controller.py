@@ -1,10 +1,13 @@
 from typing import Any
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Qt, QThreadPool, Signal
 
 from uat_tool.application import ApplicationContext
 from uat_tool.shared import get_logger
 
+from .export_worker import ExportWorker
+from .load_worker import LoadWorker
+
 logger = get_logger(__name__)
 
 
@@ -19,6 +22,10 @@ class BaseTabController(QObject):
     error_occurred = Signal(str)
     loading_state_changed = Signal(bool)
     selection_state_changed = Signal(bool)
+    export_state_changed = Signal(bool)
+    export_progress = Signal(int, int)  # Filas exportadas, total
+    export_finished = Signal(str, int)  # Ruta del archivo, filas exportadas
+    search_finished = Signal(int, bool)  # Resultados mostrados, si se recortaron
 
     def __init__(self, app_context: ApplicationContext, tab_name: str):
         super().__init__()
@@ -28,10 +35,22 @@ class BaseTabController(QObject):
         self._current_data = []
         self._selected_item_id = None
 
-        # Conectar señales CRUD para auto-refrescar
-        self.item_created.connect(lambda _: self.refresh_data())
-        self.item_updated.connect(lambda _: self.refresh_data())
-        self.item_deleted.connect(lambda _: self.refresh_data())
+        # Carga en segundo plano: un hilo por pestaña y un contador de
+        # generación para descartar resultados de cargas ya sustituidas
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(1)
+        self._load_generation = 0
+        self._is_loading = False
+
+        # Exportaciones en su propio hilo para no retrasar las cargas
+        self._export_pool = QThreadPool(self)
+        self._export_pool.setMaxThreadCount(1)
+        self._is_exporting = False
+
+        # Conectar señales CRUD para actualizar solo la fila afectada
+        self.item_created.connect(self._on_item_saved)
+        self.item_updated.connect(self._on_item_saved)
+        self.item_deleted.connect(self._on_item_deleted)
 
     def get_all_items(self) -> list[Any]:
         """Obtiene todos los items de la tabla."""
@@ -53,9 +72,145 @@ class BaseTabController(QObject):
         """Obtiene un item por su ID."""
         raise NotImplementedError
 
+    def fetch_data(self) -> Any:
+        """Obtiene los datos de la tabla. Se ejecuta en un hilo del pool.
+
+        No debe tocar modelos ni widgets de Qt; el resultado se entrega a
+        `_on_data_loaded` en el hilo de la GUI.
+        """
+        return self.get_all_items()
+
     def load_data(self):
-        """Carga los datos de la tabla."""
-        raise NotImplementedError
+        """Lanza la carga de datos de la tabla en segundo plano.
+
+        Si ya había una carga en curso, su resultado se descarta al llegar.
+        """
+        self._load_generation += 1
+        generation = self._load_generation
+
+        # Las cargas aún en cola ya no sirven: solo importa la última
+        self._thread_pool.clear()
+
+        worker = LoadWorker(generation, self.fetch_data)
+        worker.signals.finished.connect(
+            self._on_load_finished, Qt.ConnectionType.QueuedConnection
+        )
+        worker.signals.failed.connect(
+            self._on_load_failed, Qt.ConnectionType.QueuedConnection
+        )
+
+        self._set_loading(True)
+        logger.info(f"Cargando datos de {self.tab_name} (generación {generation})")
+        self._thread_pool.start(worker)
+
+    def _on_load_finished(self, generation: int, data: Any):
+        """Recibe el resultado de un worker en el hilo de la GUI."""
+        if generation != self._load_generation:
+            logger.debug(
+                f"Descartada carga obsoleta de {self.tab_name} (generación {generation})"
+            )
+            return
+
+        try:
+            self._on_data_loaded(data)
+        finally:
+            self._set_loading(False)
+
+    def _on_load_failed(self, generation: int, message: str):
+        """Recibe el error de un worker en el hilo de la GUI."""
+        if generation != self._load_generation:
+            return
+
+        self._set_loading(False)
+        self.error_occurred.emit(f"Error cargando datos: {message}")
+
+    def _on_data_loaded(self, data: Any):
+        """Vuelca los datos cargados en la pestaña."""
+        self._current_data = data
+        self.data_loaded.emit(data)
+
+    def _set_loading(self, loading: bool):
+        """Actualiza el estado de carga y lo notifica a la vista."""
+        if loading != self._is_loading:
+            self._is_loading = loading
+            self.loading_state_changed.emit(loading)
+
+    def is_loading(self) -> bool:
+        """Indica si hay una carga en curso."""
+        return self._is_loading
+
+    def wait_for_load(self, msecs: int = -1) -> bool:
+        """Espera a que termine el worker en curso (útil fuera del bucle de eventos).
+
+        Los resultados se entregan igualmente por la cola de eventos.
+        """
+        return self._thread_pool.waitForDone(msecs)
+
+    # --- EXPORTACIÓN ---
+
+    def export_items(self, path: str, progress) -> int:
+        """Exporta todos los items de la pestaña a `path`. Se ejecuta en el pool.
+
+        Por defecto exporta la tabla del mismo nombre que la pestaña con el
+        ExportService, que lee la BD por lotes (no usa los datos cargados).
+
+        Args:
+            path: archivo de destino (.csv o .xlsx)
+            progress: callback `(filas exportadas, total)`
+
+        Returns:
+            int: filas exportadas
+        """
+        export_service = self.app_context.get_service("export_service")
+        return export_service.export_table(self.tab_name, path, progress)
+
+    def export_data(self, path: str) -> bool:
+        """Lanza la exportación a `path` en segundo plano.
+
+        Returns:
+            bool: False si ya había una exportación en curso
+        """
+        if self._is_exporting:
+            self.error_occurred.emit("Ya hay una exportación en curso")
+            return False
+
+        worker = ExportWorker(path, self.export_items)
+        worker.signals.progress.connect(
+            self.export_progress, Qt.ConnectionType.QueuedConnection
+        )
+        worker.signals.finished.connect(
+            self._on_export_finished, Qt.ConnectionType.QueuedConnection
+        )
+        worker.signals.failed.connect(
+            self._on_export_failed, Qt.ConnectionType.QueuedConnection
+        )
+
+        self._set_exporting(True)
+        logger.info(f"Exportando {self.tab_name} a {path}")
+        self._export_pool.start(worker)
+        return True
+
+    def _on_export_finished(self, path: str, rows: int):
+        self._set_exporting(False)
+        logger.info(f"Exportadas {rows} filas de {self.tab_name} a {path}")
+        self.export_finished.emit(path, rows)
+
+    def _on_export_failed(self, message: str):
+        self._set_exporting(False)
+        self.error_occurred.emit(f"Error exportando datos: {message}")
+
+    def _set_exporting(self, exporting: bool):
+        if exporting != self._is_exporting:
+            self._is_exporting = exporting
+            self.export_state_changed.emit(exporting)
+
+    def is_exporting(self) -> bool:
+        """Indica si hay una exportación en curso."""
+        return self._is_exporting
+
+    def wait_for_export(self, msecs: int = -1) -> bool:
+        """Espera a que termine la exportación en curso (ver `wait_for_load`)."""
+        return self._export_pool.waitForDone(msecs)
 
     # --- MÉTODOS PARA GESTIÓN DE UI ---
 
@@ -96,6 +251,30 @@ class BaseTabController(QObject):
         self._is_active = False
         logger.info(f"Pestaña {self.tab_name} desactivada")
 
+    def _on_item_saved(self, item: Any):
+        """Aplica un item creado o actualizado sobre su fila de la tabla.
+
+        Las pestañas sin `table_model`, o con una carga en curso que podría
+        haber leído la BD antes del cambio, recargan todos los datos.
+        """
+        table_model = getattr(self, "table_model", None)
+        if table_model is None or item is None or self._is_loading:
+            self.refresh_data()
+            return
+
+        table_model.upsert_item(item)
+        logger.info(f"Fila actualizada en {self.tab_name}: {item.id}")
+
+    def _on_item_deleted(self, item_id: int):
+        """Quita de la tabla la fila del item eliminado."""
+        table_model = getattr(self, "table_model", None)
+        if table_model is None or self._is_loading:
+            self.refresh_data()
+            return
+
+        table_model.remove_item_by_id(item_id)
+        logger.info(f"Fila eliminada en {self.tab_name}: {item_id}")
+
     def refresh_data(self):
         """Recarga los datos de la pestaña."""
         if self._is_active:
@@ -108,7 +287,6 @@ class BaseTabController(QObject):
             new_item = self.create_item(item_data)
             self.item_created.emit(new_item)
             logger.info(f"Item creado en {self.tab_name}: {new_item.id}")
-            self.load_data()
         except Exception as e:
             logger.error(f"Error creando item en {self.tab_name}: {e}")
             self.error_occurred.emit(f"Error creando item: {str(e)}")
@@ -119,7 +297,6 @@ class BaseTabController(QObject):
             updated_item = self.update_item(item_id, item_data)
             self.item_updated.emit(updated_item)
             logger.info(f"Item actualizado en {self.tab_name}: {item_id}")
-            self.load_data()
         except Exception as e:
             logger.error(f"Error actualizando item en {self.tab_name}: {e}")
             self.error_occurred.emit(f"Error actualizando item: {str(e)}")
@@ -131,7 +308,6 @@ class BaseTabController(QObject):
             if success:
                 self.item_deleted.emit(item_id)
                 logger.info(f"Item eliminado de {self.tab_name}: {item_id}")
-                self.load_data()
             else:
                 self.error_occurred.emit(f"No se pudo eliminar el item {item_id}")
         except Exception as e:
@@ -145,4 +321,10 @@ class BaseTabController(QObject):
     def shutdown(self):
         """Cierra el controlador y libera recursos."""
         logger.info(f"Cerrando controlador de {self.tab_name}")
+        # Invalidar la carga en curso y esperar a que su hilo termine
+        self._load_generation += 1
+        self._thread_pool.clear()
+        self._thread_pool.waitForDone()
+        # Una exportación a medias se deja terminar para no perder el archivo
+        self._export_pool.waitForDone()
         self._current_data.clear()
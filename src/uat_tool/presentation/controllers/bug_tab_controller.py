@@ -2,6 +2,7 @@ import os
 import shutil
 from pathlib import Path
 
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QMessageBox
 
 from uat_tool.application import (
@@ -11,13 +12,16 @@ from uat_tool.application import (
 )
 from uat_tool.application.dto import BugFormDTO, BugTableDTO, FileServiceDTO
 from uat_tool.presentation import BugProxyModel, BugTableModel
-from uat_tool.presentation.dialogs.bug_dialog import BugDialog
 from uat_tool.shared import get_logger
 
 from .base_tab_controller import BaseTabController
+from .load_worker import LoadWorker
 
 logger = get_logger(__name__)
 
+# Resultados de búsqueda que se muestran como máximo (los más relevantes)
+SEARCH_LIMIT = 500
+
 
 class BugTabController(BaseTabController):
     """Controlador específico para la pestaña de Bugs."""
@@ -28,31 +32,25 @@ class BugTabController(BaseTabController):
         self.aux_service: AuxiliaryService = self.app_context.get_service(
             "auxiliary_service"
         )
+        self._search_generation = 0
         self.table_model = BugTableModel()
         self.proxy_model = BugProxyModel()
         self.proxy_model.setSourceModel(self.table_model)
 
-    def load_data(self):
-        """Carga los datos de bugs enriquecidos para la tabla."""
-        try:
-            print("Iniciando carga de datos...")
-            self.loading_state_changed.emit(True)
-
-            bugs_table_dto = self.get_all_items()
-            logger.info(f"{len(bugs_table_dto)} bugs obtenidos y enriquecidos")
+    def fetch_data(self) -> tuple[list[BugTableDTO], tuple | None]:
+        """Obtiene la primera página de bugs enriquecidos (en el hilo del pool).
 
-            self._on_data_loaded(bugs_table_dto)
-
-        except Exception as e:
-            print(f"ERROR en load_data: {e}")
-            self.loading_state_changed.emit(False)
-            self.error_occurred.emit(f"Error cargando datos: {str(e)}")
+        Las páginas siguientes las pide la vista con `fetchMore` al hacer scroll.
+        """
+        return self.get_items_page()
 
-    def _on_data_loaded(self, bugs: list[BugTableDTO]):
-        """Actualiza el modelo de tabla con los datos enriquecidos."""
+    def _on_data_loaded(self, first_page: tuple[list[BugTableDTO], tuple | None]):
+        """Actualiza el modelo de tabla con la primera página de bugs."""
         try:
             print("Actualizando table_model...")
-            self.table_model.update_data(bugs)
+            self.table_model.load_pages(self._request_page, first_page)
+            bugs = self.table_model.bugs
+            self._current_data = bugs
 
             self.data_loaded.emit(bugs)
 
@@ -60,11 +58,61 @@ class BugTabController(BaseTabController):
         except Exception as e:
             logger.error(f"Error actualizando modelo con bugs: {e}")
             self.error_occurred.emit(f"Error actualizando datos: {str(e)}")
-        finally:
-            self.loading_state_changed.emit(False)
+
+    def shutdown(self):
+        """Descarta las búsquedas en curso y cierra el controlador."""
+        self._search_generation += 1
+        super().shutdown()
+
+    def _request_page(self, after: tuple | None):
+        """Carga en el pool la página que pide la vista con `fetchMore`.
+
+        La página lleva la generación de la carga actual: si la tabla se
+        recarga antes de que llegue, se descarta.
+        """
+        worker = LoadWorker(self._load_generation, lambda: self.get_items_page(after))
+        worker.signals.finished.connect(
+            self._on_page_loaded, Qt.ConnectionType.QueuedConnection
+        )
+        worker.signals.failed.connect(
+            self._on_page_failed, Qt.ConnectionType.QueuedConnection
+        )
+        self._thread_pool.start(worker)
+
+    def _on_page_loaded(
+        self, generation: int, page: tuple[list[BugTableDTO], tuple | None]
+    ):
+        """Añade la página recibida al modelo en el hilo de la GUI."""
+        if generation != self._load_generation:
+            logger.debug(
+                f"Descartada página obsoleta de bugs (generación {generation})"
+            )
+            return
+
+        self.table_model.append_page(page)
+
+    def _on_page_failed(self, generation: int, message: str):
+        """Recibe el error de carga de una página en el hilo de la GUI."""
+        if generation != self._load_generation:
+            return
+
+        self.table_model.abort_page()
+        self.error_occurred.emit(f"Error cargando más bugs: {message}")
 
     # --- MÉTODOS PARA INTERACCIÓN CON LA UI ---
 
+    def _create_dialog(self, bug=None):
+        """Crea el diálogo de formulario.
+
+        El módulo del diálogo (y su formulario generado) se importa al abrirlo
+        por primera vez, no al arrancar la aplicación.
+        """
+        from uat_tool.presentation.dialogs.bug_dialog import (  # pylint: disable=import-outside-toplevel
+            BugDialog,
+        )
+
+        return BugDialog(self.app_context, bug)
+
     def handle_new_register(self):
         """Maneja la creación de un nuevo bug desde formulario"""
         dialog = None
@@ -72,7 +120,7 @@ class BugTabController(BaseTabController):
             logger.info("Abriendo diálogo para nuevo bug...")
 
             # Crear y mostrar diálogo de formulario
-            dialog = BugDialog(self.app_context)
+            dialog = self._create_dialog()
             if dialog.exec():
                 # Obtener datos del formulario
                 form_dto = dialog.get_form_data()
@@ -103,6 +151,9 @@ class BugTabController(BaseTabController):
                         )
                         return
 
+                    # Releer la fila para que incluya los adjuntos
+                    new_item = self.bug_service.get_bug_for_table(bug_id) or new_item
+
                 # Éxito completo
                 QMessageBox.information(
                     None,
@@ -141,7 +192,7 @@ class BugTabController(BaseTabController):
                 return
 
             # Crear diálogo con datos actuales
-            dialog = BugDialog(self.app_context, bug)
+            dialog = self._create_dialog(bug)
             if dialog.exec():
                 form_dto = dialog.get_form_data()
                 updated_item = self.update_item(self._selected_item_id, form_dto)
@@ -150,6 +201,11 @@ class BugTabController(BaseTabController):
                     bug_id=self._selected_item_id,
                     new_selected_files=form_dto.selected_files,
                 )
+                # Releer la fila para que refleje los adjuntos editados
+                updated_item = (
+                    self.bug_service.get_bug_for_table(self._selected_item_id)
+                    or updated_item
+                )
                 # Mostrar mensaje de éxito
                 QMessageBox.information(
                     None,
@@ -229,6 +285,75 @@ class BugTabController(BaseTabController):
         logger.info("Obteniendo todos los items...")
         return self.bug_service.get_all_bugs_for_table()
 
+    def search(self, search_text: str):
+        """Filtra la tabla con la búsqueda de texto completo (vacío = sin filtro).
+
+        La búsqueda y la carga de los bugs encontrados que aún no estaban en la
+        tabla se hacen en el pool; al llegar se añaden al final de la tabla en
+        un solo bloque. Una búsqueda posterior descarta el resultado de las
+        anteriores que sigan en curso.
+        """
+        self._search_generation += 1
+        if not search_text.strip():
+            self.proxy_model.set_search_hits(None)
+            return
+
+        loaded_ids = self.table_model.loaded_ids()
+        worker = LoadWorker(
+            self._search_generation,
+            lambda: self._fetch_search(search_text, loaded_ids),
+        )
+        worker.signals.finished.connect(
+            self._on_search_finished, Qt.ConnectionType.QueuedConnection
+        )
+        worker.signals.failed.connect(
+            self._on_search_failed, Qt.ConnectionType.QueuedConnection
+        )
+        self._thread_pool.start(worker)
+
+    def _fetch_search(
+        self, search_text: str, loaded_ids: frozenset[int]
+    ) -> tuple[str, list, list[BugTableDTO], bool]:
+        """Busca en el hilo del pool y carga los bugs encontrados que falten.
+
+        Se pide un resultado más que `SEARCH_LIMIT` para saber si la lista
+        se ha recortado.
+        """
+        hits = self.bug_service.search_bugs(search_text, limit=SEARCH_LIMIT + 1)
+        truncated = len(hits) > SEARCH_LIMIT
+        hits = hits[:SEARCH_LIMIT]
+        missing = self.bug_service.get_bugs_for_table_by_ids(
+            [hit.id for hit in hits if hit.id not in loaded_ids]
+        )
+        return search_text, hits, missing, truncated
+
+    def _on_search_finished(
+        self, generation: int, result: tuple[str, list, list[BugTableDTO], bool]
+    ):
+        """Muestra los resultados de la búsqueda en el hilo de la GUI."""
+        if generation != self._search_generation:
+            return
+
+        search_text, hits, missing, truncated = result
+        self.table_model.append_items(missing)
+        self.proxy_model.set_search_hits(hits)
+        self.search_finished.emit(len(hits), truncated)
+        logger.info(f"Búsqueda '{search_text}': {len(hits)} bugs")
+
+    def _on_search_failed(self, generation: int, message: str):
+        """Recibe el error de una búsqueda en el hilo de la GUI."""
+        if generation != self._search_generation:
+            return
+
+        self.error_occurred.emit(f"Error buscando bugs: {message}")
+
+    def get_items_page(
+        self, after: tuple | None = None
+    ) -> tuple[list[BugTableDTO], tuple | None]:
+        """Obtiene una página de bugs enriquecidos para la tabla."""
+        logger.info("Obteniendo página de bugs...")
+        return self.bug_service.get_bugs_page_for_table(after=after)
+
     def create_item(self, form_dto: BugFormDTO) -> BugTableDTO:
         """Crea un nuevo bug desde formulario."""
         logger.info("Creando nuevo bug...")
@@ -0,0 +1,38 @@
+from collections.abc import Callable
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from uat_tool.shared import get_logger
+
+logger = get_logger(__name__)
+
+
+class ExportWorkerSignals(QObject):
+    """Señales de un ExportWorker (ver LoadWorkerSignals)."""
+
+    progress = Signal(int, int)  # Filas exportadas, total de filas
+    finished = Signal(str, int)  # Ruta del archivo, filas exportadas
+    failed = Signal(str)  # Mensaje de error
+
+
+class ExportWorker(QRunnable):
+    """Ejecuta una exportación a archivo en un hilo de QThreadPool.
+
+    `export` recibe la ruta y un callback de progreso `(hechas, total)` y
+    devuelve el número de filas escritas, como `ExportService.export_bugs`.
+    """
+
+    def __init__(self, path: str, export: Callable[[str, Callable], int]):
+        super().__init__()
+        self.path = path
+        self.export = export
+        self.signals = ExportWorkerSignals()
+
+    def run(self):
+        try:
+            rows = self.export(self.path, self.signals.progress.emit)
+        except Exception as e:
+            logger.error(f"Error exportando a {self.path}: {e}")
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(self.path, rows)
@@ -0,0 +1,43 @@
+from collections.abc import Callable
+from typing import Any
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from uat_tool.shared import get_logger
+
+logger = get_logger(__name__)
+
+
+class LoadWorkerSignals(QObject):
+    """Señales de un LoadWorker.
+
+    QRunnable no es un QObject, así que las señales viven en un objeto aparte
+    creado en el hilo de la GUI. Al emitirse desde el hilo del pool llegan a
+    los slots del controlador como conexiones en cola.
+    """
+
+    finished = Signal(int, object)  # Generación, resultado de la carga
+    failed = Signal(int, str)  # Generación, mensaje de error
+
+
+class LoadWorker(QRunnable):
+    """Ejecuta una función de carga en un hilo de QThreadPool.
+
+    La función no debe tocar modelos ni widgets de Qt: solo consulta los
+    servicios, que abren su propia sesión por cada unit of work.
+    """
+
+    def __init__(self, generation: int, load: Callable[[], Any]):
+        super().__init__()
+        self.generation = generation
+        self.load = load
+        self.signals = LoadWorkerSignals()
+
+    def run(self):
+        try:
+            result = self.load()
+        except Exception as e:
+            logger.error(f"Error en carga en segundo plano: {e}")
+            self.signals.failed.emit(self.generation, str(e))
+        else:
+            self.signals.finished.emit(self.generation, result)
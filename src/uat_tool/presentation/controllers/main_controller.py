@@ -219,6 +219,15 @@ class MainController(QObject):
             controller = self._tab_controllers[self._current_tab]
             controller.refresh_data()
 
+    def get_query_report(self) -> str | None:
+        """Informe de sentencias SQL, o None si el perfilador no está activo."""
+        profiler = self.app_context.get_query_profiler()
+        return profiler.format_report() if profiler.enabled else None
+
+    def reset_query_stats(self):
+        """Pone a cero las estadísticas de sentencias SQL."""
+        self.app_context.get_query_profiler().reset()
+
     def shutdown(self):
         """Cierra todos los controladores y libera recursos."""
         try:
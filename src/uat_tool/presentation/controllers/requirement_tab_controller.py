@@ -1,3 +1,4 @@
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import QMessageBox
 
 from uat_tool.application import (
@@ -9,10 +10,10 @@ from uat_tool.application.dto import (
     RequirementTableDTO,
 )
 from uat_tool.presentation import RequirementProxyModel, RequirementTableModel
-from uat_tool.presentation.dialogs.requirement_dialog import RequirementDialog
 from uat_tool.shared import get_logger
 
 from .base_tab_controller import BaseTabController
+from .load_worker import LoadWorker
 
 logger = get_logger(__name__)
 
@@ -20,6 +21,8 @@ logger = get_logger(__name__)
 class RequirementTabController(BaseTabController):
     """Controlador específico para la pestaña de Requisitos."""
 
+    import_finished = Signal(object)  # RequirementImportResultDTO
+
     def __init__(self, app_context: ApplicationContext):
         super().__init__(app_context, "requirements")
         self.requirement_service: RequirementService = self.app_context.get_service(
@@ -29,24 +32,6 @@ class RequirementTabController(BaseTabController):
         self.proxy_model = RequirementProxyModel()
         self.proxy_model.setSourceModel(self.table_model)
 
-    def load_data(self):
-        """Carga los datos de requisitos enriquecidos para la tabla."""
-        try:
-            logger.info("Iniciando carga de datos...")
-            self.loading_state_changed.emit(True)
-
-            requirement_table_dto = self.get_all_items()
-            logger.info(
-                f"{len(requirement_table_dto)} requisitos obtenidos y enriquecidos"
-            )
-
-            self._on_data_loaded(requirement_table_dto)
-
-        except Exception as e:
-            print(f"ERROR en load_data: {e}")
-            self.loading_state_changed.emit(False)
-            self.error_occurred.emit(f"Error cargando datos: {str(e)}")
-
     def _on_data_loaded(self, requirements: list[RequirementTableDTO]):
         """Actualiza el modelo de tabla con los datos enriquecidos."""
         try:
@@ -60,18 +45,65 @@ class RequirementTabController(BaseTabController):
         except Exception as e:
             logger.error(f"Error actualizando modelo con requirements: {e}")
             self.error_occurred.emit(f"Error actualizando datos: {str(e)}")
-        finally:
-            self.loading_state_changed.emit(False)
+
+    def import_data(self, path: str):
+        """Importa requisitos de un CSV o JSON en segundo plano.
+
+        Se ejecuta en el pool de exportaciones (un solo hilo), así que nunca se
+        solapa con una exportación de la pestaña. Al terminar se recarga la
+        tabla y se emite `import_finished` con el resultado.
+        """
+        # CONTEXTO HARDCODEADO PROVISIONAL. EN EL FUTURO SERÁ VARIABLE DE CONFIGURACIÓN DEFINIDA
+        # POR EL USUARIO AL INICIAR EL PROGRAMA.
+        context = {
+            "modified_by": "provisional",
+            "environment_id": 1,
+        }
+
+        logger.info(f"Importando requisitos desde {path}...")
+        worker = LoadWorker(
+            0, lambda: self.requirement_service.import_requirements_file(path, context)
+        )
+        worker.signals.finished.connect(
+            self._on_import_finished, Qt.ConnectionType.QueuedConnection
+        )
+        worker.signals.failed.connect(
+            self._on_import_failed, Qt.ConnectionType.QueuedConnection
+        )
+        self._export_pool.start(worker)
+
+    def _on_import_finished(self, _generation: int, result):
+        logger.info(
+            f"Importación terminada: {result.created} creados, {len(result.errors)} errores"
+        )
+        if result.created:
+            self.refresh_data()
+        self.import_finished.emit(result)
+
+    def _on_import_failed(self, _generation: int, message: str):
+        self.error_occurred.emit(f"Error importando requisitos: {message}")
 
     # --- MÉTODOS PARA INTERACCIÓN CON LA UI ---
 
+    def _create_dialog(self, requirement=None):
+        """Crea el diálogo de formulario.
+
+        El módulo del diálogo (y su formulario generado) se importa al abrirlo
+        por primera vez, no al arrancar la aplicación.
+        """
+        from uat_tool.presentation.dialogs.requirement_dialog import (  # pylint: disable=import-outside-toplevel
+            RequirementDialog,
+        )
+
+        return RequirementDialog(self.app_context, requirement)
+
     def handle_new_register(self):
         """Maneja la creación de un nuevo requisito."""
         try:
             logger.info("Abriendo diálogo para nuevo requisito...")
 
             # Crear y mostrar diálogo de formulario
-            dialog = RequirementDialog(self.app_context)
+            dialog = self._create_dialog()
             if dialog.exec():
                 form_dto = dialog.get_form_data()
                 new_item = self.create_item(form_dto)
@@ -107,7 +139,7 @@ class RequirementTabController(BaseTabController):
                 return
 
             # Crear diálogo con datos actuales
-            dialog = RequirementDialog(self.app_context, requirement)
+            dialog = self._create_dialog(requirement)
             if dialog.exec():
                 form_dto = dialog.get_form_data()
                 form_dto.id = self._selected_item_id
@@ -209,6 +241,20 @@ class RequirementTabController(BaseTabController):
             logger.error(f"Error eliminando requirement {item_id}: {e}")
             return False
 
+    def search(self, search_text: str):
+        """Filtra la tabla con la búsqueda de texto completo (vacío = sin filtro)."""
+        try:
+            if not search_text.strip():
+                self.proxy_model.set_search_hits(None)
+                return
+
+            hits = self.requirement_service.search_requirements(search_text)
+            self.proxy_model.set_search_hits(hits)
+            logger.info(f"Búsqueda '{search_text}': {len(hits)} requisitos")
+        except Exception as e:
+            logger.error(f"Error buscando requisitos: {e}")
+            self.error_occurred.emit(f"Error buscando requisitos: {str(e)}")
+
     def get_all_items(self) -> list[RequirementTableDTO]:
         """Obtiene todos los requirements enriquecidos para la tabla."""
         logger.info("Obteniendo todos los items...")
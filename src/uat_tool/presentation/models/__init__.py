@@ -5,6 +5,7 @@ Contiene los modelos de datos específicos para Qt:
 
 - BugTableModel: Modelo de tabla para mostrar bugs en QTableView
 - BugProxyModel: Modelo proxy para filtrado y ordenación de bugs
+- SearchProxyModel: Base de los proxies con filtro por palabras y búsqueda FTS
 - [Futuros]: CampaignTableModel, RequirementTableModel, etc.
 
 Estos modelos adaptan los DTOs de aplicación al formato requerido
@@ -18,10 +19,12 @@ from .bug_proxy_model import BugProxyModel
 from .bug_table_model import BugTableModel
 from .requirement_proxy_model import RequirementProxyModel
 from .requirement_table_model import RequirementTableModel
+from .search_proxy_model import SearchProxyModel
 
 __all__ = [
     "BugTableModel",
     "BugProxyModel",
     "RequirementTableModel",
     "RequirementProxyModel",
+    "SearchProxyModel",
 ]
@@ -1,12 +1,29 @@
+from collections.abc import Callable
+
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 
 from uat_tool.application.dto import BugTableDTO
 
+from .id_rows_mixin import IdRowsMixin
+
+# (bugs de la página, cursor de la siguiente o None si no hay más)
+Page = tuple[list[BugTableDTO], tuple | None]
+
+# Pide en segundo plano la página que sigue al cursor; el resultado vuelve al
+# modelo con `append_page` (o `abort_page` si falla)
+PageRequester = Callable[[tuple | None], None]
 
-class BugTableModel(QAbstractTableModel):
+
+class BugTableModel(IdRowsMixin, QAbstractTableModel):
     def __init__(self):
         super().__init__()
         self.bugs: list[BugTableDTO] = []
+        self._reindex_rows()
+        self._rebuild_search_keys()
+        self._page_requester: PageRequester | None = None
+        self._next_cursor: tuple | None = None
+        self._has_more = False
+        self._page_pending = False
         self.headers = [
             "Id",
             "Status",
@@ -47,29 +64,32 @@ class BugTableModel(QAbstractTableModel):
         bug = self.bugs[index.row()]
 
         if role == Qt.ItemDataRole.DisplayRole:
-            columns = (
-                str(bug.id),
-                bug.status,
-                bug.system,
-                bug.system_version,
-                bug.created_at,
-                bug.updated_at,
-                bug.modified_by,
-                bug.service_now_id,
-                bug.campaign_run,
-                bug.requirements,
-                bug.short_description,
-                bug.definition,
-                bug.urgency,
-                bug.impact,
-                bug.comments,
-                bug.file_names,
-            )
+            columns = self._display_columns(bug)
             if 0 <= index.column() < len(columns):
                 return columns[index.column()]
 
         return None
 
+    def _display_columns(self, bug: BugTableDTO) -> tuple[str, ...]:
+        return (
+            str(bug.id),
+            bug.status,
+            bug.system,
+            bug.system_version,
+            bug.created_at,
+            bug.updated_at,
+            bug.modified_by,
+            bug.service_now_id,
+            bug.campaign_run,
+            bug.requirements,
+            bug.short_description,
+            bug.definition,
+            bug.urgency,
+            bug.impact,
+            bug.comments,
+            bug.file_names,
+        )
+
     def headerData(
         self,
         section: int,
@@ -83,8 +103,83 @@ class BugTableModel(QAbstractTableModel):
             return self.headers[section] if section < len(self.headers) else None
         return None
 
+    def canFetchMore(self, parent: QModelIndex = None) -> bool:
+        if parent is None:
+            parent = QModelIndex()
+        if parent.isValid():
+            return False
+        return (
+            self._page_requester is not None
+            and self._has_more
+            and not self._page_pending
+        )
+
+    def fetchMore(self, parent: QModelIndex = None):
+        """Pide la siguiente página sin bloquear el hilo de la GUI.
+
+        La vista lo llama al acercarse al final de las filas cargadas. Hasta
+        que llega la página (`append_page`) no se pide otra.
+        """
+        if not self.canFetchMore(parent):
+            return
+
+        self._page_pending = True
+        self._page_requester(self._next_cursor)
+
+    def append_page(self, page: Page):
+        """Añade al final del modelo la página pedida con `fetchMore`."""
+        bugs, self._next_cursor = page
+        self._has_more = self._next_cursor is not None
+        self._page_pending = False
+
+        # Los bugs creados o editados desde la última carga ya están en la tabla
+        self.append_items(bugs)
+
+    def abort_page(self):
+        """Descarta la página pedida (p.ej. si su carga falló) para reintentarla."""
+        self._page_pending = False
+
+    def load_pages(self, page_requester: PageRequester, first_page: Page):
+        """Vacía el modelo y carga solo la primera página.
+
+        El resto de páginas se piden bajo demanda con `fetchMore`.
+
+        Args:
+            page_requester: función que pide en segundo plano la página que
+                sigue a un cursor
+            first_page: primera página, ya obtenida en segundo plano
+        """
+        bugs, next_cursor = first_page
+
+        self.beginResetModel()
+        self.bugs = list(bugs)
+        self._reindex_rows()
+        self._rebuild_search_keys()
+        self._page_requester = page_requester
+        self._next_cursor = next_cursor
+        self._has_more = next_cursor is not None
+        self._page_pending = False
+        self.endResetModel()
+
+    def _row_items(self) -> list[BugTableDTO]:
+        return self.bugs
+
+    def upsert_item(self, item: BugTableDTO, insert_at: int | None = 0) -> int:
+        """Como `IdRowsMixin.upsert_item`, pero los bugs nuevos van arriba.
+
+        La tabla muestra primero lo último modificado; el orden exacto se
+        recupera en la siguiente carga completa.
+        """
+        return super().upsert_item(item, insert_at)
+
     def update_data(self, bugs: list[BugTableDTO]):
         """Actualiza los datos del modelo con una lista de BugDTOs."""
         self.beginResetModel()
         self.bugs = bugs
+        self._reindex_rows()
+        self._rebuild_search_keys()
+        self._page_requester = None
+        self._next_cursor = None
+        self._has_more = False
+        self._page_pending = False
         self.endResetModel()
@@ -0,0 +1,135 @@
+from typing import Any
+
+from PySide6.QtCore import QModelIndex
+
+from uat_tool.shared import normalize_search_text
+
+
+class IdRowsMixin:
+    """Actualizaciones puntuales de filas identificadas por el ID del DTO.
+
+    Para modelos de tabla que guardan una lista de TableDTOs con atributo `id`.
+    Tras un alta, edición o borrado se toca una sola fila con
+    beginInsertRows/dataChanged/beginRemoveRows en lugar de resetear el modelo,
+    de modo que la vista conserva el scroll y la selección.
+
+    También guarda por ID una clave de búsqueda precalculada (columnas visibles
+    normalizadas con `normalize_search_text`) para que el filtro del proxy no
+    tenga que formatear ni normalizar cada celda en cada pulsación.
+
+    El modelo debe implementar `_row_items` y `_display_columns`, y llamar a
+    `_reindex_rows` y `_rebuild_search_keys` cada vez que sustituya la lista
+    completa.
+    """
+
+    def _row_items(self) -> list[Any]:
+        """Lista de DTOs que respalda las filas del modelo."""
+        raise NotImplementedError
+
+    def _display_columns(self, item: Any) -> tuple[str, ...]:
+        """Texto de cada columna de la fila de un item."""
+        raise NotImplementedError
+
+    def _rebuild_search_keys(self):
+        """Recalcula las claves de búsqueda de todas las filas."""
+        self._search_keys = {}
+        self._index_search_keys(self._row_items())
+
+    def _index_search_keys(self, items: list[Any]):
+        """Calcula las claves de búsqueda de los items indicados."""
+        for item in items:
+            # "\n" separa columnas: ninguna palabra del filtro puede contenerlo.
+            # Una celda None se muestra vacía, así que no aporta "None" a la clave
+            self._search_keys[item.id] = normalize_search_text(
+                "\n".join(
+                    "" if value is None else str(value)
+                    for value in self._display_columns(item)
+                )
+            )
+
+    def search_key(self, row: int) -> str:
+        """Clave de búsqueda normalizada de una fila ("" si no existe)."""
+        return self._search_keys.get(self.id_at(row), "")
+
+    def _reindex_rows(self):
+        """Reconstruye el índice {id: fila}."""
+        self._row_by_id = {item.id: row for row, item in enumerate(self._row_items())}
+
+    def row_of_id(self, item_id: int) -> int | None:
+        """Devuelve la fila del item con ese ID, o None si no está cargado."""
+        return self._row_by_id.get(item_id)
+
+    def loaded_ids(self) -> frozenset[int]:
+        """IDs de los items cargados (copia segura para otro hilo)."""
+        return frozenset(self._row_by_id)
+
+    def id_at(self, row: int) -> int | None:
+        """Devuelve el ID del item de una fila, o None si la fila no existe."""
+        items = self._row_items()
+        return items[row].id if 0 <= row < len(items) else None
+
+    def upsert_item(self, item: Any, insert_at: int | None = None) -> int:
+        """Sustituye la fila del item si ya está cargado o la inserta si no.
+
+        Args:
+            item: TableDTO a mostrar
+            insert_at: fila donde insertar un item nuevo; por defecto al final
+
+        Returns:
+            int: fila que ocupa el item
+        """
+        items = self._row_items()
+        row = self.row_of_id(item.id)
+
+        self._index_search_keys([item])
+
+        if row is not None:
+            items[row] = item
+            self.dataChanged.emit(
+                self.index(row, 0), self.index(row, self.columnCount() - 1)
+            )
+            return row
+
+        row = len(items) if insert_at is None else max(0, min(insert_at, len(items)))
+        self.beginInsertRows(QModelIndex(), row, row)
+        items.insert(row, item)
+        self._reindex_rows()
+        self.endInsertRows()
+        return row
+
+    def append_items(self, items: list[Any]) -> int:
+        """Añade al final, en un solo bloque, los items que aún no estén cargados.
+
+        Una sola inserción (y un solo filtrado del proxy) para todo el lote en
+        lugar de una por item como con `upsert_item`.
+
+        Returns:
+            int: número de filas añadidas
+        """
+        items = [item for item in items if item.id not in self._row_by_id]
+        if not items:
+            return 0
+
+        rows = self._row_items()
+        first = len(rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+        rows.extend(items)
+        # Las filas existentes no se mueven: basta con indexar las nuevas
+        for row, item in enumerate(items, start=first):
+            self._row_by_id[item.id] = row
+        self._index_search_keys(items)
+        self.endInsertRows()
+        return len(items)
+
+    def remove_item_by_id(self, item_id: int) -> bool:
+        """Elimina la fila del item. Devuelve False si no estaba cargado."""
+        row = self.row_of_id(item_id)
+        if row is None:
+            return False
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._row_items()[row]
+        self._search_keys.pop(item_id, None)
+        self._reindex_rows()
+        self.endRemoveRows()
+        return True
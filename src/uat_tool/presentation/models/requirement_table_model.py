@@ -2,11 +2,15 @@ from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 
 from uat_tool.application.dto import RequirementTableDTO
 
+from .id_rows_mixin import IdRowsMixin
 
-class RequirementTableModel(QAbstractTableModel):
+
+class RequirementTableModel(IdRowsMixin, QAbstractTableModel):
     def __init__(self):
         super().__init__()
         self.requirements: list[RequirementTableDTO] = []
+        self._reindex_rows()
+        self._rebuild_search_keys()
         self.headers = [
             "Id",
             "Code",
@@ -39,21 +43,24 @@ class RequirementTableModel(QAbstractTableModel):
         requirement = self.requirements[index.row()]
 
         if role == Qt.ItemDataRole.DisplayRole:
-            columns = (
-                str(requirement.id),
-                requirement.code,
-                requirement.definition,
-                requirement.systems,
-                requirement.sections,
-                requirement.created_at,
-                requirement.updated_at,
-                requirement.modified_by,
-            )
+            columns = self._display_columns(requirement)
             if 0 <= index.column() < len(columns):
                 return columns[index.column()]
 
         return None
 
+    def _display_columns(self, requirement: RequirementTableDTO) -> tuple[str, ...]:
+        return (
+            str(requirement.id),
+            requirement.code,
+            requirement.definition,
+            requirement.systems,
+            requirement.sections,
+            requirement.created_at,
+            requirement.updated_at,
+            requirement.modified_by,
+        )
+
     def headerData(
         self,
         section: int,
@@ -67,8 +74,13 @@ class RequirementTableModel(QAbstractTableModel):
             return self.headers[section] if section < len(self.headers) else None
         return None
 
+    def _row_items(self) -> list[RequirementTableDTO]:
+        return self.requirements
+
     def update_data(self, requirements: list[RequirementTableDTO]):
         """Actualiza los datos del modelo con una lista de RequirementTableDTOs."""
         self.beginResetModel()
         self.requirements = requirements
+        self._reindex_rows()
+        self._rebuild_search_keys()
         self.endResetModel()
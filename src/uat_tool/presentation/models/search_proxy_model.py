@@ -0,0 +1,91 @@
+from PySide6.QtCore import QModelIndex, QSortFilterProxyModel, Qt, QTimer, Signal
+
+from uat_tool.shared import search_tokens
+
+# Espera tras la última pulsación antes de reaplicar el filtro
+FILTER_DEBOUNCE_MS = 250
+
+
+class SearchProxyModel(QSortFilterProxyModel):
+    """Proxy con filtro por palabras y resultados de búsqueda de texto completo.
+
+    El filtro local compara las palabras normalizadas del texto (todas deben
+    aparecer, en cualquier columna) con la clave precalculada de cada fila
+    (`search_key` de IdRowsMixin), así que filtrar no formatea ninguna celda.
+    `set_filter_text` espera `FILTER_DEBOUNCE_MS` sin cambios antes de filtrar
+    y emitir `filter_text_applied`, que es cuando el controlador lanza la
+    búsqueda FTS.
+
+    Una fila se muestra si cumple el filtro local o está entre los resultados
+    FTS (que incluyen bugs que aún no estaban cargados).
+    """
+
+    filter_text_applied = Signal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        # Palabras normalizadas del filtro local; vacío = sin filtro
+        self._filter_tokens: list[str] = []
+        self._pending_filter_text = ""
+        # Resultados de la búsqueda FTS por ID; None = sin búsqueda activa
+        self._search_hits: dict | None = None
+
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self.apply_filter_text)
+
+    def set_filter_text(self, text: str):
+        """Programa el filtro por `text`; cada llamada reinicia la espera."""
+        self._pending_filter_text = text
+        self._filter_timer.start()
+
+    def apply_filter_text(self, text: str | None = None):
+        """Aplica el filtro ya, sin esperar (por defecto, el texto pendiente)."""
+        self._filter_timer.stop()
+        if text is None:
+            text = self._pending_filter_text
+        self._pending_filter_text = text
+
+        tokens = search_tokens(text)
+        if tokens != self._filter_tokens:
+            self._filter_tokens = tokens
+            self.invalidateFilter()
+        self.filter_text_applied.emit(text)
+
+    def set_search_hits(self, hits: list | None):
+        """Muestra también las filas de los resultados de búsqueda.
+
+        Args:
+            hits: lista de SearchHit devuelta por el servicio, o None para
+                quitar el filtro
+        """
+        self._search_hits = None if hits is None else {hit.id: hit for hit in hits}
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        model = self.sourceModel()
+        if not model:
+            return False
+
+        if not self._filter_tokens:
+            if self._search_hits is None:
+                return True
+        else:
+            key = model.search_key(source_row)
+            if all(token in key for token in self._filter_tokens):
+                return True
+
+        return self._search_hits is not None and (
+            model.id_at(source_row) in self._search_hits
+        )
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        # El fragmento que coincide con la búsqueda se muestra como tooltip
+        if role == Qt.ItemDataRole.ToolTipRole and self._search_hits:
+            source_row = self.mapToSource(index).row()
+            hit = self._search_hits.get(self.sourceModel().id_at(source_row))
+            if hit:
+                return hit.snippet
+        return super().data(index, role)
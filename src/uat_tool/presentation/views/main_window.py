@@ -1,8 +1,18 @@
-from PySide6.QtWidgets import QAbstractItemView, QHeaderView, QMainWindow, QMessageBox
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QFileDialog,
+    QHeaderView,
+    QMainWindow,
+    QMessageBox,
+    QProgressBar,
+)
 
 from uat_tool.presentation.controllers import MainController
 from uat_tool.presentation.views.ui.main_ui import Ui_main_window
 
+# Filas rechazadas que se listan en el aviso de fin de importación
+IMPORT_ERRORS_SHOWN = 20
+
 
 class MainWindow(QMainWindow, Ui_main_window):
     """Ventana principal de la aplicación adaptada al diseño existente."""
@@ -16,6 +26,9 @@ class MainWindow(QMainWindow, Ui_main_window):
         self.bug_controller = None
         self.requirement_controller = None
 
+        # Pestañas con una carga de datos en curso
+        self._loading_tabs: set[str] = set()
+
         self._connect_signals()
         self._setup_menu_actions()
         self._setup_initial_state()
@@ -87,9 +100,152 @@ class MainWindow(QMainWindow, Ui_main_window):
         self.action_new_uhub_user.triggered.connect(self.main_controller.on_add_clicked)
         self.action_new_uspace.triggered.connect(self.main_controller.on_add_clicked)
 
+        # Exportación de tablas (los controladores se asignan al estar listos)
+        self.action_export_bugs = self.menu_bugs.addAction("Export...")
+        self.action_export_bugs.triggered.connect(
+            lambda: self._on_export_requested(self.bug_controller, "bugs.xlsx")
+        )
+        self.action_export_requirements = self.menu_requirements.addAction(
+            "Export..."
+        )
+        self.action_export_requirements.triggered.connect(
+            lambda: self._on_export_requested(
+                self.requirement_controller, "requirements.xlsx"
+            )
+        )
+
+        self.action_import_requirements = self.menu_requirements.addAction(
+            "Import..."
+        )
+        self.action_import_requirements.triggered.connect(
+            self._on_import_requirements_requested
+        )
+
+        # Panel de depuración de consultas SQL (solo con --profile-sql)
+        self.action_query_stats = self.menu_statistics.addAction("SQL Queries...")
+        self.action_query_stats.setVisible(
+            self.main_controller.get_query_report() is not None
+        )
+        self.action_query_stats.triggered.connect(self._on_query_stats_requested)
+
     def _setup_initial_state(self):
         """Configura el estado inicial de la interfaz."""
         self._setup_tables()
+        self._setup_loading_indicator()
+        self._setup_export_indicator()
+
+    def _setup_loading_indicator(self):
+        """Crea el indicador de carga (barra indeterminada) de la barra de estado."""
+        self.loading_indicator = QProgressBar(self)
+        self.loading_indicator.setRange(0, 0)  # Sin rango = animación continua
+        self.loading_indicator.setMaximumWidth(120)
+        self.loading_indicator.setTextVisible(False)
+        self.loading_indicator.hide()
+        self.status_bar.addPermanentWidget(self.loading_indicator)
+
+    def _setup_export_indicator(self):
+        """Crea la barra de progreso de exportación de la barra de estado."""
+        self.export_indicator = QProgressBar(self)
+        self.export_indicator.setMaximumWidth(160)
+        self.export_indicator.setFormat("Exportando %p%")
+        self.export_indicator.hide()
+        self.status_bar.addPermanentWidget(self.export_indicator)
+
+    def _connect_export_state(self, controller):
+        """Enlaza el progreso de exportación de un controlador con el indicador."""
+        controller.export_state_changed.connect(self._on_export_state_changed)
+        controller.export_progress.connect(self._on_export_progress)
+        controller.export_finished.connect(self._on_export_finished)
+
+    def _on_export_requested(self, controller, default_name: str):
+        """Pide el archivo de destino y lanza la exportación de la pestaña."""
+        if controller is None:
+            return
+
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Exportar tabla",
+            default_name,
+            "Excel (*.xlsx);;CSV (*.csv)",
+        )
+        if path:
+            controller.export_data(path)
+
+    def _on_export_state_changed(self, exporting: bool):
+        # Sin total todavía: animación continua hasta el primer lote
+        self.export_indicator.setRange(0, 0)
+        self.export_indicator.setVisible(exporting)
+
+    def _on_export_progress(self, done: int, total: int):
+        self.export_indicator.setRange(0, max(total, 1))
+        self.export_indicator.setValue(done)
+
+    def _on_export_finished(self, path: str, rows: int):
+        self.status_bar.showMessage(f"Exportadas {rows} filas a {path}", 5000)
+
+    def _on_import_requirements_requested(self):
+        """Pide el archivo de requisitos y lanza la importación."""
+        if self.requirement_controller is None:
+            return
+
+        path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Importar requisitos",
+            "",
+            "CSV (*.csv);;JSON (*.json)",
+        )
+        if path:
+            self.status_bar.showMessage(f"Importando requisitos desde {path}...")
+            self.requirement_controller.import_data(path)
+
+    def _on_import_finished(self, result):
+        """Muestra el resumen de una importación y sus filas rechazadas."""
+        summary = f"{result.created} de {result.total} requisitos importados"
+        self.status_bar.showMessage(summary, 5000)
+        if result.errors:
+            shown = result.errors[:IMPORT_ERRORS_SHOWN]
+            details = "\n".join(str(error) for error in shown)
+            if len(result.errors) > len(shown):
+                details += f"\n... y {len(result.errors) - len(shown)} más"
+            QMessageBox.warning(
+                self,
+                "Importación de requisitos",
+                f"{summary}. {len(result.errors)} filas con errores:\n\n{details}",
+            )
+
+    def _on_query_stats_requested(self):
+        """Muestra las sentencias SQL por ámbito y permite ponerlas a cero."""
+        report = self.main_controller.get_query_report()
+        if report is None:
+            return
+
+        box = QMessageBox(self)
+        box.setWindowTitle("Consultas SQL")
+        box.setText(report.splitlines()[0])
+        box.setDetailedText(report)
+        box.setStandardButtons(QMessageBox.Close | QMessageBox.Reset)
+        if box.exec() == QMessageBox.Reset:
+            self.main_controller.reset_query_stats()
+            self.status_bar.showMessage("Estadísticas SQL reiniciadas", 3000)
+
+    def _connect_loading_state(self, tab_name: str, controller):
+        """Enlaza el estado de carga de un controlador con el indicador."""
+        controller.loading_state_changed.connect(
+            lambda loading, tab=tab_name: self._on_loading_state_changed(tab, loading)
+        )
+        # La primera carga puede haber empezado antes de crear la ventana
+        self._on_loading_state_changed(tab_name, controller.is_loading())
+
+    def _on_loading_state_changed(self, tab_name: str, loading: bool):
+        """Muestra el indicador mientras alguna pestaña esté cargando."""
+        if loading:
+            self._loading_tabs.add(tab_name)
+            self.status_bar.showMessage("Cargando datos...")
+        else:
+            self._loading_tabs.discard(tab_name)
+            if not self._loading_tabs:
+                self.status_bar.showMessage("Datos cargados", 2000)
+        self.loading_indicator.setVisible(bool(self._loading_tabs))
 
     def _setup_tables(self):
         """Configura las propiedades comunes de todas las tablas."""
@@ -136,6 +292,9 @@ class MainWindow(QMainWindow, Ui_main_window):
             self.tbl_bugs.doubleClicked.connect(
                 lambda index: self.bug_controller.handle_double_click(index)
             )
+            self._connect_loading_state("bugs", self.bug_controller)
+            self._connect_export_state(self.bug_controller)
+            self._connect_search(self.le_search_bug, self.bug_controller)
 
         # Configurar modelo de requirements
         self.requirement_controller = self.main_controller.get_tab_controller(
@@ -161,6 +320,35 @@ class MainWindow(QMainWindow, Ui_main_window):
             self.tbl_requirements.doubleClicked.connect(
                 lambda index: self.requirement_controller.handle_double_click(index)
             )
+            self._connect_loading_state("requirements", self.requirement_controller)
+            self._connect_export_state(self.requirement_controller)
+            self.requirement_controller.import_finished.connect(
+                self._on_import_finished
+            )
+            self._connect_search(
+                self.le_search_requirement, self.requirement_controller
+            )
+
+    def _connect_search(self, line_edit, controller):
+        """Conecta la caja de búsqueda al filtro (con espera) del proxy.
+
+        El proxy filtra las filas cargadas y, cuando el texto deja de cambiar,
+        el controlador lanza la búsqueda de texto completo en la base de datos.
+        """
+        proxy = controller.proxy_model
+        line_edit.textChanged.connect(proxy.set_filter_text)
+        proxy.filter_text_applied.connect(controller.search)
+        controller.search_finished.connect(self._on_search_finished)
+
+    def _on_search_finished(self, hits: int, truncated: bool):
+        """Muestra en la barra de estado cuántos resultados hay y si se recortaron."""
+        if truncated:
+            self.status_bar.showMessage(
+                f"Se muestran los {hits} resultados más relevantes: "
+                "concreta la búsqueda para ver el resto"
+            )
+        else:
+            self.status_bar.showMessage(f"{hits} resultados", 3000)
 
     def _on_bug_selection_changed(self, selected, deselected):
         """Maneja cambios de selección en la tabla de bugs."""
@@ -6,6 +6,8 @@ Contiene utilidades compartidas entre todas las capas:
 - Logging: Configuración centralizada de logging
 - Constants: Constantes de la aplicación
 - Helpers: Funciones utilitarias generales
+- Text: Normalización de texto para búsquedas
+- Startup: Cronometraje de las fases del arranque
 - [Futuros]: Validators, decorators, etc.
 
 Componentes reutilizables que no pertenecen a una capa específica.
@@ -13,8 +15,21 @@ Componentes reutilizables que no pertenecen a una capa específica.
 
 from .constants import *
 from .logging import get_logger, setup_logging
+from .startup import (
+    STARTUP_BUDGET_S,
+    StartupPhase,
+    StartupProfiler,
+    get_startup_profiler,
+)
+from .text import normalize_search_text, search_tokens
 
 __all__ = [
     "setup_logging",
     "get_logger",
+    "normalize_search_text",
+    "search_tokens",
+    "STARTUP_BUDGET_S",
+    "StartupPhase",
+    "StartupProfiler",
+    "get_startup_profiler",
 ]
@@ -6,7 +6,9 @@ from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
 
-def setup_logging(verbose=False, log_level="INFO", log_file="uat_tool.log"):
+def setup_logging(
+    verbose=False, log_level="INFO", log_file="uat_tool.log", console_level=None
+):
     """
     Configura el logging para toda la aplicación.
 
@@ -14,12 +16,14 @@ def setup_logging(verbose=False, log_level="INFO", log_file="uat_tool.log"):
         verbose: Si es True, muestra DEBUG en consola
         log_level: Nivel para archivo (DEBUG, INFO, WARNING, ERROR)
         log_file: Nombre del archivo de log
+        console_level: Nivel de consola; si se indica, tiene prioridad sobre verbose
     """
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
 
     # Niveles
-    console_level = logging.DEBUG if verbose else logging.INFO
+    if console_level is None:
+        console_level = logging.DEBUG if verbose else logging.INFO
     file_level = getattr(logging, log_level.upper(), logging.INFO)
 
     # Handlers
@@ -0,0 +1,74 @@
+"""
+Medición de las fases del arranque de la interfaz gráfica.
+
+El perfilador global se crea al importar el paquete `uat_tool` (que importa
+`shared`), así que su origen es prácticamente el inicio del proceso: la
+primera fase mide los imports. `main` marca cada fase (imports, Qt,
+bootstrap, controlador y ventana) y, cuando la ventana principal ya es
+visible, escribe en el log el desglose y avisa si se supera el objetivo.
+
+El detalle de qué módulos cuestan más en los imports se obtiene con
+`python -m uat_tool benchmark startup` (parsea `-X importtime`).
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+# Objetivo de tiempo hasta la ventana principal visible (segundos)
+STARTUP_BUDGET_S = 1.0
+
+
+@dataclass
+class StartupPhase:
+    """Fase del arranque y su duración en segundos."""
+
+    name: str
+    duration: float
+
+
+class StartupProfiler:
+    """Cronometra fases consecutivas desde un origen común."""
+
+    def __init__(self, origin: float | None = None):
+        self.origin = time.perf_counter() if origin is None else origin
+        self.phases: list[StartupPhase] = []
+        self._last_end = self.origin
+
+    def mark(self, name: str) -> float:
+        """Cierra la fase `name`, que empezó al terminar la anterior."""
+        now = time.perf_counter()
+        duration = now - self._last_end
+        self.phases.append(StartupPhase(name, duration))
+        self._last_end = now
+        return duration
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Cronometra el bloque como la fase `name`."""
+        self._last_end = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.mark(name)
+
+    def elapsed(self) -> float:
+        """Segundos transcurridos desde el origen."""
+        return time.perf_counter() - self.origin
+
+    def format_report(self, total: float | None = None) -> str:
+        """Resumen de una línea: total y duración de cada fase."""
+        total = self.elapsed() if total is None else total
+        phases = ", ".join(
+            f"{phase.name} {phase.duration * 1000:.0f} ms" for phase in self.phases
+        )
+        return f"{total:.2f} s ({phases})" if phases else f"{total:.2f} s"
+
+
+_profiler = StartupProfiler()
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """Devuelve el perfilador del arranque del proceso."""
+    return _profiler
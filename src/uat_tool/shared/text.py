@@ -0,0 +1,30 @@
+"""
+Normalización de texto para búsquedas.
+
+Las claves de búsqueda de las tablas y el texto del filtro se normalizan igual
+para poder compararlos con un simple `in`: sin tildes y en minúsculas
+(casefold, que también pliega casos como "ß" -> "ss").
+"""
+
+import re
+import unicodedata
+
+# Bloques Unicode de marcas combinables (tildes, diéresis, virgulillas...)
+_COMBINING_MARKS = re.compile(
+    "[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]"
+)
+
+
+def normalize_search_text(value: str) -> str:
+    """Devuelve el texto en minúsculas (casefold) y sin marcas diacríticas."""
+    value = value or ""
+    if value.isascii():
+        # Caso más habitual: no hay nada que descomponer
+        return value.casefold()
+    decomposed = unicodedata.normalize("NFKD", value)
+    return _COMBINING_MARKS.sub("", decomposed).casefold()
+
+
+def search_tokens(value: str) -> list[str]:
+    """Divide el texto del filtro en palabras normalizadas (sin repetir)."""
+    return list(dict.fromkeys(normalize_search_text(value).split()))
@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from datetime import datetime
 
 import pytest
@@ -82,6 +83,30 @@ def app_context(db_session):
     ctx.shutdown()
 
 
+@pytest.fixture
+def max_queries(test_engine):
+    """Context manager que falla si el bloque ejecuta más de `limit` sentencias SQL.
+
+    Uso:
+        with max_queries(2):
+            repo.get_field_by_ids(ids, "name")
+        with max_queries(1, engine=otro_engine) as captured:
+            ...
+    """
+    from uat_tool.infrastructure import count_queries
+
+    @contextmanager
+    def _max_queries(limit: int, engine=None):
+        with count_queries(engine or test_engine) as captured:
+            yield captured
+        assert captured.count <= limit, (
+            f"{captured.count} sentencias SQL (máximo {limit}):\n"
+            + "\n".join(captured.statements)
+        )
+
+    return _max_queries
+
+
 @pytest.fixture
 def sample_audit_data():
     """Datos de auditoría para testing"""
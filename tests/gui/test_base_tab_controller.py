@@ -0,0 +1,292 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+from uat_tool.application.dto import BugTableDTO, RequirementTableDTO
+from uat_tool.infrastructure import SearchHit
+from uat_tool.presentation import RequirementTableModel
+from uat_tool.presentation.controllers import (
+    BaseTabController,
+    BugTabController,
+    bug_tab_controller,
+)
+
+
+@pytest.fixture(scope="module")
+def qt_app():
+    """Aplicación Qt mínima para el bucle de eventos"""
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+class _FakeController(BaseTabController):
+    """Controlador cuya carga devuelve lo que indique cada test"""
+
+    def __init__(self, results):
+        super().__init__(Mock(), "fake")
+        self.results = results
+        self.first_load_gate = None  # Si se fija, la primera carga espera al evento
+        self.worker_threads = []
+
+    def fetch_data(self):
+        self.worker_threads.append(threading.current_thread())
+        result = self.results.pop(0)
+        if self.first_load_gate and len(self.worker_threads) == 1:
+            self.first_load_gate.wait(5)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def _drain(qt_app, controller):
+    """Espera al worker y entrega las señales en cola"""
+    controller.wait_for_load(5000)
+    qt_app.processEvents()
+
+
+def test_load_runs_in_worker_and_delivers_on_gui_thread(qt_app):
+    """Test que la carga va a un hilo del pool y el resultado vuelve por la cola"""
+    controller = _FakeController([["a", "b"]])
+    loaded, states = [], []
+    controller.data_loaded.connect(loaded.append)
+    controller.loading_state_changed.connect(states.append)
+
+    controller.load_data()
+    assert controller.is_loading()
+    _drain(qt_app, controller)
+
+    assert controller.worker_threads[0] is not threading.main_thread()
+    assert loaded == [["a", "b"]]
+    assert controller.get_current_data() == ["a", "b"]
+    assert states == [True, False]
+    controller.shutdown()
+
+
+def test_superseded_load_is_discarded(qt_app):
+    """Test que el resultado de una carga sustituida no llega a la vista"""
+    controller = _FakeController([["old"], ["new"]])
+    controller.first_load_gate = threading.Event()
+    loaded, states = [], []
+    controller.data_loaded.connect(loaded.append)
+    controller.loading_state_changed.connect(states.append)
+
+    controller.load_data()
+    controller.load_data()
+    controller.first_load_gate.set()
+    _drain(qt_app, controller)
+    _drain(qt_app, controller)
+
+    assert loaded == [["new"]]
+    assert states == [True, False]
+    controller.shutdown()
+
+
+def test_failed_load_emits_error(qt_app):
+    """Test que un error en el worker se notifica y apaga el indicador de carga"""
+    controller = _FakeController([RuntimeError("sin conexión")])
+    errors = []
+    controller.error_occurred.connect(errors.append)
+
+    controller.load_data()
+    _drain(qt_app, controller)
+
+    assert errors == ["Error cargando datos: sin conexión"]
+    assert not controller.is_loading()
+    controller.shutdown()
+
+
+def _requirement(item_id: int, code: str = "") -> RequirementTableDTO:
+    return RequirementTableDTO(
+        id=item_id,
+        created_at="N/A",
+        updated_at="N/A",
+        modified_by="test",
+        code=code,
+        definition="",
+    )
+
+
+def test_crud_signals_update_rows_without_reload(qt_app):
+    """Test que crear, editar y borrar tocan una fila sin volver a cargar"""
+    controller = _FakeController([[_requirement(1), _requirement(2)]])
+    controller.table_model = RequirementTableModel()
+    controller._on_data_loaded = controller.table_model.update_data
+    controller._is_active = True
+    controller.load_data()
+    _drain(qt_app, controller)
+
+    controller.item_updated.emit(_requirement(2, "EDIT"))
+    controller.item_created.emit(_requirement(3))
+    controller.item_deleted.emit(1)
+
+    assert [item.id for item in controller.table_model.requirements] == [2, 3]
+    assert controller.table_model.requirements[0].code == "EDIT"
+    assert len(controller.worker_threads) == 1
+    controller.shutdown()
+
+
+def test_export_runs_in_worker_and_reports_progress(qt_app):
+    """Test que la exportación va al pool, informa del progreso y no admite dos a la vez"""
+    controller = _FakeController([])
+    export_threads = []
+
+    def _export_items(path, progress):
+        export_threads.append(threading.current_thread())
+        progress(0, 3)
+        progress(3, 3)
+        return 3
+
+    controller.export_items = _export_items
+    progress, finished, states, errors = [], [], [], []
+    controller.export_progress.connect(lambda done, total: progress.append(done))
+    controller.export_finished.connect(lambda path, rows: finished.append((path, rows)))
+    controller.export_state_changed.connect(states.append)
+    controller.error_occurred.connect(errors.append)
+
+    assert controller.export_data("bugs.csv")
+    assert not controller.export_data("otro.csv")
+    controller.wait_for_export(5000)
+    qt_app.processEvents()
+
+    assert export_threads[0] is not threading.main_thread()
+    assert progress == [0, 3]
+    assert finished == [("bugs.csv", 3)]
+    assert states == [True, False]
+    assert errors == ["Ya hay una exportación en curso"]
+    controller.shutdown()
+
+
+def _bug(item_id: int) -> BugTableDTO:
+    return BugTableDTO(
+        id=item_id,
+        created_at="N/A",
+        updated_at="N/A",
+        modified_by="test",
+        status="Open",
+        system="USSP",
+        system_version="1.0",
+        short_description="",
+        definition="",
+        urgency="Baja",
+        impact="Baja",
+    )
+
+
+def _bug_controller(pages):
+    """BugTabController cuyo servicio devuelve `pages` según el cursor"""
+    controller = BugTabController(Mock())
+    controller.page_threads = []
+
+    def _page(after=None):
+        controller.page_threads.append(threading.current_thread())
+        return pages[after]
+
+    controller.bug_service.get_bugs_page_for_table.side_effect = _page
+    return controller
+
+
+def test_fetch_more_loads_page_in_worker(qt_app):
+    """Test que la página de fetchMore se carga en el pool y se añade al llegar"""
+    controller = _bug_controller({None: ([_bug(2)], "c1"), "c1": ([_bug(1)], None)})
+    model = controller.table_model
+    controller.load_data()
+    _drain(qt_app, controller)
+
+    model.fetchMore()
+    assert [bug.id for bug in model.bugs] == [2]
+    _drain(qt_app, controller)
+
+    assert [bug.id for bug in model.bugs] == [2, 1]
+    assert threading.main_thread() not in controller.page_threads
+    assert not model.canFetchMore()
+    controller.shutdown()
+
+
+def test_page_of_superseded_load_is_discarded(qt_app):
+    """Test que una página pedida antes de recargar la tabla no se añade"""
+    controller = _bug_controller({None: ([_bug(2)], "c1"), "c1": ([_bug(1)], None)})
+    model = controller.table_model
+    controller.load_data()
+    _drain(qt_app, controller)
+
+    model.fetchMore()
+    controller.load_data()
+    _drain(qt_app, controller)
+
+    assert [bug.id for bug in model.bugs] == [2]
+    assert model.canFetchMore()
+    controller.shutdown()
+
+
+def test_search_runs_in_worker_and_adds_missing_bugs(qt_app):
+    """Test que la búsqueda va al pool y añade de una vez los bugs que faltan"""
+    controller = _bug_controller({None: ([_bug(3), _bug(2)], "c1")})
+    controller.load_data()
+    _drain(qt_app, controller)
+    service = controller.bug_service
+    search_threads = []
+
+    def _search(_text, limit):
+        search_threads.append(threading.current_thread())
+        return [SearchHit(bug_id, -1.0, "") for bug_id in (9, 2, 8)][:limit]
+
+    service.search_bugs.side_effect = _search
+    service.get_bugs_for_table_by_ids.side_effect = lambda ids: [_bug(i) for i in ids]
+    finished = []
+    controller.search_finished.connect(lambda *args: finished.append(args))
+
+    controller.search("zona")
+    assert finished == []
+    _drain(qt_app, controller)
+
+    assert threading.main_thread() not in search_threads
+    service.get_bugs_for_table_by_ids.assert_called_once_with([9, 8])
+    assert [bug.id for bug in controller.table_model.bugs] == [3, 2, 9, 8]
+    assert controller.proxy_model.rowCount() == 3
+    assert finished == [(3, False)]
+    controller.shutdown()
+
+
+def test_search_reports_truncated_results(qt_app, monkeypatch):
+    """Test que se avisa cuando hay más resultados que el límite mostrado"""
+    monkeypatch.setattr(bug_tab_controller, "SEARCH_LIMIT", 2)
+    controller = _bug_controller({None: ([_bug(1), _bug(2), _bug(3)], None)})
+    controller.load_data()
+    _drain(qt_app, controller)
+    controller.bug_service.search_bugs.side_effect = lambda _text, limit: [
+        SearchHit(bug_id, -1.0, "") for bug_id in (1, 2, 3)
+    ][:limit]
+    controller.bug_service.get_bugs_for_table_by_ids.return_value = []
+    finished = []
+    controller.search_finished.connect(lambda *args: finished.append(args))
+
+    controller.search("zona")
+    _drain(qt_app, controller)
+
+    assert finished == [(2, True)]
+    assert controller.proxy_model.rowCount() == 2
+    controller.shutdown()
+
+
+def test_superseded_search_is_discarded(qt_app):
+    """Test que solo se muestran los resultados de la última búsqueda"""
+    controller = _bug_controller({None: ([_bug(1), _bug(2)], None)})
+    controller.load_data()
+    _drain(qt_app, controller)
+    controller.bug_service.search_bugs.side_effect = lambda text, limit: [
+        SearchHit(1 if text == "vieja" else 2, -1.0, "")
+    ]
+    controller.bug_service.get_bugs_for_table_by_ids.return_value = []
+    finished = []
+    controller.search_finished.connect(lambda *args: finished.append(args))
+
+    controller.search("vieja")
+    controller.search("nueva")
+    _drain(qt_app, controller)
+
+    assert finished == [(1, False)]
+    assert controller.proxy_model.rowCount() == 1
+    proxy = controller.proxy_model
+    assert proxy.mapToSource(proxy.index(0, 0)).row() == 1
+    controller.shutdown()
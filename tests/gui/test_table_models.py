@@ -0,0 +1,233 @@
+from types import SimpleNamespace
+
+import pytest
+from PySide6.QtCore import QCoreApplication, Qt
+from PySide6.QtTest import QTest
+
+from uat_tool.presentation import (
+    BugProxyModel,
+    BugTableModel,
+    RequirementProxyModel,
+    RequirementTableModel,
+)
+from uat_tool.presentation.models.search_proxy_model import FILTER_DEBOUNCE_MS
+
+
+@pytest.fixture(scope="module")
+def qt_app():
+    """Aplicación Qt mínima para los modelos"""
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+class _Row(SimpleNamespace):
+    """DTO de prueba: las columnas no indicadas se muestran vacías"""
+
+    def __getattr__(self, name):
+        return ""
+
+
+def _item(item_id: int, label: str = "", **columns):
+    return _Row(id=item_id, label=label, **columns)
+
+
+def _record_signals(model):
+    """Registra las señales de cambio estructural del modelo"""
+    events = []
+    model.modelReset.connect(lambda: events.append("reset"))
+    model.rowsInserted.connect(lambda _p, first, last: events.append(("insert", first)))
+    model.rowsRemoved.connect(lambda _p, first, last: events.append(("remove", first)))
+    model.dataChanged.connect(
+        lambda top_left, _br, _roles=None: events.append(("changed", top_left.row()))
+    )
+    return events
+
+
+def test_upsert_existing_item_changes_single_row(qt_app):
+    """Test que editar un item emite dataChanged de su fila sin resetear el modelo"""
+    model = RequirementTableModel()
+    model.update_data([_item(1), _item(2), _item(3)])
+    events = _record_signals(model)
+
+    row = model.upsert_item(_item(2, "editado"))
+
+    assert row == 1
+    assert model.requirements[1].label == "editado"
+    assert events == [("changed", 1)]
+
+
+def test_insert_and_remove_by_id(qt_app):
+    """Test de alta al final y baja por ID con el índice actualizado"""
+    model = RequirementTableModel()
+    model.update_data([_item(1), _item(2)])
+    events = _record_signals(model)
+
+    model.upsert_item(_item(9))
+    assert model.remove_item_by_id(1)
+    assert not model.remove_item_by_id(1)
+
+    assert [item.id for item in model.requirements] == [2, 9]
+    assert model.row_of_id(9) == 1
+    assert events == [("insert", 2), ("remove", 0)]
+
+
+def test_bug_model_inserts_on_top_and_skips_duplicates_when_paging(qt_app):
+    """Test que un bug nuevo va arriba y no se repite al cargar más páginas"""
+    pages = {
+        None: ([_item(5), _item(4)], "c1"),
+        "c1": ([_item(3), _item(9)], None),
+    }
+    requested = []
+    model = BugTableModel()
+    model.load_pages(requested.append, pages[None])
+
+    model.upsert_item(_item(9))
+    model.fetchMore()
+    assert requested == ["c1"]
+    assert not model.canFetchMore()  # Página pedida y aún sin llegar
+
+    model.append_page(pages["c1"])
+
+    assert [bug.id for bug in model.bugs] == [9, 5, 4, 3]
+    assert not model.canFetchMore()
+
+
+def test_bug_model_retries_aborted_page(qt_app):
+    """Test que una página fallida se puede volver a pedir"""
+    requested = []
+    model = BugTableModel()
+    model.load_pages(requested.append, ([_item(2)], "c1"))
+
+    model.fetchMore()
+    model.abort_page()
+    assert model.canFetchMore()
+    model.fetchMore()
+
+    assert requested == ["c1", "c1"]
+
+
+def test_proxy_filters_by_search_hits_and_shows_snippet(qt_app):
+    """Test que el proxy muestra solo los resultados FTS y su fragmento como tooltip"""
+    model = RequirementTableModel()
+    model.update_data([_item(1), _item(2), _item(3)])
+    proxy = RequirementProxyModel()
+    proxy.setSourceModel(model)
+
+    proxy.set_search_hits([SimpleNamespace(id=3, rank=-2.0, snippet="[zona] sin...")])
+
+    assert proxy.rowCount() == 1
+    assert proxy.data(proxy.index(0, 1), Qt.ItemDataRole.ToolTipRole) == "[zona] sin..."
+
+    proxy.set_search_hits(None)
+    assert proxy.rowCount() == 3
+
+
+def _requirement_proxy(items):
+    model = RequirementTableModel()
+    model.update_data(items)
+    proxy = RequirementProxyModel()
+    proxy.setSourceModel(model)
+    return model, proxy
+
+
+def test_filter_matches_all_words_across_columns_ignoring_case_and_accents(qt_app):
+    """Test que el filtro exige todas las palabras, en cualquier columna, sin tildes"""
+    _model, proxy = _requirement_proxy(
+        [
+            _item(1, code="REQ-01", definition="Validación de la zona", systems="USSP"),
+            _item(2, code="REQ-02", definition="Validacion de vuelo", systems="CISP"),
+            _item(3, code="REQ-03", definition="Zona geográfica", systems="ussp"),
+        ]
+    )
+
+    proxy.apply_filter_text("VALIDACIÓN ussp")
+    assert proxy.rowCount() == 1
+    assert proxy.data(proxy.index(0, 1)) == "REQ-01"
+
+    proxy.apply_filter_text("zona")
+    assert proxy.rowCount() == 2
+
+    proxy.apply_filter_text("  ")
+    assert proxy.rowCount() == 3
+
+
+def test_filter_shows_local_matches_and_search_hits(qt_app):
+    """Test que se muestran las filas que cumplen el filtro o están en los resultados FTS"""
+    _model, proxy = _requirement_proxy(
+        [_item(1, definition="zona"), _item(2, definition="vuelo"), _item(3)]
+    )
+
+    proxy.apply_filter_text("zona")
+    proxy.set_search_hits([SimpleNamespace(id=3, rank=-1.0, snippet="[zonas]")])
+
+    assert proxy.rowCount() == 2
+
+
+def test_filter_keys_follow_row_updates(qt_app):
+    """Test que editar, insertar y paginar actualizan la clave de búsqueda"""
+    model = BugTableModel()
+    model.load_pages(
+        lambda _cursor: model.append_page(([_item(1, short_description="beta")], None)),
+        ([_item(2, short_description="alfa")], "c1"),
+    )
+    proxy = BugProxyModel()
+    proxy.setSourceModel(model)
+    proxy.apply_filter_text("beta")
+    assert proxy.rowCount() == 0
+
+    model.fetchMore()
+    model.upsert_item(_item(2, short_description="beta editado"))
+    model.upsert_item(_item(3, comments="Beta"))
+
+    assert proxy.rowCount() == 3
+    model.remove_item_by_id(3)
+    assert proxy.rowCount() == 2
+
+
+def test_set_filter_text_waits_for_typing_to_stop(qt_app):
+    """Test que el filtro y la señal se aplican una sola vez al dejar de escribir"""
+    _model, proxy = _requirement_proxy([_item(1, code="abc"), _item(2, code="xyz")])
+    applied = []
+    proxy.filter_text_applied.connect(applied.append)
+
+    for text in ("x", "xy", "xyz"):
+        proxy.set_filter_text(text)
+
+    assert proxy.rowCount() == 2
+    assert applied == []
+
+    QTest.qWait(FILTER_DEBOUNCE_MS + 100)
+
+    assert applied == ["xyz"]
+    assert proxy.rowCount() == 1
+
+
+def test_search_key_skips_empty_cells(qt_app):
+    """Test que una columna None no hace que el filtro "none" encuentre la fila"""
+    model = BugTableModel()
+    model.update_data([_item(1, service_now_id=None, short_description="alfa")])
+    proxy = BugProxyModel()
+    proxy.setSourceModel(model)
+
+    proxy.apply_filter_text("none")
+    assert proxy.rowCount() == 0
+    proxy.apply_filter_text("alfa")
+    assert proxy.rowCount() == 1
+
+
+def test_append_items_inserts_missing_rows_in_one_block(qt_app):
+    """Test que un lote de items se añade con una sola inserción y sin duplicados"""
+    model = BugTableModel()
+    model.update_data([_item(1), _item(2)])
+    proxy = BugProxyModel()
+    proxy.setSourceModel(model)
+    events = _record_signals(model)
+
+    added = model.append_items([_item(2), _item(7, comments="zona"), _item(8)])
+
+    assert added == 2
+    assert events == [("insert", 2)]
+    assert [bug.id for bug in model.bugs] == [1, 2, 7, 8]
+    assert (model.row_of_id(7), model.row_of_id(8)) == (2, 3)
+    assert model.loaded_ids() == {1, 2, 7, 8}
+    proxy.apply_filter_text("zona")
+    assert proxy.rowCount() == 1
@@ -15,7 +15,9 @@ def test_initialize_and_shutdown_integration(mock_init_db, MockBugService, app_c
     # --- Verificar base de datos inicializada ---
     mock_init_db.assert_called_once_with(drop_existing=True)
 
-    # --- Verificar que BugService fue creado y registrado ---
+    # --- Verificar que BugService se crea al pedirlo y queda registrado ---
+    MockBugService.assert_not_called()
+    assert app_context.get_service("bug_service") is mock_bug_service_instance
     MockBugService.assert_called_once_with(app_context)
     assert "bug_service" in app_context._services
     assert app_context._services["bug_service"] is mock_bug_service_instance
@@ -3,6 +3,7 @@ from datetime import datetime
 import pytest
 
 from uat_tool.application.dto import (
+    RequirementCoverageDTO,
     RequirementFormDTO,
     RequirementServiceDTO,
     RequirementTableDTO,
@@ -355,3 +356,22 @@ def test_requirement_table_dto_single_items():
 
     assert table_dto.systems == "Single System"
     assert table_dto.sections == "Single Section"
+
+
+@pytest.mark.parametrize(
+    "counts, status",
+    [
+        ({}, "NOT COVERED"),
+        ({"steps": 2, "step_runs": 2}, "NOT RUN"),
+        ({"steps": 2, "step_runs": 4, "executed": 3, "passed": 2}, "FAILED"),
+        ({"steps": 2, "step_runs": 4, "executed": 2, "passed": 2}, "IN PROGRESS"),
+        ({"steps": 2, "step_runs": 4, "executed": 4, "passed": 4}, "PASSED"),
+    ],
+)
+def test_requirement_coverage_dto_status(counts, status):
+    """Test del estado de cobertura calculado a partir de los contadores"""
+    coverage = RequirementCoverageDTO(requirement_id=1, code="REQ001", **counts)
+
+    assert coverage.status == status
+    assert coverage.failed == coverage.executed - coverage.passed
+    assert coverage.not_run == coverage.step_runs - coverage.executed
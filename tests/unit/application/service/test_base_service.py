@@ -0,0 +1,264 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from uat_tool.application import ApplicationContext
+from uat_tool.application.dto import BugServiceDTO
+from uat_tool.application.services import BaseService, BugService
+from uat_tool.domain import (
+    GROUP_SEPARATOR,
+    Bug,
+    Environment,
+    File,
+    Requirement,
+    System,
+)
+from uat_tool.infrastructure import Base
+
+
+@pytest.fixture
+def mock_uow():
+    """Mock de UnitOfWork"""
+    return Mock()
+
+
+@pytest.fixture
+def mock_app_context(mock_uow):
+    """Mock de ApplicationContext que devuelve siempre la misma UnitOfWork"""
+    app_context = Mock()
+    app_context.get_unit_of_work_context.return_value.__enter__ = Mock(
+        return_value=mock_uow
+    )
+    app_context.get_unit_of_work_context.return_value.__exit__ = Mock(
+        return_value=None
+    )
+    app_context.get_reference_cache.return_value.get_names.return_value = {
+        1: "USSP",
+        2: "CISP",
+    }
+    return app_context
+
+
+def _bug_dto(bug_id: int, system_id: int, requirements: list[int]) -> BugServiceDTO:
+    return BugServiceDTO(
+        id=bug_id,
+        environment_id=1,
+        modified_by="test_user",
+        created_at=None,
+        updated_at=None,
+        status="OPEN",
+        system_id=system_id,
+        system_version="1.0.0",
+        short_description="Test bug",
+        definition="Test bug definition",
+        urgency=2,
+        impact=2,
+        requirements=requirements,
+    )
+
+
+def test_resolve_ids_single_query(mock_app_context, mock_uow):
+    """Test que varios IDs se resuelven con una única consulta"""
+    mock_uow.req_repo.get_field_by_ids.return_value = {10: "REQ-10", 11: "REQ-11"}
+    service = BaseService(mock_app_context)
+
+    result = service._resolve_ids("requirement", [10, 11, 11, None])
+
+    assert result == {10: "REQ-10", 11: "REQ-11"}
+    mock_uow.req_repo.get_field_by_ids.assert_called_once_with({10, 11}, "code")
+    assert mock_app_context.get_unit_of_work_context.call_count == 1
+
+
+def test_resolve_ids_reference_data_uses_cache(mock_app_context, mock_uow):
+    """Test que los datos de referencia se resuelven desde la caché sin abrir UoW"""
+    service = BaseService(mock_app_context)
+
+    result = service._resolve_ids("system", [1, 2, 99])
+
+    assert result == {1: "USSP", 2: "CISP"}
+    mock_app_context.get_reference_cache.return_value.get_names.assert_called_once_with(
+        "system"
+    )
+    mock_app_context.get_unit_of_work_context.assert_not_called()
+
+
+def test_resolve_ids_empty_does_not_open_uow(mock_app_context):
+    """Test que sin IDs no se abre ninguna unidad de trabajo"""
+    service = BaseService(mock_app_context)
+
+    assert service._resolve_ids("section", []) == {}
+    mock_app_context.get_unit_of_work_context.assert_not_called()
+
+
+def test_get_system_name_uses_batched_resolver(mock_app_context):
+    """Test que los helpers individuales delegan en el resolvedor por lotes"""
+    service = BaseService(mock_app_context)
+
+    assert service._get_system_name(1) == "USSP"
+    assert service._get_system_name(7) == "Unknown"
+
+
+def test_enrich_bugs_for_table_constant_queries(mock_app_context, mock_uow):
+    """Test que enriquecer N bugs cuesta una consulta por tipo de entidad"""
+    mock_uow.req_repo.get_field_by_ids.return_value = {10: "REQ-10", 11: "REQ-11"}
+    service = BugService(mock_app_context)
+    bugs = [_bug_dto(i, 1 + i % 2, [10, 11]) for i in range(50)]
+
+    result = service._enrich_bugs_for_table(bugs)
+
+    assert len(result) == 50
+    assert result[0].system == "USSP"
+    assert result[1].system == "CISP"
+    assert result[0].requirements == "REQ-10, REQ-11"
+    mock_uow.sys_repo.get_field_by_ids.assert_not_called()
+    mock_uow.req_repo.get_field_by_ids.assert_called_once()
+
+
+def _bug_row(bug_id: int, **values) -> SimpleNamespace:
+    """Fila como las de `BugRepository.get_all_table_rows`"""
+    row = {
+        "id": bug_id,
+        "status": "OPEN",
+        "system_name": "USSP",
+        "system_version": "1.0.0",
+        "created_at": None,
+        "updated_at": None,
+        "modified_by": "test_user",
+        "service_now_id": None,
+        "campaign_run_id": None,
+        "short_description": "Test bug",
+        "definition": "Test bug definition",
+        "urgency": 3,
+        "impact": 1,
+        "comments": None,
+        "requirement_codes": None,
+        "file_names": None,
+        "file_count": 0,
+        "history_count": 0,
+    }
+    row.update(values)
+    return SimpleNamespace(**row)
+
+
+def test_get_all_bugs_for_table_uses_projection(mock_app_context, mock_uow):
+    """Test que la tabla se construye desde las filas sin modelos ni otros servicios"""
+    mock_uow.bug_repo.get_all_table_rows.return_value = [
+        _bug_row(
+            1,
+            requirement_codes=f"REQ-1{GROUP_SEPARATOR}REQ-2",
+            file_names=GROUP_SEPARATOR.join(f"f{i}.png" for i in range(5)),
+            file_count=5,
+            history_count=2,
+        ),
+        _bug_row(2, system_name=None),
+    ]
+    service = BugService(mock_app_context)
+
+    result = service.get_all_bugs_for_table()
+
+    assert [bug.id for bug in result] == [1, 2]
+    assert result[0].requirements == "REQ-1, REQ-2"
+    assert result[0].file_names == "f0.png, f1.png, f2.png ... (+2 más)"
+    assert (result[0].urgency, result[0].impact) == ("Alta", "Baja")
+    assert result[0].history_count == 2
+    assert result[1].system == "Unknown"
+    assert result[1].requirements == "N/A"
+    assert result[1].file_names == "No files attached"
+    mock_uow.bug_repo.get_all_with_relations.assert_not_called()
+    mock_app_context.get_service.assert_not_called()
+
+
+def test_get_bugs_page_for_table_enriches_only_page(mock_app_context, mock_uow):
+    """Test que solo se leen las filas de la página y se devuelve el cursor"""
+    mock_uow.bug_repo.get_table_page.return_value = (
+        [_bug_row(7), _bug_row(6)],
+        ("2025-01-01", 6),
+    )
+    service = BugService(mock_app_context)
+
+    result, cursor = service.get_bugs_page_for_table(2, ("2025-02-01", 9))
+
+    assert [bug.id for bug in result] == [7, 6]
+    assert cursor == ("2025-01-01", 6)
+    mock_uow.bug_repo.get_table_page.assert_called_once_with(2, ("2025-02-01", 9))
+    mock_uow.bug_repo.get_all_table_rows.assert_not_called()
+
+
+@pytest.fixture
+def db_app_context():
+    """ApplicationContext sobre una BD en memoria con 30 bugs y sus relaciones"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        environment = Environment(name="BUDGET_ENV", description="Budget env")
+        system = System(name="BUDGET_SYS")
+        session.add_all([environment, system])
+        session.flush()
+        audit = {"environment_id": environment.id, "modified_by": "test_user"}
+        requirements = [
+            Requirement(code=f"REQ-{i}", definition="def", **audit) for i in range(20)
+        ]
+        bugs = [
+            Bug(
+                status="OPEN",
+                system_id=system.id,
+                system_version="1.0.0",
+                short_description=f"Bug {i}",
+                definition="def",
+                urgency=1,
+                impact=1,
+                requirements=requirements[i % 5 : i % 5 + 3],
+                **audit,
+            )
+            for i in range(30)
+        ]
+        session.add_all(requirements + bugs)
+        session.flush()
+        session.add_all(
+            File(
+                owner_type="bug",
+                owner_id=bug.id,
+                filename=f"f{bug.id}.png",
+                filepath="p",
+                mime_type="image/png",
+                size="1",
+                uploaded_by="t",
+            )
+            for bug in bugs
+        )
+        session.commit()
+        requirement_ids = [requirement.id for requirement in requirements]
+
+    app_context = ApplicationContext(test_mode=True, test_engine=engine)
+    yield app_context, engine, requirement_ids
+    app_context.shutdown()
+    engine.dispose()
+
+
+def test_resolve_ids_query_budget(db_app_context, max_queries):
+    """Test que resolver 20 IDs cuesta una sola consulta IN"""
+    app_context, engine, requirement_ids = db_app_context
+    service = BaseService(app_context)
+
+    with max_queries(1, engine=engine):
+        codes = service._resolve_ids("requirement", requirement_ids)
+
+    assert len(codes) == 20
+
+
+def test_bug_table_page_query_budget(db_app_context, max_queries):
+    """Test que cada página de bugs cuesta lo mismo sea cual sea su tamaño"""
+    app_context, engine, _ = db_app_context
+    service = BugService(app_context)
+
+    # Una consulta por tramo del keyset (con y sin updated_at)
+    with max_queries(2, engine=engine):
+        page, cursor = service.get_bugs_page_for_table(limit=25)
+    with max_queries(2, engine=engine):
+        rest, last_cursor = service.get_bugs_page_for_table(limit=25, after=cursor)
+
+    assert (len(page), len(rest), last_cursor) == (25, 5, None)
+    assert all(bug.requirements != "N/A" for bug in page + rest)
@@ -0,0 +1,88 @@
+import csv
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from uat_tool.application.services import ExportService
+
+
+def _requirement(item_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=item_id,
+        code=f"REQ-{item_id}",
+        definition="Definición",
+        systems="USSP",
+        sections="N/A",
+        created_at="01/01/2025 10:00",
+        updated_at="Not assigned",
+        modified_by="test_user",
+    )
+
+
+@pytest.fixture
+def requirement_service():
+    """Servicio de requisitos con 5 requisitos en lotes de 2"""
+    service = Mock()
+    service.count_requirements.return_value = 5
+
+    def _iter(batch_size):
+        ids = list(range(1, 6))
+        for start in range(0, len(ids), batch_size):
+            yield [_requirement(i) for i in ids[start : start + batch_size]]
+
+    service.iter_requirements_for_table.side_effect = _iter
+    return service
+
+
+@pytest.fixture
+def export_service(requirement_service):
+    app_context = Mock()
+    app_context.get_service.side_effect = {
+        "requirement_service": requirement_service
+    }.get
+    return ExportService(app_context)
+
+
+def test_export_writes_every_batch_and_reports_progress(tmp_path, export_service):
+    """Test que se escriben todos los lotes y el progreso llega tras cada uno"""
+    path = tmp_path / "requirements.csv"
+    progress = []
+
+    rows = export_service.export_table(
+        "requirements", path, lambda done, total: progress.append((done, total)), 2
+    )
+
+    assert rows == 5
+    assert progress == [(0, 5), (2, 5), (4, 5), (5, 5)]
+    with path.open(encoding="utf-8-sig", newline="") as file:
+        lines = list(csv.reader(file))
+    assert lines[0][:3] == ["Id", "Code", "Definition"]
+    assert [line[1] for line in lines[1:]] == [f"REQ-{i}" for i in range(1, 6)]
+    assert not (tmp_path / "requirements.csv.part").exists()
+
+
+def test_export_failure_leaves_no_file(tmp_path, export_service, requirement_service):
+    """Test que un error a mitad borra el archivo parcial y no crea el final"""
+
+    def _broken(batch_size):
+        yield [_requirement(1)]
+        raise RuntimeError("BD no disponible")
+
+    requirement_service.iter_requirements_for_table.side_effect = _broken
+    path = tmp_path / "requirements.xlsx"
+
+    with pytest.raises(RuntimeError):
+        export_service.export_requirements(path)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_export_rejects_unknown_table_and_format(tmp_path, export_service):
+    """Test que tablas y formatos no soportados fallan sin dejar archivos"""
+    with pytest.raises(ValueError, match="no exportable"):
+        export_service.export_table("campaigns", tmp_path / "c.csv")
+
+    with pytest.raises(ValueError, match="no soportado"):
+        export_service.export_requirements(tmp_path / "r.pdf")
+    assert list(tmp_path.iterdir()) == []
@@ -1,4 +1,5 @@
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
@@ -9,7 +10,7 @@ from uat_tool.application.dto import (
     RequirementTableDTO,
 )
 from uat_tool.application.services import RequirementService
-from uat_tool.domain import Requirement
+from uat_tool.domain import GROUP_SEPARATOR, Requirement
 
 
 @pytest.fixture
@@ -145,8 +146,19 @@ def test_get_all_requirements_for_table(
     requirement_service, mock_app_context, mock_uow, sample_requirement_model
 ):
     """Test para obtener requisitos enriquecidos para tabla"""
-    # Setup
-    mock_uow.req_repo.get_all_with_relations.return_value = [sample_requirement_model]
+    # Setup: fila de la proyección con los nombres agregados
+    mock_uow.req_repo.get_all_table_rows.return_value = [
+        SimpleNamespace(
+            id=sample_requirement_model.id,
+            code=sample_requirement_model.code,
+            definition=sample_requirement_model.definition,
+            created_at=sample_requirement_model.created_at,
+            updated_at=sample_requirement_model.updated_at,
+            modified_by=sample_requirement_model.modified_by,
+            system_names=GROUP_SEPARATOR.join(["System A", "System B"]),
+            section_names=GROUP_SEPARATOR.join(["Section X", "Section Y"]),
+        )
+    ]
     mock_app_context.get_unit_of_work_context.return_value.__enter__.return_value = (
         mock_uow
     )
@@ -160,6 +172,7 @@ def test_get_all_requirements_for_table(
     assert result[0].code == "REQ001"
     assert result[0].systems == "System A, System B"
     assert result[0].sections == "Section X, Section Y"
+    mock_uow.req_repo.get_all_with_relations.assert_not_called()
 
 
 def test_enrich_requirement_for_table_success(
@@ -360,3 +373,50 @@ def test_create_with_invalid_form_dto(requirement_service, sample_context):
             lw_systems=[1],
             lw_sections=[1],
         )
+
+
+# --- Tests para importación masiva ---
+
+
+def test_import_requirements_reports_row_errors(
+    requirement_service, mock_app_context, mock_uow, sample_context
+):
+    """Test que las filas inválidas se descartan y las válidas se insertan en bloque"""
+    names = {"system": {1: "USSP", 2: "CISP"}, "section": {7: "Tracking"}}
+    mock_app_context.get_reference_cache.return_value.get_names.side_effect = names.get
+    mock_uow.req_repo.get_existing_codes.return_value = {"REQ-OLD"}
+    mock_uow.req_repo.bulk_create.side_effect = lambda rows, *_: {
+        row["code"]: 100 + i for i, row in enumerate(rows)
+    }
+    mock_app_context.get_unit_of_work_context.return_value.__enter__.return_value = (
+        mock_uow
+    )
+    definition = "Definición suficientemente larga"
+    records = [
+        {"code": "REQ-1", "definition": definition, "systems": "ussp, CISP", "sections": "Tracking"},
+        {"code": "REQ-2", "definition": definition, "systems": "GATEWAY", "sections": "Tracking"},
+        {"code": "REQ-1", "definition": definition, "systems": "USSP", "sections": "Tracking"},
+        {"code": "REQ-OLD", "definition": definition, "systems": ["USSP"], "sections": ["Tracking"]},
+        {"code": "REQ-3", "definition": "Corta", "systems": "USSP", "sections": "Tracking"},
+        {"code": "REQ-4", "definition": definition, "systems": ["CISP"], "sections": "N/A"},
+        {"code": "REQ-5", "definition": definition, "systems": ["CISP"], "sections": ["Tracking"]},
+    ]
+
+    result = requirement_service.import_requirements(records, sample_context)
+
+    assert result.total == 7
+    assert result.created_ids == [100, 101]
+    assert [(error.row, error.code) for error in result.errors] == [
+        (2, "REQ-2"),
+        (3, "REQ-1"),
+        (4, "REQ-OLD"),
+        (5, "REQ-3"),
+        (6, "REQ-4"),
+    ]
+    assert "GATEWAY" in result.errors[0].message
+    mock_uow.req_repo.get_existing_codes.assert_called_once()
+    rows = mock_uow.req_repo.bulk_create.call_args[0][0]
+    assert [(row["code"], row["systems"], row["sections"]) for row in rows] == [
+        ("REQ-1", [1, 2], [7]),
+        ("REQ-5", [2], [7]),
+    ]
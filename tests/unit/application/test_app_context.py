@@ -92,21 +92,35 @@ def test_initialize_database_raises_and_logs(mock_init_db):
     mock_init_db.assert_called_once_with(drop_existing=True)
 
 
-@patch(
-    "uat_tool.application.services.bug_service.BugService",
-    side_effect=Exception("Service init failed"),
-)
 @patch("uat_tool.application.app_context.init_db")
-def test_initialize_services_raises_and_logs(mock_init_db, mock_bug_service):
-    """Verifica que initialize() propaga excepciones si un servicio falla."""
+def test_initialize_services_raises_and_logs(mock_init_db):
+    """Verifica que get_service propaga excepciones si un servicio falla al construirse."""
     ctx = ApplicationContext(test_mode=True)
+    ctx.initialize()
+    failing_factory = MagicMock(side_effect=Exception("Service init failed"))
+    ctx.register_service_factory("bug_service", failing_factory)
 
     with pytest.raises(Exception, match="Service init failed"):
-        ctx.initialize()
+        ctx.get_service("bug_service")
 
-    mock_init_db.assert_called_once_with(drop_existing=True)
-    mock_bug_service.assert_called_once_with(ctx)
-    assert not ctx.is_initialized()
+    mock_init_db.assert_called_once()
+    failing_factory.assert_called_once_with(ctx)
+    assert "bug_service" not in ctx._services
+
+
+@patch("uat_tool.application.app_context.init_db")
+def test_services_are_created_on_first_get_service(_mock_init_db):
+    """Verifica que los servicios se construyen al pedirlos y una sola vez."""
+    ctx = ApplicationContext(test_mode=True)
+    ctx.initialize()
+    assert ctx._services == {}
+
+    bug_service = ctx.get_service("bug_service")
+
+    assert type(bug_service).__name__ == "BugService"
+    assert ctx.get_service("bug_service") is bug_service
+    assert list(ctx._services) == ["bug_service"]
+    assert ctx.get_service("unknown_service") is None
 
 
 def test_initialize_twice_warns(monkeypatch):
@@ -0,0 +1,77 @@
+import pytest
+
+from uat_tool.application import ReferenceDataCache
+from uat_tool.domain import System
+
+
+@pytest.fixture
+def reference_cache(db_session):
+    """Caché de referencia sobre el mismo engine que la sesión de test"""
+    cache = ReferenceDataCache(db_session.get_bind())
+    yield cache
+    cache.shutdown()
+
+
+def test_lookups_both_directions(reference_cache):
+    """Test de resolución id -> nombre y nombre -> id"""
+    ussp_id = reference_cache.get_id("system", "USSP")
+
+    assert ussp_id is not None
+    assert reference_cache.get_name("system", ussp_id) == "USSP"
+    assert reference_cache.get_name("system", -1, default="Unknown") == "Unknown"
+    assert reference_cache.is_cached("system")
+    assert not reference_cache.is_cached("section")
+
+
+def test_lazy_load_without_queries_on_init(db_session):
+    """Test que construir la caché no consulta la BD ni registra listeners"""
+    cache = ReferenceDataCache(db_session.get_bind())
+
+    assert not cache.is_cached("system")
+    assert cache._listening is False
+
+
+def test_unknown_entity_type_raises(reference_cache):
+    """Test de tipo de entidad no soportado"""
+    with pytest.raises(ValueError):
+        reference_cache.get_names("requirement")
+
+
+def test_invalidated_after_commit(reference_cache, db_session):
+    """Test que un commit sobre System invalida la caché de sistemas"""
+    reference_cache.get_names("system")
+    reference_cache.get_names("section")
+
+    system = System(name="CACHE_TEST_SYSTEM")
+    db_session.add(system)
+    db_session.commit()
+
+    try:
+        assert not reference_cache.is_cached("system")
+        assert reference_cache.is_cached("section")
+        assert reference_cache.get_id("system", "CACHE_TEST_SYSTEM") == system.id
+    finally:
+        db_session.delete(system)
+        db_session.commit()
+
+
+def test_rollback_keeps_cache(reference_cache, db_session):
+    """Test que un flush revertido no invalida la caché"""
+    reference_cache.get_names("system")
+
+    db_session.add(System(name="CACHE_ROLLBACK_SYSTEM"))
+    db_session.flush()
+    db_session.rollback()
+
+    assert reference_cache.is_cached("system")
+    assert reference_cache.get_id("system", "CACHE_ROLLBACK_SYSTEM") is None
+
+
+def test_shutdown_removes_listeners(reference_cache, db_session):
+    """Test que tras shutdown la caché queda vacía y sin listeners"""
+    reference_cache.get_names("system")
+
+    reference_cache.shutdown()
+
+    assert not reference_cache.is_cached("system")
+    assert reference_cache._listening is False
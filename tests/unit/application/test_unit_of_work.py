@@ -6,7 +6,6 @@ import pytest
 from uat_tool.application.uow import UnitOfWork, unit_of_work
 
 PATH_TO_UOW_CLASS = "uat_tool.application.uow.UnitOfWork"
-PATH_TO_SESSION_CLASS = "uat_tool.application.uow.Session"
 
 
 class TestUnitOfWork:
@@ -108,46 +107,54 @@ class TestUnitOfWorkContextManager:
                 assert isinstance(uow, UnitOfWork)
                 raise ValueError("Test error")
 
-    @patch(PATH_TO_SESSION_CLASS)
+    @staticmethod
+    def _mock_uow(MockUnitOfWork: MagicMock) -> MagicMock:
+        """Instancia simulada de una unidad de escritura con transacción abierta"""
+        mock_uow_instance = MockUnitOfWork.return_value
+        mock_uow_instance.read_only = False
+        mock_uow_instance.rollback_only = False
+        mock_uow_instance.session.in_transaction.return_value = True
+        return mock_uow_instance
+
     @patch(PATH_TO_UOW_CLASS)
-    def test_uow_commits_on_success(
-        self, MockUnitOfWork: MagicMock, MockSession: MagicMock
-    ):
+    def test_uow_commits_on_success(self, MockUnitOfWork: MagicMock):
         """Verifica que se llama a commit() y close() si no hay excepciones."""
-        # Configura el mock para que devuelva instancia simulada
-        mock_uow_instance = MockUnitOfWork.return_value
+        mock_uow_instance = self._mock_uow(MockUnitOfWork)
+        session_factory = Mock()
 
-        with unit_of_work() as uow:
+        with unit_of_work(session_factory) as uow:
             assert uow is mock_uow_instance
 
         # Verificamos las llamadas al salir del context manager
-        MockSession.assert_called_once()
-        MockUnitOfWork.assert_called_once_with(MockSession.return_value)
+        session_factory.assert_called_once_with()
+        MockUnitOfWork.assert_called_once_with(
+            session_factory.return_value, read_only=False
+        )
         mock_uow_instance.commit.assert_called_once()
         mock_uow_instance.rollback.assert_not_called()
         mock_uow_instance.close.assert_called_once()
 
-    @patch(PATH_TO_SESSION_CLASS)
     @patch(PATH_TO_UOW_CLASS)
-    def test_uow_rollbacks_on_exception(
-        self, MockUnitOfWork: MagicMock, MockSession: MagicMock
-    ):
+    def test_uow_rollbacks_on_exception(self, MockUnitOfWork: MagicMock):
         """Verifica que se llama a rollback() y close() si hay excepciones."""
-        # Configura el mock para que devuelva instancia simulada
-        mock_uow_instance = MockUnitOfWork.return_value
+        mock_uow_instance = self._mock_uow(MockUnitOfWork)
+        session_factory = Mock()
 
         with pytest.raises(ValueError, match="Test error"):
-            with unit_of_work() as uow:
+            with unit_of_work(session_factory) as uow:
                 assert uow is mock_uow_instance
                 raise ValueError("Test error")
 
         # Verificamos las llamadas tras la excepción
-        MockSession.assert_called_once()
-        MockUnitOfWork.assert_called_once_with(MockSession.return_value)
+        session_factory.assert_called_once_with()
+        MockUnitOfWork.assert_called_once_with(
+            session_factory.return_value, read_only=False
+        )
         mock_uow_instance.commit.assert_not_called()
         mock_uow_instance.rollback.assert_called_once()
         mock_uow_instance.close.assert_called_once()
 
+
 class TestUnitOfWorkErrorScenarios:
     """Tests para escenarios de error en Unit of Work"""
 
@@ -161,3 +168,199 @@ class TestUnitOfWorkErrorScenarios:
         ) as mock_close:
             uow.close()
             mock_close.assert_called_once()
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """Factoría de sesiones sobre una BD propia del test"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from uat_tool.infrastructure import Base
+
+    # En fichero: en memoria todas las sesiones comparten la conexión
+    engine = create_engine(f"sqlite:///{tmp_path / 'uow.db'}")
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def _system_names(session_factory):
+    from sqlalchemy import select
+
+    from uat_tool.domain import System
+
+    with session_factory() as session:
+        return sorted(session.scalars(select(System.name)))
+
+
+class TestUnitOfWorkReentrancy:
+    """Tests de repositorios perezosos y unidades de trabajo anidadas"""
+
+    def test_repositories_are_created_on_first_access(self, session_factory):
+        """Test que los repositorios se crean al acceder y se reutilizan"""
+        from uat_tool.domain import BugRepository
+
+        uow = UnitOfWork(session_factory())
+
+        assert "bug_repo" not in vars(uow)
+        assert isinstance(uow.bug_repo, BugRepository)
+        assert uow.bug_repo is uow.bug_repo
+        assert uow.bug_repo.session is uow.session
+        with pytest.raises(AttributeError):
+            _ = uow.unknown_repo
+
+    def test_nested_units_share_session_and_commit_once(self, session_factory):
+        """Test que una unidad anidada comparte la transacción de la externa"""
+        from uat_tool.domain import System
+
+        with unit_of_work(session_factory) as outer:
+            outer.session.add(System(name="OUTER"))
+            with unit_of_work(session_factory) as inner:
+                assert inner is outer
+                inner.session.add(System(name="INNER"))
+            # La anidada no confirma: aún no es visible desde otra sesión
+            assert _system_names(session_factory) == []
+
+        assert _system_names(session_factory) == ["INNER", "OUTER"]
+
+    def test_failed_nested_unit_rolls_back_outer(self, session_factory):
+        """Test que un fallo anidado revierte todo aunque se capture la excepción"""
+        from uat_tool.domain import System
+
+        with pytest.raises(RuntimeError, match="anidada"):
+            with unit_of_work(session_factory) as outer:
+                outer.session.add(System(name="OUTER"))
+                try:
+                    with unit_of_work(session_factory):
+                        raise ValueError("Test error")
+                except ValueError:
+                    pass
+
+        assert _system_names(session_factory) == []
+
+        # La siguiente unidad de trabajo vuelve a ser independiente
+        with unit_of_work(session_factory) as uow:
+            uow.session.add(System(name="NEXT"))
+        assert _system_names(session_factory) == ["NEXT"]
+
+    def test_app_context_uses_its_own_session_factory(self, session_factory):
+        """Test que get_unit_of_work_context usa la factoría del contexto"""
+        from uat_tool.application import ApplicationContext
+
+        ctx = ApplicationContext(test_mode=True)
+        ctx._session_factory = session_factory
+
+        with ctx.get_unit_of_work_context() as outer:
+            with ctx.get_unit_of_work_context() as inner:
+                assert inner is outer
+            assert outer.session.get_bind() is session_factory.kw["bind"]
+
+
+class TestReadOnlyUnitOfWork:
+    """Tests de unidades de trabajo de solo lectura"""
+
+    def test_read_only_unit_never_commits(self, session_factory):
+        """Test que la unidad de solo lectura cierra sin confirmar"""
+        with patch.object(UnitOfWork, "commit") as mock_commit:
+            with unit_of_work(session_factory, read_only=True) as uow:
+                assert uow.read_only
+                assert not uow.session.autoflush
+                assert not uow.session.expire_on_commit
+                uow.bug_repo.get_all()
+
+        mock_commit.assert_not_called()
+
+    def test_read_only_unit_rejects_writes(self, session_factory):
+        """Test que un flush dentro de la unidad de solo lectura falla"""
+        from uat_tool.domain import System
+
+        with pytest.raises(RuntimeError, match="solo lectura"):
+            with unit_of_work(session_factory, read_only=True) as uow:
+                uow.session.add(System(name="READ"))
+                uow.session.flush()
+
+        assert _system_names(session_factory) == []
+
+    def test_scoped_session_is_restored_after_read_only(self, tmp_path):
+        """Test que la sesión scoped del hilo vuelve a admitir escrituras"""
+        from sqlalchemy import create_engine
+
+        from uat_tool.domain import System
+        from uat_tool.infrastructure import Base, get_session_factory
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'scoped.db'}")
+        Base.metadata.create_all(engine)
+        factory = get_session_factory(engine, scoped=True)
+
+        with unit_of_work(factory, read_only=True) as uow:
+            uow.sys_repo.get_all()
+        with unit_of_work(factory) as uow:
+            uow.session.add(System(name="WRITE"))
+
+        assert _system_names(factory) == ["WRITE"]
+        engine.dispose()
+
+    def test_nested_read_only_unit_sees_pending_writes(self, session_factory):
+        """Test que una lectura anidada en una escritura ve lo pendiente"""
+        from uat_tool.domain import System
+
+        with unit_of_work(session_factory) as outer:
+            outer.session.add(System(name="PENDING"))
+            outer.session.flush()
+            with unit_of_work(session_factory, read_only=True) as inner:
+                assert inner is outer
+                assert [s.name for s in inner.sys_repo.get_all()] == ["PENDING"]
+
+        assert _system_names(session_factory) == ["PENDING"]
+
+    def test_read_session_factory_is_used_for_read_only(self, session_factory):
+        """Test que las unidades de solo lectura usan la factoría de lectura"""
+        read_factory = Mock(wraps=session_factory)
+
+        with unit_of_work(session_factory, read_session_factory=read_factory):
+            pass
+        read_factory.assert_not_called()
+
+        with unit_of_work(
+            session_factory, read_only=True, read_session_factory=read_factory
+        ):
+            pass
+        read_factory.assert_called_once()
+
+    def test_write_unit_inside_read_only_unit_fails_on_entry(self, session_factory):
+        """Test que una unidad de escritura anidada en una de lectura falla al entrar"""
+        with unit_of_work(session_factory, read_only=True):
+            with pytest.raises(RuntimeError, match="escritura dentro"):
+                with unit_of_work(session_factory):
+                    pass
+
+    def test_suspended_private_reader_does_not_capture_writes(self, tmp_path):
+        """Test que un generador con unidad privada no captura las escrituras intercaladas"""
+        from sqlalchemy import create_engine
+
+        from uat_tool.domain import System
+        from uat_tool.infrastructure import Base, get_session_factory
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'private.db'}")
+        Base.metadata.create_all(engine)
+        factory = get_session_factory(engine, scoped=True)
+        with unit_of_work(factory) as uow:
+            uow.session.add_all([System(name="A"), System(name="B")])
+
+        def read_names():
+            with unit_of_work(factory, read_only=True, private=True) as uow:
+                for system in uow.sys_repo.get_all():
+                    yield system.name
+
+        names = read_names()
+        assert next(names) == "A"
+        # Con el generador suspendido, la escritura abre su propia unidad
+        with unit_of_work(factory) as uow:
+            assert not uow.read_only
+            uow.session.add(System(name="C"))
+        assert list(names) == ["B"]
+        names.close()
+
+        assert _system_names(factory) == ["A", "B", "C"]
+        engine.dispose()
@@ -0,0 +1,130 @@
+import json
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from uat_tool.benchmarks.datasets import DatasetScale, generate_dataset
+from uat_tool.benchmarks.services import (
+    compare_reports,
+    format_comparison,
+    run_services_benchmark,
+)
+from uat_tool.infrastructure.database import engine as engine_module
+
+TINY = DatasetScale(
+    requirements=40,
+    cases=12,
+    steps_per_case=3,
+    cases_per_block=3,
+    campaigns=2,
+    runs_per_campaign=1,
+    bugs=30,
+    history_per_bug=2,
+    attachment_every=5,
+    assets=10,
+)
+
+
+def _dump(engine, table):
+    with engine.connect() as connection:
+        return connection.execute(text(f"SELECT * FROM {table} ORDER BY 1, 2")).all()
+
+
+def test_generate_dataset_is_deterministic():
+    """Test que la misma escala y semilla generan exactamente las mismas filas"""
+    engines = [create_engine("sqlite:///:memory:") for _ in range(3)]
+    counts = [
+        generate_dataset(engine, TINY, seed)
+        for engine, seed in zip(engines, [1, 1, 2], strict=True)
+    ]
+
+    assert counts[0] == counts[1]
+    assert counts[0]["bugs"] == 30
+    assert counts[0]["bug_history"] == 60
+    assert counts[0]["files"] == 6
+    assert counts[0]["steps"] == 36
+    assert counts[0]["step_runs"] == 36  # Cada campaña cubre la mitad de los casos
+    for table in ("bugs", "files", "step_runs", "step_requirements", "drones"):
+        assert _dump(engines[0], table) == _dump(engines[1], table)
+    assert _dump(engines[0], "bugs") != _dump(engines[2], "bugs")
+
+    # Los contadores de progreso se mantienen también con la carga masiva
+    with engines[0].connect() as connection:
+        assert (
+            connection.execute(
+                text("SELECT SUM(steps_total) FROM campaign_runs")
+            ).scalar()
+            == 36
+        )
+
+    with pytest.raises(ValueError, match="ya contiene"):
+        generate_dataset(engines[0], TINY)
+
+
+def test_run_services_benchmark_writes_comparable_report(tmp_path, monkeypatch):
+    """Test del benchmark de servicios sobre un dataset mínimo"""
+    monkeypatch.setattr(engine_module, "_engine", None)
+    db_path = tmp_path / "bench.db"
+
+    report = run_services_benchmark(
+        TINY, repeat=1, db_path=db_path, only=["bugs.", "executions."]
+    )
+
+    assert report["dataset"]["generated"]
+    assert report["dataset"]["rows"]["bugs"] == 30
+    results = report["results"]
+    assert set(results) == {
+        "bugs.table_load",
+        "bugs.first_page",
+        "bugs.search",
+        "bugs.count_by_status",
+        "bugs.history",
+        "executions.case_runs_progress",
+        "executions.create_run",
+        "executions.record_results",
+    }
+    assert results["bugs.table_load"]["rows"] == 30
+    assert results["bugs.table_load"]["queries"] > 0
+    assert results["executions.record_results"]["queries"] == 2
+    json.dumps(report)
+
+    # La segunda ejecución reutiliza el dataset (las escrituras se revirtieron)
+    monkeypatch.setattr(engine_module, "_engine", None)
+    again = run_services_benchmark(TINY, repeat=1, db_path=db_path, only=["bugs.table"])
+    assert not again["dataset"]["generated"]
+    assert again["dataset"]["rows"]["campaign_runs"] == 2
+    monkeypatch.setattr(engine_module, "_engine", None)
+
+
+def _report(**results):
+    return {
+        "results": {
+            name: {"median_ms": ms, "queries": queries}
+            for name, (ms, queries) in results.items()
+        }
+    }
+
+
+def test_compare_reports_flags_slower_operations_and_extra_queries():
+    """Test de la clasificación de cada operación al comparar dos informes"""
+    baseline = _report(
+        slow=(100.0, 3),
+        fast=(100.0, 3),
+        noise=(2.0, 1),
+        queries=(10.0, 2),
+        gone=(1.0, 1),
+    )
+    current = _report(
+        slow=(150.0, 3), fast=(50.0, 3), noise=(4.0, 1), queries=(10.0, 5), new=(1.0, 1)
+    )
+
+    comparison = {row["operation"]: row for row in compare_reports(baseline, current)}
+
+    assert comparison["slow"]["status"] == "regression"
+    assert comparison["slow"]["ratio"] == 1.5
+    assert comparison["fast"]["status"] == "improvement"
+    assert comparison["noise"]["status"] == "ok"  # Menos de MIN_REGRESSION_MS
+    assert comparison["queries"]["status"] == "regression"
+    assert comparison["gone"]["status"] == "removed"
+    assert comparison["new"]["status"] == "new"
+    assert "regression" in format_comparison(list(comparison.values()))
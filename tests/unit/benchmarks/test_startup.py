@@ -0,0 +1,33 @@
+from uat_tool.benchmarks.startup import ImportTime, measure_imports, parse_importtime
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2000 |       2500 |     sqlalchemy.sql
+import time:       300 |       2800 |   sqlalchemy
+import time:       400 |       3320 | uat_tool
+Otra salida en stderr
+"""
+
+
+def test_parse_importtime_reads_times_and_depth():
+    """Test que se parsean las líneas de -X importtime y se ignora el resto"""
+    imports = parse_importtime(IMPORTTIME_OUTPUT)
+
+    assert imports == [
+        ImportTime("_io", 120, 120, 1),
+        ImportTime("sqlalchemy.sql", 2000, 2500, 2),
+        ImportTime("sqlalchemy", 300, 2800, 1),
+        ImportTime("uat_tool", 400, 3320, 0),
+    ]
+
+
+def test_gui_startup_does_not_import_dialogs():
+    """Test que los diálogos y sus formularios se importan al abrirlos, no al arrancar"""
+    modules = {item.module for item in measure_imports("uat_tool.main")}
+
+    assert "uat_tool.presentation.views.main_window" in modules
+    assert not [m for m in modules if m.startswith("uat_tool.presentation.dialogs.")]
+    assert not [
+        m for m in modules if m.startswith("uat_tool.presentation.views.ui.form_")
+    ]
@@ -0,0 +1,15 @@
+from uat_tool.benchmarks.uow import run_uow_benchmark
+
+
+def test_run_uow_benchmark_reports_every_scenario():
+    """Test del benchmark de unidades de trabajo con pocas iteraciones"""
+    report = run_uow_benchmark(iterations=20, repeat=1)
+
+    assert set(report["results"]) == {
+        "legacy",
+        "context",
+        "context_one_repo",
+        "context_nested",
+    }
+    assert report["results"]["legacy"]["speedup"] == 1.0
+    assert all(result["us_per_uow"] > 0 for result in report["results"].values())
@@ -151,6 +151,30 @@ def test_file_repository_get_by_filename_not_found(db_session, model_test_data):
     assert found is None
 
 
+def test_file_repository_get_by_owners(db_session, model_test_data, monkeypatch):
+    """Test FileRepository.get_by_owners con IDs repartidos en varios bloques."""
+    from uat_tool.domain.repositories import auxiliary_repository
+
+    repo = FileRepository(db_session)
+    owner_ids = [90001, 90002, 90003]
+    for owner_id in owner_ids:
+        data = {**model_test_data["file_data"], "owner_type": "case"}
+        data["owner_id"] = owner_id
+        data["filename"] = f"owner_{owner_id}.txt"
+        db_session.add(File(**data))
+    db_session.commit()
+
+    # Forzar bloques de 2 IDs para cubrir la consulta troceada
+    original_chunked = auxiliary_repository.chunked
+    monkeypatch.setattr(
+        auxiliary_repository, "chunked", lambda ids: original_chunked(ids, 2)
+    )
+    found = repo.get_by_owners("case", owner_ids + [90001, None])
+
+    assert [f.owner_id for f in found] == owner_ids
+    assert repo.get_by_owners("bug", owner_ids) == []
+
+
 def test_reason_repository_get_by_filename(db_session):
     """Test ReasonRepository.get_by_filename."""
     repo = ReasonRepository(db_session)
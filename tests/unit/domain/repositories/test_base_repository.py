@@ -134,3 +134,28 @@ def test_base_repository_get_or_create(db_session):
     system2, created2 = repo.get_or_create(name="Test System")
     assert created2 is False
     assert system2.id == system1.id
+
+
+def test_base_repository_get_by_ids(db_session):
+    """Test obtener varios registros por IDs con una consulta IN"""
+    repo = BaseRepository(db_session, System)
+
+    ussp = repo.filter_by(name="USSP")[0]
+    cisp = repo.filter_by(name="CISP")[0]
+
+    systems = repo.get_by_ids([ussp.id, cisp.id, ussp.id, None, 99999])
+
+    assert {system.name for system in systems} == {"USSP", "CISP"}
+
+
+def test_base_repository_get_field_by_ids(db_session):
+    """Test obtener un campo de varios registros como diccionario {id: valor}"""
+    repo = BaseRepository(db_session, System)
+
+    ussp = repo.filter_by(name="USSP")[0]
+    cisp = repo.filter_by(name="CISP")[0]
+
+    names = repo.get_field_by_ids([ussp.id, cisp.id, 99999], "name")
+
+    assert names == {ussp.id: "USSP", cisp.id: "CISP"}
+    assert repo.get_field_by_ids([], "name") == {}
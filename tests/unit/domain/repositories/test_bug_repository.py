@@ -1,22 +1,34 @@
+from datetime import datetime
+
 import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
 
 from uat_tool.domain import (
+    GROUP_SEPARATOR,
     BlockRepository,
+    Bug,
+    BugHistory,
     BugRepository,
     CampaignRepository,
     CampaignRunRepository,
     CaseRepository,
     DroneRepository,
+    Environment,
+    File,
     FileRepository,
     OperatorRepository,
     ReasonRepository,
+    Requirement,
     RequirementRepository,
     SectionRepository,
+    System,
     SystemRepository,
     UasZoneRepository,
     UhubOrgRepository,
     UhubUserRepository,
 )
+from uat_tool.infrastructure import Base
 
 
 def test_bug_repository_create(db_session, model_test_data, sample_audit_data):
@@ -652,3 +664,265 @@ def test_bug_repository_add_history(db_session, model_test_data, sample_audit_da
         bug_with_history.history[1].change_summary
         == "Entrada de historial personalizada"
     )
+
+
+def _rows_fetched(engine, call) -> int:
+    """Ejecuta `call` y devuelve el total de filas que devuelven sus SELECT."""
+    statements = []
+
+    def capture(_conn, _cursor, statement, parameters, *_args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    with engine.connect() as conn:
+        return sum(
+            len(conn.exec_driver_sql(statement, parameters).all())
+            for statement, parameters in statements
+        )
+
+
+@pytest.mark.parametrize("n_bugs", [5, 20])
+def test_bug_repository_get_all_with_relations_rows_linear(n_bugs):
+    """Test que las filas leídas crecen con N + N*M + N*K y no con N*M*K"""
+    n_requirements, n_history = 6, 6
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+
+    environment = Environment(name="ROWS_ENV", description="Rows env")
+    system = System(name="ROWS_SYS")
+    session.add_all([environment, system])
+    session.flush()
+    audit = {"environment_id": environment.id, "modified_by": "test_user"}
+    requirements = [
+        Requirement(code=f"REQ-{i}", definition="def", **audit)
+        for i in range(n_requirements)
+    ]
+    for i in range(n_bugs):
+        bug = Bug(
+            status="OPEN",
+            system_id=system.id,
+            system_version="1.0.0",
+            short_description=f"Bug {i}",
+            definition="def",
+            urgency=1,
+            impact=1,
+            requirements=requirements,
+            **audit,
+        )
+        bug.history = [
+            BugHistory(changed_by="test_user", change_summary=f"change {h}")
+            for h in range(n_history)
+        ]
+        session.add(bug)
+    session.commit()
+    session.expunge_all()
+
+    repo = BugRepository(session)
+    bugs = []
+    rows = _rows_fetched(engine, lambda: bugs.extend(repo.get_all_with_relations()))
+
+    assert len(bugs) == n_bugs
+    assert all(len(bug.requirements) == n_requirements for bug in bugs)
+    assert all(len(bug.history) == n_history for bug in bugs)
+    assert rows == n_bugs + n_bugs * n_requirements + n_bugs * n_history
+
+    # Con joinedload en todas las colecciones vuelve el producto cartesiano
+    session.expunge_all()
+    joined = {"requirements": "joined", "history": "joined"}
+    rows_joined = _rows_fetched(engine, lambda: repo.get_all_with_relations(joined))
+    assert rows_joined == n_bugs * n_requirements * n_history
+
+    session.close()
+    engine.dispose()
+
+
+def test_bug_repository_get_page_keyset():
+    """Test que la paginación keyset recorre todos los bugs una sola vez y en orden"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+
+    environment = Environment(name="PAGE_ENV", description="Page env")
+    system = System(name="PAGE_SYS")
+    session.add_all([environment, system])
+    session.flush()
+    # Empates en updated_at, con y sin microsegundos, y bugs nunca editados
+    timestamps = [
+        datetime(2025, 1, 1, 10, 0),
+        datetime(2025, 1, 1, 10, 0),
+        datetime(2025, 1, 1, 10, 0, 0, 500),
+        datetime(2025, 3, 1, 9, 30),
+        None,
+        None,
+        datetime(2025, 1, 1, 10, 0),
+    ]
+    for i, updated_at in enumerate(timestamps):
+        session.add(
+            Bug(
+                status="OPEN",
+                system_id=system.id,
+                system_version="1.0.0",
+                short_description=f"Bug {i}",
+                definition="def",
+                urgency=1,
+                impact=1,
+                environment_id=environment.id,
+                modified_by="test_user",
+                updated_at=updated_at,
+            )
+        )
+    session.commit()
+
+    repo = BugRepository(session)
+    seen, cursor, pages = [], None, 0
+    while True:
+        page, cursor = repo.get_page(2, cursor)
+        seen.extend(page)
+        pages += 1
+        if cursor is None:
+            break
+
+    expected = sorted(
+        (bug for bug in seen if bug.updated_at),
+        key=lambda bug: (bug.updated_at, bug.id),
+        reverse=True,
+    ) + sorted((bug for bug in seen if not bug.updated_at), key=lambda bug: -bug.id)
+    assert [bug.id for bug in seen] == [bug.id for bug in expected]
+    assert len({bug.id for bug in seen}) == len(timestamps)
+    assert pages == 4
+
+    session.close()
+    engine.dispose()
+
+
+def test_bug_repository_iter_with_relations_batches():
+    """Test que el recorrido por lotes devuelve todos los bugs en orden con sus requisitos"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+
+    environment = Environment(name="STREAM_ENV", description="Stream env")
+    system = System(name="STREAM_SYS")
+    requirement = Requirement(
+        code="REQ-STREAM", definition="def", environment=environment, modified_by="t"
+    )
+    session.add_all([environment, system, requirement])
+    session.flush()
+    for i in range(5):
+        session.add(
+            Bug(
+                status="OPEN",
+                system_id=system.id,
+                system_version="1.0.0",
+                short_description=f"Bug {i}",
+                definition="def",
+                urgency=1,
+                impact=1,
+                environment_id=environment.id,
+                modified_by="test_user",
+                requirements=[requirement] if i % 2 == 0 else [],
+            )
+        )
+    session.commit()
+    session.expunge_all()
+
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    batches = list(
+        BugRepository(session).iter_with_relations(2, strategies={"history": "noload"})
+    )
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    bugs = [bug for batch in batches for bug in batch]
+    assert [bug.id for bug in bugs] == sorted(bug.id for bug in bugs)
+    assert [bool(bug.requirements) for bug in bugs] == [True, False, True, False, True]
+    # Una consulta principal y una selectin de requisitos por lote
+    assert len(statements) == 1 + len(batches)
+
+    session.close()
+    engine.dispose()
+
+
+def test_bug_repository_table_rows_projection():
+    """Test que la proyección de la tabla trae una fila por bug con los agregados"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+
+    environment = Environment(name="TABLE_ENV", description="Table env")
+    system = System(name="TABLE_SYS")
+    session.add_all([environment, system])
+    session.flush()
+    audit = {"environment_id": environment.id, "modified_by": "test_user"}
+    requirements = [
+        Requirement(code=f"REQ-{i}", definition="def", **audit) for i in range(3)
+    ]
+    bugs = [
+        Bug(
+            status="OPEN",
+            system_id=system.id,
+            system_version="1.0.0",
+            short_description=f"Bug {i}",
+            definition="def",
+            urgency=1,
+            impact=1,
+            requirements=requirements if i == 0 else [],
+            **audit,
+        )
+        for i in range(3)
+    ]
+    session.add_all(requirements + bugs)
+    session.flush()
+    bugs[0].history = [
+        BugHistory(changed_by="test_user", change_summary=f"change {h}")
+        for h in range(2)
+    ]
+    file_data = {"filepath": "p", "mime_type": "image/png", "size": "1", "uploaded_by": "t"}
+    session.add_all(
+        File(owner_type="bug", owner_id=bugs[0].id, filename=f"f{i}.png", **file_data)
+        for i in range(2)
+    )
+    # Mismo owner_id con otro tipo de propietario: no cuenta
+    session.add(File(owner_type="case", owner_id=bugs[0].id, filename="x", **file_data))
+    session.commit()
+
+    repo = BugRepository(session)
+    rows = repo.get_all_table_rows()
+
+    assert [row.id for row in rows] == [bug.id for bug in bugs]
+    first, second = rows[0], rows[1]
+    assert first.system_name == "TABLE_SYS"
+    assert sorted(first.requirement_codes.split(GROUP_SEPARATOR)) == [
+        "REQ-0",
+        "REQ-1",
+        "REQ-2",
+    ]
+    assert sorted(first.file_names.split(GROUP_SEPARATOR)) == ["f0.png", "f1.png"]
+    assert (first.file_count, first.history_count) == (2, 2)
+    assert (second.requirement_codes, second.file_names) == (None, None)
+    assert (second.file_count, second.history_count) == (0, 0)
+
+    by_ids = repo.get_table_rows_by_ids([bugs[2].id, bugs[0].id])
+    assert sorted(row.id for row in by_ids) == [bugs[0].id, bugs[2].id]
+    batches = list(repo.iter_table_rows(2, include_history=False))
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert batches[0][0].history_count == 0
+
+    # Misma paginación que get_page
+    page, cursor = repo.get_table_page(2)
+    assert [row.id for row in page] == [bug.id for bug in repo.get_page(2)[0]]
+    assert repo.get_table_page(2, cursor)[0][0].id == bugs[0].id
+
+    session.close()
+    engine.dispose()
@@ -1,23 +1,40 @@
 from datetime import datetime
 
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
 from uat_tool.domain import (
+    Block,
     BlockRepository,
+    Campaign,
     CampaignRepository,
     CampaignRunRepository,
+    Case,
     CaseRepository,
+    CaseRun,
+    CaseRunRepository,
     DroneRepository,
+    Environment,
     FileRepository,
     OperatorRepository,
     ReasonRepository,
     SectionRepository,
+    Step,
     StepRepository,
     StepRun,
     StepRunRepository,
+    System,
     SystemRepository,
     UasZoneRepository,
     UhubOrgRepository,
     UhubUserRepository,
 )
+from uat_tool.infrastructure import (
+    Base,
+    create_missing_result_counters,
+    rebuild_result_counters,
+)
 
 
 def test_campaign_run_repository_create(db_session, model_test_data, sample_audit_data):
@@ -578,3 +595,226 @@ def test_step_run_repository_update_step_result(
     )
     assert not updated_minimal.passed
     assert updated_minimal.notes == "Paso fallido con evidencia"
+
+
+def _build_campaign(session, n_blocks: int, cases_per_block: int, steps_per_case: int):
+    """Crea una campaña con bloques, casos y pasos directamente con los modelos."""
+    environment = Environment(name="BULK_ENV", description="Bulk env")
+    system = System(name="BULK_SYS")
+    session.add_all([environment, system])
+    session.flush()
+
+    audit = {"environment_id": environment.id, "modified_by": "test_user"}
+    blocks = []
+    for b in range(n_blocks):
+        cases = []
+        for c in range(cases_per_block):
+            case = Case(code=f"C{b}-{c}", name="Case", comments="", **audit)
+            case.steps = [
+                Step(action=f"a{s}", expected_result="ok", comments="")
+                for s in range(steps_per_case)
+            ]
+            cases.append(case)
+        blocks.append(Block(code=f"B{b}", system_id=system.id, cases=cases, **audit))
+
+    campaign = Campaign(
+        code="BULK",
+        description="Bulk campaign",
+        system_id=system.id,
+        system_version="1.0.0",
+        status="DRAFT",
+        blocks=blocks,
+        **audit,
+    )
+    session.add(campaign)
+    session.flush()
+    return campaign
+
+
+def test_campaign_run_create_bulk_materializes_runs(max_queries):
+    """Test que iniciar una campaña crea todos los case/step runs en bloque"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    campaign = _build_campaign(session, n_blocks=3, cases_per_block=10, steps_per_case=5)
+
+    # Número de sentencias constante: no depende de los 30 casos ni 150 pasos
+    # (alta de la ejecución, casos, pasos en bloque y estado de la campaña)
+    with max_queries(7, engine=engine):
+        campaign_run = CampaignRunRepository(session).create(
+            {"campaign_id": campaign.id, "modified_by": "test_user"},
+            environment_id=campaign.environment_id,
+        )
+        session.commit()
+
+    case_runs = session.query(CaseRun).filter_by(campaign_run_id=campaign_run.id).all()
+    assert len(case_runs) == 30
+    assert session.query(StepRun).filter_by(campaign_run_id=campaign_run.id).count() == 150
+    for case_run in case_runs:
+        assert sorted(sr.step.case_id for sr in case_run.step_runs) == [
+            case_run.case_id
+        ] * 5
+    assert campaign.status == "RUNNING"
+
+    session.close()
+    engine.dispose()
+
+
+def _start_campaign_run(session, campaign):
+    campaign_run = CampaignRunRepository(session).create(
+        {"campaign_id": campaign.id, "modified_by": "test_user"},
+        environment_id=campaign.environment_id,
+    )
+    session.flush()
+    return campaign_run
+
+
+def _progress(session, campaign_run_id):
+    return tuple(CampaignRunRepository(session).get_progress(campaign_run_id))[1:]
+
+
+def test_progress_counters_follow_step_runs():
+    """Test que los triggers mantienen los contadores con altas, resultados y bajas"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    campaign = _build_campaign(session, n_blocks=1, cases_per_block=2, steps_per_case=3)
+    campaign_run = _start_campaign_run(session, campaign)
+
+    # Los step runs insertados en bloque (Core) también cuentan
+    assert _progress(session, campaign_run.id) == (6, 0, 0)
+    case_run_progress = CaseRunRepository(session).get_progress_by_campaign_run(
+        campaign_run.id
+    )
+    assert [tuple(row)[1:] for row in case_run_progress] == [(3, 0, 0), (3, 0, 0)]
+
+    step_run_repo = StepRunRepository(session)
+    step_runs = step_run_repo.get_by_case_run(case_run_progress[0].id)
+    step_run_repo.update_step_result(step_runs[0].id, passed=True)
+    step_run_repo.update_step_result(step_runs[1].id, passed=False)
+    assert _progress(session, campaign_run.id) == (6, 1, 1)
+
+    step_run_repo.update_step_result(step_runs[1].id, passed=True)
+    assert _progress(session, campaign_run.id) == (6, 2, 0)
+
+    session.delete(step_runs[0])
+    session.flush()
+    assert _progress(session, campaign_run.id) == (5, 1, 0)
+    case_run_progress = CaseRunRepository(session).get_progress_by_campaign_run(
+        campaign_run.id
+    )
+    assert [tuple(row)[1:] for row in case_run_progress] == [(2, 1, 0), (3, 0, 0)]
+
+    session.close()
+    engine.dispose()
+
+
+def test_create_missing_result_counters_backfills_existing_rows():
+    """Test que una BD sin contadores los recibe calculados desde los step runs"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    campaign = _build_campaign(session, n_blocks=1, cases_per_block=2, steps_per_case=2)
+    campaign_run = _start_campaign_run(session, campaign)
+    session.commit()
+
+    # Simula una BD anterior: sin triggers y con los contadores desfasados
+    with engine.begin() as connection:
+        for suffix in ("ai", "ad", "au"):
+            connection.exec_driver_sql(
+                f"DROP TRIGGER step_runs_campaign_runs_counters_{suffix}"
+            )
+        connection.exec_driver_sql("UPDATE step_runs SET passed = 1")
+        connection.exec_driver_sql("UPDATE campaign_runs SET steps_total = 0")
+
+    assert create_missing_result_counters(engine) == ["step_runs_campaign_runs_counters"]
+    assert _progress(session, campaign_run.id) == (4, 4, 0)
+    assert create_missing_result_counters(engine) == []
+
+    with engine.begin() as connection:
+        connection.exec_driver_sql("UPDATE case_runs SET steps_passed = 0")
+    rebuild_result_counters(engine)
+    case_run_progress = CaseRunRepository(session).get_progress_by_campaign_run(
+        campaign_run.id
+    )
+    assert [tuple(row)[1:] for row in case_run_progress] == [(2, 2, 0), (2, 2, 0)]
+
+    session.close()
+    engine.dispose()
+
+
+def test_step_run_repository_update_step_results_in_bulk(max_queries):
+    """Test que los resultados en bloque se validan y escriben con un único UPDATE"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    campaign = _build_campaign(session, n_blocks=2, cases_per_block=5, steps_per_case=20)
+    campaign_run = _start_campaign_run(session, campaign)
+    step_run_ids = session.scalars(
+        select(StepRun.id)
+        .where(StepRun.campaign_run_id == campaign_run.id)
+        .order_by(StepRun.id)
+    ).all()
+    assert len(step_run_ids) == 200
+    loaded = session.get(StepRun, step_run_ids[0])
+    loaded.notes = "nota previa"
+    session.flush()
+
+    # Una validación y un UPDATE para los 200 pasos
+    with max_queries(2, engine=engine) as captured:
+        run_id = StepRunRepository(session).update_step_results(
+            [
+                {"step_run_id": step_run_id, "passed": i % 4 != 0, "notes": None}
+                for i, step_run_id in enumerate(step_run_ids)
+            ],
+            campaign_run_id=campaign_run.id,
+        )
+
+    assert run_id == campaign_run.id
+    assert [s.split()[0] for s in captured.statements] == ["SELECT", "UPDATE"]
+    assert _progress(session, campaign_run.id) == (200, 150, 50)
+    # La instancia cargada se recarga y conserva sus notas
+    assert loaded.passed is False
+    assert loaded.notes == "nota previa"
+
+    session.close()
+    engine.dispose()
+
+
+def test_step_run_repository_update_step_results_validates_ids():
+    """Test que un lote con pasos ajenos, inexistentes o repetidos no se registra"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    campaign = _build_campaign(session, n_blocks=1, cases_per_block=1, steps_per_case=2)
+    first_run = _start_campaign_run(session, campaign)
+    first_ids = session.scalars(
+        select(StepRun.id).where(StepRun.campaign_run_id == first_run.id)
+    ).all()
+    other_run = CampaignRunRepository(session).create(
+        {"campaign_id": campaign.id, "modified_by": "test_user"},
+        environment_id=campaign.environment_id,
+    )
+    session.flush()
+    other_id = session.scalars(
+        select(StepRun.id).where(StepRun.campaign_run_id == other_run.id)
+    ).first()
+    repo = StepRunRepository(session)
+
+    invalid_batches = [
+        ([*first_ids, other_id], None, "varias ejecuciones"),
+        ([*first_ids, 99999], None, "no encontrados"),
+        ([first_ids[0], first_ids[0]], None, "repetidos"),
+        (first_ids, other_run.id, "no a"),
+        ([], None, "No hay resultados"),
+    ]
+    for ids, campaign_run_id, message in invalid_batches:
+        with pytest.raises(ValueError, match=message):
+            repo.update_step_results(
+                [{"step_run_id": i, "passed": True} for i in ids], campaign_run_id
+            )
+
+    assert _progress(session, first_run.id) == (2, 0, 0)
+
+    session.close()
+    engine.dispose()
@@ -1,8 +1,24 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
 from uat_tool.domain import (
+    GROUP_SEPARATOR,
+    Bug,
+    Campaign,
+    CampaignRun,
+    Case,
+    CaseRun,
+    Environment,
+    Requirement,
     RequirementRepository,
+    Section,
     SectionRepository,
+    Step,
+    StepRun,
+    System,
     SystemRepository,
 )
+from uat_tool.infrastructure import Base
 
 
 def test_requirement_repository_create(db_session, model_test_data, sample_audit_data):
@@ -163,3 +179,136 @@ def test_requirement_repository_update(db_session, model_test_data, sample_audit
     assert len(updated_requirement.sections) == 1
     assert updated_requirement.systems[0].id == system2.id
     assert updated_requirement.sections[0].id == section2.id
+
+
+def test_requirement_repository_bulk_create(db_session, sample_audit_data):
+    """Test que bulk_create inserta requisitos y asociaciones y get_existing_codes los ve"""
+    system = SystemRepository(db_session).create(name="Bulk System")
+    section = SectionRepository(db_session).create(name="Bulk Section")
+    repo = RequirementRepository(db_session)
+
+    rows = [
+        {
+            "code": f"REQ-BULK-{i}",
+            "definition": "Requisito importado en bloque",
+            "systems": [system.id],
+            "sections": [section.id] if i else [],
+        }
+        for i in range(3)
+    ]
+    ids_by_code = repo.bulk_create(
+        rows, environment_id=1, modified_by=sample_audit_data["modified_by"]
+    )
+
+    assert set(ids_by_code) == {"REQ-BULK-0", "REQ-BULK-1", "REQ-BULK-2"}
+    assert repo.get_existing_codes(["REQ-BULK-1", "REQ-OTHER"], 1) == {"REQ-BULK-1"}
+    assert repo.get_existing_codes(["REQ-BULK-1"], 2) == set()
+
+    requirement = repo.get_with_relations(ids_by_code["REQ-BULK-2"])
+    assert [s.id for s in requirement.systems] == [system.id]
+    assert [s.id for s in requirement.sections] == [section.id]
+    assert repo.get_with_relations(ids_by_code["REQ-BULK-0"]).sections == []
+
+
+def test_requirement_repository_get_coverage():
+    """Test que la cobertura agrega pasos, ejecuciones y bugs abiertos por requisito"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    audit = {"environment_id": 1, "modified_by": "test_user"}
+
+    session.add_all([Environment(name="COV_ENV", description="env"), System(name="S")])
+    session.flush()
+    covered, uncovered = (
+        Requirement(code="REQ-A", definition="def", **audit),
+        Requirement(code="REQ-B", definition="def", **audit),
+    )
+    campaign = Campaign(
+        code="C", description="d", system_id=1, system_version="1", status="RUNNING", **audit
+    )
+    case = Case(code="CASE", name="n", comments="c", **audit)
+    session.add_all([covered, uncovered, campaign, case])
+    session.flush()
+    steps = [
+        Step(action="a", expected_result="e", comments="c", case_id=case.id, requirements=[covered])
+        for _ in range(2)
+    ]
+    runs = [CampaignRun(campaign_id=campaign.id, environment_id=1, modified_by="t") for _ in range(2)]
+    session.add_all(steps + runs)
+    session.flush()
+    case_runs = [CaseRun(campaign_run_id=run.id, case_id=case.id) for run in runs]
+    session.add_all(case_runs)
+    session.flush()
+    results = [(0, 0, True), (0, 1, False), (1, 0, True), (1, 1, None)]
+    session.add_all(
+        StepRun(
+            campaign_run_id=runs[r].id,
+            case_run_id=case_runs[r].id,
+            step_id=steps[s].id,
+            passed=passed,
+        )
+        for r, s, passed in results
+    )
+    for status, run in [("OPEN", runs[0]), ("CLOSED SOLVED", runs[0]), ("PENDING", runs[1])]:
+        session.add(
+            Bug(
+                status=status,
+                system_id=1,
+                system_version="1",
+                short_description="s",
+                definition="d",
+                urgency=1,
+                impact=1,
+                campaign_run_id=run.id,
+                requirements=[covered],
+                **audit,
+            )
+        )
+    session.flush()
+
+    repo = RequirementRepository(session)
+    rows = [tuple(row) for row in repo.get_coverage(1)]
+    assert rows == [
+        (covered.id, "REQ-A", 2, 4, 3, 2, 2),
+        (uncovered.id, "REQ-B", 0, 0, 0, 0, 0),
+    ]
+    rows = [tuple(row) for row in repo.get_coverage(1, campaign_run_id=runs[1].id)]
+    assert rows[0] == (covered.id, "REQ-A", 2, 2, 1, 1, 1)
+    assert repo.get_coverage(2) == []
+
+    session.close()
+    engine.dispose()
+
+
+def test_requirement_repository_table_rows_projection():
+    """Test que la proyección de la tabla agrega sistemas y secciones por requisito"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    audit = {"environment_id": 1, "modified_by": "test_user"}
+
+    systems = [System(name="USSP"), System(name="CISP")]
+    section = Section(name="Operational")
+    session.add_all([Environment(name="TABLE_ENV", description="env"), section, *systems])
+    session.flush()
+    session.add_all(
+        [
+            Requirement(
+                code="REQ-A", definition="def", systems=systems, sections=[section], **audit
+            ),
+            Requirement(code="REQ-B", definition="def", **audit),
+        ]
+    )
+    session.commit()
+
+    repo = RequirementRepository(session)
+    rows = repo.get_all_table_rows()
+
+    assert [row.code for row in rows] == ["REQ-A", "REQ-B"]
+    assert sorted(rows[0].system_names.split(GROUP_SEPARATOR)) == ["CISP", "USSP"]
+    assert rows[0].section_names == "Operational"
+    assert (rows[1].system_names, rows[1].section_names) == (None, None)
+    assert [len(batch) for batch in repo.iter_table_rows(1)] == [1, 1]
+
+    session.close()
+    engine.dispose()
@@ -0,0 +1,157 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from uat_tool.domain import (
+    Bug,
+    BugRepository,
+    Environment,
+    Requirement,
+    RequirementRepository,
+    System,
+)
+from uat_tool.infrastructure import (
+    Base,
+    build_match_query,
+    create_missing_search_indexes,
+    rebuild_search_indexes,
+    search_index,
+)
+
+
+@pytest.fixture
+def fts_session():
+    """Sesión sobre una BD en memoria con el esquema y los índices FTS"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+
+    environment = Environment(name="FTS_ENV", description="FTS env")
+    system = System(name="FTS_SYS")
+    session.add_all([environment, system])
+    session.flush()
+    session.info["audit"] = {"environment_id": environment.id, "modified_by": "test"}
+    session.info["system_id"] = system.id
+
+    yield session
+
+    session.close()
+    engine.dispose()
+
+
+def _bug(session, short_description, definition="def", comments=None):
+    bug = Bug(
+        status="OPEN",
+        system_id=session.info["system_id"],
+        system_version="1.0.0",
+        short_description=short_description,
+        definition=definition,
+        comments=comments,
+        urgency=1,
+        impact=1,
+        **session.info["audit"],
+    )
+    session.add(bug)
+    session.flush()
+    return bug
+
+
+def test_build_match_query():
+    """Test que cada palabra se busca como prefijo y los operadores son texto"""
+    assert build_match_query("valid USSP") == '"valid"* "USSP"*'
+    assert build_match_query('NOT "x" OR') == '"NOT"* "x" "OR"*'
+    assert build_match_query("zona a") == '"zona"* "a"'
+    assert build_match_query("  -- ") is None
+
+
+def test_triggers_keep_index_in_sync(fts_session):
+    """Test que altas, ediciones y bajas se reflejan en el índice"""
+    repo = BugRepository(fts_session)
+    bug = _bug(fts_session, "Fallo de validación", comments="Revisar el USSP")
+
+    assert [hit.id for hit in repo.search("validacion")] == [bug.id]
+    assert [hit.id for hit in repo.search("valid ussp")] == [bug.id]
+
+    bug.short_description = "Fallo de conexión"
+    fts_session.flush()
+    assert repo.search("validacion") == []
+    assert [hit.id for hit in repo.search("conexion")] == [bug.id]
+
+    fts_session.delete(bug)
+    fts_session.flush()
+    assert repo.search("conexion") == []
+
+
+def test_search_ranks_and_returns_snippet(fts_session):
+    """Test que los resultados vienen por relevancia con fragmento resaltado"""
+    weak = _bug(fts_session, "Mapa", definition="El mapa no carga la zona")
+    strong = _bug(fts_session, "Zona", definition="Zona zona sin geometría de zona")
+
+    hits = BugRepository(fts_session).search("zona")
+
+    assert [hit.id for hit in hits] == [strong.id, weak.id]
+    assert "[" in hits[0].snippet and "]" in hits[0].snippet
+
+
+def test_requirement_search_by_code(fts_session):
+    """Test de búsqueda de requisitos por código"""
+    requirement = Requirement(
+        code="REQ-FTS-01", definition="Registro de drones", **fts_session.info["audit"]
+    )
+    fts_session.add(requirement)
+    fts_session.flush()
+
+    hits = RequirementRepository(fts_session).search("REQ FTS")
+
+    assert [hit.id for hit in hits] == [requirement.id]
+
+
+def test_unindexed_table_raises(fts_session):
+    """Test de búsqueda sobre una tabla sin índice"""
+    with pytest.raises(ValueError):
+        search_index(fts_session, "systems", "x")
+
+
+def test_create_missing_search_indexes_rebuilds_existing_rows(fts_session):
+    """Test que una BD sin índices FTS los recibe con las filas ya existentes"""
+    bug = _bug(fts_session, "Error de autenticación")
+    fts_session.commit()
+    engine = fts_session.get_bind()
+    with engine.begin() as connection:
+        connection.exec_driver_sql("DROP TABLE bugs_fts")
+        connection.exec_driver_sql("DROP TRIGGER bugs_fts_ai")
+
+    created = create_missing_search_indexes(engine)
+
+    assert created == ["bugs_fts"]
+    assert [hit.id for hit in BugRepository(fts_session).search("autenticacion")] == [
+        bug.id
+    ]
+    with engine.connect() as connection:
+        triggers = connection.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        ).scalars()
+        assert "bugs_fts_ai" in set(triggers)
+    assert create_missing_search_indexes(engine) == []
+
+
+def test_rebuild_search_indexes_resyncs_index(fts_session):
+    """Test que la reconstrucción indexa filas escritas sin pasar por los triggers"""
+    bug = _bug(fts_session, "Texto original")
+    fts_session.commit()
+    connection = fts_session.connection()
+    connection.exec_driver_sql("DROP TRIGGER bugs_fts_au")
+    connection.exec_driver_sql(
+        f"UPDATE bugs SET short_description = 'Texto reescrito' WHERE id = {bug.id}"
+    )
+    fts_session.commit()
+
+    engine = fts_session.get_bind()
+    rebuilt = rebuild_search_indexes(engine)
+
+    assert "bugs_fts" in rebuilt
+    assert [hit.id for hit in search_index(fts_session, "bugs", "reescrito")] == [bug.id]
+    # El trigger borrado se vuelve a crear
+    assert fts_session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE name = 'bugs_fts_au'")
+    ).first()
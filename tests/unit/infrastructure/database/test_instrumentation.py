@@ -0,0 +1,129 @@
+import pytest
+from sqlalchemy import create_engine
+
+from uat_tool.application.services import BaseService
+from uat_tool.infrastructure import QueryProfiler, get_query_profiler, track_queries
+from uat_tool.infrastructure.database.instrumentation import normalize_statement
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def profiler(engine):
+    """Perfilador global enganchado al engine del test; se desactiva al terminar"""
+    profiler = get_query_profiler()
+    profiler.reset()
+    profiler.enable(engine)
+    yield profiler
+    profiler.disable()
+    profiler.reset()
+
+
+def _select(engine, times=1):
+    with engine.connect() as connection:
+        for _ in range(times):
+            connection.exec_driver_sql("SELECT 1")
+
+
+class _ProbeService(BaseService):
+    def run(self, engine, times):
+        _select(engine, times)
+
+    def rows(self, engine, batches):
+        for _ in range(batches):
+            _select(engine)
+            yield _
+
+
+def test_normalize_statement_groups_in_lists():
+    """Test que las sentencias con IN de distinta longitud se agrupan"""
+    assert normalize_statement("SELECT x\n FROM t WHERE id IN (?, ?,?)") == (
+        "SELECT x FROM t WHERE id IN (?, ...)"
+    )
+    assert normalize_statement("SELECT x FROM t WHERE id = (?)") == (
+        "SELECT x FROM t WHERE id = (?)"
+    )
+
+
+def test_profiler_counts_statements_per_nested_scope(engine, profiler):
+    """Test que cada sentencia cuenta en todos los ámbitos abiertos"""
+    with profiler.scope("outer"):
+        _select(engine)
+        with profiler.scope("inner"):
+            _select(engine, times=2)
+    _select(engine)
+
+    assert profiler.total.statements == 4
+    assert profiler.by_scope["outer"].statements == 3
+    assert profiler.by_scope["inner"].statements == 2
+    assert profiler.by_scope["inner"].calls == 1
+    assert profiler.by_statement["SELECT 1"].statements == 4
+
+    report = profiler.format_report()
+    assert report.startswith("4 sentencias SQL")
+    assert "outer" in report and "SELECT 1" in report
+
+    profiler.disable()
+    _select(engine)
+    assert profiler.total.statements == 4
+
+
+def test_services_are_tracked_per_method(engine, profiler):
+    """Test que los métodos públicos de los servicios (también generadores) son ámbitos"""
+    service = _ProbeService(app_context=None)
+    service.run(engine, 3)
+    service.run(engine, 1)
+
+    rows = service.rows(engine, 3)
+    next(rows)
+    _select(engine)  # Entre iteraciones: no cuenta para el generador
+    assert list(rows) == [1, 2]
+
+    assert profiler.by_scope["_ProbeService.run"].calls == 2
+    assert profiler.by_scope["_ProbeService.run"].statements == 4
+    assert profiler.by_scope["_ProbeService.rows"].calls == 1
+    assert profiler.by_scope["_ProbeService.rows"].statements == 3
+    assert profiler.total.statements == 8
+
+
+def test_track_queries_is_transparent_when_disabled(engine):
+    """Test que sin perfilador activo el decorador no registra nada"""
+    profiler = get_query_profiler()
+    assert not profiler.enabled
+
+    @track_queries("noop")
+    def run():
+        _select(engine)
+        return "ok"
+
+    assert run() == "ok"
+    assert "noop" not in profiler.by_scope
+
+
+def test_profiler_instances_are_independent(engine):
+    """Test que un perfilador propio no interfiere con el global"""
+    own = QueryProfiler()
+    own.enable(engine)
+    own.enable(engine)  # Idempotente
+    with own.scope("own"):
+        _select(engine)
+    own.disable()
+
+    assert own.by_scope["own"].statements == 1
+    assert not get_query_profiler().enabled
+
+
+def test_max_queries_fixture(engine, max_queries):
+    """Test del fixture que limita el número de sentencias de un bloque"""
+    with max_queries(2, engine=engine) as captured:
+        _select(engine, times=2)
+    assert captured.count == 2
+
+    with pytest.raises(AssertionError, match="3 sentencias SQL"):
+        with max_queries(2, engine=engine):
+            _select(engine, times=3)
@@ -0,0 +1,111 @@
+import pytest
+from sqlalchemy import create_engine, func, insert, select, text
+from sqlalchemy.orm import Session
+
+from uat_tool.domain import Reason, Section, System
+from uat_tool.infrastructure import (
+    SCHEMA_VERSION,
+    Base,
+    count_queries,
+    get_schema_version,
+    init_db,
+    migrate,
+)
+from uat_tool.infrastructure.database.initial_data import (
+    REASONS,
+    SECTIONS,
+    SYSTEMS,
+    load_initial_data,
+)
+from uat_tool.infrastructure.database.migrations import schema_version
+
+
+def _count(engine, model):
+    with engine.connect() as connection:
+        return connection.execute(
+            select(func.count()).select_from(model.__table__)
+        ).scalar()
+
+
+def test_init_db_only_checks_version_when_schema_is_current():
+    """Test que con el esquema al día init_db no crea nada: versión y datos iniciales"""
+    engine = create_engine("sqlite://")
+    assert get_schema_version(engine) == 0
+
+    init_db(engine=engine)
+    assert get_schema_version(engine) == SCHEMA_VERSION
+    assert _count(engine, System) == len(SYSTEMS)
+
+    with count_queries(engine) as captured:
+        init_db(engine=engine, load_initial_data=False)
+    assert captured.count == 1
+    assert "schema_version" in captured.statements[0]
+
+    # Con datos iniciales: además un INSERT por tabla de referencia
+    with count_queries(engine) as captured:
+        init_db(engine=engine)
+    assert captured.count == 4
+    assert all("CREATE" not in statement for statement in captured.statements)
+    assert _count(engine, System) == len(SYSTEMS)
+    assert migrate(engine) == []
+
+
+def test_init_db_seeds_database_created_without_initial_data(tmp_path):
+    """Test que una BD creada con --no-seed recibe los datos iniciales después"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'no_seed.db'}")
+
+    init_db(engine=engine, load_initial_data=False)
+    assert get_schema_version(engine) == SCHEMA_VERSION
+    assert _count(engine, System) == 0
+
+    init_db(engine=engine)
+    assert _count(engine, System) == len(SYSTEMS)
+    assert _count(engine, Section) == len(SECTIONS)
+    assert _count(engine, Reason) == len(REASONS)
+    engine.dispose()
+
+
+def test_migrate_completes_databases_created_before_versioning():
+    """Test que una BD sin versión recibe los triggers y contadores que falten"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("DROP TRIGGER step_runs_case_runs_counters_ai")
+        connection.execute(insert(System.__table__).values(name="USSP"))
+
+    applied = migrate(engine)
+
+    assert [migration.version for migration in applied] == [1]
+    with engine.connect() as connection:
+        assert (
+            connection.execute(
+                text(
+                    "SELECT COUNT(*) FROM sqlite_master WHERE name = 'step_runs_case_runs_counters_ai'"
+                )
+            ).scalar()
+            == 1
+        )
+
+    # Los datos iniciales no duplican los que ya existían
+    with Session(engine) as session:
+        load_initial_data(session)
+        load_initial_data(session)
+        session.commit()
+    assert _count(engine, System) == len(SYSTEMS)
+    assert _count(engine, Section) == len(SECTIONS)
+    assert _count(engine, Reason) == len(REASONS)
+
+
+def test_migrate_rejects_newer_schema():
+    """Test que una BD de una versión posterior de la aplicación no se toca"""
+    engine = create_engine("sqlite://")
+    init_db(engine=engine, load_initial_data=False)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(schema_version).values(
+                version=SCHEMA_VERSION + 1, description="futura", applied_at=func.now()
+            )
+        )
+
+    with pytest.raises(RuntimeError, match="posterior"):
+        init_db(engine=engine)
@@ -0,0 +1,55 @@
+import pytest
+from sqlalchemy import Table, create_engine, inspect
+
+from uat_tool.domain.models import associations
+from uat_tool.infrastructure import (
+    Base,
+    find_full_scans,
+    find_unindexed_foreign_keys,
+    init_db,
+)
+
+
+@pytest.fixture
+def audit_engine():
+    """Engine aislado con el esquema vacío"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_every_foreign_key_is_indexed():
+    """Test que toda clave foránea del dominio encabeza algún índice"""
+    # Otros tests registran modelos auxiliares en Base.metadata
+    domain_tables = {
+        mapper.local_table.name
+        for mapper in Base.registry.mappers
+        if mapper.class_.__module__.startswith("uat_tool.domain")
+    } | {table.name for table in vars(associations).values() if isinstance(table, Table)}
+
+    issues = [
+        issue for issue in find_unindexed_foreign_keys() if issue.table in domain_tables
+    ]
+
+    assert issues == []
+
+
+def test_repository_queries_do_not_scan(audit_engine):
+    """Test que ninguna consulta de repositorio recorre una tabla entera (min_rows=0)"""
+    issues = find_full_scans(audit_engine, min_rows=0)
+
+    assert issues == [], "\n".join(str(issue) for issue in issues)
+
+
+def test_init_db_adds_missing_indexes_to_existing_tables():
+    """Test que init_db crea los índices nuevos en tablas que ya existían"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ix_files_owner")
+
+    init_db(engine=engine, load_initial_data=False)
+
+    index_names = {index["name"] for index in inspect(engine).get_indexes("files")}
+    assert "ix_files_owner" in index_names
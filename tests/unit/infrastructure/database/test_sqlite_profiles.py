@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+from uat_tool.infrastructure import SQLITE_PROFILES, apply_sqlite_profile
+
+
+def _pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_desktop_profile_applied_on_connect(tmp_path):
+    """Test que el perfil por defecto activa WAL, NORMAL y claves foráneas"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'desktop.db'}")
+    apply_sqlite_profile(engine, "desktop")
+
+    assert _pragma(engine, "journal_mode") == "wal"
+    assert _pragma(engine, "synchronous") == 1  # NORMAL
+    assert _pragma(engine, "foreign_keys") == 1
+    assert _pragma(engine, "busy_timeout") == SQLITE_PROFILES["desktop"]["busy_timeout"]
+    assert _pragma(engine, "temp_store") == 2  # MEMORY
+    engine.dispose()
+
+
+def test_durable_profile_applied_on_connect(tmp_path):
+    """Test que el perfil durable usa journal DELETE y synchronous FULL"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'durable.db'}")
+    apply_sqlite_profile(engine, "durable")
+
+    assert _pragma(engine, "journal_mode") == "delete"
+    assert _pragma(engine, "synchronous") == 2  # FULL
+    engine.dispose()
+
+
+def test_unknown_profile_raises(tmp_path):
+    """Test de perfil inexistente"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'unknown.db'}")
+
+    with pytest.raises(ValueError):
+        apply_sqlite_profile(engine, "turbo")
+
+
+def test_read_engine_rejects_writes(tmp_path):
+    """Test que el engine de lectura usa su propio pool con query_only"""
+    from sqlalchemy.exc import OperationalError
+
+    from uat_tool.infrastructure import create_read_engine
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'read.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (id INTEGER)"))
+    read_engine = create_read_engine(engine)
+
+    assert read_engine is not engine
+    assert _pragma(read_engine, "query_only") == 1
+    with pytest.raises(OperationalError):
+        with read_engine.begin() as conn:
+            conn.execute(text("INSERT INTO t VALUES (1)"))
+    read_engine.dispose()
+    engine.dispose()
+
+
+def test_read_engine_for_memory_database_is_the_same():
+    """Test que en memoria no se crea otro engine (sería otra BD)"""
+    from uat_tool.infrastructure import create_read_engine
+
+    engine = create_engine("sqlite://")
+    assert create_read_engine(engine) is engine
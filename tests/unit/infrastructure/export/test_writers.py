@@ -0,0 +1,81 @@
+import csv
+import zipfile
+from xml.etree import ElementTree
+
+import pytest
+
+from uat_tool.infrastructure import CsvTableWriter, XlsxTableWriter, open_table_writer
+
+_NS = {"s": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+
+def _xlsx_rows(path):
+    """Lee las celdas de la hoja de un XLSX como listas de texto"""
+    with zipfile.ZipFile(path) as workbook:
+        sheet = ElementTree.fromstring(workbook.read("xl/worksheets/sheet1.xml"))
+    return [
+        [
+            cell.findtext("s:v", namespaces=_NS)
+            or cell.findtext("s:is/s:t", namespaces=_NS)
+            for cell in row.findall("s:c", _NS)
+        ]
+        for row in sheet.iter(f"{{{_NS['s']}}}row")
+    ]
+
+
+def test_open_table_writer_by_extension(tmp_path):
+    """Test que el escritor se elige por la extensión o por `file_format`"""
+    with open_table_writer(tmp_path / "a.CSV", ["Id"]) as writer:
+        assert isinstance(writer, CsvTableWriter)
+    with open_table_writer(tmp_path / "a.part", ["Id"], file_format=".xlsx") as writer:
+        assert isinstance(writer, XlsxTableWriter)
+
+    with pytest.raises(ValueError, match="no soportado"):
+        open_table_writer(tmp_path / "a.pdf", ["Id"])
+
+
+def test_csv_writer_writes_header_and_batches(tmp_path):
+    """Test que el CSV lleva BOM, cabecera y todas las filas de todos los lotes"""
+    path = tmp_path / "bugs.csv"
+    with open_table_writer(path, ["Id", "Descripción"]) as writer:
+        writer.write_rows([(1, "Validación, zona")])
+        writer.write_rows(row for row in [(2, 'con "comillas"')])
+
+    assert writer.rows_written == 2
+    assert path.read_bytes().startswith(b"\xef\xbb\xbf")
+    with path.open(encoding="utf-8-sig", newline="") as file:
+        assert list(csv.reader(file)) == [
+            ["Id", "Descripción"],
+            ["1", "Validación, zona"],
+            ["2", 'con "comillas"'],
+        ]
+
+
+def test_xlsx_writer_escapes_text_and_keeps_numbers(tmp_path):
+    """Test que el XLSX es XML válido con texto escapado, números y celdas vacías"""
+    path = tmp_path / "bugs.xlsx"
+    with open_table_writer(path, ["Id", "Texto", "Extra"]) as writer:
+        writer.write_rows([(1, "a < b & c\x01", None), (2, "Zona ñ", "x")])
+
+    with zipfile.ZipFile(path) as workbook:
+        assert {
+            "[Content_Types].xml",
+            "_rels/.rels",
+            "xl/workbook.xml",
+            "xl/_rels/workbook.xml.rels",
+            "xl/worksheets/sheet1.xml",
+        } <= set(workbook.namelist())
+        assert b'<c r="A2"><v>1</v></c>' in workbook.read("xl/worksheets/sheet1.xml")
+
+    assert _xlsx_rows(path) == [
+        ["Id", "Texto", "Extra"],
+        ["1", "a < b & c"],
+        ["2", "Zona ñ", "x"],
+    ]
+
+
+def test_xlsx_writer_rejects_row_with_wrong_column_count(tmp_path):
+    """Test que una fila con menos valores que cabeceras no pierde celdas en silencio"""
+    with XlsxTableWriter(tmp_path / "a.xlsx", ["Id", "Name"]) as writer:
+        with pytest.raises(ValueError):
+            writer.write_rows([(1,)])
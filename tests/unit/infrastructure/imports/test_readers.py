@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+from uat_tool.infrastructure import read_table_records
+
+
+def test_read_csv_detects_delimiter_and_normalizes_headers(tmp_path):
+    """Test que se lee un CSV de Excel (BOM y ';') con cabeceras normalizadas"""
+    path = tmp_path / "requisitos.csv"
+    path.write_text(
+        " Code ;DEFINITION;Systems\nREQ-1;Definición uno;USSP, CISP\nREQ-2;Dos;USSP\n",
+        encoding="utf-8-sig",
+    )
+
+    records = read_table_records(path)
+
+    assert records == [
+        {"code": "REQ-1", "definition": "Definición uno", "systems": "USSP, CISP"},
+        {"code": "REQ-2", "definition": "Dos", "systems": "USSP"},
+    ]
+
+
+def test_read_json_list_of_objects(tmp_path):
+    """Test que se lee una lista de objetos JSON y se rechaza otra estructura"""
+    path = tmp_path / "requisitos.json"
+    path.write_text(json.dumps([{"Code": "REQ-1", "systems": ["USSP"]}]))
+    assert read_table_records(path) == [{"code": "REQ-1", "systems": ["USSP"]}]
+
+    path.write_text(json.dumps({"code": "REQ-1"}))
+    with pytest.raises(ValueError, match="lista de objetos"):
+        read_table_records(path)
+
+
+def test_read_unsupported_format(tmp_path):
+    """Test que una extensión desconocida se rechaza antes de abrir el archivo"""
+    with pytest.raises(ValueError, match="no soportado"):
+        read_table_records(tmp_path / "requisitos.xlsx")
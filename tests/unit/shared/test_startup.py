@@ -0,0 +1,21 @@
+import time
+
+from uat_tool.shared import StartupProfiler
+
+
+def test_startup_profiler_records_consecutive_phases():
+    """Test que mark y phase encadenan fases desde el origen"""
+    profiler = StartupProfiler()
+    time.sleep(0.01)
+    profiler.mark("imports")
+    with profiler.phase("bootstrap"):
+        time.sleep(0.01)
+    profiler.mark("show")
+
+    assert [phase.name for phase in profiler.phases] == ["imports", "bootstrap", "show"]
+    assert all(phase.duration >= 0.01 for phase in profiler.phases[:2])
+    assert sum(phase.duration for phase in profiler.phases) <= profiler.elapsed()
+
+    report = profiler.format_report(total=0.5)
+    assert report.startswith("0.50 s (imports ")
+    assert "bootstrap" in report
@@ -0,0 +1,257 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from click.testing import CliRunner
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from uat_tool.cli import cli
+from uat_tool.domain import (
+    Block,
+    Bug,
+    Campaign,
+    CampaignRunRepository,
+    Case,
+    Environment,
+    Requirement,
+    Step,
+    StepRun,
+    System,
+)
+from uat_tool.infrastructure import get_query_profiler
+from uat_tool.infrastructure.database import engine as engine_module
+
+
+@pytest.fixture
+def cli_db(tmp_path, monkeypatch):
+    """URL de una BD temporal; el engine global se restaura al terminar"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(engine_module, "_engine", None)
+    yield f"sqlite:///{tmp_path / 'cli.db'}"
+    if engine_module._engine is not None:
+        engine_module._engine.dispose()
+
+
+def _invoke(db_url, *args):
+    return CliRunner().invoke(cli, ["--db", db_url, *args], obj={})
+
+
+def _add_bugs(statuses):
+    engine = engine_module._engine
+    with Session(engine) as session:
+        environment = Environment(name="CLI_ENV", description="CLI env")
+        system = System(name="CLI_SYS")
+        session.add_all([environment, system])
+        session.flush()
+        for status in statuses:
+            session.add(
+                Bug(
+                    status=status,
+                    system_id=system.id,
+                    system_version="1.0.0",
+                    short_description=f"Bug {status}",
+                    definition="def",
+                    urgency=1,
+                    impact=1,
+                    environment_id=environment.id,
+                    modified_by="cli",
+                )
+            )
+        session.commit()
+
+
+def test_cli_db_init_creates_schema(cli_db):
+    """Test que `db init` crea las tablas en la BD indicada con --db"""
+    result = _invoke(cli_db, "db", "init")
+
+    assert result.exit_code == 0, result.output
+    assert "esquema v1" in result.output
+    with Session(engine_module._engine) as session:
+        assert session.scalar(select(func.count()).select_from(System)) > 0
+
+    version = _invoke(cli_db, "db", "version")
+    assert version.exit_code == 0, version.output
+    assert "Esquema de la BD: v1" in version.output
+
+
+def test_cli_report_and_export_bugs(cli_db, tmp_path):
+    """Test que el informe agrupa por estado y sistema y la exportación escribe el CSV"""
+    assert _invoke(cli_db, "db", "init").exit_code == 0
+    _add_bugs(["OPEN", "OPEN", "PENDING"])
+
+    report = _invoke(cli_db, "report", "bugs")
+    assert report.exit_code == 0, report.output
+    lines = report.output.splitlines()
+    assert lines[0].split() == ["Status", "System", "Bugs"]
+    assert ["PENDING", "CLI_SYS", "1"] in [line.split() for line in lines]
+    assert ["OPEN", "CLI_SYS", "2"] in [line.split() for line in lines]
+    assert lines[-1] == "Total: 3"
+
+    path = tmp_path / "bugs.csv"
+    export = _invoke(cli_db, "export", "bugs", str(path), "--batch-size", "2")
+    assert export.exit_code == 0, export.output
+    assert "3 filas exportadas" in export.output
+    assert len(path.read_text(encoding="utf-8-sig").splitlines()) == 4
+
+
+def test_cli_import_requirements(cli_db, tmp_path):
+    """Test que la importación crea los requisitos válidos y lista los errores"""
+    assert _invoke(cli_db, "db", "init").exit_code == 0
+    _add_bugs([])
+    path = tmp_path / "requisitos.csv"
+    path.write_text(
+        "code;definition;systems;sections\n"
+        "REQ-CLI-1;Primer requisito importado;CLI_SYS;Tracking\n"
+        "REQ-CLI-2;Segundo requisito importado;NO_EXISTE;Tracking\n",
+        encoding="utf-8",
+    )
+
+    result = _invoke(
+        cli_db, "import", "requirements", str(path), "--environment", "CLI_ENV"
+    )
+
+    assert result.exit_code == 1
+    assert "Fila 2 (REQ-CLI-2): Sistemas no encontrados: NO_EXISTE" in result.output
+    assert "1 de 2 requisitos importados (1 errores)" in result.output
+    with Session(engine_module._engine) as session:
+        assert session.scalars(select(Requirement.code)).all() == ["REQ-CLI-1"]
+
+    unknown = _invoke(cli_db, "import", "requirements", str(path), "--environment", "X")
+    assert unknown.exit_code == 1
+    assert "Entorno no encontrado: X" in unknown.output
+
+
+def test_cli_report_coverage(cli_db, tmp_path):
+    """Test que el informe de cobertura lista los requisitos y exporta la matriz"""
+    assert _invoke(cli_db, "db", "init").exit_code == 0
+    _add_bugs([])
+    with Session(engine_module._engine) as session:
+        session.add(
+            Requirement(
+                code="REQ-COV", definition="def", environment_id=1, modified_by="cli"
+            )
+        )
+        session.commit()
+
+    report = _invoke(cli_db, "report", "coverage", "--environment", "CLI_ENV")
+    assert report.exit_code == 0, report.output
+    assert report.output.splitlines()[1].split() == ["REQ-COV", "NOT", "COVERED", "0", "0", "0", "0", "0"]
+    assert "Total: 1 (NOT COVERED: 1)" in report.output
+
+    path = tmp_path / "cobertura.csv"
+    export = _invoke(
+        cli_db, "report", "coverage", "--environment", "CLI_ENV", "--output", str(path)
+    )
+    assert export.exit_code == 0, export.output
+    assert path.read_text(encoding="utf-8-sig").splitlines()[1].startswith("REQ-COV,NOT COVERED")
+
+
+def test_cli_report_progress(cli_db):
+    """Test que el informe de progreso lee los contadores de la ejecución"""
+    assert _invoke(cli_db, "db", "init", "--no-seed").exit_code == 0
+    with Session(engine_module._engine) as session:
+        environment = Environment(name="CLI_ENV", description="CLI env")
+        system = System(name="CLI_SYS")
+        session.add_all([environment, system])
+        session.flush()
+        audit = {"environment_id": environment.id, "modified_by": "cli"}
+        case = Case(code="C1", name="Case", comments="", **audit)
+        case.steps = [Step(action=f"a{i}", expected_result="ok", comments="") for i in range(4)]
+        campaign = Campaign(
+            code="CLI",
+            description="CLI campaign",
+            system_id=system.id,
+            system_version="1.0.0",
+            status="DRAFT",
+            blocks=[Block(code="B1", system_id=system.id, cases=[case], **audit)],
+            **audit,
+        )
+        session.add(campaign)
+        session.flush()
+        campaign_run = CampaignRunRepository(session).create(
+            {"campaign_id": campaign.id, "modified_by": "cli"}, environment.id
+        )
+        step_runs = (
+            session.query(StepRun)
+            .filter_by(campaign_run_id=campaign_run.id)
+            .order_by(StepRun.id)
+        )
+        # El último paso queda sin ejecutar
+        results = [True, True, False, None]
+        for step_run, passed in zip(step_runs, results, strict=True):
+            step_run.passed = passed
+        session.commit()
+        campaign_run_id = campaign_run.id
+
+    report = _invoke(cli_db, "report", "progress", str(campaign_run_id))
+    assert report.exit_code == 0, report.output
+    assert report.output.splitlines()[1].split()[1:] == ["4", "2", "1", "1", "75%"]
+    assert "Total: 4 pasos, 2 superados, 1 fallidos, 1 sin ejecutar (75%)" in report.output
+
+    unknown = _invoke(cli_db, "report", "progress", "999")
+    assert unknown.exit_code == 1
+    assert "no encontrada: 999" in unknown.output
+
+
+def test_cli_profile_sql_prints_query_report(cli_db):
+    """Test que --profile-sql muestra las sentencias por servicio al terminar"""
+    assert _invoke(cli_db, "db", "init").exit_code == 0
+
+    result = _invoke(cli_db, "--profile-sql", "report", "bugs")
+
+    assert result.exit_code == 0, result.output
+    assert "sentencias SQL" in result.output
+    assert "BugService.count_bugs_by_status_and_system" in result.output
+    assert "unit_of_work" in result.output
+    assert not get_query_profiler().enabled
+    get_query_profiler().reset()
+
+
+def test_cli_export_rejects_unknown_format(cli_db, tmp_path):
+    """Test que un formato no soportado termina con error y sin archivo"""
+    result = _invoke(cli_db, "export", "bugs", str(tmp_path / "bugs.txt"))
+
+    assert result.exit_code == 1
+    assert "no soportado" in result.output
+    assert not list(tmp_path.glob("bugs.txt*"))
+
+
+def test_cli_db_maintenance_commands(cli_db):
+    """Test que rebuild-search, rebuild-counters y vacuum se ejecutan sobre una BD inicializada"""
+    assert _invoke(cli_db, "db", "init", "--no-seed").exit_code == 0
+
+    rebuild = _invoke(cli_db, "db", "rebuild-search")
+    assert rebuild.exit_code == 0, rebuild.output
+    assert "bugs_fts" in rebuild.output
+
+    counters = _invoke(cli_db, "db", "rebuild-counters")
+    assert counters.exit_code == 0, counters.output
+    assert "step_runs_case_runs_counters" in counters.output
+
+    vacuum = _invoke(cli_db, "db", "vacuum")
+    assert vacuum.exit_code == 0, vacuum.output
+
+
+def test_cli_benchmark_services_rejects_db_option(cli_db, tmp_path):
+    """Test que el benchmark no se ejecuta sobre la BD indicada con --db"""
+    result = _invoke(cli_db, "benchmark", "services", "--dataset", str(tmp_path / "b.db"))
+
+    assert result.exit_code == 1
+    assert "--dataset" in result.output
+    assert not (tmp_path / "b.db").exists()
+
+
+def test_cli_import_does_not_load_qt():
+    """Test que la CLI se puede importar sin cargar PySide6"""
+    code = "import sys, uat_tool.cli; print('PySide6' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+
+    assert result.stdout.strip() == "False"